@@ -0,0 +1,411 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Shared pattern-growth runtime for the FP-tree based miners.
+
+The tree keeps its nodes in flat arrays indexed by node id (item, parent, payload and children) instead of one object
+per node. Every node carries a payload whose type is chosen by the miner: a list of timestamps stored at the last node
+of each branch (ConditionalTree), the summaries of those timestamps as intervals whose consecutive timestamps are at
+most maxPer apart (IntervalTree), or an additive value stored along the whole branch such as a count, a utility or an
+expected support (CountTree). Miners subclass one of the trees and only provide their measure functions::
+
+    class _Tree(conditionalTree.ConditionalTree):
+
+        def measure(self, timeStamps, pattern):
+            return getSupportAndPeriod(timeStamps)
+
+        def isPromising(self, value):
+            return value[0] >= _minSup and value[1] <= _maxPer
+
+The miners built on these trees are SPPGrowth, RPGrowth, PFPGrowthPlus, PSGrowth, EPCPGrowth, WFRIMiner and WFIM. The
+other FP-tree miners still keep their own trees.
+"""
+
+from abc import ABC as _ABC, abstractmethod as _abstractmethod
+from itertools import chain as _chain, combinations as _combinations
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+
+class ConditionalTree(_ABC):
+    """
+    :Description: Array-backed prefix tree with pluggable node payloads and the generic pattern-growth search.
+
+    :Attributes:
+
+        summaries : dict
+            Stores the ids of the nodes which share the same item
+        info : dict
+            Stores the measure value of every item of the tree
+        accumulatePath : bool
+            If True the payload of a transaction is merged into every node of its branch, otherwise only into the last
+            node and folded into the parent when the node is removed
+        expandNonPatterns : bool
+            If False only the items which are patterns themselves are extended
+        singlePathShortcut : bool
+            If True a conditional tree made of a single branch is not mined, all the subsets of its items being patterns
+            with the measure of its last node
+
+    :Methods:
+
+        addTransaction(transaction, payload)
+            Adding a transaction into the tree
+        getConditionalPatterns(item)
+            Returns the prefix paths of an item with the payload of their nodes
+        conditionalDatabases(paths, payloads, pattern)
+            Measures the items of the prefix paths and keeps the promising ones
+        conditionalTree(item, pattern)
+            Builds the conditional tree of an item
+        removeNode(item)
+            Removes the nodes of an item after pushing their payload to the parents
+        singlePath()
+            Returns the items and the payload of the tree when it is a single branch
+        generatePatterns(prefix)
+            Mines the patterns of the tree
+        measure(payload, pattern)
+            Measure of a pattern computed from its combined payload, provided by the miner
+        isPromising(value)
+            Whether an item is kept in the conditional databases
+        isPattern(value)
+            Whether a pattern is reported
+        support(value)
+            Key used to order the items of the tree
+    """
+
+    accumulatePath = False
+    expandNonPatterns = True
+    singlePathShortcut = False
+
+    def __init__(self) -> None:
+        self._items = [None]
+        self._parents = [-1]
+        self._payloads = [self.newPayload()]
+        self._children = [{}]
+        self.summaries = {}
+        self.info = {}
+
+    def newPayload(self) -> Any:
+        """
+        :return: Payload of a new node
+        """
+        return []
+
+    def mergePayload(self, target: Any, source: Any) -> Any:
+        """
+        Merging the payload source into the payload of a node
+
+        :param target: payload owned by the node
+        :param source: payload to be merged
+        :return: merged payload
+        """
+        target.extend(source)
+        return target
+
+    def combinePayloads(self, payloads: List[Any]) -> Any:
+        """
+        Combining the payloads of several prefix paths before measuring an item
+
+        :param payloads: payloads of the prefix paths containing the item
+        :type payloads: list
+        :return: combined payload
+        """
+        return list(_chain.from_iterable(payloads))
+
+    @_abstractmethod
+    def measure(self, payload: Any, pattern: List[Any]) -> Any:
+        """
+        Computing the measure of a pattern, such as its support and periodicity
+
+        :param payload: combined payload of the pattern
+        :param pattern: the pattern being measured
+        :type pattern: list
+        :return: measure value stored in info
+        """
+        pass
+
+    def isPromising(self, value: Any) -> bool:
+        """
+        :param value: measure value of an item
+        :return: True if the item is kept in the conditional databases
+        """
+        return True
+
+    def isPattern(self, value: Any) -> bool:
+        """
+        :param value: measure value of a pattern
+        :return: True if the pattern is reported
+        """
+        return True
+
+    def support(self, value: Any) -> Any:
+        """
+        :param value: measure value of an item
+        :return: key used to order the items of the tree
+        """
+        return value[0]
+
+    def newTree(self) -> 'ConditionalTree':
+        """
+        :return: Empty tree with the same measure functions
+        """
+        return type(self)()
+
+    def _newNode(self, item: Any, parent: int) -> int:
+        node = len(self._items)
+        self._items.append(item)
+        self._parents.append(parent)
+        self._payloads.append(self.newPayload())
+        self._children.append({})
+        self._children[parent][item] = node
+        if item in self.summaries:
+            self.summaries[item].append(node)
+        else:
+            self.summaries[item] = [node]
+        return node
+
+    def addTransaction(self, transaction: List[Any], payload: Any) -> None:
+        """
+        Adding a transaction into tree
+
+        :param transaction: items of the transaction in tree order
+        :type transaction: list
+        :param payload: payload of the transaction, such as its timestamps or count
+        :return: None
+        """
+        node = 0
+        children = self._children
+        for item in transaction:
+            child = children[node].get(item)
+            if child is None:
+                child = self._newNode(item, node)
+            node = child
+            if self.accumulatePath:
+                self._payloads[node] = self.mergePayload(self._payloads[node], payload)
+        if not self.accumulatePath:
+            self._payloads[node] = self.mergePayload(self._payloads[node], payload)
+
+    def getConditionalPatterns(self, item: Any) -> Tuple[List[List[Any]], List[Any]]:
+        """
+        Generates the prefix paths of a respective item
+
+        :param item: item of the tree
+        :return: prefix paths and the payloads of the nodes of item
+        """
+        paths = []
+        payloads = []
+        items = self._items
+        parents = self._parents
+        for node in self.summaries[item]:
+            path = []
+            parent = parents[node]
+            while parent > 0:
+                path.append(items[parent])
+                parent = parents[parent]
+            if path:
+                path.reverse()
+                paths.append(path)
+                payloads.append(self._payloads[node])
+        return paths, payloads
+
+    def conditionalDatabases(self, paths: List[List[Any]], payloads: List[Any],
+                             pattern: List[Any]) -> Tuple[List[List[Any]], List[Any], Dict[Any, Any]]:
+        """
+        It generates the conditional transactions with the promising items
+
+        :param paths: prefix paths of an item
+        :type paths: list
+        :param payloads: payloads of the prefix paths
+        :type payloads: list
+        :param pattern: pattern whose conditional databases are generated
+        :type pattern: list
+        :return: conditional transactions, their payloads and the measure of the promising items
+        """
+        itemPayloads = {}
+        for path, payload in zip(paths, payloads):
+            for item in path:
+                if item in itemPayloads:
+                    itemPayloads[item].append(payload)
+                else:
+                    itemPayloads[item] = [payload]
+        info = {}
+        for item, itemPayload in itemPayloads.items():
+            value = self.measure(self.combinePayloads(itemPayload), pattern + [item])
+            if self.isPromising(value):
+                info[item] = value
+        transactions = []
+        transactionPayloads = []
+        support = self.support
+        for path, payload in zip(paths, payloads):
+            transaction = sorted([item for item in path if item in info], key=lambda x: (support(info[x]), -x),
+                                 reverse=True)
+            if transaction:
+                transactions.append(transaction)
+                transactionPayloads.append(payload)
+        return transactions, transactionPayloads, info
+
+    def conditionalTree(self, item: Any, pattern: List[Any]) -> 'ConditionalTree':
+        """
+        Builds the conditional tree of an item
+
+        :param item: item of the tree
+        :param pattern: pattern formed by the prefix of the tree and item
+        :type pattern: list
+        :return: conditional tree
+        """
+        paths, payloads = self.getConditionalPatterns(item)
+        transactions, transactionPayloads, info = self.conditionalDatabases(paths, payloads, pattern)
+        tree = self.newTree()
+        tree.info = info
+        for transaction, payload in zip(transactions, transactionPayloads):
+            tree.addTransaction(transaction, payload)
+        return tree
+
+    def removeNode(self, item: Any) -> None:
+        """
+        Removing the nodes of an item from tree
+
+        :param item: item whose nodes are removed
+        :return: None
+        """
+        for node in self.summaries.pop(item, []):
+            parent = self._parents[node]
+            if not self.accumulatePath:
+                self._payloads[parent] = self.mergePayload(self._payloads[parent], self._payloads[node])
+            del self._children[parent][item]
+            self._payloads[node] = None
+
+    def singlePath(self) -> Optional[Tuple[List[Any], Any]]:
+        """
+        Items of the tree when it is a single branch whose payload is held by its last node
+
+        :return: the items of the branch from the root and the payload of its last node, or None
+        """
+        if self.accumulatePath:
+            return None
+        path = []
+        node = 0
+        while self._children[node]:
+            if len(self._children[node]) > 1 or (node and self._payloads[node]):
+                return None
+            node = next(iter(self._children[node].values()))
+            path.append(self._items[node])
+        return path, self._payloads[node]
+
+    def generatePatterns(self, prefix: List[Any]) -> Generator[Tuple[List[Any], Any], None, None]:
+        """
+        Generates the patterns
+
+        :param prefix: Forms the combination of items
+        :type prefix: list
+        :returns: yields patterns with their measure value
+        """
+        support = self.support
+        for item in sorted(self.summaries, key=lambda x: (support(self.info[x]), -x)):
+            pattern = prefix + [item]
+            value = self.info[item]
+            isPattern = self.isPattern(value)
+            if isPattern:
+                yield pattern, value
+            if isPattern or self.expandNonPatterns:
+                conditionalTree = self.conditionalTree(item, pattern)
+                single = conditionalTree.singlePath() if self.singlePathShortcut else None
+                if single is not None and single[0]:
+                    path, payload = single
+                    value = self.measure(payload, pattern + path)
+                    if self.isPattern(value):
+                        path.reverse()
+                        for length in range(1, len(path) + 1):
+                            for subset in _combinations(path, length):
+                                yield pattern + list(subset), value
+                elif conditionalTree.summaries:
+                    for q in conditionalTree.generatePatterns(pattern):
+                        yield q
+            self.removeNode(item)
+
+
+class CountTree(ConditionalTree):
+    """
+    :Description: Conditional tree whose payload is additive and stored along the whole branch, such as a count, a
+                  utility or an expected support. Removing a node does not change its ancestors.
+    """
+
+    accumulatePath = True
+
+    def newPayload(self) -> Any:
+        return 0
+
+    def mergePayload(self, target: Any, source: Any) -> Any:
+        return target + source
+
+    def combinePayloads(self, payloads: List[Any]) -> Any:
+        return sum(payloads)
+
+
+class IntervalTree(ConditionalTree):
+    """
+    :Description: Conditional tree whose payload summarises the timestamps of a branch as (start, end, period, support)
+                  intervals sorted by start, the consecutive timestamps of an interval being at most maxPer apart. The
+                  support of a merged summary is exact, and so is whether its timestamps are periodic, while the period
+                  inside overlapping intervals is bounded by the largest of their periods.
+
+    :Attributes:
+
+        maxPer : float
+            The largest gap between two timestamps of an interval
+    """
+
+    singlePathShortcut = True
+
+    def __init__(self, maxPer: float = float("inf")) -> None:
+        self.maxPer = maxPer
+        super().__init__()
+
+    def newTree(self) -> 'IntervalTree':
+        return type(self)(self.maxPer)
+
+    def mergeIntervals(self, summaries: List[List[Tuple[int, int, int, int]]]) -> List[Tuple[int, int, int, int]]:
+        """
+        Merging interval summaries into one
+
+        :param summaries: interval summaries, each sorted by start
+        :type summaries: list
+        :return: the merged summary
+        :rtype: list
+        """
+        merged = []
+        for start, end, per, sup in sorted(_chain.from_iterable(summaries)):
+            if merged and start - merged[-1][1] <= self.maxPer:
+                first, last, lastPer, lastSup = merged[-1]
+                merged[-1] = (first, max(last, end), max(lastPer, per, start - last), lastSup + sup)
+            else:
+                merged.append((start, end, per, sup))
+        return merged
+
+    def mergePayload(self, target: Any, source: Any) -> Any:
+        if not target:
+            return list(source)
+        if len(source) == 1 and source[0][0] >= target[-1][1]:
+            # a later timestamp of the same branch extends or follows the last interval
+            start, end, per, sup = source[0]
+            first, last, lastPer, lastSup = target[-1]
+            if start - last <= self.maxPer:
+                target[-1] = (first, end, max(lastPer, per, start - last), lastSup + sup)
+            else:
+                target.append(source[0])
+            return target
+        return self.mergeIntervals([target, source])
+
+    def combinePayloads(self, payloads: List[Any]) -> Any:
+        return self.mergeIntervals(payloads)
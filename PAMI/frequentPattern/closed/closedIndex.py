@@ -0,0 +1,143 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Closedness check shared by the closed pattern miners.
+
+An itemset is not closed when an already discovered superset has the same support, which means both have the same
+tidset. The index therefore keys the patterns by a 64-bit fingerprint of their tidset together with their support, and
+stores only the ids of the patterns in every bucket. Items are encoded as bit positions so the subset check against the
+patterns of a bucket is a single integer operation. Two different tidsets sharing a fingerprint cannot produce a wrong
+answer: a superset with the same support always has exactly the same tidset.
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple
+
+_fingerprintMask = (1 << 64) - 1
+
+
+class ClosedIndex:
+    """
+    :Description: Index of the discovered patterns keyed by tidset fingerprint and support, with bitset subsumption.
+
+    :Methods:
+
+        fingerprint(tidSet)
+            64-bit fingerprint of a tidset
+        bitset(itemSet)
+            Encodes an itemset as an integer bitset
+        isSubsumed(itemSet, tidSet, support)
+            Checks whether a stored superset of itemSet has the same tidset
+        insert(itemSet, tidSet, support)
+            Stores an itemset and reports whether it was not subsumed
+
+    **Sample run of the importing code:**
+    ----------------------------------------
+    .. code-block:: python
+
+            from PAMI.frequentPattern.closed import closedIndex as _closedIndex
+
+            index = _closedIndex.ClosedIndex()
+
+            if index.insert(itemSet, tidSet, len(tidSet)):
+
+                print("closed so far:", itemSet)
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[Tuple[int, Any], List[int]] = {}
+        self._patterns: List[int] = []
+        self._bits: Dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    @staticmethod
+    def fingerprint(tidSet: Iterable[int]) -> int:
+        """
+        Calculates the fingerprint of a tidset, independent of the order of its timestamps
+
+        :param tidSet: timestamps of a pattern
+        :type tidSet: set or list
+        :return: 64-bit fingerprint
+        :rtype: int
+        """
+        return hash(frozenset(tidSet)) & _fingerprintMask
+
+    def bitset(self, itemSet: Iterable[Any]) -> int:
+        """
+        Encodes an itemset as an integer whose set bits are the positions of its items
+
+        :param itemSet: items of a pattern
+        :type itemSet: list
+        :return: bitset of the itemset
+        :rtype: int
+        """
+        mask = 0
+        bits = self._bits
+        for item in itemSet:
+            bit = bits.get(item)
+            if bit is None:
+                bit = bits[item] = 1 << len(bits)
+            mask |= bit
+        return mask
+
+    def _find(self, key: Tuple[int, Any], mask: int) -> int:
+        patterns = self._patterns
+        for patternId in self._buckets.get(key, ()):
+            if patterns[patternId] & mask == mask:
+                return patternId
+        return -1
+
+    def isSubsumed(self, itemSet: Iterable[Any], tidSet: Iterable[int], support: Any) -> bool:
+        """
+        Checks whether a stored superset of itemSet, including itemSet itself, has the same support and tidset
+
+        :param itemSet: items of the pattern
+        :type itemSet: list
+        :param tidSet: timestamps of the pattern
+        :type tidSet: set or list
+        :param support: support of the pattern
+        :type support: int
+        :return: True if the pattern is not closed
+        :rtype: bool
+        """
+        return self._find((self.fingerprint(tidSet), support), self.bitset(itemSet)) >= 0
+
+    def insert(self, itemSet: Iterable[Any], tidSet: Iterable[int], support: Any) -> bool:
+        """
+        Stores a pattern in the index unless a stored superset already has the same support and tidset
+
+        :param itemSet: items of the pattern
+        :type itemSet: list
+        :param tidSet: timestamps of the pattern
+        :type tidSet: set or list
+        :param support: support of the pattern
+        :type support: int
+        :return: True if no stored superset had the same support and tidset before the insertion
+        :rtype: bool
+        """
+        key = (self.fingerprint(tidSet), support)
+        mask = self.bitset(itemSet)
+        if self._find(key, mask) >= 0:
+            # every subset of the pattern is already covered by the stored superset
+            return False
+        self._patterns.append(mask)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._buckets[key] = [len(self._patterns) - 1]
+        else:
+            bucket.append(len(self._patterns) - 1)
+        return True
@@ -0,0 +1,124 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Subsumption index shared by the maximal pattern miners.
+
+Every maximal pattern found so far is stored as an integer bitset of its items, so checking whether it contains a
+candidate is a single AND and compare. The miners grow patterns depth first, and the conditional index of a prefix only
+keeps the maximal patterns containing that prefix (progressive focusing). The deeper the search, the fewer patterns a
+check has to look at. A pattern added to a conditional index is also added to all the indexes it was derived from.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class MaximalIndex:
+    """
+    :Description: Bitset index of the maximal patterns found so far, with conditional indexes for the prefixes of the
+                  search.
+
+    :Methods:
+
+        bitset(itemSet)
+            Encodes an itemset as an integer bitset
+        hasSuperset(itemSet)
+            Checks whether a stored maximal pattern contains itemSet
+        add(itemSet)
+            Stores a maximal pattern in the index and in the indexes it was derived from
+        conditionalIndex(itemSet)
+            Index of the stored patterns which contain itemSet
+
+    **Sample run of the importing code:**
+    ----------------------------------------
+    .. code-block:: python
+
+            from PAMI.frequentPattern.maximal import maximalIndex as _maximalIndex
+
+            index = _maximalIndex.MaximalIndex()
+
+            index.add([1, 2, 3])
+
+            print(index.hasSuperset([1, 3]), index.conditionalIndex([2]).hasSuperset([2, 4]))
+    """
+
+    def __init__(self, parent: Optional['MaximalIndex'] = None, bits: Optional[Dict[Any, int]] = None,
+                 masks: Optional[List[int]] = None) -> None:
+        self._parent = parent
+        self._bits = {} if bits is None else bits
+        self._masks = [] if masks is None else masks
+
+    def __len__(self) -> int:
+        return len(self._masks)
+
+    def bitset(self, itemSet: Iterable[Any]) -> int:
+        """
+        Encodes an itemset as an integer whose set bits are the positions of its items
+
+        :param itemSet: items of a pattern
+        :type itemSet: list
+        :return: bitset of the itemset
+        :rtype: int
+        """
+        mask = 0
+        bits = self._bits
+        for item in itemSet:
+            bit = bits.get(item)
+            if bit is None:
+                bit = bits[item] = 1 << len(bits)
+            mask |= bit
+        return mask
+
+    def hasSuperset(self, itemSet: Iterable[Any]) -> bool:
+        """
+        Checks whether a stored maximal pattern contains every item of itemSet
+
+        :param itemSet: items of the candidate pattern
+        :type itemSet: list
+        :return: True if the candidate is subsumed
+        :rtype: bool
+        """
+        mask = self.bitset(itemSet)
+        for stored in self._masks:
+            if stored & mask == mask:
+                return True
+        return False
+
+    def add(self, itemSet: Iterable[Any]) -> None:
+        """
+        Stores a maximal pattern in this index and in all the indexes it was derived from
+
+        :param itemSet: items of the maximal pattern
+        :type itemSet: list
+        :return: None
+        """
+        mask = self.bitset(itemSet)
+        index = self
+        while index is not None:
+            index._masks.append(mask)
+            index = index._parent
+
+    def conditionalIndex(self, itemSet: Iterable[Any]) -> 'MaximalIndex':
+        """
+        Creates the index of the stored patterns which contain itemSet. Patterns added to it are also added to this
+        index.
+
+        :param itemSet: items appended to the prefix of this index
+        :type itemSet: list
+        :return: conditional index
+        :rtype: MaximalIndex
+        """
+        mask = self.bitset(itemSet)
+        return MaximalIndex(self, self._bits, [stored for stored in self._masks if stored & mask == mask])
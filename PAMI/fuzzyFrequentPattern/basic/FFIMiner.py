@@ -52,6 +52,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.fuzzyFrequentPattern.basic import abstract as _ab
+from PAMI.highUtilityPattern.basic import utilityList as _utilityList
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 from deprecated import deprecated
 
@@ -263,11 +264,12 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
             for j in range(i + 1, len(cands)):
                 newCand = tuple(cands[i] + tuple([cands[j][-1]]))
                 # print(items[cands[i]], items[cands[j]])
-                newCandItems = {}
-                keys = self._Database[cands[i]].keys() & self._Database[cands[j]].keys()
-                for k in keys:
-                    newCandItems[k] = min(self._Database[cands[i]][k], self._Database[cands[j]][k])
-                count = sum(newCandItems.values())
+                left = self._Database[cands[i]]
+                right = self._Database[cands[j]]
+                tids, inLeft, inRight = left.intersect(right)
+                newCandItems = _utilityList.UtilityList(newCand, tids,
+                                                        values=_ab._np.minimum(left.values[inLeft], right.values[inRight]))
+                count = newCandItems.total('values')
                 if count >= self._minSup:
                     newCands.append(newCand)
                     self._finalPatterns[newCand] = count
@@ -296,10 +298,11 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
         self._minSup = self._convert(self._minSup)
         self._Database = items.copy()
 
-        supports = {k:sum(v.values()) for k,v in items.items()}
+        items = {k: _utilityList.UtilityList(k, list(v.keys()), values=list(v.values())) for k, v in items.items()}
+        supports = {k:v.total('values') for k,v in items.items()}
         supports = {k:v for k,v in supports.items() if v >= self._minSup}
         self._Database = {k:v for k,v in items.items() if k in supports}
-        self._Database = {k:v for k,v in sorted(self._Database.items(), key=lambda x: sum(x[1].values()), reverse=True)}
+        self._Database = {k:v for k,v in sorted(self._Database.items(), key=lambda x: supports[x[0]], reverse=True)}
 
         self._finalPatterns = supports.copy()
 
@@ -1,7 +1,7 @@
 # GFSPminer is one of the fundamental algorithm to discover georeferenced sequential frequent patterns in a transactional database.
 # This program employs GFSPminer property (or downward closure property) to  reduce the search space effectively.
-# This algorithm employs breadth-first search technique when 1-2 length patterns and depth-first search when above 3 length patterns to find the complete set of frequent patterns in a
-# transactional database.
+# This algorithm searches the equivalence classes of SPADE depth-first, and joins two patterns of a class only when their latest items are
+# neighbours, which is looked up in a bitset of the neighbourhoods built once from the neighbourhood file.
 #
 # **Importing this algorithm into a python program**
 # --------------------------------------------------------
@@ -55,6 +55,9 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.georeferencedFrequentSequencePattern.basic import abstract as _ab
+from PAMI.georeferencedFrequentSequencePattern.basic import neighbourhoodEngine as _neighbourhoodEngine
+from PAMI.sequentialPattern.basic import sequenceDatabase as _sequenceDatabase
+from PAMI.sequentialPattern.basic import spadeEngine as _spadeEngine
 import sys
 from deprecated import deprecated
 
@@ -65,8 +68,9 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
     """
     :Description:   GFSPminer is one of the fundamental algorithm to discover georeferenced sequential frequent patterns in a transactional database.
                     This program employs GFSPminer property (or downward closure property) to  reduce the search space effectively.
-                    This algorithm employs breadth-first search technique when 1-2 length patterns and depth-first search when above 3 length patterns to find the complete set of frequent patterns in a
-                    transactional database.
+                    This algorithm searches the equivalence classes of SPADE depth-first, and joins two patterns of a class only when their latest items are
+                    neighbours, which is looked up in a bitset of the neighbourhoods built once from the neighbourhood file.
+                    A pattern is georeferenced when all its items are neighbours of each other, two items being neighbours when either of them lists the other.
 
     :Reference:   Suzuki Shota and Rage Uday kiran: towards efficient discovery of spatially interesting patterns in geo-referenced sequential databases: To be appeared in SSDBM 2023:
 
@@ -110,16 +114,12 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
             To store the total amount of USS memory consumed by the program
         memoryRSS : float
             To store the total amount of RSS memory consumed by the program
-        Database : list
-            To store the transactions of a database in list
-        _xLenDatabase : dict
-            To store the datas in different sequence separated by sequence, rownumber, length.
-        _xLenDatabaseSame : dict
-            To store the datas in same sequence separated by sequence, rownumber, length.
+        Database : sequenceDatabase.SequenceDatabase
+            To store the sequences of the database
         _NeighboursMap : dict
             To store the neighbors
-        _failPatterns : dict
-            To store the failed patterns
+        _names : list
+            the name of every item, by item id
 
     :Methods:
 
@@ -137,36 +137,6 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
             Total amount of RSS memory consumed by the mining process will be retrieved from this function
         getRuntime()
             Total amount of runtime taken by the mining process will be retrieved from this function
-        Prune(startLine)
-            check the subsequence from sequence(startLine)
-        make1LenDatabase()
-            find 1 length frequent pattern from database
-        make2LenDatabase()
-            find 1 length frequent pattern by convene two 1 len patterns
-        makexLenData(x)
-            find x-1 length frequent pattern by convene two x len patterns
-        makexLenDatabase(rowLen, bs, latestWord)
-            To make "rowLen" length frequent patterns from pattern which latest word is in same seq  by joining "rowLen"-1 length patterns by depth-first search technique  and update xlenDatabase to sequential database
-        makeSame(rowLen, bs, latestWord, latestWord2)
-                to check the pattern is frequent or not (ex a-bc from a-c and a-b )
-        makeFaster(rowLen, bs, latestWord, latestWord2):
-                to check the pattern is frequent or not (ex a-b-c from a-c a-b)
-        makeLater(rowLen, bs, latestWord, latestWord2):
-                to check the pattern is frequent or not (ex ac-b from a-b ac)
-        makeSame2(rowLen, bs, latestWord, latestWord2):
-                to check the pattern is frequent or not (ex a-bc from a-c ab)
-        makeSame3(rowLen, bs, latestWord, latestWord2):
-                to check the pattern is frequent or not (ex abc from ac ab)
-        makexLenDatabaseSame(rowLen, bs, latestWord):
-                To make 3 or more length frequent patterns from pattern which latest word is in different seq  by depth-first search technique  and update xlenDatabase to sequential database
-        makeNextRow(bs, latestWord, latestWord2):
-                   To make pattern row when two patterns have latest word in different sequence
-        makeNextRowSame(bs, latestWord, latestWord2):
-                    To make pattern row when one pattern have latestWord1 in different sequence and other(latestWord2) in same
-        makeNextRowSame2(bs, latestWord, latestWord2):
-                    To make pattern row when two patterns have latest word in same sequence
-        makeNextRowSame3(bs, latestWord, latestWord2):
-              To make pattern row when two patterns have latest word in different sequence and both latest word is in same sequence
 
 
     **Executing the code on terminal:**
@@ -230,16 +200,17 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
     _memoryUSS = float()
     _memoryRSS = float()
     _Database = []
-    _xLenDatabase = {}
-    _xLenDatabaseSame = {}
     _NeighboursMap = {}
-    _failPatterns = {}
+    _names = []
 
     def _creatingItemSets(self):
         """
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
+        if _sequenceDatabase.isSequenceDatabase(self._iFile):
+            self._Database = _sequenceDatabase.load(self._iFile)
+            return
 
         if isinstance(self._iFile, _ab._pd.DataFrame):
             temp = []
@@ -261,38 +232,11 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
                     addList.append(temp[k + 1])
             self._Database.append(addList)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    temp.pop()
-                    self._Database.append(temp)
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split('-1')]
-                            temp = [x for x in temp if x]
-                            temp.pop()
-
-                            seq = []
-                            for i in temp:
-                                k = -2
-                                if len(i) > 1:
-                                    seq.append(list(sorted(set(i.split()))))
-
-                                else:
-                                    seq.append(i)
-
-                            self._Database.append(seq)
-
-                except IOError:
-                    print("File Not Found")
-                    quit()
+            try:
+                self._Database = _sequenceDatabase.load(self._iFile, self._sep)
+            except IOError:
+                print("File Not Found")
+                quit()
 
     def _convert(self, value):
         """
@@ -353,680 +297,31 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
                     print("File Not Found")
                     quit()
 
-    def Prune(self, startline):
-        """
-        To check k-1 length patterns are not failed.
-        :param startline: start line of the pattern
-        :type startline: int
-        """
-        for i in range(len(startline) - 1):
-            if startline[i] != -1 and startline[i] != -2:
-                copyline = [j for j in startline]
-                if i == 0 and copyline[i + 1] == -1:
-                    copyline.remove(copyline[i])
-                    copyline.remove(copyline[i])
-                elif copyline[i - 1] == -1 and copyline[i + 1] == -1:
-                    copyline.remove(copyline[i])
-                    copyline.remove(copyline[i])
-                else:
-                    copyline.remove(copyline[i])
-                if str(tuple(copyline)) in self._failPatterns.keys():
-                    return 0
-
-        return 1
-
-    def make1LenDatabase(self):
-        """
-        To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database
-        """
-
-        idDatabase = {}
-        alreadyInData = []
-        lineNumber = 0
-        alreadyInLine = {}
-        for line in self._Database:
-            seqNumber = 0
-            for seq in line:
-
-                for data in seq:
-                    if data in alreadyInData:
-                        if lineNumber in alreadyInLine[data]:
-                            idDatabase[data][lineNumber].append(seqNumber)
-                        else:
-                            idDatabase[data][lineNumber] = []
-                            idDatabase[data][lineNumber].append(seqNumber)
-                            alreadyInLine[data].append(lineNumber)
-                    else:
-                        idDatabase[data] = {}
-                        idDatabase[data][lineNumber] = []
-                        idDatabase[data][lineNumber].append(seqNumber)
-                        alreadyInData.append(data)
-                        alreadyInLine[data] = []
-                        alreadyInLine[data].append(lineNumber)
-
-                seqNumber += 1
-            lineNumber += 1
-
-        newDatabase = {i: idDatabase[i] for i in idDatabase.keys()}
-        for key in idDatabase.keys():
-            if len(idDatabase[key].keys()) < self._minSup:
-                newDatabase.pop(key)
-            else:
-                self._finalPatterns[str((key, -1))] = len(idDatabase[key].keys())
-        self._Database = newDatabase
-
-    def make2LenDatabase(self):
-        """
-        To make 2 length frequent patterns by joining two one length patterns by breadth-first search technique  and update xlenDatabase to sequential database
-        """
-        self._xLenDatabase = {}
-        keyList = [i for i in self._Database.keys()]
-        nextDatabase = {i: {} for i in self._Database.keys()}
-        nextDatabaseSame = {i: {} for i in self._Database.keys()}
-        keyNumber = -1
-        for key1 in keyList:
-            keyNumber += 1
-            for key2 in keyList[keyNumber:]:
-                if key1 != key2:
-                    if key1 in self._NeighboursMap.keys() and key2 in self._NeighboursMap.keys():
-                        if key1 in self._NeighboursMap[key2]:
-
-                            if len(self._Database[key1].keys()) >= len(self._Database[key1].keys()):
-                                nextDatabase[key1][key2] = {}
-                                nextDatabase[key2][key1] = {}
-                                nextDatabaseSame[key1][key2] = {}
-
-                                for seq in self._Database[key2].keys():
-                                    if seq in self._Database[key1].keys():
-                                        x = [i for i in self._Database[key1][seq] if i > self._Database[key2][seq][0]]
-                                        if len(x) != 0:
-                                            nextDatabase[key2][key1][seq] = x
-                                        x = [i for i in self._Database[key2][seq] if i > self._Database[key1][seq][0]]
-                                        if len(x) != 0:
-                                            nextDatabase[key1][key2][seq] = x
-                                        x = list(
-                                            sorted(set(self._Database[key1][seq]) & set(self._Database[key2][seq])))
-                                        if len(x) != 0:
-                                            nextDatabaseSame[key1][key2][seq] = x
-                            else:
-                                nextDatabase[key1][key2] = {}
-                                nextDatabase[key2][key1] = {}
-                                nextDatabaseSame[key1][key2] = {}
-
-                                for seq in self._Database[key1].keys():
-                                    x = [i for i in self._Database[key1][seq] if
-                                         i > self._Database[key2][seq][0]]
-                                    if len(x) != 0:
-                                        nextDatabase[key2][key1][seq] = 0
-                                    x = [i for i in self._Database[key2][seq] if
-                                         i > self._Database[key1][seq][0]]
-                                    if len(x) != 0:
-                                        nextDatabase[key1][key2][seq] = x
-                                    x = list(
-                                        sorted(set(self._Database[key1][seq]) & set(self._Database[key2][seq])))
-                                    if len(x) != 0:
-                                        nextDatabaseSame[key1][key2][seq] = x
-                else:
-                    nextDatabase[key1][key2] = {}
-                    for seq in self._Database[key2].keys():
-                        if len(self._Database[key1][seq]) >= 2:
-                            nextDatabase[key1][key2][seq] = self._Database[key2][seq][1:]
-        self._xLenDatabase[2] = {tuple([i]): {} for i in nextDatabase.keys()}
-        for key1 in nextDatabase.keys():
-            for key2 in nextDatabase[key1].keys():
-                if len(nextDatabase[key1][key2].keys()) >= self._minSup:
-                    self._finalPatterns[str((key1, -1, key2, -1))] = len(nextDatabase[key1][key2].keys())
-                    self._xLenDatabase[2][tuple([key1])][key2] = nextDatabase[key1][key2]
-                else:
-                    self._failPatterns[str((key1, -1, key2, -1))] = len(nextDatabase[key1][key2].keys())
-        self._xLenDatabaseSame[2] = {tuple([i]): {} for i in nextDatabaseSame.keys()}
-        for key1 in nextDatabaseSame.keys():
-            for key2 in nextDatabaseSame[key1].keys():
-                if len(nextDatabaseSame[key1][key2].keys()) >= self._minSup:
-                    self._finalPatterns[str((key1, key2, -1))] = len(nextDatabaseSame[key1][key2].keys())
-                    self._xLenDatabaseSame[2][tuple([key1])][key2] = {i: nextDatabaseSame[key1][key2][i] for i in
-                                                                      nextDatabaseSame[key1][key2].keys()}
-                    self._xLenDatabaseSame[2][tuple([key2])][key1] = {i: nextDatabaseSame[key1][key2][i] for i in
-                                                                      nextDatabaseSame[key1][key2].keys()}
-                else:
-                    self._failPatterns[str((key1, key2, -1))] = len(nextDatabase[key1][key2].keys())
-
-    def makexLenData(self, x):
-        """
-        To call each x length patterns to make x+1 length frequent patterns depth-first search technique
-
-        :param x: User specified x value to make it as Sequential Database
-        :type x: int
-        """
-        for i in self._xLenDatabase[x].keys():
-            for k in self._xLenDatabase[x][i].keys():
-                self.makexLenDatabase(x, i, k)
-                if len(self._xLenDatabase[x + 1]) > 0 or len(self._xLenDatabaseSame[x + 1]) > 0:
-                    self.makexLenData(x + 1)
-                    self._xLenDatabase[x + 1] = {}
-                    self._xLenDatabaseSame[x + 1] = {}
-
-        for i in self._xLenDatabaseSame[x].keys():
-            for k in self._xLenDatabaseSame[x][i].keys():
-                self.makexLenDatabaseSame(x, i, k)
-                if len(self._xLenDatabaseSame[x + 1]) > 0 or len(self._xLenDatabase[x + 1]) > 0:
-                    self.makexLenData(x + 1)
-                    self._xLenDatabaseSame[x + 1] = {}
-                    self._xLenDatabase[x + 1] = {}
-
-    def makexLenDatabase(self, rowLen, bs, latestWord):
+    def _patternName(self, pattern):
         """
-        To make "rowLen" length frequent patterns from pattern which the latest word is in same seq  by joining "rowLen"-1 length patterns by depth-first search technique  and update xlenDatabase to sequential database
-
-        :param rowLen: row length of patterns.
-        :type rowLen: int
-        :param bs : patterns without the latest one
-        :type bs: int
-        :param latestWord : latest word of patterns
-        :type latestWord: str
-        """
-        if rowLen + 1 not in self._xLenDatabase:
-            self._xLenDatabase[rowLen + 1] = {}
-            self._xLenDatabaseSame[rowLen + 1] = {}
-
-        for latestWord2 in self._xLenDatabase[rowLen][bs].keys():
-            if latestWord != latestWord2:
-                if latestWord in self._NeighboursMap[latestWord2]:
-                    nextRow, nextbs, nextlate = self.makeNextRowSame3(bs, latestWord, latestWord2)
-                    if self.Prune(list(nextRow)) == 1:
-                        self.makeSame(rowLen, bs, latestWord, latestWord2)
-                    nextRow, nextbs = self.makeNextRow(bs, latestWord2, latestWord)
-                    if self.Prune(list(nextRow)) == 1:
-                        self.makeLater(rowLen, bs, latestWord, latestWord2)
-                    nextRow, nextbs = self.makeNextRow(bs, latestWord, latestWord2)
-                    if self.Prune(list(nextRow)) == 1:
-                        self.makeFaster(rowLen, bs, latestWord, latestWord2)
-
+        To convert a pattern of item ids to the pattern of item names
 
-
-            else:
-                next = {}
-                for seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                    if len(self._xLenDatabase[rowLen][bs][latestWord][seq]) >= 2:
-                        next[seq] = self._xLenDatabase[rowLen][bs][latestWord][seq][1:]
-                if len(next) >= self._minSup:
-                    nextRow, nextbs = self.makeNextRow(bs, latestWord, latestWord2)
-                    if str(nextRow) not in self._finalPatterns.keys():
-                        if nextbs not in self._xLenDatabase[rowLen + 1]:
-                            self._xLenDatabase[rowLen + 1][nextbs] = {}
-                        self._finalPatterns[str(nextRow)] = len(next)
-                        self._xLenDatabase[rowLen + 1][nextbs][latestWord2] = {i: next[i] for i in next}
-                    else:
-                        if nextbs not in self._xLenDatabase[rowLen + 1]:
-                            self._xLenDatabase[rowLen + 1][nextbs] = {}
-                        self._xLenDatabase[rowLen + 1][nextbs][latestWord2] = {i: next[i] for i in next}
-                else:
-                    nextRow, nextbs = self.makeNextRow(bs, latestWord, latestWord2)
-                    self._failPatterns[str(nextRow)] = len(next)
-        if bs in self._xLenDatabaseSame[rowLen]:
-            for latestWord2 in self._xLenDatabaseSame[rowLen][bs]:
-                if latestWord in self._NeighboursMap[latestWord2]:
-                    nextRow, nextbs = self.makeNextRowSame(bs, latestWord2, latestWord)
-                    if self.Prune(nextRow) == 1:
-                        self.makeSame2(rowLen, bs, latestWord, latestWord2)
-
-    def makeSame(self, rowLen, bs, latestWord, latestWord2):
+        :param pattern: the pattern as a tuple of itemsets of item ids
+        :type pattern: tuple
+        :return: the pattern as it is stored in the final patterns, every itemset followed by -1
+        :rtype: str
         """
-        to check the pattern is frequent or not (ex a-bc from a-c and a-b )
-
-        :param rowLen: row length of patterns.
-        :type rowLen: int
-        :param bs: patterns without the latest one
-        :type bs: int
-        :param latestWord: latest word of patterns
-        :type latestWord: str
-        :param latestWord2: latest word of other previous pattern in different sequence
-        :type latestWord2: str
+        row = []
+        for itemSet in pattern:
+            row.extend(self._names[i] for i in itemSet)
+            row.append(-1)
+        return str(tuple(row))
 
+    def _savePattern(self, pattern, support):
         """
-        if len(self._xLenDatabase[rowLen][bs][latestWord].keys()) <= len(
-                self._xLenDatabase[rowLen][bs][latestWord2].keys()):
-            nextSame = {}
-
-            for seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                if seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                    if self._xLenDatabase[rowLen][bs][latestWord2][seq] != [] and \
-                            self._xLenDatabase[rowLen][bs][latestWord][seq] != []:
-                        x = list(sorted(set(self._xLenDatabase[rowLen][bs][latestWord][seq]) & set(
-                            self._xLenDatabase[rowLen][bs][latestWord2][seq])))
-                        if len(x) != 0:
-                            nextSame[seq] = x
-            if len(nextSame) >= self._minSup:
-                nextRow, nextbs, nextlste = self.makeNextRowSame3(bs, latestWord, latestWord2)
-                if str(nextRow) not in self._finalPatterns.keys():
-                    if nextbs not in self._xLenDatabaseSame[rowLen + 1]:
-                        self._xLenDatabaseSame[rowLen + 1][nextbs] = {}
-                    self._finalPatterns[str(nextRow)] = len(nextSame)
-                    self._xLenDatabaseSame[rowLen + 1][nextbs][nextlste] = {i: nextSame[i] for i in nextSame}
-                else:
-                    if nextbs not in self._xLenDatabaseSame[rowLen + 1]:
-                        self._xLenDatabaseSame[rowLen + 1][nextbs] = {}
-                    self._xLenDatabaseSame[rowLen + 1][nextbs][nextlste] = {i: nextSame[i] for i in nextSame}
-            else:
-                nextRow, nextbs, nextlste = self.makeNextRowSame3(bs, latestWord, latestWord2)
-                self._failPatterns[str(nextRow)] = len(nextSame)
-
-
-        else:
-            nextSame = {}
-
-            for seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                if seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                    if self._xLenDatabase[rowLen][bs][latestWord2][seq] != [] and \
-                            self._xLenDatabase[rowLen][bs][latestWord][seq] != []:
-                        x = list(sorted(set(self._xLenDatabase[rowLen][bs][latestWord][seq]) & set(
-                            self._xLenDatabase[rowLen][bs][latestWord2][seq])))
-                        if len(x) != 0:
-                            nextSame[seq] = x
-            if len(nextSame) >= self._minSup:
-                nextRow, nextbs, nextlate = self.makeNextRowSame3(bs, latestWord, latestWord2)
-                if str(nextRow) not in self._finalPatterns.keys():
-                    if nextbs not in self._xLenDatabaseSame[rowLen + 1]:
-                        self._xLenDatabaseSame[rowLen + 1][nextbs] = {}
-                    self._finalPatterns[str(nextRow)] = len(nextSame)
-                    self._xLenDatabaseSame[rowLen + 1][nextbs][nextlate] = {i: nextSame[i] for i in nextSame}
-                else:
-                    if nextbs not in self._xLenDatabaseSame[rowLen + 1]:
-                        self._xLenDatabaseSame[rowLen + 1][nextbs] = {}
-                    self._xLenDatabaseSame[rowLen + 1][nextbs][nextlate] = {i: nextSame[i] for i in nextSame}
-            else:
-                nextRow, nextbs, nextlate = self.makeNextRowSame3(bs, latestWord, latestWord2)
-                self._failPatterns[str(nextRow)] = len(nextSame)
+        To store a georeferenced frequent pattern found by the search
 
-    def makeFaster(self, rowLen, bs, latestWord, latestWord2):
-        """
-        To check the pattern is frequent or not (ex a-b-c from a-c a-b)
-
-        :param rowLen: row length of patterns.
-        :type rowLen: int
-        :param bs: patterns without the latest one
-        :type bs: int
-        :param latestWord: latest word of patterns
-        :type latestWord: str
-        :param latestWord2: latest word of other previous pattern in different sequence
-        :type latestWord2: str
+        :param pattern: the pattern as a tuple of itemsets of item ids
+        :type pattern: tuple
+        :param support: the support of the pattern
+        :type support: int
         """
-        if len(self._xLenDatabase[rowLen][bs][latestWord].keys()) <= len(
-                self._xLenDatabase[rowLen][bs][latestWord2].keys()):
-            next = {}
-
-            for seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                if seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                    if self._xLenDatabase[rowLen][bs][latestWord2][seq] != [] and \
-                            self._xLenDatabase[rowLen][bs][latestWord][seq] != []:
-                        x = [i for i in self._xLenDatabase[rowLen][bs][latestWord2][seq] if
-                             i > self._xLenDatabase[rowLen][bs][latestWord][seq][0]]
-                        if len(x) != 0:
-                            next[seq] = x
-            if len(next) >= self._minSup:
-                nextRow, nextbs = self.makeNextRow(bs, latestWord, latestWord2)
-                if str(nextRow) not in self._finalPatterns.keys():
-                    self._finalPatterns[str(nextRow)] = len(next)
-                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                    self._xLenDatabase[rowLen + 1][nextbs][latestWord2] = {i: next[i] for i in next}
-                else:
-                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                    self._xLenDatabase[rowLen + 1][nextbs][latestWord2] = {i: next[i] for i in next}
-            else:
-                nextRow, nextbs = self.makeNextRow(bs, latestWord, latestWord2)
-                self._failPatterns[str(nextRow)] = len(next)
-
-        else:
-            next = {}
-
-            for seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                if seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                    if self._xLenDatabase[rowLen][bs][latestWord2][seq] != [] and \
-                            self._xLenDatabase[rowLen][bs][latestWord][seq] != []:
-                        x = [i for i in self._xLenDatabase[rowLen][bs][latestWord2][seq] if
-                             i > self._xLenDatabase[rowLen][bs][latestWord][seq][0]]
-                        if len(x) != 0:
-                            next[seq] = x
-            if len(next) >= self._minSup:
-                nextRow, nextbs = self.makeNextRow(bs, latestWord, latestWord2)
-                if str(nextRow) not in self._finalPatterns.keys():
-                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                    self._finalPatterns[str(nextRow)] = len(next)
-                    self._xLenDatabase[rowLen + 1][nextbs][latestWord2] = {i: next[i] for i in next}
-                else:
-                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                    self._xLenDatabase[rowLen + 1][nextbs][latestWord2] = {i: next[i] for i in next}
-            else:
-                nextRow, nextbs = self.makeNextRow(bs, latestWord, latestWord2)
-                self._failPatterns[str(nextRow)] = len(next)
-
-    def makeLater(self, rowLen, bs, latestWord, latestWord2):
-        """
-        To check the pattern is frequent or not (ex ac-b from a-b ac)
-
-        :param rowLen : row length of patterns.
-        :type rowLen: int
-        :param bs : patterns without the latest one
-        :type bs: int
-        :param latestWord : latest word of patterns
-        :type latestWord: str
-        :param latestWord2 : latest word of other previous pattern in different sequence
-        :type latestWord2: str
-        """
-
-        if len(self._xLenDatabase[rowLen][bs][latestWord].keys()) <= len(
-                self._xLenDatabase[rowLen][bs][latestWord2].keys()):
-            next2 = {}
-
-            for seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                if seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                    if self._xLenDatabase[rowLen][bs][latestWord2][seq] != [] and \
-                            self._xLenDatabase[rowLen][bs][latestWord][seq] != []:
-
-                        x = [i for i in self._xLenDatabase[rowLen][bs][latestWord][seq] if
-                             i > self._xLenDatabase[rowLen][bs][latestWord2][seq][0]]
-                        if len(x) != 0:
-                            next2[seq] = x
-            if len(next2) >= self._minSup:
-                nextRow, nextbs = self.makeNextRow(bs, latestWord2, latestWord)
-                if str(nextRow) not in self._finalPatterns.keys():
-                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                    self._finalPatterns[str(nextRow)] = len(next2)
-                    self._xLenDatabase[rowLen + 1][nextbs][latestWord] = {i: next2[i] for i in next2}
-                else:
-                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                    self._xLenDatabase[rowLen + 1][nextbs][latestWord] = {i: next2[i] for i in next2}
-            else:
-                nextRow, nextbs = self.makeNextRow(bs, latestWord2, latestWord)
-                self._failPatterns[str(nextRow)] = len(next2)
-
-        else:
-
-            next2 = {}
-
-            for seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                if seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                    if self._xLenDatabase[rowLen][bs][latestWord2][seq] != [] and \
-                            self._xLenDatabase[rowLen][bs][latestWord][seq] != []:
-                        x = [i for i in self._xLenDatabase[rowLen][bs][latestWord][seq] if
-                             i > self._xLenDatabase[rowLen][bs][latestWord2][seq][0]]
-                        if len(x) != 0:
-                            next2[seq] = x
-            if len(next2) >= self._minSup:
-                nextRow, nextbs = self.makeNextRow(bs, latestWord2, latestWord)
-                if str(nextRow) not in self._finalPatterns.keys():
-                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                    self._finalPatterns[str(nextRow)] = len(next2)
-                    self._xLenDatabase[rowLen + 1][nextbs][latestWord] = {i: next2[i] for i in next2}
-                else:
-                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                    self._xLenDatabase[rowLen + 1][nextbs][latestWord] = {i: next2[i] for i in next2}
-            else:
-                nextRow, nextbs = self.makeNextRow(bs, latestWord2, latestWord)
-                self._failPatterns[str(nextRow)] = len(next2)
-
-    def makeSame2(self, rowLen, bs, latestWord, latestWord2):
-        """
-        to check the pattern is frequent or not (ex a-bc from a-c ab)
-
-        :param rowLen: row length of patterns.
-        :type rowLen: int
-        :param bs : patterns without the latest one
-        :type bs: int
-        :param latestWord : latest word of patterns
-        :type latestWord: str
-        :param latestWord2 : latest word of other previous pattern in different sequence
-        :type latestWord2: str
-        """
-        if len(self._xLenDatabase[rowLen][bs][latestWord].keys()) <= len(
-                self._xLenDatabaseSame[rowLen][bs][latestWord2].keys()):
-            next = {}
-
-            for seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                if seq in self._xLenDatabaseSame[rowLen][bs][latestWord2].keys():
-                    if self._xLenDatabaseSame[rowLen][bs][latestWord2][seq] != []:
-                        x = [i for i in self._xLenDatabase[rowLen][bs][latestWord][seq] if
-                             i > self._xLenDatabaseSame[rowLen][bs][latestWord2][seq][0]]
-                        if len(x) != 0:
-                            next[seq] = x
-            if len(next) >= self._minSup:
-
-                nextRow, nextbs = self.makeNextRowSame(bs, latestWord2, latestWord)
-                if str(nextRow) not in self._finalPatterns.keys():
-                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                    self._finalPatterns[str(nextRow)] = len(next)
-                    self._xLenDatabase[rowLen + 1][nextbs][latestWord] = {i: next[i] for i in next}
-                else:
-                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                    self._xLenDatabase[rowLen + 1][nextbs][latestWord] = {i: next[i] for i in next}
-            else:
-                nextRow, nextbs = self.makeNextRowSame(bs, latestWord2, latestWord)
-                self._failPatterns[str(nextRow)] = len(next)
-
-        else:
-            next = {}
-            for seq in self._xLenDatabaseSame[rowLen][bs][latestWord2].keys():
-                if seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                    if self._xLenDatabaseSame[rowLen][bs][latestWord2][seq] != []:
-                        x = [i for i in self._xLenDatabase[rowLen][bs][latestWord][seq] if
-                             i > self._xLenDatabaseSame[rowLen][bs][latestWord2][seq][0]]
-                        if len(x) != 0:
-                            next[seq] = x
-            if len(next) >= self._minSup:
-                nextRow, nextbs = self.makeNextRowSame(bs, latestWord2, latestWord)
-                if str(nextRow) not in self._finalPatterns.keys():
-                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                    self._finalPatterns[str(nextRow)] = len(next)
-                    self._xLenDatabase[rowLen + 1][nextbs][latestWord] = {i: next[i] for i in next}
-
-                else:
-                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                    self._xLenDatabase[rowLen + 1][nextbs][latestWord] = {i: next[i] for i in next}
-            else:
-                nextRow, nextbs = self.makeNextRowSame(bs, latestWord2, latestWord)
-                self._failPatterns[str(nextRow)] = len(next)
-
-    def makeSame3(self, rowLen, bs, latestWord, latestWord2):
-        """
-        To check the pattern is frequent or not (ex abc from ac ab)
-
-        :param rowLen: row length of patterns.
-        :type rowLen: int
-        :param bs : patterns without the latest one
-        :type bs: int
-        :param latestWord : latest word of patterns
-        :type latestWord: str
-        :param latestWord2 : latest word of other previous pattern in different sequence
-        :type latestWord2: str
-
-        """
-        if len(self._xLenDatabaseSame[rowLen][bs][latestWord].keys()) <= len(
-                self._xLenDatabaseSame[rowLen][bs][latestWord2].keys()):
-            next = {}
-
-            for seq in self._xLenDatabaseSame[rowLen][bs][latestWord].keys():
-                if seq in self._xLenDatabaseSame[rowLen][bs][latestWord2].keys():
-                    x = list(sorted(set(self._xLenDatabaseSame[rowLen][bs][latestWord][seq]) & set(
-                        self._xLenDatabaseSame[rowLen][bs][latestWord2][seq])))
-                    if len(x) != 0:
-                        next[seq] = x
-            if len(next) >= self._minSup:
-
-                nextRow, nextbs, nextLate = self.makeNextRowSame2(bs, latestWord, latestWord2)
-                if str(nextRow) not in self._finalPatterns.keys():
-                    if nextbs not in self._xLenDatabaseSame[rowLen + 1]:
-                        self._xLenDatabaseSame[rowLen + 1][nextbs] = {}
-
-                    self._finalPatterns[str(nextRow)] = len(next)
-                    self._xLenDatabaseSame[rowLen + 1][nextbs][nextLate] = {i: next[i] for i in next}
-                else:
-                    if nextbs not in self._xLenDatabaseSame[rowLen + 1]:
-                        self._xLenDatabaseSame[rowLen + 1][nextbs] = {}
-                    self._xLenDatabaseSame[rowLen + 1][nextbs][nextLate] = {i: next[i] for i in next}
-            else:
-                nextRow, nextbs, nextLate = self.makeNextRowSame2(bs, latestWord, latestWord2)
-                self._failPatterns[str(nextRow)] = len(next)
-        else:
-            next = {}
-
-            for seq in self._xLenDatabaseSame[rowLen][bs][latestWord2].keys():
-                if seq in self._xLenDatabaseSame[rowLen][bs][latestWord].keys():
-                    x = list(sorted(set(self._xLenDatabaseSame[rowLen][bs][latestWord][seq]) & set(
-                        self._xLenDatabaseSame[rowLen][bs][latestWord2][seq])))
-                    if len(x) != 0:
-                        next[seq] = x
-            if len(next) >= self._minSup:
-
-                nextRow, nextbs, nextLate = self.makeNextRowSame2(bs, latestWord, latestWord2)
-                if str(nextRow) not in self._finalPatterns.keys():
-                    if nextbs not in self._xLenDatabaseSame[rowLen + 1]:
-                        self._xLenDatabaseSame[rowLen + 1][nextbs] = {}
-
-                    self._finalPatterns[str(nextRow)] = len(next)
-                    self._xLenDatabaseSame[rowLen + 1][nextbs][nextLate] = {i: next[i] for i in next}
-                else:
-                    if nextbs not in self._xLenDatabaseSame[rowLen + 1]:
-                        self._xLenDatabaseSame[rowLen + 1][nextbs] = {}
-                    self._xLenDatabaseSame[rowLen + 1][nextbs][nextLate] = {i: next[i] for i in next}
-            else:
-                nextRow, nextbs, nextLate = self.makeNextRowSame2(bs, latestWord, latestWord2)
-                self._failPatterns[str(nextRow)] = len(next)
-
-    def makexLenDatabaseSame(self, rowLen, bs, latestWord):
-        """
-        To make 3 or more length frequent patterns from pattern which the latest word is in different seq  by depth-first search technique  and update xlenDatabase to sequential database
-
-        :param rowLen: row length of patterns.
-        :type rowLen: int
-        :param bs : patterns without the latest one
-        :type bs: int
-        :param latestWord : latest word of patterns
-        :type latestWord: str
-        """
-        if rowLen + 1 not in self._xLenDatabase:
-            self._xLenDatabase[rowLen + 1] = {}
-            self._xLenDatabaseSame[rowLen + 1] = {}
-        if bs in self._xLenDatabase[rowLen]:
-            for latestWord2 in self._xLenDatabase[rowLen][bs]:
-                if latestWord in self._NeighboursMap[latestWord2]:
-                    nextRow, nextbs = self.makeNextRowSame(bs, latestWord, latestWord2)
-                    if self.Prune(nextRow) == 1:
-                        self.makeSame2(rowLen, bs, latestWord2, latestWord)
-
-        if bs in self._xLenDatabaseSame[rowLen]:
-            for latestWord2 in self._xLenDatabaseSame[rowLen][bs]:
-                if latestWord2 != latestWord:
-                    if latestWord in self._NeighboursMap[latestWord2]:
-                        nextRow, nextbs, nextLate = self.makeNextRowSame2(bs, latestWord, latestWord2)
-                        if self.Prune(nextRow) == 1:
-                            self.makeSame3(rowLen, bs, latestWord, latestWord2)
-
-    def makeNextRow(self, bs, latestWord, latestWord2):
-        """
-        To make pattern row when two patterns having the latest word in different sequence
-
-        :param bs : patterns without the latest one
-        :type bs: int
-        :param latestWord : latest word of patterns
-        :type latestWord: str
-        :param latestWord2 : latest word of other previous pattern in different sequence
-        :type latestWord2: str
-        """
-
-        bs = bs + (-1, latestWord)
-        bs2 = bs + (-1, latestWord2, -1)
-        return bs2, bs
-
-    def makeNextRowSame(self, bs, latestWord, latestWord2):
-        """
-        To make pattern row when one pattern having the latestWord in different sequence and other(latestWord2) in same
-
-        :param bs : patterns without the latest one
-        :type bs: int
-        :param latestWord : latest word of patterns
-        :type latestWord: str
-        :param latestWord2 : latest word of other previous pattern in different sequence
-        :type latestWord2: str
-        """
-
-        bs = list(bs)
-        x = 1
-        x2 = [latestWord, ]
-        while bs:
-            x = bs.pop()
-            if x != -1:
-                x2.append(x)
-            else:
-                break
-        x2 = list(sorted(set(x2)))
-        if len(bs) != 0:
-            bs = tuple(bs) + (-1,) + tuple(x2)
-        else:
-            bs = tuple(x2)
-        bs2 = tuple(bs) + (-1, latestWord2, -1)
-        return bs2, bs
-
-    def makeNextRowSame2(self, bs, latestWord, latestWord2):
-        """
-        To make pattern row when two patterns having the latest word in same sequence
-
-        param bs : patterns without the latest one
-        :type bs: int
-        :param latestWord : latest word of patterns
-        :type latestWord: str
-        :param latestWord2 : latest word of other previous pattern in different sequence
-        :type latestWord2: str
-        """
-
-        bs = list(bs)
-        x = 1
-        x2 = [latestWord, latestWord2]
-        while bs:
-            x = bs.pop()
-            if x != -1:
-                x2.append(x)
-            else:
-                break
-        x2 = list(sorted(set(x2)))
-        x3 = x2.pop()
-        if len(bs) != 0:
-            bs = tuple(bs) + (-1,) + tuple(x2)
-        else:
-            bs = tuple(x2)
-        bs2 = tuple(bs) + (x3, -1)
-
-        return bs2, bs, x3
-
-    def makeNextRowSame3(self, bs, latestWord, latestWord2):
-        """
-        To make pattern row when two patterns having the latest word in different sequence and both latest word is in same sequence
-
-        :param bs : patterns without the latest one
-        :type bs: int
-        :param latestWord : latest word of patterns
-        :type latestWord: str
-        :param latestWord2 : latest word of other previous pattern in different sequence
-        :type latestWord2: str
-        """
-
-        x = list(sorted({latestWord, latestWord2}))
-        x2 = x.pop()
-        x3 = x.pop()
-        bs = bs + (-1, x3)
-        bs2 = bs + (x2, -1)
-        return bs2, bs, x2
+        self._finalPatterns[self._patternName(pattern)] = support
 
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
@@ -1040,20 +335,26 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
         Frequent pattern mining process will start from here
         """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
         self._mapNeighbours()
+        if not isinstance(self._Database, _sequenceDatabase.SequenceDatabase):
+            self._Database = _sequenceDatabase.fromItemsets(self._Database)
         self._minSup = self._convert(self._minSup)
-        self.make1LenDatabase()
-        self.make2LenDatabase()
-        self.makexLenData(2)
+        self._names = list(self._Database.names)
+        idLists = _spadeEngine.idLists(*self._Database.occurrences(), len(self._names))
+        lists = {item: idList for item, idList in enumerate(idLists) if idList.support >= self._minSup}
+        neighbours = _neighbourhoodEngine.NeighbourBits.fromMap(self._NeighboursMap, self._names)
+        for pattern, support in _neighbourhoodEngine.classMine(lists, self._minSup, neighbours):
+            self._savePattern(pattern, support)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
         self._memoryRSS = float()
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
-        print("Frequent patterns were generated successfully using Apriori algorithm ")
+        print("Georeferenced frequent sequential patterns were generated successfully using GFSPminer algorithm ")
 
     def getMemoryUSS(self):
         """
@@ -0,0 +1,232 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Neighbourhood-constrained sequential pattern mining for the georeferenced sequential miners.
+
+A georeferenced sequential pattern is a frequent sequential pattern whose items are all neighbours of each other, where
+two items are neighbours when either of them lists the other in the neighbourhood file, and an item is a neighbour of
+itself. The neighbourhoods are read once into an item x item bitset, one row of uint64 words per item id, so that
+whether an item may extend a pattern is a single lookup instead of a scan of the neighbour lists:
+
+* in the equivalence classes of SPADE, two atoms of a class share their prefix, so their join is georeferenced iff
+  their last items are neighbours. The members of a class are filtered with one lookup in the row of the last item of
+  the atom before any id-list is joined, and the joins are the ones of spadeEngine.
+* in the pseudo-projections of PrefixSpan, an item may extend a pattern iff it is in the intersection of the rows of
+  the items of the pattern, computed once per pattern, and the extensions are the ones of prefixSpanEngine.
+"""
+
+from typing import Dict, Hashable, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as _np
+
+from PAMI.sequentialPattern.basic import parallelSearch as _parallelSearch
+from PAMI.sequentialPattern.basic import prefixSpanEngine as _prefixSpanEngine
+from PAMI.sequentialPattern.basic import spadeEngine as _spadeEngine
+
+Pattern = Tuple[Tuple[int, ...], ...]
+
+
+class NeighbourBits:
+    """
+    :Description: Symmetric item x item neighbourhood relation, as one bitset row of uint64 words per item id.
+
+    :Attributes:
+
+        bits : numpy.ndarray
+            The rows, bit j of row i is set iff the items i and j are neighbours
+
+    :Methods:
+
+        fromMap(neighbours, names)
+            Builds the bitset of a neighbour map of item names
+        adjacent(item, others)
+            Whether items are neighbours of an item
+        common(items)
+            Row of the items neighbours of all the given ones
+        allows(row, others)
+            Whether items are set in a row
+    """
+
+    __slots__ = ('bits',)
+
+    def __init__(self, bits: _np.ndarray) -> None:
+        self.bits = bits
+
+    @classmethod
+    def fromMap(cls, neighbours: Dict[Hashable, Iterable[Hashable]], names: Sequence[Hashable]) -> 'NeighbourBits':
+        """
+        Builds the bitset of a neighbour map, the names missing in the database are ignored
+
+        :param neighbours: the names of the neighbours of an item name
+        :type neighbours: dict
+        :param names: the name of every item id
+        :type names: list
+        :return: the bitset, every item being a neighbour of itself
+        :rtype: NeighbourBits
+        """
+        ids = {name: i for i, name in enumerate(names)}
+        pairs = [(ids[item], ids[other]) for item, others in neighbours.items() if item in ids
+                 for other in others if other in ids]
+        rows = _np.array([i for i, _ in pairs] + list(range(len(names))), dtype=_np.int64)
+        columns = _np.array([j for _, j in pairs] + list(range(len(names))), dtype=_np.int64)
+        rows, columns = _np.concatenate((rows, columns)), _np.concatenate((columns, rows))
+        bits = _np.zeros((len(names), (len(names) + 63) // 64), dtype=_np.uint64)
+        _np.bitwise_or.at(bits, (rows, columns >> 6), _np.left_shift(_np.uint64(1), (columns & 63).astype(_np.uint64)))
+        return cls(bits)
+
+    @staticmethod
+    def allows(row: _np.ndarray, others: _np.ndarray) -> _np.ndarray:
+        """
+        Whether items are set in a row of the bitset
+
+        :param row: a row of uint64 words
+        :type row: numpy.ndarray
+        :param others: item ids
+        :type others: numpy.ndarray
+        :return: the mask of the items set in the row
+        :rtype: numpy.ndarray
+        """
+        others = _np.asarray(others, dtype=_np.int64)
+        return ((row[others >> 6] >> (others & 63).astype(_np.uint64)) & _np.uint64(1)).astype(bool)
+
+    def adjacent(self, item: int, others: _np.ndarray) -> _np.ndarray:
+        """
+        Whether items are neighbours of an item
+
+        :param item: an item id
+        :type item: int
+        :param others: item ids
+        :type others: numpy.ndarray
+        :return: the mask of the neighbours of item
+        :rtype: numpy.ndarray
+        """
+        return self.allows(self.bits[item], others)
+
+    def common(self, items: Iterable[int]) -> _np.ndarray:
+        """
+        Row of the items which are neighbours of all the given ones
+
+        :param items: item ids
+        :type items: iterable
+        :return: the intersection of the rows of the items
+        :rtype: numpy.ndarray
+        """
+        return _np.bitwise_and.reduce(self.bits[_np.fromiter(set(items), dtype=_np.int64)], axis=0)
+
+
+class NeighbourClassSpace(_spadeEngine.ClassSpace):
+    """
+    :Description: Search space of SPADE restricted to the georeferenced patterns. The atoms of a class are joined only
+                  with the atoms whose last item is a neighbour of their own.
+
+    :Attributes:
+
+        minSup : int
+            The minimum support of a pattern
+        neighbours : NeighbourBits
+            The neighbourhoods of the items
+    """
+
+    def __init__(self, lists: Dict[int, _spadeEngine.IdList], minSup: int, neighbours: NeighbourBits) -> None:
+        super().__init__(lists, minSup)
+        self.neighbours = neighbours
+
+    def _members(self, task: tuple) -> list:
+        members = super()._members(task)
+        if not members:
+            return members
+        items = _np.array([other[-1][-1] for other, _, _ in members], dtype=_np.int64)
+        keep = self.neighbours.adjacent(task[0][0][-1][-1], items)
+        return [atom for atom, joinable in zip(members, keep.tolist()) if joinable]
+
+
+class NeighbourProjectionSpace(_prefixSpanEngine.ProjectionSpace):
+    """
+    :Description: Search space of PrefixSpan restricted to the georeferenced patterns. The extensions of a pattern are
+                  the ones whose item is a neighbour of all the items of the pattern.
+
+    :Attributes:
+
+        store : SequenceStore
+            The sequence database, without the infrequent items
+        minSup : float
+            The minimum support
+        maxLength : float
+            The largest number of itemsets of a pattern
+        maxGap : float
+            The consecutive itemsets of a pattern match less than maxGap itemsets apart
+        neighbours : NeighbourBits
+            The neighbourhoods of the items
+    """
+
+    def __init__(self, store: _prefixSpanEngine.SequenceStore, minSup: float, neighbours: NeighbourBits,
+                 maxLength: float = float("inf"), maxGap: float = float("inf")) -> None:
+        super().__init__(store, minSup, maxLength, maxGap)
+        self.neighbours = neighbours
+
+    def _extensions(self, pattern: Pattern, positions: _np.ndarray) \
+            -> Tuple[Dict[int, _np.ndarray], Dict[int, _np.ndarray]]:
+        row = self.neighbours.common(item for itemSet in pattern for item in itemSet)
+        extensions = []
+        for projections in super()._extensions(pattern, positions):
+            items = _np.fromiter(projections, dtype=_np.int64, count=len(projections))
+            keep = self.neighbours.allows(row, items)
+            extensions.append({item: projections[item] for item in items[keep].tolist()})
+        return extensions[0], extensions[1]
+
+
+def classMine(lists: Dict[int, _spadeEngine.IdList], minSup: int, neighbours: NeighbourBits) \
+        -> Iterator[Tuple[Pattern, int]]:
+    """
+    Georeferenced patterns by the equivalence classes of SPADE
+
+    :param lists: the id-list of every frequent item id
+    :type lists: dict
+    :param minSup: the minimum support
+    :type minSup: int
+    :param neighbours: the neighbourhoods of the items
+    :type neighbours: NeighbourBits
+    :return: every georeferenced frequent pattern with its support
+    :rtype: iterator
+    """
+    space = NeighbourClassSpace(lists, minSup, neighbours)
+    for root in space.roots():
+        yield root[0][0], root[0][2].support
+        yield from _parallelSearch.subtree(space, root)
+
+
+def projectionMine(store: _prefixSpanEngine.SequenceStore, minSup: float, neighbours: NeighbourBits,
+                   maxLength: float = float("inf"), maxGap: float = float("inf")) -> Iterator[Tuple[Pattern, int]]:
+    """
+    Georeferenced patterns by the pseudo-projections of PrefixSpan
+
+    :param store: the sequence database
+    :type store: SequenceStore
+    :param minSup: the minimum support
+    :type minSup: float
+    :param neighbours: the neighbourhoods of the items
+    :type neighbours: NeighbourBits
+    :param maxLength: the largest number of itemsets of a pattern
+    :type maxLength: float
+    :param maxGap: the consecutive itemsets of a pattern match less than maxGap itemsets apart
+    :type maxGap: float
+    :return: every georeferenced frequent pattern with its support
+    :rtype: iterator
+    """
+    space = NeighbourProjectionSpace(store, minSup, neighbours, maxLength, maxGap)
+    for root in space.roots():
+        yield root[0], space.store.support(root[1])
+        yield from _parallelSearch.subtree(space, root)
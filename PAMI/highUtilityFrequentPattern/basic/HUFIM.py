@@ -55,6 +55,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.highUtilityFrequentPattern.basic import abstract as _ab
+from PAMI.highUtilityPattern.basic import efimEngine as _efimEngine
 from typing import List, Dict, Union
 from deprecated import deprecated
 
@@ -71,58 +72,23 @@ class _Transaction:
             A list of utilities of items in transaction
         transactionUtility: int
             represent total sum of all utilities in the database
-        prefixUtility:
-            prefix Utility values of item
-        offset:
-            an offset pointer, used by projected transactions
-        support:
-            maintains the support of the transaction
 
     :Methods:
 
-        projectedTransaction(offsetE)
-            A method to create new Transaction from existing starting from offsetE until the end
         getItems()
             return items in transaction
         getUtilities()
             return utilities in transaction
-        getLastPosition()
-            return last position in a transaction
         removeUnpromisingItems()
             A method to remove items which are having low values when compared with minUtil
         insertionSort()
             A method to sort all items in the transaction
-        getSupport()
-            returns the support of the transaction
     """
-    offset = 0
-    prefixUtility = 0
-    support = 1
 
     def __init__(self, items: List[int], utilities: List[int], transactionUtility: int) -> None:
         self.items = items
         self.utilities = utilities
         self.transactionUtility = transactionUtility
-        self.support = 1
-
-    def projectTransaction(self, offsetE: int) -> '_Transaction':
-        """
-        A method to create new Transaction from existing transaction starting from offsetE until the end
-
-        :param offsetE: an offset over the original transaction for projecting the transaction
-        :type offsetE: int
-        :return: a new transaction starting from offsetE until the end of the transaction
-        :rtype: _Transaction
-        """
-        new_transaction = _Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        new_transaction.prefixUtility = self.prefixUtility + utilityE
-        new_transaction.transactionUtility = self.transactionUtility - utilityE
-        new_transaction.support = self.support
-        for i in range(self.offset, offsetE):
-            new_transaction.transactionUtility -= self.utilities[i]
-        new_transaction.offset = offsetE + 1
-        return new_transaction
 
     def getItems(self) -> List[int]:
         """
@@ -142,25 +108,6 @@ class _Transaction:
         """
         return self.utilities
 
-    def getLastPosition(self) -> int:
-        """
-        A method to return last position in a transaction
-        :return: the last position in a transaction
-        :rtype: int
-        """
-
-        return len(self.items) - 1
-
-    def getSupport(self) -> int:
-        """
-        A method to return support in a transaction
-
-        :return: the support in a transaction
-        :rtype: int
-        """
-
-        return self.support
-
     def removeUnpromisingItems(self, oldNamesToNewNames: Dict[int, int]) -> None:
         """
         A method to remove items which are not present in the map passed to the function
@@ -378,10 +325,10 @@ class HUFIM(_ab._utilityPatterns):
             set of high utility frequent itemSets
         candidateCount: int
              Number of candidates 
-        utilityBinArrayLU: list
-             A map to hold the local utility values of the items in database
-        utilityBinArraySU: list
-            A map to hold the subtree utility values of the items is database
+        utilityBinArrayLU: numpy.ndarray
+             Local utility values of the items in the projected database, indexed by the new name of the items
+        utilityBinArraySU: numpy.ndarray
+            Subtree utility values of the items in the projected database, indexed by the new name of the items
         oldNamesToNewNames: list
             A map which contains old names, new names of items as key value pairs
         newNamesToOldNames: list
@@ -415,20 +362,16 @@ class HUFIM(_ab._utilityPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
         getRuntime()
                Total amount of runtime taken by the mining process will be retrieved from this function
-        backTrackingHUFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
+        getMergeRatio()
+               Fraction of the projected transactions merged into identical ones will be retrieved from this function
+        backTrackingHUFIM(databaseOfP, itemsToKeep, itemsToExplore, prefixLength)
                A method to mine the RHUIs Recursively
-        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep)
+        useUtilityBinArraysToCalculateUpperBounds(databasePe, j, itemsToKeep)
                A method to calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method to output a relative-high-utility itemSet to file or memory depending on what the user chose
-        isEqual(transaction1, transaction2)
-               A method to Check if two transaction are identical
-        useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
-              A method to calculate the sub tree utility values for single items
-        sortDatabase(self, transactions)
-              A Method to sort transaction
-        sortTransaction(self, trans1, trans2)
-              A Method to sort transaction
+        buildDatabase()
+              A method to store the renamed transactions as a projected database, merging the identical transactions
         useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
              A method to calculate local utility values for single itemSets
 
@@ -509,6 +452,8 @@ class HUFIM(_ab._utilityPatterns):
     _minSup = 0
     _memoryUSS = float()
     _memoryRSS = float()
+    _projectedTransactions = 0
+    _mergedTransactions = 0
 
     def __init__(self, iFile: str, minUtil: Union[int, float], minSup: Union[int, float], sep: str="\t") -> None:
         super().__init__(iFile, minUtil, minSup, sep)
@@ -551,7 +496,11 @@ class HUFIM(_ab._utilityPatterns):
         """
         self._startTime = _ab._time.time()
         self._finalPatterns = {}
-        self._dataset = []
+        self._utilityBinArrayLU = {}
+        self._oldNamesToNewNames = {}
+        self._newNamesToOldNames = {}
+        self._projectedTransactions = 0
+        self._mergedTransactions = 0
         self._dataset = _Dataset(self._iFile, self._sep)
         self._singleItemSetsSupport = _ab._defaultdict(int)
         self._singleItemSetsUtility = _ab._defaultdict(int)
@@ -569,14 +518,7 @@ class HUFIM(_ab._utilityPatterns):
             self._newNamesToOldNames[currentName] = item
             itemsToKeep[idx] = currentName
             currentName += 1
-        for transaction in self._dataset.getTransactions():
-            transaction.removeUnpromisingItems(self._oldNamesToNewNames)
-        self._sortDatabase(self._dataset.getTransactions())
-        emptyTransactionCount = 0
-        for transaction in self._dataset.getTransactions():
-            if len(transaction.getItems()) == 0:
-                emptyTransactionCount += 1
-        self._dataset.transactions = self._dataset.transactions[emptyTransactionCount:]
+        database = self._buildDatabase()
         # calculating suffix utility values
         totalUtility = 0
         for item in itemsToKeep:
@@ -589,12 +531,14 @@ class HUFIM(_ab._utilityPatterns):
                 totalUtility -= self._singleItemSetsUtility[self._newNamesToOldNames[item]]
             else:
                 break
-        self._useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self._dataset)
+        keep = _ab._np.zeros(currentName, dtype=bool)
+        keep[itemsToKeep] = True
+        self._utilityBinArrayLU, self._utilityBinArraySU = database.utilityBins(keep, currentName)
         itemsToExplore = []
         for item in piItems:
             if self._utilityBinArraySU[item] >= self._minUtil:
                 itemsToExplore.append(item)
-        self._backTrackingHUFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
+        self._backTrackingHUFIM(database, itemsToKeep, itemsToExplore, 0)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -603,12 +547,31 @@ class HUFIM(_ab._utilityPatterns):
         self._memoryRSS = process.memory_info().rss
         print("High Utility Frequent patterns were generated successfully using HUFIM algorithm")
 
-    def _backTrackingHUFIM(self, transactionsOfP: List[_Transaction], itemsToKeep: List[int], itemsToExplore: List[int], prefixLength: int) -> None:
+    def _buildDatabase(self) -> '_efimEngine.ProjectedDatabase':
+        """
+        A method to rename the promising items of the transactions and store them as a projected database, merging
+        the identical transactions
+
+        :return: the database of the non-empty transactions
+        :rtype: _efimEngine.ProjectedDatabase
+        """
+        items = []
+        utilities = []
+        transactionUtilities = []
+        for transaction in self._dataset.getTransactions():
+            transaction.removeUnpromisingItems(self._oldNamesToNewNames)
+            if len(transaction.getItems()) > 0:
+                items.append(transaction.getItems())
+                utilities.append(transaction.getUtilities())
+                transactionUtilities.append(transaction.transactionUtility)
+        return _efimEngine.ProjectedDatabase.fromTransactions(items, utilities, transactionUtilities).mergeIdentical()
+
+    def _backTrackingHUFIM(self, databaseOfP: '_efimEngine.ProjectedDatabase', itemsToKeep: List[int], itemsToExplore: List[int], prefixLength: int) -> None:
         """
         A method to mine the HUFIs Recursively
 
-        :param transactionsOfP: the list of transactions containing the current prefix P
-        :type transactionsOfP: list
+        :param databaseOfP: the projected database of the current prefix P
+        :type databaseOfP: _efimEngine.ProjectedDatabase
         :param itemsToKeep: the list of secondary items in the p-projected database
         :type itemsToKeep: list
         :param itemsToExplore: the list of primary items in the p-projected database
@@ -617,77 +580,16 @@ class HUFIM(_ab._utilityPatterns):
         :type prefixLength: int
         :return: None
         """
-        # print("###############")
-        # print("P is", [self.dataset.intToStr.get(x) for x in self.temp[:prefixLength]])
-        # print("items to explore", [self.dataset.intToStr.get(x) for x in [self.newNamesToOldNames[y] for y  in itemsToExplore]])
-        # print("items to keep", [self.dataset.intToStr.get(x) for x in [self.newNamesToOldNames[y] for y in itemsToKeep]])
-        # print("--------------")
         self._candidateCount += len(itemsToExplore)
         for idx, e in enumerate(itemsToExplore):
-            # print("exploring item", self.dataset.intToStr.get(self.newNamesToOldNames[e]))
-            transactionsPe = []
-            utilityPe = 0
-            supportPe = 0
-            previousTransaction = []
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                        supportPe += transaction.getSupport()
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction is []:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                support = previousTransaction.getSupport()
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                                previousTransaction.support = support
-                                previousTransaction.support += projectedTransaction.getSupport()
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                previousTransaction.support += projectedTransaction.getSupport()
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            supportPe += previousTransaction.getSupport()
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction is not []:
-                transactionsPe.append(previousTransaction)
-                supportPe += previousTransaction.getSupport()
-            # print("support is", supportPe)
+            utilityPe, supportPe, databasePe = databaseOfP.project(e)
+            self._projectedTransactions += databasePe.unmerged
+            self._mergedTransactions += databasePe.unmerged - len(databasePe)
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             if (utilityPe >= self._minUtil) and (supportPe >= self._minSup):
                 self._output(prefixLength, utilityPe, supportPe)
-            if supportPe >= self._minSup:
-                self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep)
+            if supportPe >= self._minSup and len(databasePe) != 0:
+                self._useUtilityBinArraysToCalculateUpperBounds(databasePe, idx, itemsToKeep)
                 newItemsToKeep = []
                 newItemsToExplore = []
                 for l in range(idx + 1, len(itemsToKeep)):
@@ -697,37 +599,25 @@ class HUFIM(_ab._utilityPatterns):
                         newItemsToKeep.append(itemK)
                     elif self._utilityBinArrayLU[itemK] >= self._minUtil:
                         newItemsToKeep.append(itemK)
-                if len(transactionsPe) != 0:
-                    self._backTrackingHUFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
+                self._backTrackingHUFIM(databasePe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
 
-    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: List[_Transaction], j: int, itemsToKeep: List[int]) -> None:
+    def _useUtilityBinArraysToCalculateUpperBounds(self, databasePe: '_efimEngine.ProjectedDatabase', j: int, itemsToKeep: List[int]) -> None:
         """
         A method to  calculate the subtree utility and local utility of all items that can extend itemSet P U {e}
 
         :Attributes:
 
-        :param transactionsPe: transactions the projected database for P U {e}
-        :type transactionsPe: list or Dataset
+        :param databasePe: the projected database for P U {e}
+        :type databasePe: _efimEngine.ProjectedDatabase
         :param j:the position of j in the list of promising items
         :type j:int
         :param itemsToKeep :the list of promising items
-        :type itemsToKeep: list or Dataset
+        :type itemsToKeep: list
         :return: None
         """
-        for i in range(j + 1, len(itemsToKeep)):
-            item = itemsToKeep[i]
-            self._utilityBinArrayLU[item] = 0
-            self._utilityBinArraySU[item] = 0
-        for transaction in transactionsPe:
-            sumRemainingUtility = 0
-            i = len(transaction.getItems()) - 1
-            while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
-                    sumRemainingUtility += transaction.getUtilities()[i]
-                    self._utilityBinArraySU[item] += sumRemainingUtility + transaction.prefixUtility
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
-                i -= 1
+        keep = _ab._np.zeros(len(self._newNamesToOldNames) + 1, dtype=bool)
+        keep[itemsToKeep[j + 1:]] = True
+        self._utilityBinArrayLU, self._utilityBinArraySU = databasePe.utilityBins(keep, len(keep))
 
     def _output(self, tempPosition: int, utility: int, support: int):
         """
@@ -750,102 +640,6 @@ class HUFIM(_ab._utilityPatterns):
                 s1 += "\t"
         self._finalPatterns[s1] = [utility, support]
 
-    def _isEqual(self, transaction1: _Transaction, transaction2: _Transaction) -> bool:
-        """
-        A method to Check if two transaction are identical
-
-        :param  transaction1: the first transaction
-        :type  transaction1: Trans
-        :param  transaction2:    the second transaction
-        :type  transaction2: Trans
-        :return : whether both are identical or not
-        :rtype: bool
-        """
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-
-    def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset: _Dataset) -> None:
-        """
-        Scan the initial database to calculate the subtree utility of each item using a utility-bin array
-
-        :param dataset: the transaction database
-        :type dataset: Dataset
-        :return : None
-        """
-        for transaction in dataset.getTransactions():
-            sumSU = 0
-            i = len(transaction.getItems()) - 1
-            while i >= 0:
-                item = transaction.getItems()[i]
-                currentUtility = transaction.getUtilities()[i]
-                sumSU += currentUtility
-                if item in self._utilityBinArraySU.keys():
-                    self._utilityBinArraySU[item] += sumSU
-                else:
-                    self._utilityBinArraySU[item] = sumSU
-                i -= 1
-
-    def _sortDatabase(self, transactions: List[_Transaction]) -> None:
-        """
-        A Method to sort transaction
-
-        :param transactions: transactions of items
-        :type transactions: list
-        :return: None
-        """
-        compareItems = _ab._functools.cmp_to_key(self._sortTransaction)
-        transactions.sort(key=compareItems)
-
-    def _sortTransaction(self, trans1: _Transaction, trans2: _Transaction) -> int:
-        """
-        A Method to sort transaction
-
-        :param trans1: the first transaction
-        :type trans1: Trans
-        :param trans2:the second transaction
-        :type trans2: Trans
-        :return: sorted transaction
-        :rtype: int
-        """
-        transItemsX = trans1.getItems()
-        transItemsY = trans2.getItems()
-        pos1 = len(transItemsX) - 1
-        pos2 = len(transItemsY) - 1
-        if len(transItemsX) < len(transItemsY):
-            while pos1 >= 0:
-                sub = transItemsY[pos2] - transItemsX[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(transItemsX) > len(transItemsY):
-            while pos2 >= 0:
-                sub = transItemsY[pos2] - transItemsX[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = transItemsY[pos2] - transItemsX[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
-
     def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset: _Dataset) -> None:
         """
         A method to calculate local utility of single itemSets
@@ -928,7 +722,18 @@ class HUFIM(_ab._utilityPatterns):
         :rtype: float
         """
         return self._endTime-self._startTime
-    
+
+    def getMergeRatio(self) -> float:
+        """
+        Fraction of the projected transactions which were merged into an identical projected transaction
+
+        :return: returning the merge ratio of the projected databases
+        :rtype: float
+        """
+        if self._projectedTransactions == 0:
+            return 0.0
+        return self._mergedTransactions / self._projectedTransactions
+
     def printResults(self) -> None:
         """
         This function is used to print the results
@@ -937,6 +742,7 @@ class HUFIM(_ab._utilityPatterns):
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in seconds:", self.getRuntime())
+        print("Merge ratio of the projected transactions:", self.getMergeRatio())
 
 if __name__ == '__main__':
     _ap = str()
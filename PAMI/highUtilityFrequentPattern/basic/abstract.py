@@ -39,6 +39,7 @@ import validators as _validators
 import sys as _sys
 from urllib.request import urlopen as _urlopen
 import functools as _functools
+import numpy as _np
 
 
 class _utilityPatterns(_ABC):
@@ -53,6 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 """
 from PAMI.highUtilityGeoreferencedFrequentPattern.basic import abstract as _ab
+from PAMI.highUtilitySpatialPattern.basic import neighbourhoodIndex as _neighbourhoodIndex
 from functools import cmp_to_key as _comToKey
 from deprecated import deprecated
 
@@ -543,6 +544,11 @@ class SHUFIM(_ab._utilityPatterns):
         self._patternCount = 0
         self._finalPatterns = {}
         self._dataset = _Dataset(self._iFile, self._sep)
+        self._utilityBinArrayLU = {}
+        self._utilityBinArraySU = {}
+        self._oldNamesToNewNames = {}
+        self._newNamesToOldNames = {}
+        self._Neighbours = {}
         self._singleItemSetsSupport = _ab._defaultdict(int)
         self._singleItemSetsUtility = _ab._defaultdict(int)
         self._minUtil = int(self._minUtil)
@@ -574,6 +580,7 @@ class SHUFIM(_ab._utilityPatterns):
             _currentName += 1
         for transaction in self._dataset.getTransactions():
             transaction.removeUnpromisingItems(self._oldNamesToNewNames)
+        self._neighbourhood = _neighbourhoodIndex.NeighbourhoodIndex(self._Neighbours, self._oldNamesToNewNames)
         self._sortDatabase(self._dataset.getTransactions())
         _emptyTransactionCount = 0
         for transaction in self._dataset.getTransactions():
@@ -584,11 +591,11 @@ class SHUFIM(_ab._utilityPatterns):
         _secondary = []
         for idx, item in enumerate(_itemsToKeep):
             _cumulativeUtility = self._singleItemSetsUtility[self._newNamesToOldNames[item]]
-            if self._newNamesToOldNames[item] in self._Neighbours:
-                neighbors = [self._oldNamesToNewNames[y] for y in self._Neighbours[self._newNamesToOldNames[item]] if y in self._oldNamesToNewNames]
+            if item in self._neighbourhood:
+                neighbors = self._neighbourhood.neighbours(item)
                 for i in range(idx+1, len(_itemsToKeep)):
                     _nextItem = _itemsToKeep[i]
-                    if _nextItem in neighbors:
+                    if neighbors >> _nextItem & 1:
                         _cumulativeUtility += self._singleItemSetsUtility[self._newNamesToOldNames[_nextItem]]
             if _cumulativeUtility >= self._minUtil:
                 _secondary.append(item)
@@ -597,10 +604,7 @@ class SHUFIM(_ab._utilityPatterns):
         for item in _secondary:
             if self._utilityBinArraySU[item] >= self._minUtil:
                 _itemsToExplore.append(item)
-        _commonitems = []
-        for i in range(self._dataset.maxItem):
-            _commonitems.append(i)
-        self._backtrackingEFIM(self._dataset.getTransactions(), _itemsToKeep, _itemsToExplore, 0)
+        self._backtrackingEFIM(self._dataset.getTransactions(), _itemsToKeep, _itemsToExplore, 0, self._neighbourhood.all)
         _finalMemory = _ab._psutil.virtual_memory()[3]
         memory = (_finalMemory - InitialMemory) / 10000
         if memory > self._maxMemory:
@@ -613,7 +617,7 @@ class SHUFIM(_ab._utilityPatterns):
         self._memoryRSS = process.memory_info().rss
         print('Spatial High Utility Frequent Itemsets generated successfully using SHUFIM algorithm')
 
-    def _backtrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength):
+    def _backtrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, commonNeighbours):
         """
         A method to mine the SHUFIs Recursively
         :param transactionsOfP: the list of transactions containing the current prefix P
@@ -624,6 +628,8 @@ class SHUFIM(_ab._utilityPatterns):
         :type itemsToExplore: list
         :param prefixLength: current prefixLength
         :type prefixLength: int
+        :param commonNeighbours: bitset of the common neighbours of the items in P
+        :type commonNeighbours: int
         """
         self._candidateCount += len(itemsToExplore)
         for idx, e in enumerate(itemsToExplore):
@@ -631,7 +637,7 @@ class SHUFIM(_ab._utilityPatterns):
             transactionsPe = []
             utilityPe = 0
             supportPe = 0
-            previousTransaction = []
+            previousTransaction = None
             consecutiveMergeCount = 0
             for transaction in transactionsOfP:
                 items = transaction.getItems()
@@ -643,7 +649,7 @@ class SHUFIM(_ab._utilityPatterns):
                     else:
                         projectedTransaction = transaction.projectTransaction(positionE)
                         utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction is []:
+                        if previousTransaction is None:
                             previousTransaction = projectedTransaction
                         elif self._isEqual(projectedTransaction, previousTransaction):
                             if consecutiveMergeCount == 0:
@@ -682,34 +688,33 @@ class SHUFIM(_ab._utilityPatterns):
                             previousTransaction = projectedTransaction
                             consecutiveMergeCount = 0
                     transaction.offset = positionE
-            if previousTransaction is not []:
+            if previousTransaction is not None:
                 transactionsPe.append(previousTransaction)
                 supportPe += previousTransaction.getSupport()
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             if utilityPe >= self._minUtil and supportPe >= self._minSup:
                 self._output(prefixLength, utilityPe, supportPe)
             if supportPe >= self._minSup:
-                neighbourhoodList = self._calculateNeighbourIntersection(prefixLength)
-                #print(neighbourhoodList)
-                self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhoodList)
+                neighboursPe = self._neighbourhood.narrow(commonNeighbours, e)
+                self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighboursPe)
                 newItemsToKeep = []
                 newItemsToExplore = []
                 for l in range(idx + 1, len(itemsToKeep)):
                     itemK = itemsToKeep[l]
+                    if not neighboursPe >> itemK & 1:
+                        continue
                     if self._utilityBinArraySU[itemK] >= self._minUtil:
-                        if itemK in neighbourhoodList:
-                            newItemsToExplore.append(itemK)
-                            newItemsToKeep.append(itemK)
+                        newItemsToExplore.append(itemK)
+                        newItemsToKeep.append(itemK)
                     elif self._utilityBinArrayLU[itemK] >= self._minUtil:
-                        if itemK in neighbourhoodList:
-                            newItemsToKeep.append(itemK)
-                self._backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
+                        newItemsToKeep.append(itemK)
+                self._backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1, neighboursPe)
             finalMemory = _ab._psutil.virtual_memory()[3]
             memory = (finalMemory - initialMemory) / 10000
             if self._maxMemory < memory:
                 self._maxMemory = memory
 
-    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep, neighbourhoodList):
+    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep, commonNeighbours):
         """
         A method to  calculate the subtree utility and local utility of all items that can extend itemSet P U {e}
 
@@ -721,50 +726,33 @@ class SHUFIM(_ab._utilityPatterns):
         :type j:int
         :param itemsToKeep :the list of promising items
         :type itemsToKeep: list
-        :param neighbourhoodList : the list of promising items that can extend itemSet P U {e}
-        :type neighbourhoodList: list
+        :param commonNeighbours : bitset of the common neighbours of the items in P U {e}
+        :type commonNeighbours: int
 
         """
         for i in range(j + 1, len(itemsToKeep)):
             item = itemsToKeep[i]
             self._utilityBinArrayLU[item] = 0
             self._utilityBinArraySU[item] = 0
+        keep = set(itemsToKeep)
         for transaction in transactionsPe:
-            length = len(transaction.getItems())
+            items = transaction.getItems()
+            utilities = transaction.getUtilities()
+            length = len(items)
             i = length - 1
             while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
-                    remainingUtility = 0
-                    if self._newNamesToOldNames[item] in self._Neighbours:
-                        itemNeighbours = self._Neighbours[self._newNamesToOldNames[item]]
+                item = items[i]
+                if item in keep:
+                    remainingUtility = utilities[i]
+                    itemNeighbours = self._neighbourhood.narrow(commonNeighbours, item)
+                    if itemNeighbours:
                         for k in range(i, length):
-                            transaction_item = transaction.getItems()[k]
-                            if self._newNamesToOldNames[transaction_item] in itemNeighbours and transaction_item in neighbourhoodList:
-                                remainingUtility += transaction.getUtilities()[k]
-
-                    remainingUtility += transaction.getUtilities()[i]
+                            if itemNeighbours >> items[k] & 1:
+                                remainingUtility += utilities[k]
                     self._utilityBinArraySU[item] += remainingUtility + transaction.prefixUtility
                     self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
                 i -= 1
 
-    def _calculateNeighbourIntersection(self, prefixLength):
-        """
-        A method to find common Neighbours
-        :param prefixLength: the prefix itemSet
-        :type prefixLength:int
-        """
-        intersectionList = self._Neighbours.get(self._temp[0])
-        for i in range(1, prefixLength+1):
-            intersectionList = self._intersection(self._Neighbours[self._temp[i]], intersectionList)
-        finalIntersectionList = []
-        if intersectionList is None:
-            return finalIntersectionList
-        for item in intersectionList:
-            if item in self._oldNamesToNewNames:
-                finalIntersectionList.append(self._oldNamesToNewNames[item])
-        return finalIntersectionList
-    
     def _output(self, tempPosition, utility, support):
         """
          A method save all high-utility itemSet to file or memory depending on what the user chose
@@ -807,21 +795,6 @@ class SHUFIM(_ab._utilityPatterns):
             position2 += 1
         return True
     
-    def _intersection(self, lst1, lst2):
-        """
-        A method that return the intersection of 2 list
-
-        :param  lst1: items neighbour to item1
-        :type lst1: list
-        :param lst2: items neighbour to item2
-        :type lst2: list
-        :return :intersection of two lists
-        :rtype : list
-        """
-        temp = set(lst2)
-        lst3 = [value for value in lst1 if value in temp]
-        return lst3
-
     def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset):
         """
         Scan the initial database to calculate the subtree utility of each item using a utility-bin array
@@ -834,13 +807,11 @@ class SHUFIM(_ab._utilityPatterns):
             for idx, item in enumerate(items):
                 if item not in self._utilityBinArraySU:
                     self._utilityBinArraySU[item] = 0
-                if self._newNamesToOldNames[item] not in self._Neighbours:
-                    self._utilityBinArraySU[item] += utilities[idx]
-                    continue
+                neighbours = self._neighbourhood.neighbours(item)
                 i = idx + 1
                 sumSu = utilities[idx]
-                while i < len(items):
-                    if self._newNamesToOldNames[items[i]] in self._Neighbours[self._newNamesToOldNames[item]]:
+                while neighbours and i < len(items):
+                    if neighbours >> items[i] & 1:
                         sumSu += utilities[i]
                     i += 1
                 self._utilityBinArraySU[item] += sumSu
@@ -901,16 +872,19 @@ class SHUFIM(_ab._utilityPatterns):
         :param dataset: the transaction database
         :type dataset: dataset
         """
+        neighbours = {item: set(adjacent) for item, adjacent in self._Neighbours.items()}
         for transaction in dataset.getTransactions():
-            for idx, item in enumerate(transaction.getItems()):
+            items = transaction.getItems()
+            utilities = transaction.getUtilities()
+            for idx, item in enumerate(items):
                 self._singleItemSetsSupport[item] += 1
-                self._singleItemSetsUtility[item] += transaction.getUtilities()[idx]
-                pmu = transaction.getUtilities()[idx]
-                if item in self._Neighbours:
-                    neighbors = self._Neighbours[item]
-                    for idx, item in enumerate(transaction.getItems()):
-                        if item in neighbors:
-                            pmu += transaction.getUtilities()[idx]
+                self._singleItemSetsUtility[item] += utilities[idx]
+                pmu = utilities[idx]
+                if item in neighbours:
+                    adjacent = neighbours[item]
+                    for other, utility in zip(items, utilities):
+                        if other in adjacent:
+                            pmu += utility
                 if item in self._utilityBinArrayLU:
                     # self._utilityBinArrayLU[item] += transaction.getPmus()[idx]
                     self._utilityBinArrayLU[item] += pmu
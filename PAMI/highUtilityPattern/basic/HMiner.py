@@ -53,43 +53,27 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.highUtilityPattern.basic import abstract as _ab
+from PAMI.highUtilityPattern.basic import utilityList as _utilityList
+from PAMI.highUtilityPattern.basic import utilityDatabase as _utilityDatabase
 from deprecated import deprecated
 
 
-class _Element:
+class _CUList(_utilityList.UtilityList):
     """
-    A class represents an Element of a utility list.
-
-    :Attributes :
-
-        ts : int
-            keep tact of transaction id
-        nu : int
-            non-closed itemSet utility
-        nru : int
-             non-closed remaining utility
-        pu : int
-            prefix utility
-        ppos: int
-            position of previous item in the list
-    """
-
-    def __init__(self, tid, nu, nru, pu, ppos):
-        self.tid = tid
-        self.nu = nu
-        self.nru = nru
-        self.pu = pu
-        self.ppos = ppos
-
-
-class _CUList:
-    """
-    A class represents a UtilityList
+    A class represents a compact utility list, with one column per field of its elements
 
     :Attributes :
 
         item: int
             item 
+        tids: numpy.ndarray
+            transaction ids of the elements
+        nu: numpy.ndarray
+            non-closed itemSet utility of the elements
+        nru: numpy.ndarray
+            non-closed remaining utility of the elements
+        pu: numpy.ndarray
+            prefix utility of the elements
         sumNu: long
             the sum of item utilities
         sumNru: long
@@ -100,32 +84,15 @@ class _CUList:
             the sum of closed remaining utilities
         sumCpu: long
             the sum of closed prefix utilities
-        elements: list
-            the list of elements 
-    :Methods :
-
-        addElement(element)
-            Method to add an element to this utility list and update the sums at the same time.
     """
 
-    def __init__(self, item):
-        self.item = item
-        self.sumnu = 0
-        self.sumnru = 0
+    def __init__(self, item, tids, nu, nru, pu):
+        super().__init__(item, tids, nu=nu, nru=nru, pu=pu)
+        self.sumnu = self.total('nu')
+        self.sumnru = self.total('nru')
         self.sumCu = 0
         self.sumCru = 0
         self.sumCpu = 0
-        self.elements = []
-
-    def addElements(self, element):
-        """
-        A method to add new element to CUList
-        :param element: element to be added to CUList
-        :type element: Element
-        """
-        self.sumnu += element.nu
-        self.sumnru += element.nru
-        self.elements.append(element)
 
 
 class _Pair:
@@ -200,13 +167,13 @@ class HMiner(_ab._utilityPatterns):
             Total amount of runtime taken by the mining process will be retrieved from this function
         Explore_SearchTree(prefix, uList, minUtil)
             A method to find all high utility itemSets
-        UpdateCLosed(x, culs, st, excul, newT, ex, ey_ts, length)
-            A method to update closed values
+        UpdateCLosed(x, closed, utilities, remaining)
+            A method to calculate the closed values of the extensions
         saveitemSet(prefix, prefixLen, item, utility)
             A method to save itemSets
-        updateElement(z, culs, st, excul, newT, ex, duppos, ey_ts)
-            A method to updates vales for duplicates
-        construcCUL(x, culs, st, minUtil, length, exnighbors)
+        updateElement(x, rows, found, utilities, remaining)
+            A method to merge the elements having the same extensions
+        construcCUL(x, culs, st, minUtil, length)
             A method to construct CUL's database
 
     **Executing the code on terminal:**
@@ -310,44 +277,7 @@ class HMiner(_ab._utilityPatterns):
         """
         Storing the complete transactions of the database/input file in a database variable
         """
-        self._transactions, self._utilities, self._utilitySum = [], [], []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                self._transactions = self._iFile['Transactions'].tolist()
-            if 'Utilities' in i:
-                self._utilities = self._iFile['Utilities'].tolist()
-            if 'UtilitySum' in i:
-                self._utilitySum = self._iFile['UtilitySum'].tolist()
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                #print("hey")
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line = line.decode("utf-8")
-                    line = line.split("\n")[0]
-                    parts = line.split(":")
-                    items = parts[0].split(self._sep)
-                    self._transactions.append([x for x in items if x])
-                    utilities = parts[2].split(self._sep)
-                    self._utilities.append(utilities)
-                    self._utilitySum.append(int(parts[1]))
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line = line.split("\n")[0]
-                            parts = line.split(":")
-                            items = parts[0].split(self._sep)
-                            self._transactions.append([x for x in items if x])
-                            utilities = parts[2].split(self._sep)
-                            self._utilities.append(utilities)
-                            self._utilitySum.append(int(parts[1]))
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        self._database = _utilityDatabase.load(self._iFile, self._sep)
 
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
@@ -363,70 +293,31 @@ class HMiner(_ab._utilityPatterns):
         self._startTime = _ab._time.time()
         self._creteItemsets()
         self._finalPatterns = {}
-        for line in range(len(self._transactions)):
-            items_str = self._transactions[line]
-            utility_str = self._utilities[line]
-            transUtility = self._utilitySum[line]
-            for i in range(0, len(items_str)):
-                item = items_str[i]
-                twu = self._mapOfTWU.get(item)
-                if twu is None:
-                    twu = transUtility
-                else:
-                    twu += transUtility
-                self._mapOfTWU[item] = twu
-        listOfCUList = []
-        hashTable = {}
-        mapItemsToCUList = {}
+        self._mapOfTWU = dict(zip(self._database.names, self._database.twu.tolist()))
         minutil = self._minUtil
-        for item in self._mapOfTWU.keys():
-            if self._mapOfTWU.get(item) >= self._minUtil:
-                uList = _CUList(item)
-                mapItemsToCUList[item] = uList
-                listOfCUList.append(uList)
-        listOfCUList.sort(key=_ab._functools.cmp_to_key(self._HMiner))
-        tid = 1
-        for line in range(len(self._transactions)):
-            items = self._transactions[line]
-            utilities = self._utilities[line]
-            ru = 0
+        promising = [item for item in self._mapOfTWU.keys() if self._mapOfTWU.get(item) >= self._minUtil]
+        order = _ab._functools.cmp_to_key(self._HMiner)
+        # identical revised transactions are merged into the element of their first occurrence
+        hashTable = {}
+        for line, (items, utilities, _) in enumerate(self._database.transactions()):
             newTwu = 0
-            tx_key = []
             revisedTrans = []
             for i in range(0, len(items)):
                 pair = _Pair()
                 pair.item = items[i]
-                pair.utility = int(utilities[i])
+                pair.utility = utilities[i]
                 if self._mapOfTWU.get(pair.item) >= self._minUtil:
                     revisedTrans.append(pair)
-                    tx_key.append(pair.item)
                     newTwu += pair.utility
-            revisedTrans.sort(key=_ab._functools.cmp_to_key(self._HMiner))
-            tx_key1 = tuple(tx_key)
+            revisedTrans.sort(key=order)
             if len(revisedTrans) > 0:
-                if tx_key1 not in hashTable.keys():
-                    hashTable[tx_key1] = len(mapItemsToCUList[revisedTrans[len(revisedTrans) - 1].item].elements)
-                    for i in range(len(revisedTrans) - 1, -1, -1):
-                        pair = revisedTrans[i]
-                        cuListoFItems = mapItemsToCUList.get(pair.item)
-                        element = _Element(tid, pair.utility, ru, 0, 0)
-                        if i > 0:
-                            element.ppos = len(mapItemsToCUList[revisedTrans[i - 1].item].elements)
-                        else:
-                            element.ppos = - 1
-                        cuListoFItems.addElements(element)
-                        ru += pair.utility
+                tx_key = tuple(pair.item for pair in revisedTrans)
+                merged = hashTable.get(tx_key)
+                if merged is None:
+                    hashTable[tx_key] = [line + 1, [pair.utility for pair in revisedTrans]]
                 else:
-                    pos = hashTable[tx_key1]
-                    ru = 0
-                    for i in range(len(revisedTrans) - 1, -1, -1):
-                        cuListoFItems = mapItemsToCUList[revisedTrans[i].item]
-                        cuListoFItems.elements[pos].nu += revisedTrans[i].utility
-                        cuListoFItems.elements[pos].nru += ru
-                        cuListoFItems.sumnu += revisedTrans[i].utility
-                        cuListoFItems.sumnru += ru
-                        ru += revisedTrans[i].utility
-                        pos = cuListoFItems.elements[pos].ppos
+                    for i in range(len(revisedTrans)):
+                        merged[1][i] += revisedTrans[i].utility
                     # EUCS
             for i in range(len(revisedTrans) - 1, -1, -1):
                 pair = revisedTrans[i]
@@ -441,7 +332,19 @@ class HMiner(_ab._utilityPatterns):
                         mapFMAPItem[pairAfter.item] = newTwu
                     else:
                         mapFMAPItem[pairAfter.item] = twuSUm + newTwu
-            tid += 1
+        columns = {item: ([], [], []) for item in promising}
+        for tx_key, (tid, utilities) in sorted(hashTable.items(), key=lambda x: x[1][0]):
+            ru = 0
+            for i in range(len(tx_key) - 1, -1, -1):
+                tids, nu, nru = columns[tx_key[i]]
+                tids.append(tid)
+                nu.append(utilities[i])
+                nru.append(ru)
+                ru += utilities[i]
+        listOfCUList = [_CUList(item, tids, _ab._np.array(nu, dtype=_ab._np.int64),
+                                _ab._np.array(nru, dtype=_ab._np.int64), _ab._np.zeros(len(tids), dtype=_ab._np.int64))
+                        for item, (tids, nu, nru) in columns.items()]
+        listOfCUList.sort(key=order)
         self._ExploreSearchTree([], listOfCUList, minutil)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
@@ -489,147 +392,103 @@ class HMiner(_ab._utilityPatterns):
         :return: projectd database of list X
         :rtype: list
         """
-        excul = []
-        lau = []
-        cutil = []
-        ey_tid = []
-        for i in range(0, len(culs)):
-            uList = _CUList(culs[i].item)
-            excul.append(uList)
-            lau.append(0)
-            cutil.append(0)
-            ey_tid.append(0)
-        sz = len(culs) - (st + 1)
-        exSZ = sz
+        mapOfTWUF = self._mapFMAP.get(x.item, {})
+        candidates = []
         for j in range(st + 1, len(culs)):
-            mapOfTWUF = self._mapFMAP[x.item]
-            if mapOfTWUF is not None:
-                twuf = mapOfTWUF.get(culs[j].item)
-                if twuf is not None and twuf < minutil:
-                    excul[j] = None
-                    exSZ = sz - 1
-                else:
-                    uList = _CUList(culs[j].item)
-                    excul[j] = uList
-                    ey_tid[j] = 0
-                    lau[j] = x.sumCu + x.sumCru + x.sumnu + x.sumnru
-                    cutil[j] = x.sumCu + x.sumCru
-        hashTable = {}
-        for ex in x.elements:
-            newT = []
-            for j in range(st + 1, len(culs)):
-                if excul[j] is None:
-                    continue
-                eylist = culs[j].elements
-                while ey_tid[j] < len(eylist) and eylist[ey_tid[j]].tid < ex.tid:
-                    ey_tid[j] = ey_tid[j] + 1
-                if ey_tid[j] < len(eylist) and eylist[ey_tid[j]].tid == ex.tid:
-                    newT.append(j)
-                else:
-                    lau[j] = lau[j] - ex.nu - ex.nru
-                    if lau[j] < minutil:
-                        excul[j] = None
-                        exSZ = exSZ - 1
-            if len(newT) == exSZ:
-                self._UpdateCLosed(x, culs, st, excul, newT, ex, ey_tid, length)
-            else:
-                if len(newT) == 0:
-                    continue
-                ru = 0
-                newT1 = tuple(newT)
-                if newT1 not in hashTable.keys():
-                    hashTable[newT1] = len(excul[newT[len(newT) - 1]].elements)
-                    for i in range(len(newT) - 1, -1, -1):
-                        cuListoFItems = excul[newT[i]]
-                        y = culs[newT[i]].elements[ey_tid[newT[i]]]
-                        element = _Element(ex.tid, ex.nu + y.nu - ex.pu, ru, ex.nu, 0)
-                        if i > 0:
-                            element.ppos = len(excul[newT[i - 1]].elements)
-                        else:
-                            element.ppos = - 1
-                        cuListoFItems.addElements(element)
-                        ru += y.nu - ex.pu
-                else:
-                    dppos = hashTable[newT1]
-                    self._updateElement(x, culs, st, excul, newT, ex, dppos, ey_tid)
-            for j in range(st + 1, len(culs)):
-                cutil[j] = cutil[j] + ex.nu + ex.nru
+            twuf = mapOfTWUF.get(culs[j].item)
+            if twuf is None or twuf >= minutil:
+                candidates.append(j)
+        if len(candidates) == 0:
+            return []
+        # merge-join of the tids of x with the tids of every candidate extension
+        found = _ab._np.empty((len(x), len(candidates)), dtype=bool)
+        positions = _ab._np.empty((len(x), len(candidates)), dtype=_ab._np.int64)
+        for c, j in enumerate(candidates):
+            found[:, c], positions[:, c] = culs[j].locate(x.tids)
+        # LA-prune: the utility of the elements of x missing from an extension is lost for it
+        lau = x.sumCu + x.sumCru + x.sumnu + x.sumnru - ((x.nu + x.nru)[:, None] * ~found).sum(axis=0)
+        alive = _ab._np.flatnonzero(lau >= minutil)
+        if len(alive) == 0:
+            return []
+        candidates = [candidates[c] for c in alive]
+        found = found[:, alive]
+        positions = positions[:, alive]
+        gain = _ab._np.zeros(found.shape, dtype=_ab._np.int64)
+        for c, j in enumerate(candidates):
+            if len(culs[j]) > 0:
+                gain[:, c] = _ab._np.where(found[:, c], culs[j].nu[positions[:, c]] - x.pu, 0)
+        utilities = _ab._np.where(found, x.nu[:, None] + gain, 0)
+        remaining = gain[:, ::-1].cumsum(axis=1)[:, ::-1] - gain
+        count = found.sum(axis=1)
+        closed = count == len(candidates)
+        sumCu, sumCru, sumCpu = self._UpdateCLosed(x, closed, utilities, remaining)
+        tids, groupFound, nu, nru, pu = self._updateElement(x, _ab._np.flatnonzero(~closed & (count > 0)), found,
+                                                             utilities, remaining)
         filter_culs = []
-        for j in range(st + 1, len(culs)):
-            if cutil[j] < minutil or excul[j] is None:
-                continue
-            else:
-                if length > 1:
-                    excul[j].sumCu += culs[j].sumCu + x.sumCu - x.sumCpu
-                    excul[j].sumCru += culs[j].sumCru
-                    excul[j].sumCpu += x.sumCu
-                filter_culs.append(excul[j])
+        for c, j in enumerate(candidates):
+            inGroup = groupFound[:, c]
+            exCUL = _CUList(culs[j].item, tids[inGroup], nu[inGroup, c], nru[inGroup, c], pu[inGroup])
+            exCUL.sumCu = int(sumCu[c])
+            exCUL.sumCru = int(sumCru[c])
+            exCUL.sumCpu = sumCpu
+            if length > 1:
+                exCUL.sumCu += culs[j].sumCu + x.sumCu - x.sumCpu
+                exCUL.sumCru += culs[j].sumCru
+                exCUL.sumCpu += x.sumCu
+            filter_culs.append(exCUL)
         return filter_culs
 
-    def _UpdateCLosed(self, x, culs, st, excul, newT, ex, ey_tid, length):
+    def _UpdateCLosed(self, x, closed, utilities, remaining):
         """
-        A method to update closed values
+        A method to calculate the closed values of the extensions from the elements of x found in all of them
         :parm x: Compact utility list
-        :type x: lists
-        :parm culs:list of Compact utility list
-        :type culs:lists
-        :parm st: starting pos of culs
-        :type st:int
-        :parm excul: list of culs
-        :type excul: list
-        :parm newT:transaction to be updated
-        :type newT:list
-        :parm ex: element ex
-        :type ex:element
-        :parm ey_tid:list of tss
-        :type ey_tid:ts
-        :parm length: length of x
-        :type length:int
-        """
-        nru = 0
-        for j in range(len(newT) - 1, -1, -1):
-            ey = culs[newT[j]]
-            eyy = ey.elements[ey_tid[newT[j]]]
-            excul[newT[j]].sumCu += ex.nu + eyy.nu - ex.pu
-            excul[newT[j]].sumCru += nru
-            excul[newT[j]].sumCpu += ex.nu
-            nru = nru + eyy.nu - ex.pu
-
-    def _updateElement(self, z, culs, st, excul, newT, ex, duppos, ey_tid):
-        """
-        A method to updates vales for duplicates
-
-        :Attributes:
-
-        :parm z: Compact utility list
-        :type z: lists
-        :parm culs:list of Compact utility list
-        :type culs:lists
-        :parm st: starting pos of culs
-        :type st:int
-        :parm excul:list of culs
-        :type excul:list
-        :parm newT:transaction to be updated
-        :type newT:list
-        :parm ex: element ex
-        :type ex:element
-        :parm duppos: position of z in excul
-        :type duppos:int
-        :parm ey_tid:list of tss
-        :type ey_tid:ts
-        """
-        nru = 0
-        pos = duppos
-        for j in range(len(newT) - 1, -1, -1):
-            ey = culs[newT[j]]
-            eyy = ey.elements[ey_tid[newT[j]]]
-            excul[newT[j]].elements[pos].nu += ex.nu + eyy.nu - ex.pu
-            excul[newT[j]].sumnu += ex.nu + eyy.nu - ex.pu
-            excul[newT[j]].elements[pos].nru += nru
-            excul[newT[j]].sumnru += nru
-            excul[newT[j]].elements[pos].pu += ex.nu
-            nru = nru + eyy.nu - ex.pu
-            pos = excul[newT[j]].elements[pos].ppos
+        :type x: _CUList
+        :parm closed: flags of the elements of x found in all the extensions
+        :type closed: numpy.ndarray
+        :parm utilities: utility of every element of x in every extension
+        :type utilities: numpy.ndarray
+        :parm remaining: remaining utility of every element of x in every extension
+        :type remaining: numpy.ndarray
+        :return: closed utility and closed remaining utility of every extension, and the closed prefix utility
+        :rtype: tuple
+        """
+        return utilities[closed].sum(axis=0), remaining[closed].sum(axis=0), int(x.nu[closed].sum())
+
+    def _updateElement(self, x, rows, found, utilities, remaining):
+        """
+        A method to merge the elements of x found in the same extensions, which become a single element with the
+        tid of the first one
+        :parm x: Compact utility list
+        :type x: _CUList
+        :parm rows: the elements of x which are not closed but found in some extension
+        :type rows: numpy.ndarray
+        :parm found: flags of the elements of x found in every extension
+        :type found: numpy.ndarray
+        :parm utilities: utility of every element of x in every extension
+        :type utilities: numpy.ndarray
+        :parm remaining: remaining utility of every element of x in every extension
+        :type remaining: numpy.ndarray
+        :return: tids of the merged elements, the extensions they are found in, and their utilities, remaining
+                 utilities and prefix utilities
+        :rtype: tuple
+        """
+        if len(rows) == 0:
+            empty = _ab._np.zeros((0, found.shape[1]), dtype=_ab._np.int64)
+            return x.tids[rows], found[rows], empty, empty, x.pu[rows]
+        _, first, group = _ab._np.unique(_ab._np.packbits(found[rows], axis=1), axis=0, return_index=True,
+                                         return_inverse=True)
+        group = group.reshape(-1)
+        # the merged elements keep the order of their first occurrence, so their tids stay sorted
+        rank = _ab._np.empty(len(first), dtype=_ab._np.int64)
+        rank[_ab._np.argsort(first)] = _ab._np.arange(len(first))
+        group = rank[group]
+        representatives = rows[_ab._np.sort(first)]
+        nu = _ab._np.zeros((len(first), found.shape[1]), dtype=_ab._np.int64)
+        nru = _ab._np.zeros((len(first), found.shape[1]), dtype=_ab._np.int64)
+        _ab._np.add.at(nu, group, utilities[rows])
+        _ab._np.add.at(nru, group, remaining[rows])
+        pu = _ab._np.bincount(group, weights=x.nu[rows], minlength=len(first)).astype(_ab._np.int64)
+        return x.tids[representatives], found[representatives], nu, nru, pu
 
     def _saveitemSet(self, prefix, prefixLen, item, utility):
         """
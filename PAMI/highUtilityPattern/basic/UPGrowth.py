@@ -53,6 +53,8 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.highUtilityPattern.basic import abstract as _ab
+from PAMI.highUtilityPattern.basic import utilityList as _utilityList
+from PAMI.highUtilityPattern.basic import utilityDatabase as _utilityDatabase
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 from deprecated import deprecated
 
@@ -353,6 +355,8 @@ class UPGrowth(_ab._utilityPatterns):
                    Maximum memory used by this program for running
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  batchSize: int :
+                   Number of potential high utility itemsets buffered before they are verified against the database.
 
 
     :Attributes:
@@ -376,7 +380,11 @@ class UPGrowth(_ab._utilityPatterns):
         MapItemToMinimumUtility : map
            A map to store the minimum utility of item in the database
         phuis : list
-            A list to store the phuis
+            A buffer of the phuis waiting for verification
+        phuiCount : int
+            Number of phuis generated
+        itemUtilities : map
+            A map from every promising item to its tid and utility columns
         MapItemToTwu : map
             A map to store the twu of each item in database
 
@@ -392,6 +400,8 @@ class UPGrowth(_ab._utilityPatterns):
             A Method to Mine UP Tree recursively
         PrintStats()
             A Method to print number of phuis
+        verifyCandidates()
+            A Method to calculate the exact utility of the buffered phuis
         save(oFile)
                 Complete set of frequent patterns will be loaded in to an output file
         getPatternsAsDataFrame()
@@ -465,50 +475,23 @@ class UPGrowth(_ab._utilityPatterns):
     _NumberOfNodes = 0
     _ParentNumberOfNodes = 0
     _MapItemToMinimumUtility = {}
-    _MapItemsetsToUtilities = _ab._defaultdict(int)
     _phuis = []
+    _phuiCount = 0
+    _batchSize = 10000
     _Database = []
     _MapItemToTwu = {}
     _sep = " "
 
-    def __init__(self, iFile: str, minUtil: int, sep: str='\t') -> None:
+    def __init__(self, iFile: str, minUtil: int, sep: str='\t', batchSize: int=10000) -> None:
         super().__init__(iFile, minUtil, sep)
+        self._batchSize = batchSize
 
     def _creatingItemSets(self) -> None:
         """
         Storing the complete transactions of the database/input file in a database variable
         :return: None
         """
-        self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            timeStamp, data = [], []
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                data = self._iFile['Transactions'].tolist()
-            if 'Utilities' in i:
-                data = self._iFile['Utilities'].tolist()
-            if 'UtilitySum' in i:
-                data = self._iFile['UtilitySum'].tolist()
-            for i in range(len(data)):
-                tr = timeStamp[i]
-                tr.append(data[i])
-                self._Database.append(tr)
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line = line.decode("utf-8")
-                    self._Database.append(line)
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            self._Database.append(line)
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        self._Database = _utilityDatabase.load(self._iFile, self._sep)
 
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self) -> None:
@@ -527,30 +510,33 @@ class UPGrowth(_ab._utilityPatterns):
         tree = _UPTree()
         self._creatingItemSets()
         self._finalPatterns = {}
-        for line in self._Database:
-            line = line.split("\n")[0]
-            transaction = line.strip().split(':')
-            items = transaction[0].split(self._sep)
-            transactionUtility = int(transaction[1])
-            for item in items:
-                Item = int(item)
-                if Item in self._MapItemToTwu:
-                    self._MapItemToTwu[Item] += transactionUtility
-                else:
-                    self._MapItemToTwu[Item] = transactionUtility
-        for line in self._Database:
-            line = line.split("\n")[0]
-            transaction = line.strip().split(':')
-            items = transaction[0].split(self._sep)
-            utilities = transaction[2].split(self._sep)
+        self._MapItemToTwu = {}
+        self._MapItemToMinimumUtility = {}
+        self._phuis = []
+        self._phuiCount = 0
+        self._verifyStack = []
+        itemTids = {}
+        itemUtilities = {}
+        for name, twu in zip(self._Database.names, self._Database.twu.tolist()):
+            Item = int(name)
+            self._MapItemToTwu[Item] = self._MapItemToTwu.get(Item, 0) + twu
+        for tid, (items, utilities, _) in enumerate(self._Database.transactions()):
             remainingUtility = 0
             revisedTransaction = []
-            for idx, item in enumerate(items):
-                Item = int(item)
-                utility = int(utilities[idx])
+            # a repeated item is merged into one, so the tid columns of the store hold every tid once
+            merged = {}
+            for item, utility in zip(items, utilities):
+                merged[int(item)] = merged.get(int(item), 0) + utility
+            for Item, utility in merged.items():
                 if self._MapItemToTwu[Item] >= self._minUtil:
                     element = _UPItem(Item, utility)
                     revisedTransaction.append(element)
+                    if Item in itemTids:
+                        itemTids[Item].append(tid)
+                        itemUtilities[Item].append(utility)
+                    else:
+                        itemTids[Item] = [tid]
+                        itemUtilities[Item] = [utility]
                     remainingUtility += utility
                     if Item in self._MapItemToMinimumUtility:
                         minItemUtil = self._MapItemToMinimumUtility[Item]
@@ -561,43 +547,14 @@ class UPGrowth(_ab._utilityPatterns):
             revisedTransaction = sorted(revisedTransaction, key=lambda x: self._MapItemToTwu[x.name], reverse=True)
             self._ParentNumberOfNodes += tree.addTransaction(revisedTransaction, remainingUtility)
         tree.createHeaderList(self._MapItemToTwu)
+        # tid-indexed utility store used to verify the phuis without scanning the transactions again
+        self._itemUtilities = {item: _utilityList.UtilityList(item, itemTids[item], utility=itemUtilities[item])
+                               for item in itemTids}
         alpha = []
-        self._finalPatterns = {}
-        # print("number of nodes in parent tree", self.ParentNumberOfNodes)
         self._UPGrowth(tree, alpha)
-        # self.phuis = sorted(self.phuis, key=lambda x: len(x))
-        # print(self.phuis[0:10])
-        for line in self._Database:
-            line = line.split("\n")[0]
-            transaction = line.strip().split(':')
-            items = transaction[0].split(self._sep)
-            utilities = transaction[2].split(self._sep)
-            mapItemToUtility = {}
-            for idx, item in enumerate(items):
-                Item = int(item)
-                utility = int(utilities[idx])
-                if self._MapItemToTwu[Item] >= self._minUtil:
-                    mapItemToUtility[Item] = utility
-            for itemset in self._phuis:
-                l = len(itemset)
-                count = 0
-                utility = 0
-                for item in itemset:
-                    item = int(item)
-                    if item in mapItemToUtility:
-                        utility += mapItemToUtility[item]
-                        count += 1
-                if count == l:
-                    self._MapItemsetsToUtilities[tuple(itemset)] += utility
-
-        for itemset in self._phuis:
-            util = self._MapItemsetsToUtilities[tuple(itemset)]
-            if util >= self._minUtil:
-                s = str()
-                for item in itemset:
-                    s = s + str(item)
-                    s = s + "\t"
-                self._finalPatterns[s] = util
+        self._verifyCandidates()
+        self._itemUtilities = {}
+        self._verifyStack = []
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -625,6 +582,9 @@ class UPGrowth(_ab._utilityPatterns):
             if ItemTotalUtility >= self._minUtil:
                 beta = alpha + [item]
                 self._phuis.append(beta)
+                self._phuiCount += 1
+                if len(self._phuis) >= self._batchSize:
+                    self._verifyCandidates()
                 # str1 = ' '.join(map(str, beta))
                 # self.finalPatterns[str1] = ItemTotalUtility
                 if len(localTree.headerList) > 0:
@@ -681,7 +641,41 @@ class UPGrowth(_ab._utilityPatterns):
         A Method to print number of phuis
         :return: None
         """
-        print('number of PHUIS are ' + str(len(self._phuis)))
+        print('number of PHUIS are ' + str(self._phuiCount))
+
+    def _verifyCandidates(self) -> None:
+        """
+        A Method to calculate the exact utility of the buffered phuis by intersecting the tid columns of their items,
+        and to output the high utility ones. The phuis arrive in depth-first order, so the intersections of the
+        prefix of the current phui are kept on a stack and every phui only intersects its last items.
+        :return: None
+        """
+        stack = self._verifyStack
+        for itemset in self._phuis:
+            while stack and (len(stack[-1][0]) >= len(itemset) or
+                             itemset[:len(stack[-1][0])] != stack[-1][0]):
+                stack.pop()
+            if stack:
+                prefix, tids, utilities = stack[-1]
+            else:
+                prefix, tids, utilities = [], None, None
+            for length in range(len(prefix), len(itemset)):
+                itemList = self._itemUtilities[itemset[length]]
+                if tids is None:
+                    tids, utilities = itemList.tids, itemList.utility
+                else:
+                    tids, inPrefix, inItem = _ab._np.intersect1d(tids, itemList.tids, assume_unique=True,
+                                                                 return_indices=True)
+                    utilities = utilities[inPrefix] + itemList.utility[inItem]
+                stack.append((itemset[:length + 1], tids, utilities))
+            util = int(utilities.sum())
+            if util >= self._minUtil:
+                s = str()
+                for item in itemset:
+                    s = s + str(item)
+                    s = s + "\t"
+                self._finalPatterns[s] = util
+        self._phuis = []
 
     def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
         """
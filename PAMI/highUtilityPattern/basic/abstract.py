@@ -27,6 +27,7 @@ import os.path as _ospath
 import psutil as _psutil
 from array import *
 import functools as _functools
+import numpy as _np
 import sys as _sys
 
 class _utilityPatterns(_ABC):
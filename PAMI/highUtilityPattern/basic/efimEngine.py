@@ -0,0 +1,384 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Array based projected databases for the EFIM family of high utility miners.
+
+The database is stored as two flat arrays, the renamed items and their utilities, and every transaction is a
+(start, end) range over them together with its prefix utility, remaining utility and support. Projecting on an item
+only creates new ranges over the same arrays. New arrays are only allocated when identical projected transactions are
+merged, because their utilities are summed. Utility-bin arrays are dense NumPy arrays indexed by the renamed item id.
+
+Identical projected transactions are found with a polynomial rolling hash over the item arrays: the suffix hashes of
+the arrays are computed once, after which the hash of any range costs two lookups, whatever the order of the
+transactions. Only the transactions sharing a hash and a length are compared item by item.
+
+A database can be copied once into shared memory blocks and opened without copying by other processes, which then
+project it like any other database.
+"""
+
+from multiprocessing import shared_memory as _sharedMemory
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as _np
+
+_hashBase = 0x9E3779B97F4A7C15
+_hashInverse = pow(_hashBase, -1, 1 << 64)
+_lengthSalt = _np.uint64(0xC2B2AE3D27D4EB4F)
+
+
+def _sumBy(index: _np.ndarray, weights: _np.ndarray, size: int) -> _np.ndarray:
+    """
+    Sums the integer weights which share the same index.
+
+    bincount accumulates in float64, which is exact for the utility sums below 2**53.
+
+    :param index: bin of every weight
+    :type index: numpy.ndarray
+    :param weights: values to be summed
+    :type weights: numpy.ndarray
+    :param size: number of bins
+    :type size: int
+    :return: sums of the bins
+    :rtype: numpy.ndarray
+    """
+    return _np.rint(_np.bincount(index, weights=weights, minlength=size)).astype(_np.int64)
+
+
+def segmentPositions(starts: _np.ndarray, ends: _np.ndarray) -> Tuple[_np.ndarray, _np.ndarray]:
+    """
+    Expands (start, end) ranges into the positions they cover.
+
+    :param starts: first position of every range
+    :type starts: numpy.ndarray
+    :param ends: position after the last one of every range
+    :type ends: numpy.ndarray
+    :return: the covered positions and the range of every position
+    :rtype: tuple
+    """
+    lengths = ends - starts
+    rows = _np.arange(len(starts)).repeat(lengths)
+    offsets = lengths.cumsum() - lengths
+    positions = _np.arange(len(rows)) + (starts - offsets).repeat(lengths)
+    return positions, rows
+
+
+def _powers(base: int, count: int) -> _np.ndarray:
+    """
+    The first count powers of base modulo 2**64
+    """
+    powers = _np.full(count, base, dtype=_np.uint64)
+    if count:
+        powers[0] = 1
+    return _np.cumprod(powers, dtype=_np.uint64)
+
+
+def suffixHashes(items: _np.ndarray) -> Tuple[_np.ndarray, _np.ndarray]:
+    """
+    Rolling hashes of all the suffixes of an item array. The hash of the range [start, end) is
+    hashes[start] - powers[end - start] * hashes[end], modulo 2**64.
+
+    :param items: flat item array
+    :type items: numpy.ndarray
+    :return: the suffix hashes, one more than the items, and the powers of the hash base
+    :rtype: tuple
+    """
+    count = len(items)
+    powers = _powers(_hashBase, count + 1)
+    weighted = (items.astype(_np.uint64) + _np.uint64(1)) * powers[:count]
+    hashes = _np.zeros(count + 1, dtype=_np.uint64)
+    hashes[:count] = weighted[::-1].cumsum(dtype=_np.uint64)[::-1]
+    hashes[:count] *= _powers(_hashInverse, count)
+    return hashes, powers
+
+
+class ProjectedDatabase:
+    """
+    :Description: Transactions stored as ranges over flat item and utility arrays.
+
+    :Attributes:
+
+        items : numpy.ndarray
+            Renamed items of all the transactions, sorted in increasing order within every transaction
+        utilities : numpy.ndarray
+            Utility of every item
+        starts : numpy.ndarray
+            First position of every projected transaction
+        ends : numpy.ndarray
+            Position after the last item of every projected transaction
+        prefixUtilities : numpy.ndarray
+            Utility of the prefix in every projected transaction
+        remainingUtilities : numpy.ndarray
+            Transaction utility left after the prefix in every projected transaction
+        supports : numpy.ndarray
+            Number of original transactions merged into every projected transaction
+        unmerged : int
+            Number of projected transactions before identical ones were merged
+
+    :Methods:
+
+        fromTransactions(items, utilities, transactionUtilities)
+            Builds the database from lists of renamed and sorted transactions
+        fromArrays(items, utilities, starts, ends, transactionUtilities)
+            Builds the database from flat arrays of renamed and sorted transactions
+        project(item)
+            Utility and support of the prefix extended with item, and the projected database
+        mergeIdentical()
+            Merges the projected transactions having the same items
+        utilityBins(keep, size)
+            Local and sub-tree utilities of the items marked in keep
+        toSharedMemory()
+            Copies the database into shared memory blocks
+        fromSharedMemory(layout)
+            Opens a database stored in shared memory blocks
+    """
+
+    def __init__(self, items: _np.ndarray, utilities: _np.ndarray, starts: _np.ndarray, ends: _np.ndarray,
+                 prefixUtilities: _np.ndarray, remainingUtilities: _np.ndarray, supports: _np.ndarray,
+                 cumulative: _np.ndarray = None, hashes: Tuple[_np.ndarray, _np.ndarray] = None) -> None:
+        self.items = items
+        self.utilities = utilities
+        self.starts = starts
+        self.ends = ends
+        self.prefixUtilities = prefixUtilities
+        self.remainingUtilities = remainingUtilities
+        self.supports = supports
+        if cumulative is None:
+            cumulative = _np.concatenate(([0], _np.cumsum(utilities)))
+        self._cumulative = cumulative
+        self._hashes = hashes
+        self.unmerged = len(starts)
+        self._layout = None
+        self._itemIndex = None
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @classmethod
+    def fromTransactions(cls, items: Sequence[Sequence[int]], utilities: Sequence[Sequence[int]],
+                         transactionUtilities: Sequence[int]) -> 'ProjectedDatabase':
+        """
+        Builds the database from renamed transactions whose items are sorted in increasing order
+
+        :param items: items of every transaction
+        :type items: list
+        :param utilities: utilities of every transaction
+        :type utilities: list
+        :param transactionUtilities: utility of every transaction
+        :type transactionUtilities: list
+        :return: the database
+        :rtype: ProjectedDatabase
+        """
+        lengths = _np.fromiter((len(transaction) for transaction in items), dtype=_np.int64, count=len(items))
+        ends = _np.cumsum(lengths)
+        flatItems = _np.fromiter((item for transaction in items for item in transaction), dtype=_np.int64,
+                                 count=int(ends[-1]) if len(ends) else 0)
+        flatUtilities = _np.fromiter((utility for transaction in utilities for utility in transaction),
+                                     dtype=_np.int64, count=len(flatItems))
+        return cls.fromArrays(flatItems, flatUtilities, ends - lengths, ends, transactionUtilities)
+
+    @classmethod
+    def fromArrays(cls, items: _np.ndarray, utilities: _np.ndarray, starts: _np.ndarray, ends: _np.ndarray,
+                   transactionUtilities: Sequence[int]) -> 'ProjectedDatabase':
+        """
+        Builds the database from flat arrays of renamed transactions whose items are sorted in increasing order
+
+        :param items: items of all the transactions, one after another
+        :type items: numpy.ndarray
+        :param utilities: utility of every item of items
+        :type utilities: numpy.ndarray
+        :param starts: position of the first item of every transaction
+        :type starts: numpy.ndarray
+        :param ends: position after the last item of every transaction
+        :type ends: numpy.ndarray
+        :param transactionUtilities: utility of every transaction
+        :type transactionUtilities: list
+        :return: the database
+        :rtype: ProjectedDatabase
+        """
+        return cls(_np.asarray(items, dtype=_np.int64), _np.asarray(utilities, dtype=_np.int64), starts, ends,
+                   _np.zeros(len(starts), dtype=_np.int64), _np.asarray(transactionUtilities, dtype=_np.int64),
+                   _np.ones(len(starts), dtype=_np.int64))
+
+    def _getLayout(self) -> Tuple[_np.ndarray, _np.ndarray, _np.ndarray]:
+        """
+        Positions covered by the projected transactions, the transaction of every position and the items at those
+        positions, computed once per database
+        """
+        if self._layout is None:
+            positions, rows = segmentPositions(self.starts, self.ends)
+            self._layout = (positions, rows, self.items[positions])
+        return self._layout
+
+    def _positionsOf(self, item: int) -> Tuple[_np.ndarray, _np.ndarray]:
+        """
+        Positions of an item and the projected transactions containing them, in the order of the transactions
+        """
+        if self._itemIndex is None:
+            positions, rows, gathered = self._getLayout()
+            order = _np.argsort(gathered, kind='stable')
+            self._itemIndex = (gathered[order], positions[order], rows[order])
+        sortedItems, positions, rows = self._itemIndex
+        low = _np.searchsorted(sortedItems, item, side='left')
+        high = _np.searchsorted(sortedItems, item, side='right')
+        return positions[low:high], rows[low:high]
+
+    def project(self, item: int) -> Tuple[int, int, 'ProjectedDatabase']:
+        """
+        Projects the database on an item
+
+        :param item: renamed item extending the prefix
+        :type item: int
+        :return: utility and support of the extended prefix and its projected database
+        :rtype: tuple
+        """
+        positions, rows = self._positionsOf(item)
+        prefixUtilities = self.prefixUtilities[rows] + self.utilities[positions]
+        supports = self.supports[rows]
+        utility = int(prefixUtilities.sum())
+        support = int(supports.sum())
+        starts = positions + 1
+        ends = self.ends[rows]
+        consumed = self._cumulative[starts] - self._cumulative[self.starts[rows]]
+        remaining = self.remainingUtilities[rows] - consumed
+        nonEmpty = starts < ends
+        projected = ProjectedDatabase(self.items, self.utilities, starts[nonEmpty], ends[nonEmpty],
+                                      prefixUtilities[nonEmpty], remaining[nonEmpty], supports[nonEmpty],
+                                      self._cumulative, self._getHashes())
+        return utility, support, projected.mergeIdentical()
+
+    def _getHashes(self) -> Tuple[_np.ndarray, _np.ndarray]:
+        """
+        Suffix hashes of the item arrays, shared by all the databases projected from them
+        """
+        if self._hashes is None:
+            self._hashes = suffixHashes(self.items)
+        return self._hashes
+
+    def mergeIdentical(self) -> 'ProjectedDatabase':
+        """
+        Merges the projected transactions containing the same items by summing their utilities. Transactions are
+        grouped by the rolling hash of their items and compared item by item only within a group.
+
+        :return: the merged database, or the database itself when nothing was merged
+        :rtype: ProjectedDatabase
+        """
+        count = len(self.starts)
+        if count < 2:
+            return self
+        hashes, powers = self._getHashes()
+        lengths = self.ends - self.starts
+        keys = hashes[self.starts] - powers[lengths] * hashes[self.ends] + lengths.astype(_np.uint64) * _lengthSalt
+        _, first, group = _np.unique(keys, return_index=True, return_inverse=True)
+        group = group.reshape(-1)
+        groups = len(first)
+        if groups == count:
+            return self
+        positions, rows, gathered = self._getLayout()
+        rowOffsets = lengths.cumsum() - lengths
+        offsets = _np.arange(len(rows)) - rowOffsets[rows]
+        representative = first[group]
+        # a hash collision is detected by comparing every member of a group with its first transaction
+        collided = lengths != lengths[representative]
+        compared = _np.flatnonzero(~collided[rows])
+        differs = gathered[compared] != gathered[rowOffsets[representative[rows[compared]]] + offsets[compared]]
+        collided[rows[compared[differs]]] = True
+        if collided.any():
+            collidedRows = _np.flatnonzero(collided)
+            group[collidedRows] = groups + _np.arange(len(collidedRows))
+            first = _np.concatenate((first, collidedRows))
+            groups = len(first)
+        groupLengths = lengths[first]
+        groupEnds = groupLengths.cumsum()
+        groupStarts = groupEnds - groupLengths
+        target = groupStarts[group[rows]] + offsets
+        items = _np.empty(int(groupEnds[-1]), dtype=gathered.dtype)
+        items[target] = gathered
+        utilities = _sumBy(target, self.utilities[positions], len(items))
+        merged = ProjectedDatabase(items, utilities, groupStarts, groupEnds,
+                                   _sumBy(group, self.prefixUtilities, groups),
+                                   _sumBy(group, self.remainingUtilities, groups),
+                                   _sumBy(group, self.supports, groups))
+        merged.unmerged = count
+        merged._layout = (_np.arange(len(items)), _np.arange(groups).repeat(groupLengths), items)
+        return merged
+
+    def utilityBins(self, keep: _np.ndarray, size: int) -> Tuple[_np.ndarray, _np.ndarray]:
+        """
+        Calculates the local utility and the sub-tree utility of the items marked in keep
+
+        :param keep: flags of the items whose utilities are calculated, indexed by renamed item
+        :type keep: numpy.ndarray
+        :param size: length of the utility-bin arrays
+        :type size: int
+        :return: local utility and sub-tree utility bins
+        :rtype: tuple
+        """
+        positions, rows, items = self._getLayout()
+        if len(positions) == 0:
+            return _np.zeros(size, dtype=_np.int64), _np.zeros(size, dtype=_np.int64)
+        mask = keep[items]
+        keptUtilities = _np.where(mask, self.utilities[positions], 0)
+        suffix = keptUtilities[::-1].cumsum()[::-1]
+        rowEnds = (self.ends - self.starts).cumsum()
+        suffix -= _np.append(suffix, 0)[rowEnds][rows]
+        items = items[mask]
+        rows = rows[mask]
+        local = _sumBy(items, (self.remainingUtilities + self.prefixUtilities)[rows], size)
+        subtree = _sumBy(items, suffix[mask] + self.prefixUtilities[rows], size)
+        return local, subtree
+
+    def toSharedMemory(self) -> Tuple[List[_sharedMemory.SharedMemory], Dict[str, Tuple[str, str, tuple]]]:
+        """
+        Copies the arrays of the database, including its cumulative utilities and suffix hashes, into shared memory
+        blocks. The caller closes and unlinks the blocks once the other processes are done with them.
+
+        :return: the blocks and their layout, which is passed to fromSharedMemory
+        :rtype: tuple
+        """
+        hashes, powers = self._getHashes()
+        arrays = {'items': self.items, 'utilities': self.utilities, 'starts': self.starts, 'ends': self.ends,
+                  'prefixUtilities': self.prefixUtilities, 'remainingUtilities': self.remainingUtilities,
+                  'supports': self.supports, 'cumulative': self._cumulative, 'hashes': hashes, 'powers': powers}
+        blocks = []
+        layout = {}
+        for name, array in arrays.items():
+            block = _sharedMemory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            _np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+            blocks.append(block)
+            layout[name] = (block.name, array.dtype.str, array.shape)
+        return blocks, layout
+
+    @classmethod
+    def fromSharedMemory(cls, layout: Dict[str, Tuple[str, str, tuple]]) -> Tuple['ProjectedDatabase',
+                                                                                List[_sharedMemory.SharedMemory]]:
+        """
+        Opens a database copied into shared memory by toSharedMemory, without copying its arrays
+
+        :param layout: names, types and shapes of the shared memory blocks
+        :type layout: dict
+        :return: the database and the opened blocks, which must be kept open while the database is used
+        :rtype: tuple
+        """
+        blocks = []
+        arrays = {}
+        for name, (blockName, dtype, shape) in layout.items():
+            block = _sharedMemory.SharedMemory(name=blockName)
+            blocks.append(block)
+            arrays[name] = _np.ndarray(shape, dtype=_np.dtype(dtype), buffer=block.buf)
+        database = cls(arrays['items'], arrays['utilities'], arrays['starts'], arrays['ends'],
+                       arrays['prefixUtilities'], arrays['remainingUtilities'], arrays['supports'],
+                       arrays['cumulative'], (arrays['hashes'], arrays['powers']))
+        return database, blocks
@@ -52,10 +52,8 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 import os
-import mmap
 import time
 import psutil
-from joblib import Parallel, delayed
 from deprecated import deprecated
 
 __copyright__ = """
@@ -78,6 +76,65 @@ __copyright__ = """
 """
 
 from PAMI.highUtilityPattern.basic import abstract as _ab
+from PAMI.highUtilityPattern.basic import efimEngine as _efimEngine
+from PAMI.highUtilityPattern.basic import utilityDatabase as _utilityDatabase
+from PAMI.sequentialPattern.basic import parallelSearch as _parallelSearch
+
+def _attachWorker(minUtil, sep, layout, secondary):
+    """
+    Initializes a worker process: opens the database shared by the main process and keeps it for all the tasks. The
+    input is not read again by the workers.
+
+    :param minUtil: The minimum utility of the patterns
+
+    :type minUtil: int
+
+    :param sep: The separator of the items, kept by the miner of the worker
+
+    :type sep: str
+
+    :param layout: The shared memory layout of the database
+
+    :type layout: dict
+
+    :param secondary: Flags of the secondary items of the database
+
+    :type secondary: numpy.ndarray
+
+    :return: The state of the worker
+    """
+    database, blocks = _efimEngine.ProjectedDatabase.fromSharedMemory(layout)
+    return {'miner': efimParallel(None, minUtil, sep), 'database': database, 'secondary': secondary,
+            'blocks': blocks, 'ancestor': ((), database, secondary)}
+
+
+def _mineTask(worker, beta):
+    """
+    Searches the subtree of the prefix beta in a worker process. The tasks come grouped by their first items, so that
+    the worker keeps the projection of the ancestors of its last task and only replays them for a new prefix.
+
+    :param worker: The state of the worker, from _attachWorker
+
+    :type worker: dict
+
+    :param beta: The prefix whose subtree is searched
+
+    :type beta: list
+
+    :return: The patterns of the subtree with their utilities and the merge counts of its projections
+    """
+    miner = worker['miner']
+    miner.projectedTransactions = 0
+    miner.mergedTransactions = 0
+    ancestor, database, secondary = worker['ancestor']
+    if ancestor != tuple(beta[:-1]):
+        # the projections of the ancestors of beta are replayed from the shared database
+        database, secondary = worker['database'], worker['secondary']
+        for length in range(1, len(beta)):
+            _, database, secondary, _, _ = miner._project(beta[:length], database, secondary)
+        worker['ancestor'] = (tuple(beta[:-1]), database, secondary)
+    patterns = miner._searchSubtree(beta, database, secondary)
+    return patterns, miner.projectedTransactions, miner.mergedTransactions
 
 class efimParallel(_ab._utilityPatterns):
     """
@@ -87,7 +144,7 @@ class efimParallel(_ab._utilityPatterns):
                    high-utility itemset mining. Knowl Inf Syst 51, 595–625 (2017). https://doi.org/10.1007/s10115-016-0986-0
 
     :param  iFile: str :
-                   Name of the Input file to mine complete set of High Utility patterns
+                   Name of the Input file to mine complete set of High Utility patterns, or a database loaded by utilityDatabase.load
     :param  oFile: str :
                    Name of the output file to store complete set of High Utility patterns
     :param minUtil: int :
@@ -102,7 +159,7 @@ class efimParallel(_ab._utilityPatterns):
     :Attributes:
 
         inputFile (str):
-            The input file path.
+            The input file path, or a loaded utility database.
         minUtil (int):
             The minimum utility threshold.
         sep (str):
@@ -113,6 +170,10 @@ class efimParallel(_ab._utilityPatterns):
             A dictionary containing the discovered patterns.
         rename (dict):
             A dictionary containing the mapping between the item IDs and their names.
+        projectedTransactions (int):
+            The number of projected transactions before identical ones were merged.
+        mergedTransactions (int):
+            The number of projected transactions merged into an identical one.
         runtime (float):
             The runtime of the algorithm in seconds.
         memoryRSS (int):
@@ -123,13 +184,13 @@ class efimParallel(_ab._utilityPatterns):
     :Methods:
 
         read_file():
-            Read the input file and return the filtered transactions, primary items, and secondary items.
-        binarySearch(arr, item):
-            Perform a binary search on the given array to find the given item.
-        project(beta, file_data, secondary):
+            Read the input file and return the merged database, primary items, and secondary items.
+        project(beta, database, secondary):
             Project the given beta itemset on the given database.
-        search(collections):
-            Search for high utility itemsets in the given collections.
+        searchSubtree(beta, database, secondary):
+            Search depth first for the high utility itemsets starting with beta.
+        search(database, primary, secondary):
+            Search for high utility itemsets, sharing the subtrees among the worker processes.
         mine():
             Start the EFIM algorithm.
         savePatterns(outputFile):
@@ -142,6 +203,8 @@ class efimParallel(_ab._utilityPatterns):
             Get the Resident Set Size (RSS) memory usage of the algorithm.
         getMemoryUSS():
             Get the Unique Set Size (USS) memory usage of the algorithm.
+        getMergeRatio():
+            Get the fraction of the projected transactions merged into identical ones.
         printResults():
             Print the results of the algorithm.
 
@@ -202,120 +265,52 @@ class efimParallel(_ab._utilityPatterns):
         self.Patterns = {}
         self.rename = {}
         self.threads = threads
+        self.projectedTransactions = 0
+        self.mergedTransactions = 0
 
     # Read input file
     def _read_file(self):
         """
-        Read the input file and return the filtered transactions, primary items, and secondary items.
+        Read the input file and return the merged database, primary items, and secondary items.
 
         :return:
 
-            filtered_transactions (dict): A dictionary containing the filtered transactions.
-            primary (set): A set containing the primary items.
-            secondary (set): A set containing the secondary items.
+            database (efimEngine.ProjectedDatabase): The renamed transactions, identical ones merged.
+            primary (list): A list containing the primary items.
+            secondary (numpy.ndarray): Flags of the secondary items, indexed by item ID.
         """
 
 
-        file_data = []
-        twu = {}
-
-        with open(self.inputFile, 'r') as f:
-            fd = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
-
-            for line in iter(fd.readline, b""):
-                line = line.decode('utf-8').strip().split(":")
-                
-                # Parse and process the line
-                line = [x.split(self.sep) for x in line]
-                weight = int(line[1][0])
+        utilityDatabase = _utilityDatabase.load(self.inputFile, self.sep)
 
-                # Update file data with the parsed items
-                file_data.append([line[0], [int(x) for x in line[2]]])
+        # Keep the items whose TWU reaches minUtil, in decreasing order of TWU
+        twu = utilityDatabase.twu
+        promising = [item for item in _ab._np.argsort(-twu, kind='stable').tolist() if twu[item] >= self.minUtil]
 
-                for k in line[0]:
-                    if k not in twu:
-                        twu[k] = weight
-                    else:
-                        twu[k] += weight
-
-        # Filter TWU dictionary based on minUtil (minimum utility threshold)
-        twu = {k: v for k, v in twu.items() if v >= self.minUtil}
-
-        # Sort TWU items by utility
-        twu = {k: v for k, v in sorted(twu.items(), key=lambda item: item[1], reverse=True)}
-
-        strToInt = {}
-        t = len(twu)
-        for k in twu.keys():
-            strToInt[k] = t
-            self.rename[t] = k
+        newNames = _ab._np.zeros(len(utilityDatabase.names), dtype=_ab._np.int64)
+        t = len(promising)
+        for item in promising:
+            newNames[item] = t
+            self.rename[t] = utilityDatabase.names[item]
             t -= 1
 
-        secondary = set(self.rename.keys())
-
-        # Filter and sort transactions
-        subtree = {}
-        filtered_transactions = {}
-        for col in file_data:
-            zipped = zip(col[0], col[1])
-            transaction = [(strToInt[x], y) for x, y in zipped if x in strToInt]
-            transaction = sorted(transaction, key=lambda x: x[0])
-            if len(transaction) > 0:
-                val = [x[1] for x in transaction]
-                key = [x[0] for x in transaction]
-                
-                fs = frozenset(key)
-
-                if fs not in filtered_transactions:
-                    filtered_transactions[fs] = [key, val, 0]
-                else:
-                    filtered_transactions[fs][1] = [x + y for x, y in zip(filtered_transactions[fs][1], val)]
-
-                subUtil = sum([x[1] for x in transaction])
-                temp = 0
-
-                for i in range(len(transaction)):
-                    item = key[i]
-                    if item not in subtree:
-                        subtree[item] = subUtil - temp
-                    else:
-                        subtree[item] += subUtil - temp
-                    temp += val[i]
-
-        primary = [key for key in subtree.keys() if subtree[key] >= self.minUtil]
-
-        return filtered_transactions, primary, secondary
-    
+        secondary = _ab._np.ones(len(self.rename) + 1, dtype=bool)
 
-    def _binarySearch(self, arr, item):
-        """
-        Do a binary search on the given array to find the given item.
+        # Rename, filter and sort the transactions
+        items, utilities, starts, ends, _ = utilityDatabase.rename(newNames)
 
-        :param arr: The array to search in.
+        if len(starts) == 0:
+            return None, [], secondary
 
-        :type arr: list
+        database = _efimEngine.ProjectedDatabase.fromArrays(items, utilities, starts, ends,
+                                                            _ab._np.add.reduceat(utilities, starts))
+        database = database.mergeIdentical()
+        _, subtree = database.utilityBins(secondary, len(secondary))
+        primary = _ab._np.flatnonzero(subtree >= self.minUtil).tolist()
 
-        :param item: The item to search for
+        return database, primary, secondary
 
-        :type item: int
-        """
-
-        low = 0
-        high = len(arr) - 1
-        mid = 0
-
-        while low <= high:
-            mid = (high + low) // 2
-            if arr[mid] < item:
-                low = mid + 1
-            elif arr[mid] > item:
-                high = mid - 1
-            else:
-                return mid
-
-        return -1
-
-    def _project(self, beta, file_data, secondary):
+    def _project(self, beta, database, secondary):
         """
         Project the given beta itemset on the given database.
 
@@ -323,127 +318,146 @@ class efimParallel(_ab._utilityPatterns):
 
         :type beta: list
 
-        :param file_data: The database to project on.
+        :param database: The database to project on.
 
-        :type file_data: list
+        :type database: efimEngine.ProjectedDatabase
 
-        :param secondary: The set of secondary items
+        :param secondary: Flags of the secondary items
 
-        :type secondary: set
+        :type secondary: numpy.ndarray
 
         :return:
 
-            projected_db (dict):
-                The projected database.
-            local_utils (dict):
-                The local utilities of the projected database.
-            subtree_utils (dict):
-                The subtree utilities of the projected database.
+            projected_db (efimEngine.ProjectedDatabase):
+                The projected database, identical transactions merged.
+            nsecondary (numpy.ndarray):
+                Flags of the secondary items of the projected database.
+            nprimary (list):
+                The primary items of the projected database.
             utility (int):
                 The utility of the projected database.
         """
 
+        utility, _, projected_db = database.project(beta[-1])
 
-        projected_db = {}
-        local_utils = {}
-        subtree_utils = {}
-        utility = 0     
+        local_utils, subtree_utils = projected_db.utilityBins(secondary, len(secondary))
 
-        added = set()
+        nprimary = _ab._np.flatnonzero(subtree_utils >= self.minUtil).tolist()
+        nsecondary = local_utils >= self.minUtil
 
-        item = beta[-1]
+        return beta, projected_db, nsecondary, nprimary, utility
+    
 
-        temp = [v for k, v in file_data.items() if item in k]
-        start = time.time()
+    def _searchSubtree(self, beta, database, secondary):
+        """
+        Search depth first for the high utility itemsets starting with beta.
 
-        for v in temp:
-            index = self._binarySearch(v[0], item)
+        :param beta: The prefix whose subtree is searched
 
-            curr = v[1][index] + v[2]
-            utility += curr
+        :type beta: list
 
-            newKey = []
-            newVal = []
+        :param database: The projected database of beta without its last item.
 
-            for i in range(index+1, len(v[0])):
-                if v[0][i] in secondary:
-                    newKey.append(v[0][i])
-                    newVal.append(v[1][i])
+        :type database: efimEngine.ProjectedDatabase
 
-            if len(newKey) == 0:
-                continue
+        :param secondary: Flags of the secondary items of the database
 
-            s = sum(newVal)
-            temp = 0
+        :type secondary: numpy.ndarray
 
-            for i in range(len(newKey)):
-                if newKey[i] in added:
-                    local_utils[newKey[i]] += s + curr
-                    subtree_utils[newKey[i]] += s + curr - temp
-                else:
-                    local_utils[newKey[i]] = s + curr
-                    subtree_utils[newKey[i]] = s + curr - temp
-                    added.add(newKey[i])
-                
-                temp += newVal[i]
-            
-            fs = frozenset(newKey)
+        :return:
+            list: The itemsets of the subtree with their utilities.
+        """
 
-            if fs not in projected_db:
-                projected_db[fs] = [newKey, newVal, curr]
-            else:
-                projected_db[fs][1] = [x + y for x, y in zip(projected_db[fs][1], newVal)]
-                projected_db[fs][2] += curr
+        patterns = []
+        stack = [(beta, database, secondary)]
+        while len(stack) > 0:
+            beta, database, secondary = stack.pop()
+            beta, projected_db, secondary, primary, utility = self._project(beta, database, secondary)
+            self.projectedTransactions += projected_db.unmerged
+            self.mergedTransactions += projected_db.unmerged - len(projected_db)
+            if utility >= self.minUtil:
+                patterns.append((beta, utility))
+            for item in reversed(primary):
+                stack.append((beta + [item], projected_db, secondary))
+        return patterns
+
+    def _tasks(self, database, primary, secondary):
+        """
+        Split the search into the subtrees handed to the worker processes. When there are too few items for the
+        workers, the subtrees of the items are split into the subtrees of their extensions.
 
-        nprimary = [key for key in subtree_utils.keys() if subtree_utils[key] >= self.minUtil]
-        nsecondary = set([key for key in local_utils.keys() if local_utils[key] >= self.minUtil])
+        :param database: The database
 
-        return beta, projected_db, nsecondary, nprimary, utility
-    
+        :type database: efimEngine.ProjectedDatabase
+
+        :param primary: The primary items of the database
+
+        :type primary: list
+
+        :param secondary: Flags of the secondary items of the database
 
-    def _search(self, collections):
+        :type secondary: numpy.ndarray
 
+        :return:
+            list: The prefixes of the subtrees, in search order.
         """
-        Search for frequent patterns in the given collections.
 
-        :param collections: list of collections to search in
+        if len(primary) >= 4 * self.threads:
+            return [[item] for item in primary]
+        tasks = []
+        for item in primary:
+            beta, projected_db, nsecondary, nprimary, utility = self._project([item], database, secondary)
+            self.projectedTransactions += projected_db.unmerged
+            self.mergedTransactions += projected_db.unmerged - len(projected_db)
+            if utility >= self.minUtil:
+                self._addPattern(beta, utility)
+            tasks.extend(beta + [nitem] for nitem in nprimary)
+        return tasks
+
+    def _addPattern(self, beta, utility):
+        """
+        Store a high utility itemset under the names of its items.
+        """
+        self.Patterns["\t".join([self.rename[x] for x in beta])] = utility
 
-        :type collections: list
+    def _search(self, database, primary, secondary):
         """
+        Search for high utility itemsets. With several threads the database is copied once into shared memory and
+        the subtrees of the search are handed to worker processes, which search them depth first. A worker takes the
+        next subtree as soon as it is done with one.
+
+        :param database: The database
 
-        if self.threads > 1:
-            with Parallel(n_jobs=self.threads) as parallel:
-                while len(collections) > 0:
-                    new_collections = []
+        :type database: efimEngine.ProjectedDatabase
 
-                    # print("Num of tasks:", sum(len(collections[i][2]) for i in range(len(collections))))
-                    results = parallel(delayed(self._project)(collections[i][0] + [collections[i][2][j]], collections[i][1], collections[i][3]) for i in range(len(collections)) for j in range(len(collections[i][2])))
+        :param primary: The primary items of the database
 
-                    for i in range(len(results)):
-                        beta, projected_db, secondary, primary, utility = results[i]
-                        if utility >= self.minUtil:
-                            pattern = "\t".join([self.rename[x] for x in beta])
-                            # self.Patterns[tuple(beta)] = utility
-                            self.Patterns[pattern] = utility
-                        if len(primary) > 0:
-                            new_collections.append([beta, projected_db, primary, secondary])
-                    
-                    collections = new_collections
+        :type primary: list
+
+        :param secondary: Flags of the secondary items of the database
+
+        :type secondary: numpy.ndarray
+        """
 
+        if self.threads > 1 and len(primary) > 0:
+            tasks = self._tasks(database, primary, secondary)
+            blocks, layout = database.toSharedMemory()
+            try:
+                for patterns, projected, merged in _parallelSearch.poolMap(
+                        _mineTask, tasks, self.threads, _attachWorker, (self.minUtil, self.sep, layout, secondary),
+                        ordered=True):
+                    for beta, utility in patterns:
+                        self._addPattern(beta, utility)
+                    self.projectedTransactions += projected
+                    self.mergedTransactions += merged
+            finally:
+                for block in blocks:
+                    block.close()
+                    block.unlink()
         else:
-            while len(collections) > 0:
-                new_collections = []
-                for i in range(len(collections)):
-                    for j in range(len(collections[i][2])):
-                        beta, projected_db, secondary, primary, utility = self._project(collections[i][0] + [collections[i][2][j]], collections[i][1], collections[i][3])
-                        if utility >= self.minUtil:
-                            pattern = "\t".join([self.rename[x] for x in beta])
-                            # self.Patterns[tuple(beta)] = utility
-                            self.Patterns[pattern] = utility
-                        if len(primary) > 0:
-                            new_collections.append([beta, projected_db, primary, secondary])
-
-                collections = new_collections
+            for item in primary:
+                for beta, utility in self._searchSubtree([item], database, secondary):
+                    self._addPattern(beta, utility)
 
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
@@ -461,12 +475,14 @@ class efimParallel(_ab._utilityPatterns):
         ps = psutil.Process(os.getpid())
 
         self.start = time.time()
+        self.Patterns = {}
+        self.rename = {}
+        self.projectedTransactions = 0
+        self.mergedTransactions = 0
 
-        fileData, primary, secondary = self._read_file()
-
-        collection = [[[], fileData, primary, secondary]]
+        database, primary, secondary = self._read_file()
 
-        self._search(collection)
+        self._search(database, primary, secondary)
 
         self.memoryRSS = ps.memory_info().rss
         self.memoryUSS = ps.memory_full_info().uss
@@ -536,6 +552,16 @@ class efimParallel(_ab._utilityPatterns):
         """
         return self.memoryUSS
 
+    def getMergeRatio(self):
+        """
+        Get the fraction of the projected transactions which were merged into an identical projected transaction.
+
+        :return:
+            float: The merge ratio of the projected databases.
+        """
+        if self.projectedTransactions == 0:
+            return 0.0
+        return self.mergedTransactions / self.projectedTransactions
 
     def printResults(self):
         """
@@ -545,6 +571,7 @@ class efimParallel(_ab._utilityPatterns):
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in seconds:", self.getRuntime())
+        print("Merge ratio of the projected transactions:", self.getMergeRatio())
 
 
 if __name__ == "__main__":
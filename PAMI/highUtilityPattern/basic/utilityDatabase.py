@@ -0,0 +1,414 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Bulk loader of utility databases shared by the high utility miners.
+
+A utility database has one transaction per line, in the form items:transactionUtility:utilities. The file is memory
+mapped and read in chunks of whole lines. Every chunk is split into its three columns at once, and the numbers of a
+column are converted by NumPy in a single call instead of one int() per token. Items are given ids in the order of
+their first appearance, so the miners which break ties by that order find the same patterns as before. Chunks can also
+be parsed by several processes, each one reading its own byte range of the file.
+
+The result keeps the transactions as flat arrays of item ids and utilities with the (start, end) range of every
+transaction, the transaction utilities and the TWU of every item. A loaded database can be passed to the miners in
+place of a file name, so that several miners or several thresholds reuse it without reading the file again.
+"""
+
+import mmap as _mmap
+import multiprocessing as _multiprocessing
+import os as _os
+import warnings as _warnings
+from typing import Any, Iterator, List, Optional, Tuple
+from urllib.request import urlopen as _urlopen
+
+import numpy as _np
+import pandas as _pd
+import validators as _validators
+
+_Chunk = Tuple[_np.ndarray, List[bytes], _np.ndarray, _np.ndarray, _np.ndarray]
+
+
+def _toIntegers(text: bytes, count: int) -> Optional[_np.ndarray]:
+    """
+    Converts a text of integers separated by white spaces in a single call
+
+    :param text: the integers
+    :type text: bytes
+    :param count: number of integers the text should hold
+    :type count: int
+    :return: the integers, or None if the text holds anything else
+    :rtype: numpy.ndarray
+    """
+    if count == 0:
+        return _np.zeros(0, dtype=_np.int64)
+    # every token is checked to be [-]digits, so that NumPy never gets a text it may read in a different way
+    if text.translate(None, b'0123456789- \t\n'):
+        return None
+    buffer = _np.frombuffer(text, dtype=_np.uint8)
+    signs = _np.flatnonzero(buffer == ord('-'))
+    if len(signs):
+        following = buffer[_np.minimum(signs + 1, len(buffer) - 1)]
+        preceding = buffer[_np.maximum(signs - 1, 0)]
+        if signs[-1] == len(buffer) - 1 or not ((following >= ord('0')) & (following <= ord('9'))).all() or \
+                not ((signs == 0) | _np.isin(preceding, (ord(' '), ord('\t'), ord('\n')))).all():
+            return None
+    with _warnings.catch_warnings():
+        # older NumPy versions only warn about unmatched data, instead of raising
+        _warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = _np.fromstring(text, dtype=_np.int64, sep=' ')
+        except (ValueError, DeprecationWarning):
+            return None
+    return values if len(values) == count else None
+
+
+def _tokens(segments: List[bytes], sep: bytes) -> Tuple[bytes, _np.ndarray]:
+    """
+    Joins the segments of a column, one per transaction, and counts their tokens. Empty tokens are dropped.
+
+    :param segments: the column of every transaction
+    :type segments: list
+    :param sep: separator of the tokens
+    :type sep: bytes
+    :return: the segments joined by new lines and the number of tokens of every segment
+    :rtype: tuple
+    """
+    text = b'\n'.join(segments)
+    padded = b'\n' + text + b'\n'
+    if sep + sep in padded or b'\n' + sep in padded or sep + b'\n' in padded:
+        segments = [sep.join(token for token in segment.split(sep) if token) for segment in segments]
+        text = b'\n'.join(segments)
+    if len(sep) == 1 and sep != b'\n':
+        buffer = _np.frombuffer(text, dtype=_np.uint8)
+        separators = _np.concatenate(([0], _np.cumsum(buffer == sep[0])))
+        lineEnds = _np.concatenate((_np.flatnonzero(buffer == 10), [len(buffer)]))
+        counts = _np.diff(_np.concatenate(([0], separators[lineEnds]))) + 1
+    else:
+        counts = _np.fromiter((segment.count(sep) + 1 for segment in segments), dtype=_np.int64,
+                              count=len(segments))
+    counts[_np.fromiter((len(segment) == 0 for segment in segments), dtype=bool, count=len(segments))] = 0
+    return text, counts
+
+
+def _itemIds(text: bytes, sep: bytes, count: int) -> Tuple[_np.ndarray, List[bytes]]:
+    """
+    Gives every item of a chunk an id, in the order of the first appearance of the items
+
+    :param text: items of the transactions, separated by sep and by new lines
+    :type text: bytes
+    :param sep: separator of the items
+    :type sep: bytes
+    :param count: number of items
+    :type count: int
+    :return: the id of every item and the name of every id
+    :rtype: tuple
+    """
+    values = _toIntegers(text.replace(sep, b' ').replace(b'\n', b' '), count)
+    if values is not None and count > 0:
+        low, high = int(values.min()), int(values.max())
+        # canonical integers only, i.e., no sign or leading zeros the conversion would lose
+        digits = _np.floor(_np.log10(_np.maximum(_np.abs(values), 1))).astype(_np.int64) + 1 + (values < 0)
+        if high - low <= max(1 << 20, 2 * count) and \
+                int(digits.sum()) + len(sep) * text.count(sep) + text.count(b'\n') == len(text):
+            first = _np.full(high - low + 1, count, dtype=_np.int64)
+            _np.minimum.at(first, values - low, _np.arange(count, dtype=_np.int64))
+            present = _np.flatnonzero(first < count)
+            present = present[_np.argsort(first[present], kind='stable')]
+            ids = _np.empty(high - low + 1, dtype=_np.int64)
+            ids[present] = _np.arange(len(present), dtype=_np.int64)
+            return ids[values - low], [str(value + low).encode() for value in present.tolist()]
+    tokens = [token for token in text.replace(b'\n', sep).split(sep) if token]
+    names = dict.fromkeys(tokens)
+    for index, name in enumerate(names):
+        names[name] = index
+    return _np.fromiter(map(names.__getitem__, tokens), dtype=_np.int64, count=len(tokens)), list(names)
+
+
+def _parseChunk(data: bytes, sep: bytes) -> _Chunk:
+    """
+    Parses whole lines of a utility database
+
+    :param data: the lines
+    :type data: bytes
+    :param sep: separator of the items and of the utilities
+    :type sep: bytes
+    :return: ids of the items in the chunk, names of the ids, utilities, number of items and utility of every
+             transaction
+    :rtype: tuple
+    """
+    body = data.replace(b'\r', b'').strip(b'\n')
+    lines = body.count(b'\n') + 1 if body else 0
+    if lines and body.count(b':') == 2 * lines and b'\n\n' not in body:
+        fields = body.replace(b'\n', b':').split(b':')
+        itemSegments, utilitySums, utilitySegments = fields[0::3], fields[1::3], fields[2::3]
+    else:
+        itemSegments, utilitySums, utilitySegments = [], [], []
+        for line in body.split(b'\n'):
+            parts = line.split(b':')
+            if len(parts) < 3:
+                continue
+            itemSegments.append(parts[0])
+            utilitySums.append(parts[1])
+            utilitySegments.append(parts[2])
+    itemText, lengths = _tokens(list(map(bytes.strip, itemSegments)), sep)
+    utilityText, utilityCounts = _tokens(list(map(bytes.strip, utilitySegments)), sep)
+    if not _np.array_equal(lengths, utilityCounts):
+        raise ValueError("every item of a transaction needs a utility")
+    count = int(lengths.sum())
+    ids, names = _itemIds(itemText, sep, count)
+    utilities = _toIntegers(utilityText.replace(sep, b' ').replace(b'\n', b' '), count)
+    if utilities is None:
+        utilities = _np.array([int(x) for x in utilityText.replace(b'\n', sep).split(sep) if x], dtype=_np.int64)
+    transactionUtilities = _toIntegers(b' '.join(utilitySums), len(utilitySums))
+    if transactionUtilities is None:
+        transactionUtilities = _np.array([int(x) for x in utilitySums], dtype=_np.int64)
+    return ids, names, utilities, lengths, transactionUtilities
+
+
+def _parseRange(task: Tuple[str, int, int, bytes]) -> _Chunk:
+    """
+    Parses a byte range of whole lines of a file in a worker process
+
+    :param task: path of the file, first and last byte of the range and separator
+    :type task: tuple
+    :return: the parsed chunk
+    :rtype: tuple
+    """
+    path, start, end, sep = task
+    with open(path, 'rb') as f, _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ) as data:
+        return _parseChunk(data[start:end], sep)
+
+
+def _byteRanges(data: Any, size: int, chunkSize: int) -> List[Tuple[int, int]]:
+    """
+    Splits a buffer into ranges of about chunkSize bytes, ending at the end of a line
+
+    :param data: the buffer
+    :param size: length of the buffer
+    :type size: int
+    :param chunkSize: number of bytes of a range
+    :type chunkSize: int
+    :return: the (start, end) of every range
+    :rtype: list
+    """
+    ranges = []
+    start = 0
+    while start < size:
+        end = data.find(b'\n', min(start + chunkSize, size) - 1)
+        end = size if end < 0 else end + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+class UtilityDatabase:
+    """
+    :Description: Transactions of a utility database stored as flat NumPy arrays.
+
+    :Attributes:
+
+        names : list
+            Name of every item id, ids are given in the order of the first appearance of the items
+        items : numpy.ndarray
+            Item ids of all the transactions, one after another
+        utilities : numpy.ndarray
+            Utility of every item of items
+        starts : numpy.ndarray
+            Position of the first item of every transaction
+        ends : numpy.ndarray
+            Position after the last item of every transaction
+        transactionUtilities : numpy.ndarray
+            Utility of every transaction, as given by the database
+        twu : numpy.ndarray
+            Transaction weighted utility of every item id
+
+    :Methods:
+
+        transaction(index)
+            Item ids and utilities of a transaction
+        transactions()
+            Item names, utilities and utility of every transaction
+        rename(newNames)
+            Keeps the items having a new name and sorts every transaction by the new names
+
+    **Sample run of the importing code:**
+    ----------------------------------------
+    .. code-block:: python
+
+            from PAMI.highUtilityPattern.basic import utilityDatabase as _utilityDatabase
+
+            database = _utilityDatabase.load("sampleUtility.txt", "\\t")
+
+            print(len(database), dict(zip(database.names, database.twu.tolist())))
+
+            from PAMI.highUtilityPattern.basic import EFIM
+
+            for minUtil in (30000, 20000):
+
+                obj = EFIM.EFIM(database, minUtil)
+
+                obj.mine()
+    """
+
+    def __init__(self, names: List[str], items: _np.ndarray, utilities: _np.ndarray, lengths: _np.ndarray,
+                 transactionUtilities: _np.ndarray) -> None:
+        self.names = names
+        self.items = items
+        self.utilities = utilities
+        self.ends = _np.cumsum(lengths)
+        self.starts = self.ends - lengths
+        self.transactionUtilities = transactionUtilities
+        self.twu = _np.rint(_np.bincount(items, weights=_np.repeat(transactionUtilities, lengths),
+                                         minlength=len(names))).astype(_np.int64)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def transaction(self, index: int) -> Tuple[_np.ndarray, _np.ndarray]:
+        """
+        Returns a transaction
+
+        :param index: position of the transaction in the database
+        :type index: int
+        :return: item ids and utilities of the transaction
+        :rtype: tuple
+        """
+        return self.items[self.starts[index]:self.ends[index]], self.utilities[self.starts[index]:self.ends[index]]
+
+    def transactions(self) -> Iterator[Tuple[List[str], List[int], int]]:
+        """
+        Iterates over the transactions in the order of the database
+
+        :return: item names, utilities and utility of every transaction
+        :rtype: Iterator[tuple]
+        """
+        names = self.names
+        items = self.items.tolist()
+        utilities = self.utilities.tolist()
+        for start, end, transactionUtility in zip(self.starts.tolist(), self.ends.tolist(),
+                                                  self.transactionUtilities.tolist()):
+            yield [names[item] for item in items[start:end]], utilities[start:end], transactionUtility
+
+    def rename(self, newNames: _np.ndarray) -> Tuple[_np.ndarray, _np.ndarray, _np.ndarray, _np.ndarray,
+                                                     _np.ndarray]:
+        """
+        Renames the items, removes the items without a new name and sorts every transaction by increasing new name.
+        The transactions left empty are removed.
+
+        :param newNames: new name of every item id, 0 for the items to be removed
+        :type newNames: numpy.ndarray
+        :return: the renamed items, their utilities, the start and end of every transaction and the utility of every
+                 transaction without the removed items
+        :rtype: tuple
+        """
+        lengths = self.ends - self.starts
+        rows = _np.repeat(_np.arange(len(self), dtype=_np.int64), lengths)
+        renamed = _np.asarray(newNames, dtype=_np.int64)[self.items]
+        kept = renamed > 0
+        removed = _np.rint(_np.bincount(rows[~kept], weights=self.utilities[~kept], minlength=len(self)))
+        order = _np.flatnonzero(kept)
+        order = order[_np.lexsort((renamed[order], rows[order]))]
+        keptLengths = _np.bincount(rows[order], minlength=len(self))
+        nonEmpty = keptLengths > 0
+        ends = _np.cumsum(keptLengths[nonEmpty])
+        transactionUtilities = (self.transactionUtilities - removed.astype(_np.int64))[nonEmpty]
+        return renamed[order], self.utilities[order], ends - keptLengths[nonEmpty], ends, transactionUtilities
+
+
+def _merge(chunks: List[_Chunk]) -> UtilityDatabase:
+    """
+    Joins parsed chunks, given in the order of the file, into a database
+
+    :param chunks: the parsed chunks
+    :type chunks: list
+    :return: the database
+    :rtype: UtilityDatabase
+    """
+    names = {}
+    items = []
+    for ids, chunkNames, _, _, _ in chunks:
+        local = _np.empty(len(chunkNames), dtype=_np.int64)
+        for index, name in enumerate(chunkNames):
+            local[index] = names.setdefault(name, len(names))
+        items.append(local[ids])
+
+    def join(arrays: List[_np.ndarray]) -> _np.ndarray:
+        return _np.concatenate(arrays) if arrays else _np.zeros(0, dtype=_np.int64)
+
+    return UtilityDatabase([name.decode('utf-8') for name in names], join(items),
+                           join([chunk[2] for chunk in chunks]), join([chunk[3] for chunk in chunks]),
+                           join([chunk[4] for chunk in chunks]))
+
+
+def _fromDataFrame(dataFrame: _pd.DataFrame) -> UtilityDatabase:
+    """
+    Builds a database from the columns Transactions, Utilities and UtilitySum of a data frame
+
+    :param dataFrame: the data frame
+    :type dataFrame: pandas.DataFrame
+    :return: the database
+    :rtype: UtilityDatabase
+    """
+    names = {}
+    items = []
+    utilities = []
+    lengths = []
+    for transaction, values in zip(dataFrame['Transactions'], dataFrame['Utilities']):
+        for item in transaction:
+            items.append(names.setdefault(str(item), len(names)))
+        utilities.extend(int(value) for value in values)
+        lengths.append(len(transaction))
+    return UtilityDatabase(list(names), _np.array(items, dtype=_np.int64), _np.array(utilities, dtype=_np.int64),
+                           _np.array(lengths, dtype=_np.int64),
+                           _np.array([int(value) for value in dataFrame['UtilitySum']], dtype=_np.int64))
+
+
+def load(source: Any, sep: str = '\t', chunkSize: int = 1 << 25, processes: int = 1) -> UtilityDatabase:
+    """
+    Loads a utility database
+
+    :param source: path or URL of a file in the items:transactionUtility:utilities format, a data frame with the columns
+                   Transactions, Utilities and UtilitySum, or a database loaded before, which is returned as it is
+    :param sep: separator of the items and of the utilities
+    :type sep: str
+    :param chunkSize: number of bytes of the file parsed at once
+    :type chunkSize: int
+    :param processes: number of processes parsing the chunks of a local file
+    :type processes: int
+    :return: the database
+    :rtype: UtilityDatabase
+    """
+    if isinstance(source, UtilityDatabase):
+        return source
+    if isinstance(source, _pd.DataFrame):
+        return _fromDataFrame(source)
+    separator = sep.encode('utf-8')
+    if _validators.url(source):
+        data = _urlopen(source).read()
+        return _merge([_parseChunk(data[start:end], separator)
+                       for start, end in _byteRanges(data, len(data), chunkSize)])
+    with open(source, 'rb') as f:
+        size = _os.fstat(f.fileno()).st_size
+        if size == 0:
+            return _merge([])
+        with _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ) as data:
+            ranges = _byteRanges(data, size, chunkSize)
+            if processes > 1 and len(ranges) > 1:
+                with _multiprocessing.Pool(min(processes, len(ranges))) as pool:
+                    chunks = pool.map(_parseRange, [(source, start, end, separator) for start, end in ranges])
+            else:
+                chunks = [_parseChunk(data[start:end], separator) for start, end in ranges]
+    return _merge(chunks)
@@ -0,0 +1,132 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Columnar utility lists shared by the utility-list based miners.
+
+A utility list stores one NumPy array per field of its elements instead of one object per element: the transaction
+ids, sorted in increasing order, and the value columns chosen by the miner, such as the utility and the remaining
+utility of the pattern in every transaction. Joins are merge-joins over the sorted tid columns, and the values of the
+joined elements are computed column by column.
+"""
+
+from typing import Any, Iterable, Tuple
+
+import numpy as _np
+
+
+class UtilityList:
+    """
+    :Description: Utility list of a pattern stored as a struct of arrays, one column per field of its elements.
+
+    :Attributes:
+
+        item : Any
+            Last item of the pattern, or the pattern itself
+        tids : numpy.ndarray
+            Transaction ids of the elements, sorted in increasing order
+        columns : dict
+            Value columns of the elements, aligned with tids and also readable as attributes
+
+    :Methods:
+
+        total(name)
+            Sum of a column
+        locate(tids)
+            Positions of the given transaction ids in the list
+        intersect(other)
+            Transaction ids shared with another list and their positions in both lists
+        take(positions, item)
+            Utility list of the elements at the given positions
+
+    **Sample run of the importing code:**
+    ----------------------------------------
+    .. code-block:: python
+
+            from PAMI.highUtilityPattern.basic import utilityList as _utilityList
+
+            x = _utilityList.UtilityList('a', [1, 3, 4], utility=[5, 2, 1])
+
+            y = _utilityList.UtilityList('b', [3, 4, 7], utility=[1, 1, 9])
+
+            tids, inX, inY = x.intersect(y)
+
+            xy = _utilityList.UtilityList('ab', tids, utility=x.utility[inX] + y.utility[inY])
+    """
+
+    def __init__(self, item: Any, tids: Iterable[int], **columns: Iterable[Any]) -> None:
+        self.item = item
+        self.tids = _np.asarray(tids, dtype=_np.int64)
+        self.columns = {name: _np.asarray(values) for name, values in columns.items()}
+
+    def __getattr__(self, name: str) -> _np.ndarray:
+        if name == 'columns':
+            raise AttributeError(name)
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __len__(self) -> int:
+        return len(self.tids)
+
+    def total(self, name: str) -> Any:
+        """
+        Calculates the sum of a column
+
+        :param name: name of the column
+        :type name: str
+        :return: sum of the column as a Python number
+        """
+        return self.columns[name].sum().item()
+
+    def locate(self, tids: _np.ndarray) -> Tuple[_np.ndarray, _np.ndarray]:
+        """
+        Finds the given transaction ids in the list by binary search over its sorted tids
+
+        :param tids: transaction ids to be found
+        :type tids: numpy.ndarray
+        :return: flags of the ids present in the list and their positions, meaningful only where found
+        :rtype: tuple
+        """
+        positions = _np.searchsorted(self.tids, tids)
+        clipped = _np.minimum(positions, max(len(self.tids) - 1, 0))
+        if len(self.tids) == 0:
+            return _np.zeros(len(tids), dtype=bool), clipped
+        return self.tids[clipped] == tids, clipped
+
+    def intersect(self, other: 'UtilityList') -> Tuple[_np.ndarray, _np.ndarray, _np.ndarray]:
+        """
+        Merge-joins the tid columns of two lists
+
+        :param other: the other utility list
+        :type other: UtilityList
+        :return: the shared transaction ids and their positions in this list and in the other list
+        :rtype: tuple
+        """
+        return _np.intersect1d(self.tids, other.tids, assume_unique=True, return_indices=True)
+
+    def take(self, positions: _np.ndarray, item: Any = None) -> 'UtilityList':
+        """
+        Selects the elements at the given positions
+
+        :param positions: positions of the selected elements, in increasing order
+        :type positions: numpy.ndarray
+        :param item: item of the new list, the item of this list if None
+        :return: utility list of the selected elements
+        :rtype: UtilityList
+        """
+        return UtilityList(self.item if item is None else item, self.tids[positions],
+                           **{name: values[positions] for name, values in self.columns.items()})
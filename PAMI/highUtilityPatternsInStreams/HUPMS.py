@@ -54,10 +54,9 @@ Copyright (C)  2021 Rage Uday Kiran
 
 """
 
-import abstract as _hus
+from PAMI.highUtilityPatternsInStreams import abstract as _hus
+from PAMI.highUtilityPatternsInStreams import paneIndex as _paneIndex
 import pandas as pd
-from functools import reduce
-from operator import and_ 
 from deprecated import deprecated
 
 _minSup = str()
@@ -395,7 +394,7 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
 
 
     :param  iFile: str :
-                   Name of the Input file to mine complete set of High Utility patterns in Streams
+                   Name of the Input file to mine complete set of High Utility patterns in Streams, or any iterable of its lines such as a socket or a file being tailed
     :param  oFile: str :
                    Name of the output file to store complete set of High Utility patterns in Streams
     :param minUtil: int :
@@ -434,14 +433,8 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
         __memoryRSS : float
             memory usage of the algorithm in resident set size
 
-        __transactions : list
-            list of transactions in the database
-
-        __utilities : list
-            list of utilities of each item of a transaction in the database
-
-        __utilitySum : list
-            list of utility sum of each transaction in the database
+        __index : paneIndex.PaneIndex
+            item utility lists of the panes of the current window
 
         __tree : _HUSTree
             HUS tree of the current window
@@ -454,9 +447,6 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
 
     :Methods:
 
-        _createItemsets()
-            Storing the complete transactions of the database/input file in a transaction variable with their utilities.
-
         createPrefixBranch(root)
             Creates the prefix branch of the current HUS-Tree for construction of prefix tree
 
@@ -466,15 +456,15 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
         createConditionalTree(root, transactions, minUtil)
             Creates the conditional tree for the given prefix tree
 
-        contains(superset, subset)
-            Checks if the superset contains the subset
-
         treeGenerations(root, netUtil, candidatePattern, curItem)
             Generates the tree of the high utility patterns
 
         mine()
             Starts the mining process
 
+        windowPatterns()
+            Mines the stream and yields the patterns of every window as soon as its last pane closes
+
         printTree(root, level)
             Prints the HUS-tree in a readable format
 
@@ -531,9 +521,7 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
     _sep = " "
     __memoryUSS = float()
     __memoryRSS = float()
-    __transactions = []
-    __utilities = []
-    __utilitySum = []
+    __index = None
     __tree = None
     __windowSize = 0
     __paneSize = 0
@@ -542,50 +530,6 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
         super().__init__(iFile, minUtil, windowSize, paneSize, sep)
         self._oFile = oFile
 
-    def _createItemsets(self):
-        """
-        Storing the complete transactions of the database/input file in a transaction variable
-        """
-        self._transactions, self._utilities, self._utilitySum = [], [], []
-        if isinstance(self._iFile, _hus._pd.DataFrame):
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                self._transactions = self._iFile['Transactions'].tolist()
-            if 'Utilities' in i:
-                self._utilities = self._iFile['Utilities'].tolist()
-            if 'UtilitySum' in i:
-                self._utilitySum = self._iFile['UtilitySum'].tolist()
-        if isinstance(self._iFile, str):
-            if _hus._validators.url(self._iFile):
-                data = _hus._urlopen(self._iFile)
-                for line in data:
-                    line = line.decode("utf-8")
-                    line = line.split("\n")[0]
-                    parts = line.split(":")
-                    items = parts[0].split(self._sep)
-                    self.__transactions.append([x for x in items if x])
-                    utilities = parts[2].split(self._sep)
-                    utilities = [float(x) for x in utilities]
-                    self.__utilities.append(utilities)
-                    self.__utilitySum.append(int(parts[1]))
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line = line.split("\n")[0]
-                            parts = line.split(":")
-                            items = parts[0].split(self._sep)
-                            self._transactions.append([x for x in items if x])
-                            utilities = parts[2].split(self._sep)
-                            utilities = [float(x) for x in utilities]
-                            self._utilities.append(utilities)
-                            self._utilitySum.append(float(parts[1]))
-                except IOError:
-                    print("File Not Found")
-                    quit()
-
     def createPrefixBranch(self, root):
         """
         Creates the prefix branch of the node
@@ -665,25 +609,6 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
         self.fixUtility(tempTree.root)
 
         return tempTree
-    
-    def contains(self, superset, subset):
-        """
-        Checks if the superset contains the subset
-
-        :param superset: list of items in the superset
-
-        :type superset: list
-
-        :param subset: list of items in the subset
-
-        :type subset: list
-
-        :return bool: True if the superset contains the subset, False otherwise
-
-        :rtype: bool
-        """
-     
-        return reduce(and_, [i in superset for i in subset])
 
     def treeGenerations(self, root, netUtil, candidatePattern, curItem = None):
         """
@@ -735,7 +660,7 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
 
                 conditionalTree = self.createConditionalTree(prefixTree, completeTransactions, netUtil)
 
-                newItemset = curItem.copy()
+                newItemset = [] if curItem is None else curItem.copy()
                 newItemset.append(item)
 
                 if len(newItemset) not in candidatePattern:
@@ -754,12 +679,14 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
         """
         self.mine()
 
-    def mine(self):
+    def windowPatterns(self):
         """
-        This function will start the mining process
+        Mines the stream and yields the patterns of every window as soon as its last pane closes. The input is read
+        lazily, so it can be an endless iterable of lines such as a socket or a file being tailed.
+
+        :return: (start, end) transaction ids of every window and its list of [pattern, utility]
+        :rtype: Iterator[tuple]
         """
-        global _minUtil
-        self.__startTime = _hus._time.time()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minUtil is None:
@@ -770,59 +697,48 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
             raise Exception("Please enter the Pane Size")
         self.__windowSize = int(self._windowSize)
         self.__paneSize = int(self._paneSize)
-
-        self._createItemsets()
         self._minUtil = float(self._minUtil)
+        self.__finalPatterns = {}
         self.__tree = _HUSTree(self.__windowSize, self.__paneSize)
+        self.__index = _paneIndex.PaneIndex(self.__windowSize)
 
-        transactionwiseUtility = []
-
-        for i in range(len(self._transactions)):
-            curTrans = {}
-            for j in range(len(self._transactions[i])):
-                curTrans[self._transactions[i][j]] = self._utilities[i][j]
-            transactionwiseUtility.append(curTrans)
-
-        for i in range(0, self.__windowSize):
-            self.__tree.batchIndex = i
-            for j in range(0, self.__paneSize):
-                self.__tree.addTransaction(self._transactions[i * self.__paneSize + j],
-                                           self._utilitySum[i * self.__paneSize + j])
-
-        startIndex = 0
-        endIndex = self.__windowSize * self.__paneSize
-
-        while endIndex <= len(self._transactions):
+        for pane in _paneIndex.panes(_paneIndex.readTransactions(self._iFile, self._sep), self.__paneSize):
+            if self.__index.isFull():
+                self.__tree.removeBatch()
+            else:
+                self.__tree.batchIndex = len(self.__index)
+            # the pane is indexed first because the tree sorts the items of the transactions in place
+            self.__index.addPane(pane)
+            for items, utilities, utilitySum in pane:
+                self.__tree.addTransaction(items, utilitySum)
+            if not self.__index.isFull():
+                continue
 
             filteredItemsets = {}
 
             self.treeGenerations(self.__tree, self._minUtil, filteredItemsets)
 
             results = []
+            joins = {}
 
             for itemSetLen in filteredItemsets:
                 for itemSet in filteredItemsets[itemSetLen]:
-                    itemSetUtility = 0
-                    for transId in range(startIndex, endIndex):
-                        if (self.contains(list(transactionwiseUtility[transId].keys()), itemSet)):
-                            for item in itemSet:
-                                itemSetUtility += transactionwiseUtility[transId][item]
+                    itemSetUtility = self.__index.utility(itemSet, joins)
 
                     if itemSetUtility >= self._minUtil:
                         results.append([itemSet, itemSetUtility])
 
-            self.__finalPatterns[(startIndex, endIndex)] = results
+            window = (self.__index.start, self.__index.end)
+            self.__finalPatterns[window] = results
+            yield window, results
 
-            if endIndex >= len(self._transactions):
-                break
-
-            self.__tree.removeBatch()
-
-            for i in range(0, self.__paneSize):
-                self.__tree.addTransaction(self._transactions[endIndex + i], self._utilitySum[endIndex + i])
-
-            startIndex += self.__paneSize
-            endIndex += self.__paneSize
+    def mine(self):
+        """
+        This function will start the mining process
+        """
+        self.__startTime = _hus._time.time()
+        for _ in self.windowPatterns():
+            pass
 
         self.__endTime = _hus._time.time()
         self.__memoryUSS = float()
@@ -0,0 +1,237 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Incremental sliding-window index shared by the high utility stream miners.
+
+The stream is read lazily, one transaction at a time, from a file, a URL, a data frame or any iterable of lines such
+as an open socket or a file being tailed. Every closed pane keeps, for each of its items, the utility list of the item:
+the ids of the transactions containing it and its utility in each of them. The window is the deque of its last panes,
+so sliding it appends the new pane and drops the oldest one without looking at the other transactions again.
+
+The exact utility of a candidate is the sum, over the panes of the window, of the merge-join of the utility lists of its
+items. The joins of a pattern are cached while a window is verified, so the candidates sharing a prefix reuse it.
+"""
+
+from collections import deque as _deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.request import urlopen as _urlopen
+
+import pandas as _pd
+import validators as _validators
+
+from PAMI.highUtilityPattern.basic import utilityList as _utilityList
+
+Transaction = Tuple[List[str], List[float], float]
+
+
+def _parseLine(line: Any, sep: str) -> Optional[Transaction]:
+    """
+    Splits a line of the form items:transactionUtility:utilities
+
+    :param line: line of the input, str or bytes
+    :param sep: separator of the items and of the utilities
+    :type sep: str
+    :return: items, item utilities and transaction utility, or None for a blank line
+    :rtype: tuple
+    """
+    if isinstance(line, bytes):
+        line = line.decode("utf-8")
+    line = line.split("\n")[0].strip("\r")
+    if not line.strip():
+        return None
+    parts = line.split(":")
+    items = [x for x in parts[0].split(sep) if x]
+    utilities = [float(x) for x in parts[2].split(sep) if x.strip()]
+    return items, utilities, float(parts[1])
+
+
+def readTransactions(source: Any, sep: str) -> Iterator[Transaction]:
+    """
+    Reads the transactions of a stream lazily
+
+    :param source: path or URL of a file, a data frame with the columns Transactions, Utilities and UtilitySum, or any
+                   iterable of lines in the file format or of (items, utilities, transactionUtility) tuples
+    :param sep: separator of the items and of the utilities
+    :type sep: str
+    :return: items, item utilities and transaction utility of every transaction, in stream order
+    :rtype: Iterator[tuple]
+    """
+    if isinstance(source, _pd.DataFrame):
+        for items, utilities, utilitySum in zip(source['Transactions'], source['Utilities'], source['UtilitySum']):
+            yield list(items), [float(x) for x in utilities], float(utilitySum)
+        return
+    if isinstance(source, str):
+        if _validators.url(source):
+            lines = _urlopen(source)
+        else:
+            try:
+                lines = open(source, 'r', encoding='utf-8')
+            except IOError:
+                print("File Not Found")
+                quit()
+        with lines:
+            for line in lines:
+                transaction = _parseLine(line, sep)
+                if transaction is not None:
+                    yield transaction
+        return
+    for line in source:
+        if isinstance(line, (str, bytes)):
+            line = _parseLine(line, sep)
+            if line is None:
+                continue
+        items, utilities, utilitySum = line
+        yield list(items), [float(x) for x in utilities], float(utilitySum)
+
+
+def panes(transactions: Iterable[Transaction], paneSize: int) -> Iterator[List[Transaction]]:
+    """
+    Groups a stream of transactions into panes. A pane is produced as soon as its last transaction has been read, and
+    the transactions of an unfinished last pane are not produced.
+
+    :param transactions: stream of transactions
+    :type transactions: Iterable[tuple]
+    :param paneSize: number of transactions of a pane
+    :type paneSize: int
+    :return: the panes of the stream
+    :rtype: Iterator[list]
+    """
+    pane = []
+    for transaction in transactions:
+        pane.append(transaction)
+        if len(pane) == paneSize:
+            yield pane
+            pane = []
+
+
+class PaneIndex:
+    """
+    :Description: Item utility lists of the panes of a sliding window.
+
+    :Attributes:
+
+        windowSize : int
+            Number of panes of a window
+        start : int
+            Id of the first transaction of the window
+        end : int
+            Id following the last transaction of the window
+
+    :Methods:
+
+        addPane(pane)
+            Indexes a closed pane and drops the oldest pane once the window is full
+        isFull()
+            Checks whether the window holds windowSize panes
+        utility(itemSet, cache)
+            Exact utility of an itemset in the window
+
+    **Sample run of the importing code:**
+    ----------------------------------------
+    .. code-block:: python
+
+            from PAMI.highUtilityPatternsInStreams import paneIndex as _paneIndex
+
+            index = _paneIndex.PaneIndex(3)
+
+            for pane in _paneIndex.panes(_paneIndex.readTransactions("stream.txt", ","), 1000):
+
+                index.addPane(pane)
+
+                if index.isFull():
+
+                    print(index.start, index.end, index.utility(['a', 'b'], {}))
+    """
+
+    def __init__(self, windowSize: int) -> None:
+        self.windowSize = windowSize
+        self.start = 0
+        self.end = 0
+        self._panes = _deque()
+
+    def __len__(self) -> int:
+        return len(self._panes)
+
+    def isFull(self) -> bool:
+        """
+        Checks whether the window holds windowSize panes
+
+        :return: True if the window is full
+        :rtype: bool
+        """
+        return len(self._panes) == self.windowSize
+
+    def addPane(self, pane: Sequence[Transaction]) -> None:
+        """
+        Builds the item utility lists of a closed pane and appends it to the window, dropping the oldest pane when the
+        window is full. An item repeated in a transaction keeps its last utility.
+
+        :param pane: transactions of the pane
+        :type pane: list
+        :return: None
+        """
+        columns: Dict[str, Tuple[List[int], List[float]]] = {}
+        for tid, (items, utilities, _) in enumerate(pane, self.end):
+            for item, utility in dict(zip(items, utilities)).items():
+                column = columns.get(item)
+                if column is None:
+                    columns[item] = ([tid], [utility])
+                else:
+                    column[0].append(tid)
+                    column[1].append(utility)
+        if self.isFull():
+            self.start += self._panes.popleft()[1]
+        self._panes.append(({item: _utilityList.UtilityList(item, tids, utility=utilities)
+                             for item, (tids, utilities) in columns.items()}, len(pane)))
+        self.end += len(pane)
+
+    def _join(self, itemSet: Tuple[str, ...], cache: Dict[Tuple[str, ...], list]) -> list:
+        joined = cache.get(itemSet)
+        if joined is not None:
+            return joined
+        item = itemSet[-1]
+        if len(itemSet) == 1:
+            joined = [lists.get(item) for lists, _ in self._panes]
+        else:
+            joined = []
+            for prefix, (lists, _) in zip(self._join(itemSet[:-1], cache), self._panes):
+                last = lists.get(item)
+                if prefix is None or last is None:
+                    joined.append(None)
+                    continue
+                tids, inPrefix, inLast = prefix.intersect(last)
+                joined.append(_utilityList.UtilityList(itemSet, tids,
+                                                       utility=prefix.utility[inPrefix] + last.utility[inLast])
+                              if len(tids) else None)
+        cache[itemSet] = joined
+        return joined
+
+    def utility(self, itemSet: Sequence[str], cache: Dict[Tuple[str, ...], list]) -> float:
+        """
+        Calculates the exact utility of an itemset in the window by joining the utility lists of its items pane by pane
+
+        :param itemSet: items of the pattern
+        :type itemSet: list
+        :param cache: joins computed so far for the current window, empty for a new window
+        :type cache: dict
+        :return: sum of the utilities of the items in the transactions containing all of them
+        :rtype: float
+        """
+        total = 0
+        for joined in self._join(tuple(itemSet), cache):
+            if joined is not None:
+                total += joined.total('utility')
+        return total
@@ -55,6 +55,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.highUtilitySpatialPattern.basic import abstract as _ab
+from PAMI.highUtilitySpatialPattern.basic import neighbourhoodIndex as _neighbourhoodIndex
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 from deprecated import deprecated
 
@@ -198,6 +199,8 @@ class HDSHUIM(_ab._utilityPatterns):
             huis created
         neighbors: map
             keep track of neighbours of elements
+        neighbourhood: NeighbourhoodIndex
+            the neighbours of the promising items as bitsets over their positions in the PMU order
         mapOfPMU: map
             a map to keep track of Probable Maximum utility(PMU) of each item
     :Methods:
@@ -384,6 +387,8 @@ class HDSHUIM(_ab._utilityPatterns):
                 mapItemsToCUList[item] = uList
                 listOfCUList.append(uList)
         listOfCUList.sort(key=_ab._functools.cmp_to_key(self._compareItems))
+        self._neighbourhood = _neighbourhoodIndex.NeighbourhoodIndex(
+            self._neighbors, {uList.item: position for position, uList in enumerate(listOfCUList)})
         ts = 1
         with open(self._iFile, 'r') as file:
             for line in file:
@@ -443,9 +448,7 @@ class HDSHUIM(_ab._utilityPatterns):
                         else:
                             mapFMAPItem[pairAfter.item] = twuSUm + newTwu
                 ts += 1
-        exNeighbours = set(self._mapOfPMU.keys())
-        # print(self.Neighbours)
-        self._ExploreSearchTree([], listOfCUList, exNeighbours, minUtil)
+        self._ExploreSearchTree([], listOfCUList, self._neighbourhood.all, minUtil)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -453,43 +456,37 @@ class HDSHUIM(_ab._utilityPatterns):
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
 
-    def _ExploreSearchTree(self, prefix: List[str], uList: List[_CUList], exNeighbours: set, minUtil: int) -> None:
+    def _ExploreSearchTree(self, prefix: List[str], uList: List[_CUList], exNeighbours: int, minUtil: int) -> None:
         """
         A method to find all high utility itemSets
         :parm prefix: it represents all items in prefix
         :type prefix :list
         :parm uList:projected Utility list.
         :type uList: list
-        :parm exNeighbours: keep track of common Neighbours
-        :type exNeighbours: set
+        :parm exNeighbours: keep track of common Neighbours, as a bitset
+        :type exNeighbours: int
         :parm minUtil:user minUtil
         :type minUtil:int
         :return: None
         """
+        names = self._neighbourhood.names
         for i in range(0, len(uList)):
             x = uList[i]
-            if x.item not in exNeighbours:
+            name = names[x.item]
+            if not exNeighbours >> name & 1:
                 continue
             self._candidates += 1
-            sortedPrefix = [0] * (len(prefix) + 1)
             sortedPrefix = prefix[0:len(prefix) + 1]
             sortedPrefix.append(x.item)
-            if (x.sumSnu + x.sumCu >= minUtil) and (x.item in exNeighbours):
+            if x.sumSnu + x.sumCu >= minUtil:
                 self._saveItemSet(prefix, len(prefix), x.item, x.sumSnu + x.sumCu)
-            if x.sumSnu + x.sumCu + x.sumRemainingUtility + x.sumCru >= minUtil:  # U-Prune # and (x.item in exNeighbours)):
-                ULIST = []
-                for j in range(i, len(uList)):
-                    if (uList[j].item in exNeighbours) and (self._neighbors.get(x.item) is not None) and (
-                            uList[j].item in self._neighbors.get(x.item)):
-                        ULIST.append(uList[j])
-                exULs = self._constructCUL(x, ULIST, -1, minUtil, len(sortedPrefix), exNeighbours)
-                if self._neighbors.get(x.item) is not None and exNeighbours is not None:
-                    set1 = exNeighbours.intersection(self._neighbors.get(x.item))
-                    if exULs is None or set1 is None:
-                        continue
-                    self._ExploreSearchTree(sortedPrefix, exULs, set1, minUtil)
+            if x.sumSnu + x.sumCu + x.sumRemainingUtility + x.sumCru >= minUtil and name in self._neighbourhood:  # U-Prune
+                set1 = self._neighbourhood.narrow(exNeighbours, name)
+                ULIST = [uList[j] for j in range(i, len(uList)) if set1 >> names[uList[j].item] & 1]
+                exULs = self._constructCUL(x, ULIST, -1, minUtil, len(sortedPrefix), set1)
+                self._ExploreSearchTree(sortedPrefix, exULs, set1, minUtil)
 
-    def _constructCUL(self, x: _Element, compactUList: List[_CUList], st: int, minUtil: int, length: int, exNeighbours: set) -> List[_CUList]:
+    def _constructCUL(self, x: _Element, compactUList: List[_CUList], st: int, minUtil: int, length: int, exNeighbours: int) -> List[_CUList]:
         """
         A method to construct CUL's database
         :parm x: Compact utility list
@@ -502,8 +499,8 @@ class HDSHUIM(_ab._utilityPatterns):
         :type minUtil:int
         :parm length: length of x
         :type length:int
-        :parm exNeighbours: common Neighbours
-        :type exNeighbours: set
+        :parm exNeighbours: common Neighbours, as a bitset
+        :type exNeighbours: int
         :return: projected database of list X
         :rtype: list or set
         """
@@ -523,7 +520,7 @@ class HDSHUIM(_ab._utilityPatterns):
             mapOfTWUF = self._mapFMAP[x.item]
             if mapOfTWUF is not None:
                 twuf = mapOfTWUF.get(compactUList[j].item)
-                if twuf != None and twuf < minUtil or (not (exCul[j].item in exNeighbours)):
+                if twuf != None and twuf < minUtil or not exNeighbours >> self._neighbourhood.names[exCul[j].item] & 1:
                     exCul[j] = None
                     exSZ = sz - 1
                 else:
@@ -53,6 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.highUtilitySpatialPattern.basic import abstract as _ab
+from PAMI.highUtilitySpatialPattern.basic import neighbourhoodIndex as _neighbourhoodIndex
 from typing import List, Dict, Tuple, Set, Union, Any, Generator, Optional, TypeVar
 from functools import cmp_to_key as _cmpToKey
 import pandas as pd
@@ -342,6 +343,8 @@ class SHUIM(_ab._utilityPatterns):
             A map to store the old name corresponding to new name
         Neighbours : map
             A dictionary to store the neighbours of a item
+        neighbourhood : NeighbourhoodIndex
+            The neighbours of the promising items as bitsets over their new names
         maxMemory:Maximum memory used by this program for running
         patternCount: int
             Number of SHUI's
@@ -366,18 +369,14 @@ class SHUIM(_ab._utilityPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
         getRuntime()
                Total amount of runtime taken by the mining process will be retrieved from this function
-        calculateNeighbourIntersection(self, prefixLength)
-               A method to return common Neighbours of items
-        backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
+        backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, commonNeighbours)
                A method to mine the SHUIs Recursively
-        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhoodList)
+        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, commonNeighbours)
                A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method ave a high-utility itemSet to file or memory depending on what the user chose
         _isEqual(transaction1, transaction2)
                A method to Check if two transaction are identical
-        intersection(lst1, lst2)
-               A method that return the intersection of 2 list
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               Scan the initial database to calculate the subtree utility of each items using a utility-bin array
         sortDatabase(self, transactions)
@@ -477,6 +476,11 @@ class SHUIM(_ab._utilityPatterns):
         self._patternCount = 0
         self._finalPatterns = {}
         self._dataset = _Dataset(self._iFile, self._sep)
+        self._utilityBinArrayLU = {}
+        self._utilityBinArraySU = {}
+        self._oldNamesToNewNames = {}
+        self._newNamesToOldNames = {}
+        self._Neighbours = {}
         with open(self._nFile, 'r') as o:
             lines = o.readlines()
             for line in lines:
@@ -505,6 +509,7 @@ class SHUIM(_ab._utilityPatterns):
             currentName += 1
         for transaction in self._dataset.getTransactions():
             transaction.removeUnpromisingItems(self._oldNamesToNewNames)
+        self._neighbourhood = _neighbourhoodIndex.NeighbourhoodIndex(self._Neighbours, self._oldNamesToNewNames)
         self._sortDatabase(self._dataset.getTransactions())
         emptyTransactionCount = 0
         for transaction in self._dataset.getTransactions():
@@ -516,10 +521,7 @@ class SHUIM(_ab._utilityPatterns):
         for item in itemsToKeep:
             if self._utilityBinArraySU[item] >= self._minUtil:
                 itemsToExplore.append(item)
-        commonitems = []
-        for i in range(self._dataset.maxItem):
-            commonitems.append(i)
-        self._backtrackingEFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
+        self._backtrackingEFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0, self._neighbourhood.all)
         finalMemory = _ab._psutil.virtual_memory()[3]
         memory = (finalMemory - InitialMemory) / 10000
         if memory > self._maxMemory:
@@ -531,7 +533,7 @@ class SHUIM(_ab._utilityPatterns):
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
 
-    def _backtrackingEFIM(self, transactionsOfP: List[_Transaction], itemsToKeep: List[int], itemsToExplore: List[int], prefixLength: int) -> None:
+    def _backtrackingEFIM(self, transactionsOfP: List[_Transaction], itemsToKeep: List[int], itemsToExplore: List[int], prefixLength: int, commonNeighbours: int) -> None:
         """
         A method to mine the SHUIs Recursively
 
@@ -543,6 +545,8 @@ class SHUIM(_ab._utilityPatterns):
         :type itemsToExplore: list
         :param prefixLength: current prefixLength
         :type prefixLength: int
+        :param commonNeighbours: bitset of the common neighbours of the items in P
+        :type commonNeighbours: int
         :return: None
         """
         self._candidateCount += len(itemsToExplore)
@@ -600,26 +604,26 @@ class SHUIM(_ab._utilityPatterns):
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             if utilityPe >= self._minUtil:
                 self._output(prefixLength, utilityPe)
-            neighbourhoodList = self._calculateNeighbourIntersection(prefixLength)
-            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhoodList)
+            neighboursPe = self._neighbourhood.narrow(commonNeighbours, e)
+            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighboursPe)
             newItemsToKeep = []
             newItemsToExplore = []
             for l in range(idx + 1, len(itemsToKeep)):
                 itemK = itemsToKeep[l]
+                if not neighboursPe >> itemK & 1:
+                    continue
                 if self._utilityBinArraySU[itemK] >= self._minUtil:
-                    if itemK in neighbourhoodList:
-                        newItemsToExplore.append(itemK)
-                        newItemsToKeep.append(itemK)
+                    newItemsToExplore.append(itemK)
+                    newItemsToKeep.append(itemK)
                 elif self._utilityBinArrayLU[itemK] >= self._minUtil:
-                    if itemK in neighbourhoodList:
-                        newItemsToKeep.append(itemK)
-            self._backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
+                    newItemsToKeep.append(itemK)
+            self._backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1, neighboursPe)
             finalMemory = _ab._psutil.virtual_memory()[3]
             memory = (finalMemory - initialMemory) / 10000
             if self._maxMemory < memory:
                 self._maxMemory = memory
 
-    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: List[_Transaction], j: int, itemsToKeep: List[int], neighbourhoodList: List[int]) -> None:
+    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: List[_Transaction], j: int, itemsToKeep: List[int], commonNeighbours: int) -> None:
         """
         A method to  calculate the subtree utility and local utility of all items that can extend itemSet P U {e}
 
@@ -629,54 +633,33 @@ class SHUIM(_ab._utilityPatterns):
         :type j:int
         :param itemsToKeep :the list of promising items
         :type itemsToKeep: list
+        :param commonNeighbours: bitset of the common neighbours of the items in P U {e}
+        :type commonNeighbours: int
         :return: None
         """
         for i in range(j + 1, len(itemsToKeep)):
             item = itemsToKeep[i]
             self._utilityBinArrayLU[item] = 0
             self._utilityBinArraySU[item] = 0
+        keep = set(itemsToKeep)
         for transaction in transactionsPe:
-            length = len(transaction.getItems())
+            items = transaction.getItems()
+            utilities = transaction.getUtilities()
+            length = len(items)
             i = length - 1
             while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
-                    remainingUtility = 0
-                    if self._newNamesToOldNames[item] in self._Neighbours:
-                        item_neighbours = self._Neighbours[self._newNamesToOldNames[item]]
+                item = items[i]
+                if item in keep:
+                    remainingUtility = utilities[i]
+                    neighbours = self._neighbourhood.narrow(commonNeighbours, item)
+                    if neighbours:
                         for k in range(i, length):
-                            transaction_item = transaction.getItems()[k]
-                            if self._newNamesToOldNames[transaction_item] in item_neighbours and transaction_item in neighbourhoodList:
-                                remainingUtility += transaction.getUtilities()[k]
-
-                    remainingUtility += transaction.getUtilities()[i]
+                            if neighbours >> items[k] & 1:
+                                remainingUtility += utilities[k]
                     self._utilityBinArraySU[item] += remainingUtility + transaction.prefixUtility
                     self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
                 i -= 1
 
-    def _calculateNeighbourIntersection(self, prefixLength: int) -> List[int]:
-        """
-        A method to find common Neighbours
-
-        :param prefixLength: the prefix itemSet
-
-        :type prefixLength:int
-
-        :return: the common neighbours
-
-        :rtype: list
-        """
-        intersectionList = self._Neighbours.get(self._temp[0])
-        for i in range(1, prefixLength+1):
-            intersectionList = self._intersection(self._Neighbours[self._temp[i]], intersectionList)
-        finalIntersectionList = []
-        if intersectionList is None:
-            return finalIntersectionList
-        for item in intersectionList:
-            if item in self._oldNamesToNewNames:
-                finalIntersectionList.append(self._oldNamesToNewNames[item])
-        return finalIntersectionList
-    
     def _output(self, tempPosition: int, utility: int) -> None:
         """
         A method save all high-utility itemSet to file or memory depending on what the user chose
@@ -720,21 +703,6 @@ class SHUIM(_ab._utilityPatterns):
             position2 += 1
         return True
     
-    def _intersection(self, lst1: List[int], lst2: List[int]) -> List[int]:
-        """
-        A method that return the intersection of 2 list
-
-        :param  lst1: items neighbour to item1
-        :type lst1: list
-        :param lst2: items neighbour to item2
-        :type lst2: list
-        :return :intersection of two lists
-        :rtype : list
-        """
-        temp = set(lst2)
-        lst3 = [value for value in lst1 if value in temp]
-        return lst3
-
     def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset: _Dataset) -> None:
         """
         Scan the initial database to calculate the subtree utility of each item using a utility-bin array
@@ -751,13 +719,11 @@ class SHUIM(_ab._utilityPatterns):
             for idx, item in enumerate(items):
                 if item not in self._utilityBinArraySU:
                     self._utilityBinArraySU[item] = 0
-                if self._newNamesToOldNames[item] not in self._Neighbours:
-                    self._utilityBinArraySU[item] += utilities[idx]
-                    continue
+                neighbours = self._neighbourhood.neighbours(item)
                 i = idx + 1
                 sumSu = utilities[idx]
-                while i < len(items):
-                    if self._newNamesToOldNames[items[i]] in self._Neighbours[self._newNamesToOldNames[item]]:
+                while neighbours and i < len(items):
+                    if neighbours >> items[i] & 1:
                         sumSu += utilities[i]
                     i += 1
                 self._utilityBinArraySU[item] += sumSu
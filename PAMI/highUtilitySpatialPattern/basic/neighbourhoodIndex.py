@@ -0,0 +1,101 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Neighbourhood bitsets shared by the spatial high utility miners.
+
+The neighbours of every item are encoded once as an integer bitset over the ids the search uses for the items, i.e.,
+the names they get once the database is renamed. A pattern can only be extended by the common neighbours of its items,
+so the search keeps the common neighbours of the current prefix as a bitset too: extending the prefix by an item is a
+single AND with the bitset of that item, and checking whether an item is a common neighbour is a single bit test.
+"""
+
+from typing import Any, Dict, Iterable
+
+
+class NeighbourhoodIndex:
+    """
+    :Description: Neighbours of the items as integer bitsets over the ids of the search.
+
+    :Attributes:
+
+        names : dict
+            Id of every item of the neighbour file kept by the search
+        all : int
+            Bitset of all the ids, the common neighbours of the empty prefix
+
+    :Methods:
+
+        neighbours(item)
+            Bitset of the neighbours of an item
+        narrow(commonNeighbours, item)
+            Common neighbours of a prefix extended by an item
+
+    **Sample run of the importing code:**
+    ----------------------------------------
+    .. code-block:: python
+
+            from PAMI.highUtilitySpatialPattern.basic import neighbourhoodIndex as _neighbourhoodIndex
+
+            index = _neighbourhoodIndex.NeighbourhoodIndex({'a': ['b', 'c'], 'b': ['a']}, {'a': 0, 'b': 1, 'c': 2})
+
+            common = index.narrow(index.all, 0)
+
+            print(common >> 1 & 1, common >> 2 & 1, index.narrow(common, 1))
+    """
+
+    def __init__(self, neighbours: Dict[Any, Iterable[Any]], names: Dict[Any, int]) -> None:
+        self.names = names
+        self.all = 0
+        for name in names.values():
+            self.all |= 1 << name
+        self._masks = {}
+        for item, adjacent in neighbours.items():
+            name = names.get(item)
+            if name is None:
+                continue
+            mask = 0
+            for other in adjacent:
+                otherName = names.get(other)
+                if otherName is not None:
+                    mask |= 1 << otherName
+            self._masks[name] = mask
+
+    def __contains__(self, item: int) -> bool:
+        return item in self._masks
+
+    def neighbours(self, item: int) -> int:
+        """
+        Returns the neighbours of an item
+
+        :param item: id of the item
+        :type item: int
+        :return: bitset of the ids of its neighbours, 0 if the item has no neighbours
+        :rtype: int
+        """
+        return self._masks.get(item, 0)
+
+    def narrow(self, commonNeighbours: int, item: int) -> int:
+        """
+        Computes the common neighbours of a prefix extended by an item
+
+        :param commonNeighbours: bitset of the common neighbours of the prefix
+        :type commonNeighbours: int
+        :param item: id of the item appended to the prefix
+        :type item: int
+        :return: bitset of the common neighbours of the extended prefix
+        :rtype: int
+        """
+        return commonNeighbours & self._masks.get(item, 0)
@@ -211,6 +211,8 @@ class Dataset:
         self.intTostr = {}
         self.cnt = 1
         self.sep = sep
+        self.transactions = []
+        self.maxItem = 0
         with open(datasetpath, 'r') as f:
             lines = f.readlines()
             for line in lines:
@@ -262,6 +264,72 @@ class Dataset:
         return self.transactions
 
 
+class TopKPatterns:
+    """
+    A min-heap of the k best patterns found so far. Its root is the utility of the k-th best pattern, which is the
+    minimum utility threshold of the search once k patterns have been found.
+
+    :Attributes:
+
+        k: int
+            number of patterns to keep
+        heap: list
+            (utility, itemset) pairs of the best patterns, the smallest utility at the root
+        floor: int
+            threshold raised before the search from the real utilities of distinct itemsets
+
+    :Methods:
+
+        threshold():
+            return the current minimum utility threshold
+        raiseThreshold(utilities):
+            raise the floor to the k-th largest of the real utilities of distinct itemsets
+        add(itemset, utility):
+            insert a pattern in O(log k) and return the new threshold
+    """
+
+    def __init__(self, k):
+        self.k = k
+        self.heap = []
+        self.floor = 0
+
+    def threshold(self):
+        """
+        A method to return the current minimum utility threshold
+        """
+        if len(self.heap) < self.k:
+            return self.floor
+        return max(self.floor, self.heap[0][0])
+
+    def raiseThreshold(self, utilities):
+        """
+        A method to raise the floor of the threshold to the k-th largest utility. The utilities must be the real
+        utilities of k distinct itemsets for the top-k patterns to be kept.
+
+        :param utilities: real utilities of distinct itemsets
+        :type utilities: list
+        """
+        if len(utilities) >= self.k:
+            self.floor = max(self.floor, heapq.nlargest(self.k, utilities)[-1])
+
+    def add(self, itemset, utility):
+        """
+        A method to insert a pattern, replacing the worst pattern once the heap holds k of them
+
+        :param itemset: the itemset to be added
+        :type itemset: str
+        :param utility: utility of the itemset
+        :type utility: int
+        :return: the new minimum utility threshold
+        :rtype: int
+        """
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, (utility, itemset))
+        else:
+            heapq.heappushpop(self.heap, (utility, itemset))
+        return self.threshold()
+
+
 class TKSHUIM(utilityPatterns):
     """
     :Description:
@@ -324,6 +392,8 @@ class TKSHUIM(utilityPatterns):
             keep only the promising items ie items having twu >= minUtil
         itemsToExplore: list
             keep items that subtreeUtility grater than minUtil
+        topK: TopKPatterns
+            the k best patterns found so far, whose root is the minimum utility threshold
 
     :Methods:
 
@@ -360,7 +430,7 @@ class TKSHUIM(utilityPatterns):
         sort_transaction(self, trans1, trans2)
               A Method to sort transaction in the order of PMU
         useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
-             A method to scan the database using utility bin array to calculate the pmus                   
+             A method to scan the database using utility bin array to calculate the pmus and raise the threshold
 
     **Executing the code on terminal:**
     -------------------------------------
@@ -428,7 +498,7 @@ class TKSHUIM(utilityPatterns):
     minUtil = 0
     memoryUSS = float()
     memoryRSS = float()
-    heapList = []
+    topK = None
 
     def __init__(self, iFile, nFile, k, sep="\t"):
         super().__init__(iFile, nFile, k, sep)
@@ -446,6 +516,14 @@ class TKSHUIM(utilityPatterns):
         """
         self.startTime = time.time()
         self.finalPatterns = {}
+        self.candidateCount = 0
+        self.utilityBinArrayLU = {}
+        self.utilityBinArraySU = {}
+        self.oldNamesToNewNames = {}
+        self.newNamesToOldNames = {}
+        self.Neighbours = {}
+        self.minUtil = 0
+        self.topK = TopKPatterns(self.k)
         self.dataset = Dataset(self.iFile, self.sep)
         with open(self.nFile, 'r') as o:
             lines = o.readlines()
@@ -480,7 +558,6 @@ class TKSHUIM(utilityPatterns):
                 emptyTransactionCount += 1
         self.dataset.transactions = self.dataset.transactions[emptyTransactionCount:]
         self.useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self.dataset)
-        self.heapList = []
         itemsToExplore = []
         for item in itemsToKeep:
             if self.utilityBinArraySU[item] >= self.minUtil:
@@ -499,13 +576,15 @@ class TKSHUIM(utilityPatterns):
         self.memoryRSS = float()
         self.memoryUSS = process.memory_full_info().uss
         self.memoryRSS = process.memory_info().rss
-        for item in self.heapList:
-            self.finalPatterns[item[1]] = item[0]
+        for utility, itemset in self.topK.heap:
+            self.finalPatterns[itemset] = utility
         print('TOP-K mining process is completed by TKSHUIM')
 
     def backtrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength):
         """
-        A method to mine the TKSHUIs Recursively
+        A method to mine the TKSHUIs Recursively. The primary items are explored by decreasing sub-tree utility, so the
+        patterns found first raise the threshold the most, and the remaining items are skipped as soon as their
+        sub-tree utility falls below it.
 
         :param transactionsOfP: the list of transactions containing the current prefix P
         :type transactionsOfP: list
@@ -517,7 +596,12 @@ class TKSHUIM(utilityPatterns):
         :type prefixLength: int
         """
         self.candidateCount += len(itemsToExplore)
-        for idx, e in enumerate(itemsToExplore):
+        positions = {item: idx for idx, item in enumerate(itemsToKeep)}
+        upperBounds = {item: self.utilityBinArraySU[item] for item in itemsToExplore}
+        for e in sorted(itemsToExplore, key=lambda item: -upperBounds[item]):
+            if upperBounds[e] < self.minUtil:
+                break
+            idx = positions[e]
             initialMemory = psutil.virtual_memory()[3]
             transactionsPe = []
             utilityPe = 0
@@ -567,7 +651,6 @@ class TKSHUIM(utilityPatterns):
                             transactionsPe.append(previousTransaction)
                             previousTransaction = projectedTransaction
                             consecutiveMergeCount = 0
-                    transaction.offset = positionE
             if previousTransaction != transactionsOfP[0]:
                 transactionsPe.append(previousTransaction)
             self.temp[prefixLength] = self.newNamesToOldNames[e]
@@ -609,18 +692,20 @@ class TKSHUIM(utilityPatterns):
             item = itemsToKeep[i]
             self.utilityBinArrayLU[item] = 0
             self.utilityBinArraySU[item] = 0
+        keep = set(itemsToKeep)
+        neighbourhood = set(neighbourhoodList)
         for transaction in transactionsPe:
             length = len(transaction.getItems())
             i = length - 1
             while i >= transaction.offset:
                 item = transaction.getItems()[i]
-                if item in itemsToKeep:
+                if item in keep:
                     remainingUtility = 0
                     if self.newNamesToOldNames[item] in self.Neighbours:
                         item_neighbours = self.Neighbours[self.newNamesToOldNames[item]]
                         for k in range(i, length):
                             transaction_item = transaction.getItems()[k]
-                            if self.newNamesToOldNames[transaction_item] in item_neighbours and transaction_item in neighbourhoodList:
+                            if self.newNamesToOldNames[transaction_item] in item_neighbours and transaction_item in neighbourhood:
                                 remainingUtility += transaction.getUtilities()[k]
 
                     remainingUtility += transaction.getUtilities()[i]
@@ -780,64 +865,47 @@ class TKSHUIM(utilityPatterns):
 
     def useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset):
         """
-        A method to scan the database using utility bin array to calculate the pmus
+        A method to scan the database using utility bin array to calculate the pmus. The real utilities of the items and
+        of the pairs of neighbouring items are gathered in the same scan and raise the minimum utility threshold before
+        the search.
 
         :param dataset: the transaction database.
         :type dataset: database
         """
-        utilityMatrix = defaultdict(lambda: defaultdict(int))
+        neighbours = {item: set(lst) for item, lst in self.Neighbours.items()}
+        itemUtilities = defaultdict(int)
+        pairUtilities = defaultdict(int)
         for transaction in dataset.getTransactions():
-            for idx, item in enumerate(transaction.getItems()):
-                pmu = transaction.getUtilities()[idx]
-                if item in self.Neighbours:
-                    neighbors = self.Neighbours[item]
-                    for idx, item in enumerate(transaction.getItems()):
-                        if item in neighbors:
-                            pmu += transaction.getUtilities()[idx]
-                if item in self.utilityBinArrayLU:
-                    # self.utilityBinArrayLU[item] += transaction.getPmus()[idx]
-                    self.utilityBinArrayLU[item] += pmu
-                else:
-                    # self.utilityBinArrayLU[item] = transaction.getPmus()[idx]
-                    self.utilityBinArrayLU[item] = pmu
-                utilityMatrix[item][item] += transaction.getUtilities()[idx]
-                if item in self.Neighbours:
-                    neighbors = self.Neighbours[item]
-                    utility = transaction.getUtilities()[idx]
-                    for i, itemj in enumerate(transaction.getItems()):
-                        if (itemj != item) and (itemj in neighbors):
-                            utilityMatrix[item][itemj] += (utility + transaction.getUtilities()[i])
-
-        for item in utilityMatrix.keys():
-            for itemj in utilityMatrix[item].keys():
-                if itemj >= item:
-                    val = utilityMatrix[item][itemj]
-                    if val != 0 and val > self.minUtil:
-                        if itemj == item:
-                            itemset = str(item)
-                        else:
-                            itemset = str(item) + str(itemj)
-                        self.additemset(itemset, val)
+            items = transaction.getItems()
+            utilities = transaction.getUtilities()
+            for idx, item in enumerate(items):
+                pmu = utilities[idx]
+                itemUtilities[item] += utilities[idx]
+                if item in neighbours:
+                    itemNeighbours = neighbours[item]
+                    for i, itemj in enumerate(items):
+                        if itemj in itemNeighbours:
+                            pmu += utilities[i]
+                            # a pair is a spatial pattern only if each item is a neighbour of the other
+                            if itemj > item and item in neighbours.get(itemj, ()):
+                                pairUtilities[(item, itemj)] += utilities[idx] + utilities[i]
+                self.utilityBinArrayLU[item] = self.utilityBinArrayLU.get(item, 0) + pmu
+        self.topK.raiseThreshold(list(itemUtilities.values()) + list(pairUtilities.values()))
+        self.minUtil = self.topK.threshold()
 
     def additemset(self, itemset, utility):
         """
-        adds the itemset to the priority queue
+        adds the itemset to the top-k patterns and raises the minimum utility threshold
 
         :param itemset: the itemset to be added
 
         :type itemset: str
 
-        :param utility: utility matrix for the itemset to be added
+        :param utility: utility of the itemset to be added
 
-        :type utility: numpy.array
+        :type utility: int
         """
-        heapq.heappush(self.heapList, (utility, itemset))
-        if len(self.heapList) > self.k:
-            while len(self.heapList) > self.k:
-                heapq.heappop(self.heapList)
-                if len(self.heapList) == 0:
-                    break
-            self.minUtil = heapq.nsmallest(1, self.heapList)[0][0]
+        self.minUtil = self.topK.add(itemset, utility)
 
     def getPatternsAsDataFrame(self):
         """
@@ -61,6 +61,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.localPeriodicPattern.basic import abstract as _ab
+from PAMI.localPeriodicPattern.basic import periodicTimeIntervals as _ptl
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 from deprecated import deprecated
 
@@ -284,7 +285,7 @@ class LPPGrowth(_ab._localPeriodicPatterns):
             finalPatterns : dict
                 To store local periodic patterns and its PTL.
             tsList : dict
-                To store items and its time stamp as bit vector.
+                To store items and the positions of the transactions containing them as arrays.
             root : Tree
                 It is root node of transaction tree of whole input data.
             PTL : dict
@@ -301,17 +302,17 @@ class LPPGrowth(_ab._localPeriodicPatterns):
             creteLPPlist()
                 Create the local periodic patterns list from input data.
             createTSList()
-                Create the tsList as bit vector from input data.
+                Create the tsList as position arrays from input data.
             generateLPP()
                 Generate 1 length local periodic pattens by tsList and execute depth first search.
             createLPPTree()
                 Create LPPTree of local periodic item from input data.
-            patternGrowth(tree, prefix, prefixPFList)
+            patternGrowth(tree, prefix, prefixPFList, prefixPTL)
                 Execute pattern growth algorithm. It is important function in this program.
             calculatePTL(tsList)
-                Calculate PTL from input tsList as integer list.
+                Calculate PTL from input tsList as sorted integer array.
             calculatePTLbit(tsList)
-                Calculate PTL from input tsList as bit vector.
+                Calculate PTL from input tsList of transaction positions.
             mine()
                 Mining process will start from here.
             getMemoryUSS()
@@ -482,101 +483,32 @@ class LPPGrowth(_ab._localPeriodicPatterns):
 
     def __createTSList(self) -> None:
         """
-        Create tsList as bit vector from temporal data.
+        Create tsList as the array of transaction positions of every item from temporal data.
         """
-        # for line in self.__Database:
-        #     count = 1
-        #     bitVector = 0b1 << count
-        #     bitVector = bitVector | 0b1
-        #     self.__tsMin = int(line.pop(0))
-        #     self.__tsList = {item: bitVector for item in line}
-        #     count += 1
-        #     ts = ' '
+        positions = {}
         count = 1
         for line in self.__Database:
-            bitVector = 0b1 << count
-            bitVector = bitVector | 0b1
-            # print(line)
             ts = line[0]
             for item in line[1:]:
-                if self.__tsList.get(item):
-                    different = abs(bitVector.bit_length() - self.__tsList[item].bit_length())
-                    self.__tsList[item] = self.__tsList[item] << different
-                    self.__tsList[item] = self.__tsList[item] | 0b1
-                else:
-                    self.__tsList[item] = bitVector
+                itemPositions = positions.setdefault(item, [])
+                if not itemPositions or itemPositions[-1] != count:
+                    itemPositions.append(count)
             count += 1
             self.__tsMax = int(ts)
-
-        for item in self.__tsList:
-            different = abs(bitVector.bit_length() - self.__tsList[item].bit_length())
-            self.__tsList[item] = self.__tsList[item] << different
+        self.__tsList = {item: _ab._np.array(value, dtype=_ab._np.int64) for item, value in positions.items()}
         self._localPeriodicPatterns__maxPer = self.__convert(self._localPeriodicPatterns__maxPer)
         self._localPeriodicPatterns__maxSoPer = self.__convert(self._localPeriodicPatterns__maxSoPer)
         self._localPeriodicPatterns__minDur = self.__convert(self._localPeriodicPatterns__minDur)
 
     def __generateLPP(self) -> None:
         """
-        Generate local periodic items from bit vector tsList.
+        Generate local periodic items from tsList.
         """
         PTL = {}
         for item in self.__tsList:
-            PTL[item] = set()
-            ts = list(bin(self.__tsList[item]))
-            ts = ts[2:]
-            start = -1
-            currentTs = 1
-            soPer = ' '
-            tsPre = ' '
-            for t in ts[currentTs:]:
-                if t == '0':
-                    currentTs += 1
-                    continue
-                else:
-                    tsPre = currentTs
-                    currentTs += 1
-                    break
-            for t in ts[currentTs:]:
-                if t == '0':
-                    currentTs += 1
-                    continue
-                else:
-                    per = currentTs - tsPre
-                    if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                        start = tsPre
-                        soPer = self._localPeriodicPatterns__maxSoPer
-                    if start != -1:
-                        soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                        if soPer > self._localPeriodicPatterns__maxSoPer:
-                            if tsPre - start >= self._localPeriodicPatterns__minDur:
-                                PTL[item].add((start, tsPre))
-                            """else:
-                                bitVector = 0b1 << currentTs
-                                different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                                bitVector = bitVector | 0b1
-                                bitVector = bitVector << different
-                                self.tsList[item] = self.tsList[item] | bitVector"""
-                            start = -1
-                    tsPre = currentTs
-                    currentTs += 1
-            if start != -1:
-                soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-                if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                    PTL[item].add((start, tsPre))
-                """else:
-                    bitVector = 0b1 << currentTs+1
-                    different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                    bitVector = bitVector | 0b1
-                    bitVector = bitVector << different
-                    self.tsList[item] = self.tsList[item] | bitVector"""
-                if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                    PTL[item].add((start, self.__tsMax))
-                """else:
-                    bitVector = 0b1 << currentTs+1
-                    different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                    bitVector = bitVector | 0b1
-                    bitVector = bitVector << different
-                    self.tsList[item] = self.tsList[item] | bitVector"""
+            PTL[item] = _ptl.intervalsToSet(_ptl.calculatePTL(self.__tsList[item], self._localPeriodicPatterns__maxPer,
+                                                              self._localPeriodicPatterns__maxSoPer,
+                                                              self._localPeriodicPatterns__minDur, self.__tsMax))
         self.__PTL = {k: v for k, v in PTL.items() if len(v) > 0}
         self.__items = list(self.__PTL.keys())
 
@@ -595,7 +527,8 @@ class LPPGrowth(_ab._localPeriodicPatterns):
             #     transaction = sorted(tempTransaction, key=lambda x: len(self.__PTL[x]), reverse=True)
             #     self.__root.addTransaction(transaction, tid)
 
-    def __patternGrowth(self, tree: 'Tree', prefix: List[int], prefixPFList: Dict[Any, Any]) -> None:
+    def __patternGrowth(self, tree: 'Tree', prefix: List[int], prefixPFList: Dict[Any, Any],
+                        prefixPTL: Dict[Any, set] = None) -> None:
         """
         Create prefix tree and prefixPFList. Store finalPatterns and its PTL.
 
@@ -605,6 +538,8 @@ class LPPGrowth(_ab._localPeriodicPatterns):
         :type prefix: list
         :param prefixPFList: tsList of prefix patterns.
         :type prefixPFList: dict or list
+        :param prefixPTL: PTL of prefix patterns already computed while pruning the parent prefix tree.
+        :type prefixPTL: dict
         :return: None
         """
         items = list(prefixPFList)
@@ -616,127 +551,61 @@ class LPPGrowth(_ab._localPeriodicPatterns):
             PFList = {}
             prefixTree = Tree()
             prefixNode = tree.firstNodeLink[item]
-            tidList = prefixNode.tidList
-            path = []
-            currentNode = prefixNode.parent
-            while currentNode.item != -1:
-                path.insert(0, currentNode.item)
-                currentNodeItem = currentNode.item
-                if currentNodeItem in PFList:
-                    PFList[currentNodeItem] |= tidList
-                else:
-                    PFList[currentNodeItem] = tidList
-                currentNode = currentNode.parent
-            prefixTree.createPrefixTree(path, tidList)
-            while prefixNode.nodeLink:
-                prefixNode = prefixNode.nodeLink
+            while prefixNode:
                 tidList = prefixNode.tidList
+                tidArray = _ab._np.fromiter(tidList, dtype=_ab._np.int64, count=len(tidList))
                 path = []
                 currentNode = prefixNode.parent
                 while currentNode.item != -1:
-                    path.insert(0, currentNode.item)
-                    currentNodeItem = currentNode.item
-                    if currentNodeItem in PFList:
-                        PFList[currentNodeItem] = PFList[currentNodeItem] | tidList
-                    else:
-                        PFList[currentNodeItem] = tidList
+                    path.append(currentNode.item)
+                    PFList.setdefault(currentNode.item, []).append(tidArray)
                     currentNode = currentNode.parent
+                path.reverse()
                 prefixTree.createPrefixTree(path, tidList)
+                prefixNode = prefixNode.nodeLink
             if len(prefixCopy) == 1:
                 self._localPeriodicPatterns__finalPatterns[prefixCopy[0]] = self.__calculatePTLbit(self.__tsList[item])
             else:
-                self._localPeriodicPatterns__finalPatterns[tuple(prefixCopy)] = self.__calculatePTL(prefixPFList[item])
-            candidateItems = list(PFList)
-            for i in candidateItems:
+                self._localPeriodicPatterns__finalPatterns[tuple(prefixCopy)] = prefixPTL[item]
+            PTLs = {}
+            for i in list(PFList):
+                PFList[i] = _ab._np.unique(_ab._np.concatenate(PFList[i]))
                 PTL = self.__calculatePTL(PFList[i])
                 if len(PTL) == 0:
                     prefixTree.deleteNode(i)
                     del PFList[i]
+                else:
+                    PTLs[i] = PTL
             if PFList:
-                self.__patternGrowth(prefixTree, prefixCopy, PFList)
+                self.__patternGrowth(prefixTree, prefixCopy, PFList, PTLs)
 
-    def __calculatePTL(self, tsList: List[int]) -> set:
+    def __calculatePTL(self, tsList: '_ab._np.ndarray') -> set:
         """
-        Calculate PTL from input tsList as integer list
+        Calculate PTL from input tsList as sorted integer array
 
         :param tsList: It is tsList which store time stamp as integer.
-        :type tsList: list
+        :type tsList: numpy.ndarray
         :return: PTL
         :rtype: set
         """
-        start = -1
-        PTL = set()
-        tsList = sorted(tsList)
-        tsPre = tsList[0]
-        soPer = ' '
-        for ts in tsList[1:]:
-            per = ts - tsPre
-            if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                start = tsPre
-                soPer = self._localPeriodicPatterns__maxSoPer
-            if start != -1:
-                soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                if soPer > self._localPeriodicPatterns__maxSoPer:
-                    if tsPre - start >= self._localPeriodicPatterns__minDur:
-                        PTL.add((start, tsPre))
-                    start = -1
-            tsPre = ts
-        if start != -1:
-            soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-            if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-            if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, self.__tsMax))
-        return PTL
-
-    def __calculatePTLbit(self, tsList: List[int]) -> set:
-        """
-        Calculate PTL from input tsList as bit vector.
-
-        :param tsList: It is tsList which store time stamp as bit vector.
-        :type tsList: list
+        return _ptl.intervalsToSet(_ptl.calculatePTL(tsList, self._localPeriodicPatterns__maxPer,
+                                                     self._localPeriodicPatterns__maxSoPer,
+                                                     self._localPeriodicPatterns__minDur, self.__tsMax))
+
+    def __calculatePTLbit(self, tsList: '_ab._np.ndarray') -> set:
+        """
+        Calculate PTL from input tsList of transaction positions. A time-interval still open at the end of the
+        database is closed at the last position of the item.
+
+        :param tsList: It is tsList which store the transaction positions of an item.
+        :type tsList: numpy.ndarray
         :return: PTL
         :rtype: set
         """
-        tsList = list(bin(tsList))
-        tsList = tsList[2:]
-        start = -1
-        currentTs = 1
-        PTL = set()
-        tsPre = ' '
-        soPer = ' '
-        for ts in tsList[currentTs:]:
-            if ts == '0':
-                currentTs += 1
-                continue
-            else:
-                tsPre = currentTs
-                currentTs += 1
-                break
-        for ts in tsList[currentTs:]:
-            if ts == '0':
-                currentTs += 1
-                continue
-            else:
-                per = currentTs - tsPre
-                if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                    start = tsPre
-                    soPer = self._localPeriodicPatterns__maxSoPer
-                if start != -1:
-                    soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                    if soPer > self._localPeriodicPatterns__maxSoPer:
-                        if tsPre - start >= self._localPeriodicPatterns__minDur:
-                            PTL.add((start, tsPre))
-                        start = -1
-                tsPre = currentTs
-                currentTs += 1
-        if start != -1:
-            soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-            if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-            if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-        return PTL
+        return _ptl.intervalsToSet(_ptl.calculatePTL(tsList, self._localPeriodicPatterns__maxPer,
+                                                     self._localPeriodicPatterns__maxSoPer,
+                                                     self._localPeriodicPatterns__minDur, self.__tsMax,
+                                                     closeAtTsMax=False))
 
     def __convert(self, value: Any) -> float:
         """
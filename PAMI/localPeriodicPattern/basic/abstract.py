@@ -38,6 +38,7 @@ import os.path as _ospath
 import psutil as _psutil
 import sys as _sys
 import validators as _validators
+import numpy as _np
 from urllib.request import urlopen as _urlopen
 
 
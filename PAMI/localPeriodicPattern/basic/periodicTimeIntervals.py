@@ -0,0 +1,123 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Vectorized computation of the periodic time-intervals list (PTL) used by the local periodic pattern miners.
+
+A time-interval starts at the first timestamp whose next period is at most maxPer. From there the spillover period
+(soPer) evolves as soPer = max(0, soPer + per - maxPer), which is a Lindley recursion and therefore has the closed
+form soPer_j = D_j - min(-soPer_0, min_{l <= j} D_l) over the cumulative excess D. The interval is closed at the
+first period where soPer exceeds maxSoPer.
+"""
+
+import numpy as _np
+
+_initialChunk = 32
+
+
+def _firstSpillover(excess: _np.ndarray, begin: int, soPer: float, maxSoPer: float):
+    """
+    Scan the periods from begin onwards and find the first one whose spillover period exceeds maxSoPer.
+
+    The scan is performed on chunks of doubling size so that the cost stays linear in the length of the interval
+    instead of the length of the remaining time series.
+
+    :param excess: per - maxPer for every period of the time series
+    :type excess: numpy.ndarray
+    :param begin: index of the period that opened the time-interval
+    :type begin: int
+    :param soPer: spillover period before the first period is applied
+    :type soPer: float
+    :param maxSoPer: maximum spillover period
+    :type maxSoPer: float
+    :return: index of the violating period (-1 if there is none) and the spillover period at the end of the scan
+    :rtype: tuple
+    """
+    width = _initialChunk
+    size = len(excess)
+    while begin < size:
+        cumulative = _np.cumsum(excess[begin:begin + width])
+        spill = cumulative - _np.minimum(_np.minimum.accumulate(cumulative), -soPer)
+        violations = _np.flatnonzero(spill > maxSoPer)
+        if len(violations) > 0:
+            return begin + int(violations[0]), spill[violations[0]]
+        soPer = spill[-1]
+        begin += width
+        width *= 2
+    return -1, soPer
+
+
+def calculatePTL(timeStamps, maxPer: float, maxSoPer: float, minDur: float, tsMax: int,
+                 closeAtTsMax: bool = True) -> _np.ndarray:
+    """
+    Calculate the periodic time-intervals of a pattern from its timestamps.
+
+    :param timeStamps: sorted timestamps of the pattern
+    :type timeStamps: numpy.ndarray or list
+    :param maxPer: maximum period
+    :type maxPer: int or float
+    :param maxSoPer: maximum spillover period
+    :type maxSoPer: int or float
+    :param minDur: minimum duration of a time-interval
+    :type minDur: int or float
+    :param tsMax: last timestamp of the database
+    :type tsMax: int
+    :param closeAtTsMax: if True, an interval still open at the end of the database ends at tsMax, otherwise it ends
+                         at the last timestamp of the pattern
+    :type closeAtTsMax: bool
+    :return: time-intervals as an array of (start, end) rows
+    :rtype: numpy.ndarray
+    """
+    timeStamps = _np.asarray(timeStamps)
+    intervals = []
+    if len(timeStamps) < 2:
+        return _np.empty((0, 2), dtype=timeStamps.dtype)
+    periods = _np.diff(timeStamps)
+    excess = periods - maxPer
+    openings = _np.flatnonzero(periods <= maxPer)
+    position = 0
+    while True:
+        index = _np.searchsorted(openings, position)
+        if index == len(openings):
+            break
+        begin = int(openings[index])
+        start = timeStamps[begin]
+        end, soPer = _firstSpillover(excess, begin, maxSoPer, maxSoPer)
+        if end == -1:
+            tsPre = timeStamps[-1]
+            soPer = max(0, soPer + tsMax - tsPre - maxPer)
+            if soPer > maxSoPer and tsPre - start >= minDur:
+                intervals.append((start, tsPre))
+            if soPer <= maxSoPer and tsMax - start >= minDur:
+                intervals.append((start, tsMax if closeAtTsMax else tsPre))
+            break
+        if timeStamps[end] - start >= minDur:
+            intervals.append((start, timeStamps[end]))
+        position = end + 1
+    if not intervals:
+        return _np.empty((0, 2), dtype=timeStamps.dtype)
+    return _np.array(intervals)
+
+
+def intervalsToSet(intervals: _np.ndarray) -> set:
+    """
+    Convert an array of time-intervals into the set of (start, end) tuples reported by the miners.
+
+    :param intervals: time-intervals as returned by calculatePTL
+    :type intervals: numpy.ndarray
+    :return: set of time-intervals
+    :rtype: set
+    """
+    return set(map(tuple, intervals.tolist()))
@@ -14,7 +14,13 @@
 #      You should have received a copy of the GNU General Public License
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from deprecated import deprecated
+import numpy as _np
+
 from PAMI.multipleMinimumSupportBasedSequentialPattern.basic import abstract as _ab
+from PAMI.multipleMinimumSupportBasedSequentialPattern.basic import misEngine as _misEngine
+from PAMI.sequentialPattern.basic import prefixSpanEngine as _prefixSpanEngine
+from PAMI.sequentialPattern.basic import sequenceDatabase as _sequenceDatabase
 import sys
 sys.setrecursionlimit(10000)
 
@@ -59,7 +65,9 @@ class MMSBprefixSpan(_ab._sequentialPatterns):
                 to store the maximum gap of sequence pattern
                 gap means the length of interval between two itemsets
             MIS:dict
-                to store the each items MIS
+                to store the each items MIS, by item id
+            _names : list
+                the name of every item, by item id
             X:int or float
                 to calculate MIS for each items
         Methods:
@@ -131,7 +139,7 @@ class MMSBprefixSpan(_ab._sequentialPatterns):
         self._memoryUSS = float()
         self._memoryRSS = float()
         self._Database = []
-        self._sepDatabase={}
+        self._names = []
         self._maxLength=maxlen
         self._maxGap=maxGap
         self._MIS={}
@@ -142,6 +150,13 @@ class MMSBprefixSpan(_ab._sequentialPatterns):
             Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
+        if isinstance(self._iFile, str) or _sequenceDatabase.isSequenceDatabase(self._iFile):
+            try:
+                self._Database = _sequenceDatabase.load(self._iFile, self._sep, self._sepSeq)
+            except IOError:
+                print("File Not Found")
+                quit()
+            return
 
         if isinstance(self._iFile, _ab._pd.DataFrame):
             temp = []
@@ -153,39 +168,6 @@ class MMSBprefixSpan(_ab._sequentialPatterns):
 
             for k in temp:
                 self._Database.append(set(k))
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._Database.append(set(temp))
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep+'-1'+self._sep)]
-                            temp = [x for x in temp if x ]
-
-                            seq = []
-                            for i in temp:
-                                if len(i)>1:
-                                   for i in list(sorted(set(i.split(self._sep)))):
-                                       seq.append(i)
-                                   seq.append(-1)
-
-                                else:
-                                    seq.append(i)
-                                    seq.append(-1)
-                            self._Database.append(seq)
-
-
-                except IOError:
-                    print("File Not Found")
-                    quit()
 
     def _convert(self, value):
         """
@@ -204,148 +186,31 @@ class MMSBprefixSpan(_ab._sequentialPatterns):
             else:
                 value = int(value)
         return value
-    def makeNext(self,sepDatabase,startrow,baseMIS):
-        """
-         To get next pattern by adding head word to next sequence of startrow
-        :param sepDatabase: dict
-            what words and rows startrow have to add it
-        :param startrow:
-            the patterns get before
-        """
-        for head in sepDatabase.keys():
-            newrow=[i for i in startrow]
-
-            if len(sepDatabase[head])>=self._minSup:
-                newMIS=baseMIS
-                if newrow!=[]:
-                    newrow.append(-1)
-                newrow.append(head)
-                newrow.append(-1)
-                if str(newrow) not in self._finalPatterns:
-                    if baseMIS>self._MIS[head]:
-                        newMIS=self._MIS[head]
-                    if len(sepDatabase[head])>=newMIS:
-                        self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    give = []
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    seqDatabase, seqDatabaseSame = self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                    if len(seqDatabase) != 0:
-                        self.makeNext(seqDatabase, newrow,newMIS)
-                    if len(seqDatabaseSame) != 0:
-                        self.makeNextSame(seqDatabaseSame, newrow,newMIS)
-                elif len(sepDatabase[head]) > self._finalPatterns[str(newrow)]:
-                    if baseMIS > self._MIS[head]:
-                        newMIS = self._MIS[head]
-                    if len(sepDatabase[head]) >= newMIS:
-                        self._finalPatterns[str(newrow)] = len(sepDatabase[head])
-                    give = []
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    seqDatabase, seqDatabaseSame = self.makeSeqDatabaseSame(sepDatabase[head],newrow)
-                    if len(seqDatabase) != 0:
-                        self.makeNext(seqDatabase, newrow,newMIS)
-                    if len(seqDatabaseSame) != 0:
-                        self.makeNextSame(seqDatabaseSame, newrow,newMIS)
-
-
-
-    def makeSupDatabase(self,database,head):
-        """
-         To delete not frequent words without words in latest sequence
-        :param database: list
-            database of lines have same startrow and head word
-        :param head:list
-         words in latest sequence
-        :return: changed database
 
+    def _itemSets(self):
+        """
+         To split the transactions of the database into the lists of their itemsets
         """
+        for line in self._Database:
+            sequence = [[]]
+            for item in line:
+                if item == -1:
+                    sequence.append([])
+                else:
+                    sequence[-1].append(item)
+            yield [itemSet for itemSet in sequence if itemSet]
 
-        supDatabase={}
-        alreadyInData=[]
-        newDatabase = []
-        for line in database:
-            alreadyInLine = []
-            for data in line:
-                    if data not in alreadyInLine:
-                        if data not in alreadyInData:
-                            supDatabase[data]=1
-                            alreadyInData.append(data)
-                        else:
-                            supDatabase[data]+=1
-                        alreadyInLine.append(data)
-        for line in database:
-                newLine=[]
-                for i in line:
-                    if supDatabase[i]>=self._minSup or i in head:
-                        if len(newLine)>1:
-                            if (newLine[-1]!=-1 or i!=-1):
-                                newLine.append(i)
-                        else:
-                            newLine.append(i)
-                newDatabase.append(newLine)
-
-        return newDatabase
-
-    def makeNextSame(self,sepDatabase,startrow,baseMIS):
+    def _patternName(self, pattern):
         """
-         To get next pattern by adding head word to latest sequence of startrow
-        :param sepDatabase: dict
-            what words and rows startrow have to add it
-        :param startrow:
-            the patterns get before
+         To convert a pattern of item ids to the pattern of item names
+        :param pattern: the pattern as a tuple of itemsets of item ids
+        :return: the pattern as it is stored in the final patterns
         """
-        
-        for head in sepDatabase.keys():
-
-            if len(sepDatabase[head])>=self._minSup:
-                newMIS=baseMIS
-                newrow = startrow.copy()
-                newrow.append(head)
-                newrow.append(-1)
-                if str(newrow) not in self._finalPatterns.keys():
-                    if baseMIS>self._MIS[head]:
-                        newMIS=self._MIS[head]
-                    if len(sepDatabase[head])>=newMIS:
-                        self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    if -1 in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    print(newrow)
-                    print(len(sepDatabase[head]))
-                    newrow.pop()
-                    seqDatabase, seqDatabaseSame = self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                    if len(seqDatabase) != 0:
-                        self.makeNext(seqDatabase, newrow,newMIS)
-                    if len(seqDatabaseSame) != 0:
-                        self.makeNextSame(seqDatabaseSame, newrow,newMIS)
-                elif len(sepDatabase[head])>self._finalPatterns[str(newrow)]:
-                    if baseMIS>self._MIS[head]:
-                        newMIS=self._MIS[head]
-                    if len(sepDatabase[head])>=newMIS:
-                        self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    if -1 in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    seqDatabase,seqDatabaseSame=self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                    if len(seqDatabase) != 0:
-                        self.makeNext(seqDatabase, newrow,newMIS)
-                    if len(seqDatabaseSame) != 0:
-                        self.makeNextSame(seqDatabaseSame, newrow,newMIS)
-
-
-
-
-
+        row = []
+        for itemSet in pattern:
+            row.extend(self._names[i] for i in itemSet)
+            row.append(-1)
+        return str(row)
 
     def makeNewMIS(self,value):
         """
@@ -367,180 +232,57 @@ class MMSBprefixSpan(_ab._sequentialPatterns):
         
         return value
 
-    def makeMISList(self,seqDatabase):
+    def makeMISList(self, supports):
         """
         make MIS list for each items
-        :param seqDatabase:dict the items and their support
-                
+        :param supports: the support of every item id
+
         """
-        for key,value in seqDatabase.items():
-            value=len(value)
-            if value>=self._minSup:
-                newValue=self.makeNewMIS(value)
-                if newValue>self._minSup:
-                    self._MIS[key]=newValue
+        self._MIS = {}
+        for key, value in enumerate(supports):
+            if value >= self._minSup:
+                newValue = self.makeNewMIS(int(value))
+                if newValue > self._minSup:
+                    self._MIS[key] = newValue
                 else:
-                    self._MIS[key]=self._minSup
-
-
+                    self._MIS[key] = self._minSup
 
-    def makeSeqDatabaseFirst(self,database):
-        """
-        To make 1 length sequence dataset list which start from same word. It was stored only 1 from 1 line.
-        :param database:
-                To store the transactions of a database in list
-        """
-        startrow=[]
-        seqDatabase={}
-        for line in database:
-            alreadyInLine=[]
-            for data in range(len(line)):
-                if line[data] not in alreadyInLine and line[data]!=-1:
-                    if line[data] not in seqDatabase.keys():
-                        seqDatabase[line[data]]=[]
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-                    else:
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-        self.makeMISList(seqDatabase)
-        print("finish making")
-        if len(seqDatabase)>0:
-            self.makeNext(seqDatabase,startrow,100000000000000)
-
-    def serchSame(self,database,startrow,give):
-        """
-         To get 2 or more length patterns in same sequence.
-        :param database: list
-            To store the transactions of a database in list which have same startrow and head word
-        :param startrow: list
-            the patterns get before
-        :param give: list
-            the word in latest sequence of startrow
-        :return:
-        """
-        sepDatabaseSame={}
-        sepDatabaseSame[startrow[-1]]=[]
-        for line in database:
-            addLine=0
-            i=0
-            if len(line)>1:
-                while line[i]!=-1:
-                    if line[i]==startrow[-1]:
-                        sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                        addLine=1
-                        break
-                    i+=1
-                if addLine!=1:
-                    ok=[]
-                    while i <len(line):
-                        if line[i]==-1:
-                            ok=[]
-                        elif line[i]==startrow[-1]:
-                            ok.append("sk1")
-                        for x in give:
-                            if x==line[i]:
-                                ok.append(x)
-                        if len(ok)==1+len(give):
-                            sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                            break
-                        i+=1
-        startrow2=[startrow[0]]
-        startrow.append(-1)
-        return sepDatabaseSame[startrow[-2]]
-
-    def getSameSeq(self,startrow):
-        """
-         To get words in latest sequence
-        :param startrow:
-         the patterns get before
-        :return:
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
+    def startMine(self):
         """
-        give = []
-        newrow = startrow.copy()
-        while newrow[-1] != -1:
-            y = newrow.pop()
-            give.append(y)
-        return give
-
-
-    def makeSeqDatabaseSame(self,database,startrow):
+            Frequent pattern mining process will start from here
         """
-            To make sequence dataset list which start from same word(head). It was stored only 1 from 1 line.
-            And it separated by having head in latest sequence of startrow or not.
-
-            :param database:
-                    To store the transactions of a database in list
-            :param startrow: list
-                    the patterns get before
-
-            """
-        seqDatabase={}
-        seqDatabaseSame={}
-        seqLength=startrow.count(-1)+1
-        for line in database:
-            if len(line)>1:
-                alreadyInLine=[]
-                i = 0
-                while line[i] != -1:
-                        if line[i] not in seqDatabaseSame:
-                            if -1 in startrow:
-                                give=self.getSameSeq(startrow)
-                            else:
-                                give=startrow.copy()
-                            newrow= [startrow[-1], line[i]]
-                            seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                        i += 1
-                same=0
-                seqCount=0
-                if self._maxLength>seqLength:
-                    while len(line)>i and self._maxGap>seqCount:
-                        if line[i]!=-1:
-                            if line[i] not in alreadyInLine:
-                                if line[i] not in seqDatabase:
-                                    seqDatabase[line[i]]=[]
-                                seqDatabase[line[i]].append(line[i + 1:])
-                                alreadyInLine.append(line[i])
-                            if line[i]==startrow[-1]:
-                                same=1
-
-
-                            elif same==1 and line[i] not in seqDatabaseSame:
-                                if -1 in startrow:
-                                    give=self.getSameSeq(startrow)
-                                else:
-                                    give=startrow.copy()
-                                newrow= [startrow[-1], line[i]]
-                                seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                        else:
-                            same=0
-                            seqCount+=1
-                        i+=1
-
-        return seqDatabase,seqDatabaseSame
-
-
+        self.mine()
 
-
-    def startMine(self):
+    def mine(self):
         """
             Frequent pattern mining process will start from here
         """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
-        self._Database=self.makeSupDatabase(self._Database,"")
         self._minSup = self._convert(self._minSup)
-        self.makeSeqDatabaseFirst(self._Database)
+        if isinstance(self._Database, _sequenceDatabase.SequenceDatabase):
+            sequences, positions, items = self._Database.occurrences()
+            self._names = list(self._Database.names)
+            store = _prefixSpanEngine.SequenceStore.fromOccurrences(sequences, positions, items, len(self._names),
+                                                                    len(self._Database))
+        else:
+            store, self._names = _prefixSpanEngine.fromItemsets(self._itemSets())
+        self.makeMISList(store.supports)
+        mis = _np.full(len(self._names), float("inf"))
+        for item, value in self._MIS.items():
+            mis[item] = value
+        for pattern, support in _misEngine.mine(store, mis, self._maxLength, self._maxGap):
+            self._finalPatterns[self._patternName(pattern)] = support
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
         self._memoryRSS = float()
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
-        print("Frequent patterns were generated successfully using Apriori algorithm ")
+        print("Frequent patterns were generated successfully using MMSBPrefixSpan algorithm ")
 
     def getMemoryUSS(self):
         """Total amount of USS memory consumed by the mining process will be retrieved from this function
@@ -0,0 +1,176 @@
+#  Copyright (C)  2024 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+PrefixSpan under multiple minimum supports for the MIS-based sequential miners.
+
+Every item has its own minimum item support (MIS), and a pattern is frequent when its support reaches the lowest MIS of
+its items. This threshold is not anti-monotone, as an extension may add an item with a lower MIS, so the search cannot
+drop a prefix below the MIS of its own items. It keeps instead, with every prefix, the lowest MIS of its items, the
+running threshold, and bounds the threshold of the descendants of a prefix with the items of its extensions, which are
+the only items its descendants can add:
+
+* a descendant through an extension is supported at most by the support of the extension, and its threshold is at least
+  the lowest of the running threshold and of the MIS of the items of the extensions that are kept.
+* so the extensions are sorted by MIS and dropped when their support is below the threshold given by the lowest MIS of
+  the extensions kept, until none is dropped. This is the sorted closure of the MIS-based miners: dropping an
+  extension can only raise the threshold.
+
+Under a maximum gap, an item of a descendant need not extend the prefix itself within the gap, so the closure is then
+only applied to the frequent items, whose supports bound the ones of every pattern.
+
+The search is the one of prefixSpanEngine over its pseudo-projections, with the extensions counted at the lowest MIS,
+and the closure only drops subtrees, so the mining is never more costly than PrefixSpan at the lowest MIS.
+"""
+
+from typing import Iterator, List, Tuple
+
+import numpy as _np
+
+from PAMI.sequentialPattern.basic import parallelSearch as _parallelSearch
+from PAMI.sequentialPattern.basic import prefixSpanEngine as _prefixSpanEngine
+
+Pattern = Tuple[Tuple[int, ...], ...]
+
+
+def closure(lowest: float, mis: _np.ndarray, supports: _np.ndarray) -> Tuple[_np.ndarray, float]:
+    """
+    Sorted closure of the extensions of a prefix
+
+    :param lowest: the running threshold of the prefix, the lowest MIS of its items
+    :type lowest: float
+    :param mis: the MIS of the item of every extension
+    :type mis: numpy.ndarray
+    :param supports: the support of every extension
+    :type supports: numpy.ndarray
+    :return: the mask of the extensions kept and the threshold of the descendants of the prefix
+    :rtype: tuple
+    """
+    order = _np.argsort(mis, kind='stable')
+    sortedMis, sortedSupports = mis[order], supports[order]
+    keep = _np.ones(len(order), dtype=bool)
+    threshold = lowest
+    while keep.any():
+        threshold = min(lowest, float(sortedMis[_np.argmax(keep)]))
+        kept = keep & (sortedSupports >= threshold)
+        if kept.sum() == keep.sum():
+            break
+        keep = kept
+    mask = _np.zeros(len(order), dtype=bool)
+    mask[order[keep]] = True
+    return mask, threshold
+
+
+class MISProjectionSpace(_prefixSpanEngine.ProjectionSpace):
+    """
+    :Description: Search space of PrefixSpan under multiple minimum supports for parallelSearch. A task is a pattern, its
+                  projection and its running threshold, and the patterns of the children are the ones whose support
+                  reaches their own threshold.
+
+    :Attributes:
+
+        store : SequenceStore
+            The sequence database, without the items supported by less than the lowest MIS
+        mis : numpy.ndarray
+            The MIS of every item id, infinite for the items which are not mined
+        minSup : float
+            The lowest MIS
+        maxLength : float
+            The largest number of itemsets of a pattern
+        maxGap : float
+            The consecutive itemsets of a pattern match less than maxGap itemsets apart
+
+    :Methods:
+
+        roots()
+            Tasks of the items kept by the closure of all the items
+        expand(task)
+            Extensions of a pattern kept by the closure, and the ones reaching their threshold
+        weight(task)
+            Number of occurrences in the suffixes of a projection
+    """
+
+    def __init__(self, store: _prefixSpanEngine.SequenceStore, mis: _np.ndarray, maxLength: float = float("inf"),
+                 maxGap: float = float("inf")) -> None:
+        self.mis = _np.asarray(mis, dtype=float)
+        super().__init__(store, float(self.mis.min()) if len(self.mis) else float("inf"), maxLength, maxGap)
+
+    def _children(self, lowest: float, children: List[Tuple[Pattern, _np.ndarray]], items: List[int],
+                  bounded: bool = True) -> Tuple[List[Tuple[Pattern, int]], List[tuple]]:
+        supports = _np.array([self.store.support(projection) for _, projection in children], dtype=_np.int64)
+        mis = self.mis[_np.array(items, dtype=_np.int64)]
+        if bounded:
+            keep, _ = closure(lowest, mis, supports)
+        else:
+            keep = _np.ones(len(children), dtype=bool)
+        patterns, tasks = [], []
+        for (pattern, projection), support, itemMis, kept in zip(children, supports.tolist(), mis.tolist(),
+                                                                 keep.tolist()):
+            if not kept:
+                continue
+            threshold = min(lowest, itemMis)
+            if support >= threshold:
+                patterns.append((pattern, support))
+            tasks.append((pattern, projection, threshold))
+        return patterns, tasks
+
+    def roots(self) -> List[tuple]:
+        """
+        Tasks of the items kept by the sorted closure of all the frequent items
+
+        :return: pattern, projection and running threshold of every item kept, in increasing order
+        :rtype: list
+        """
+        roots = super().roots()
+        return self._children(float("inf"), roots, [pattern[0][0] for pattern, _ in roots])[1]
+
+    def expand(self, task: tuple) -> Tuple[List[Tuple[Pattern, int]], List[tuple]]:
+        """
+        Extensions of a pattern kept by the sorted closure, the itemset extensions first
+
+        :param task: the pattern, its projection and its running threshold
+        :type task: tuple
+        :return: the extensions reaching their running threshold with their supports, and the tasks of the extensions
+                 kept
+        :rtype: tuple
+        """
+        pattern, positions, lowest = task
+        sExtensions, iExtensions = self._extensions(pattern, positions)
+        children = [(pattern[:-1] + (pattern[-1] + (item,),), projection) for item, projection in iExtensions.items()]
+        children += [(pattern + ((item,),), projection) for item, projection in sExtensions.items()]
+        return self._children(lowest, children, list(iExtensions) + list(sExtensions), self.maxGap == float("inf"))
+
+
+def mine(store: _prefixSpanEngine.SequenceStore, mis: _np.ndarray, maxLength: float = float("inf"),
+         maxGap: float = float("inf")) -> Iterator[Tuple[Pattern, int]]:
+    """
+    Depth-first PrefixSpan under multiple minimum supports
+
+    :param store: the sequence database
+    :type store: SequenceStore
+    :param mis: the MIS of every item id, infinite for the items which are not mined
+    :type mis: numpy.ndarray
+    :param maxLength: the largest number of itemsets of a pattern
+    :type maxLength: float
+    :param maxGap: the consecutive itemsets of a pattern match less than maxGap itemsets apart
+    :type maxGap: float
+    :return: every pattern whose support reaches the lowest MIS of its items, with its support
+    :rtype: iterator
+    """
+    space = MISProjectionSpace(store, mis, maxLength, maxGap)
+    for root in space.roots():
+        if space.store.support(root[1]) >= root[2]:
+            yield root[0], space.store.support(root[1])
+        yield from _parallelSearch.subtree(space, root)
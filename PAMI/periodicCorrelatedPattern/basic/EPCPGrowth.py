@@ -55,6 +55,7 @@ __copyright__ = """
 import sys
 
 from PAMI.periodicCorrelatedPattern.basic import abstract as _ab
+from PAMI.frequentPattern.basic import conditionalTree as _ct
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 import pandas as pd
 
@@ -66,172 +67,32 @@ _frequentList = {}
 _lno = int()
 
 
-class _Node(object):
+class _Tree(_ct.ConditionalTree):
     """
-    A class used to represent the node of frequentPatternTree
+    A class used to represent the periodic correlated pattern tree. Nodes store their timestamps and the
+    pattern-growth search is provided by the shared conditional tree runtime. Only the patterns satisfying all the
+    constraints are extended.
 
     :Attributes:
 
-        item : int or None
-            Storing item of a node
-        timeStamps : list
-            To maintain the timestamps of a database at the end of the branch
-        parent : node
-            To maintain the parent of every node
-        children : list
-            To maintain the children of a node
-
-    :Methods:
-
-        addChild(itemName)
-            Storing the children to their respective parent nodes
-        """
-
-    def __init__(self, item, children) -> None:
-        """
-        Initializing the Node class
-
-        :param item: Storing the item of a node
-        :type item: int or None
-        :param children: To maintain the children of a node
-        :type children: dict
-        """
-
-        self.item = item
-        self.children = children
-        self.parent = None
-        self.timeStamps = []
-
-    def addChild(self, node) -> None:
-        """
-        To add the children to a node
-
-        :param node: parent node in the tree
-        """
-
-        self.children[node.item] = node
-        node.parent = self
-
-
-class _Tree(object):
-    """
-    A class used to represent the frequentPatternGrowth tree structure
-
-    :Attributes:
-
-        root : Node
-            Represents the root node of the tree
         summaries : dictionary
             Storing the nodes with same item name
         info : dictionary
-            Stores the support of the items
-
+            Stores the support, periodicity, all-confidence and periodic all-confidence of the items
 
     :Methods:
 
-        addTransactions(Database)
-            Creating transaction as a branch in frequentPatternTree
-        getConditionalPatterns(Node)
-            Generates the conditional patterns from tree for specific node
-        conditionalTransaction(prefixPaths,Support)
-            Takes the prefixPath of a node and support at child of the path and extract the frequent patterns from
-            prefixPaths and generates prefixPaths with items which are frequent
-        remove(Node)
-            Removes the node from tree once after generating all the patterns respective to the node
-        generatePatterns(Node)
-            Starts from the root node of the tree and mines the periodic-frequent patterns
-
+        getSupportAndPeriod(timeStamps, pattern)
+            Calculates the support, periodicity, all-confidence and periodic all-confidence of a pattern
+        measure(timeStamps, pattern)
+            Measure of a pattern used by the conditional databases
+        isPromising(value)
+            Checks the support and periodicity of an item
+        isPattern(value)
+            Checks all the constraints of a pattern
     """
 
-    def __init__(self) -> None:
-        self.root = _Node(None, {})
-        self.summaries = {}
-        self.info = {}
-
-    def addTransaction(self, transaction, tid) -> None:
-        """
-        Adding a transaction into tree
-
-        :param transaction: To represent the complete database
-        :type transaction: list
-        :param tid: To represent the timestamp of a database
-        :type tid: list
-        :return: pfp-growth tree
-        """
-
-        currentNode = self.root
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = _Node(transaction[i], {})
-                currentNode.addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].append(newNode)
-                else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
-            else:
-                currentNode = currentNode.children[transaction[i]]
-        currentNode.timeStamps = currentNode.timeStamps + tid
-
-    def getConditionalPatterns(self, alpha, pattern) -> tuple:
-        """
-        Generates all the conditional patterns of a respective node
-
-        :param alpha: To represent a Node in the tree
-        :type alpha: Node
-        :return: A tuple consisting of finalPatterns, conditional pattern base and information
-        """
-        finalPatterns = []
-        finalSets = []
-        for i in self.summaries[alpha]:
-            set1 = i.timeStamps
-            set2 = []
-            while i.parent.item is not None:
-                set2.append(i.parent.item)
-                i = i.parent
-            if len(set2) > 0:
-                set2.reverse()
-                finalPatterns.append(set2)
-                finalSets.append(set1)
-        finalPatterns, finalSets, info = self.conditionalDatabases(finalPatterns, finalSets, pattern)
-        return finalPatterns, finalSets, info
-
-    @staticmethod
-    def generateTimeStamps(node) -> list:
-        """
-        To get the timestamps of a node
-
-        :param node: A node in the tree
-        :return: Timestamps of a node
-        """
-
-        finalTimeStamps = node.timeStamps
-        return finalTimeStamps
-
-    def removeNode(self, nodeValue) -> None:
-        """
-        Removing the node from tree
-
-        :param nodeValue: To represent a node in the tree
-        :type nodeValue: node
-        :return: Tree with their nodes updated with timestamps
-        """
-
-        for i in self.summaries[nodeValue]:
-            i.parent.timeStamps = i.parent.timeStamps + i.timeStamps
-            del i.parent.children[nodeValue]
-
-    def getTimeStamps(self, alpha) -> list:
-        """
-        To get all the timestamps of the nodes which share same item name
-
-        :param alpha: Node in a tree
-        :return: Timestamps of a  node
-        """
-        temporary = []
-        for i in self.summaries[alpha]:
-            temporary += i.timeStamps
-        return temporary
+    expandNonPatterns = False
 
     @staticmethod
     def getSupportAndPeriod(timeStamps, pattern) -> list:
@@ -265,65 +126,29 @@ class _Tree(object):
         #print(pattern, timeStamps, l, l1, sup, max(per), conf, perConf)
         return [sup, max(per), conf, perConf]
 
-    def conditionalDatabases(self, conditionalPatterns: list, conditionalTimeStamps: list, pattern) -> tuple:
-        """
-        It generates the conditional patterns with periodic-frequent items
-
-        :param conditionalPatterns: conditionalPatterns generated from conditionPattern method of a respective node
-        :type conditionalPatterns: list
-        :param conditionalTimeStamps: Represents the timestamps of a conditional patterns of a node
-        :type conditionalTimeStamps: list
-        :returns: Returns conditional transactions by removing non-periodic and non-frequent items
-        """
-        global _maxPer, _minSup
-        temp = pattern
-        pat = []
-        timeStamps = []
-        data1 = {}
-        for i in range(len(conditionalPatterns)):
-            for j in conditionalPatterns[i]:
-                if j in data1:
-                    data1[j] = data1[j] + conditionalTimeStamps[i]
-                else:
-                    data1[j] = conditionalTimeStamps[i]
-        updatedDictionary = {}
-        for m in data1:
-            updatedDictionary[m] = self.getSupportAndPeriod(data1[m], pattern + [m])
-        updatedDictionary = {k: v for k, v in updatedDictionary.items() if v[0] >= _minSup and v[1] <= _maxPer}
-        count = 0
-        for p in conditionalPatterns:
-            p1 = [v for v in p if v in updatedDictionary]
-            trans = sorted(p1, key=lambda x: (updatedDictionary.get(x)[0], -x), reverse=True)
-            if len(trans) > 0:
-                pat.append(trans)
-                timeStamps.append(conditionalTimeStamps[count])
-            count += 1
-        return pat, timeStamps, updatedDictionary
-
-    def generatePatterns(self, prefix: list) -> Generator:
-        """
-        Generates the patterns
-
-        :param prefix: Forms the combination of items
-        :type prefix: list
-        :returns: yields patterns with their support and periodicity
-        """
-        global _minSup, _minAllConf, _maxPer, _maxPerAllConf
-        for i in sorted(self.summaries, key=lambda x: (self.info.get(x)[0], -x)):
-            pattern = prefix[:]
-            pattern.append(i)
-            #print(pattern, self.info[i][0], self.info[i][1], self.info[i][2], self.info[i][3])
-            if self.info[i][0] >= _minSup and self.info[i][1] <= _maxPer and self.info[i][2] >= _minAllConf and self.info[i][3] <= _maxPerAllConf:
-                yield pattern, self.info[i]
-                patterns, timeStamps, info = self.getConditionalPatterns(i, pattern)
-                conditionalTree = _Tree()
-                conditionalTree.info = info.copy()
-                for pat in range(len(patterns)):
-                    conditionalTree.addTransaction(patterns[pat], timeStamps[pat])
-                if len(patterns) > 0:
-                    for q in conditionalTree.generatePatterns(pattern):
-                        yield q
-            self.removeNode(i)
+    def measure(self, timeStamps, pattern) -> list:
+        """
+        To calculate the support, periodicity, all-confidence and periodic all-confidence of a pattern
+
+        :param timeStamps: Timestamps of the pattern
+        :param pattern: the pattern being measured
+        :return: support, periodicity, all-confidence, periodic all-confidence
+        """
+        return self.getSupportAndPeriod(timeStamps, pattern)
+
+    def isPromising(self, value) -> bool:
+        """
+        :param value: measure of an item
+        :return: True if the item is periodic-frequent
+        """
+        return value[0] >= _minSup and value[1] <= _maxPer
+
+    def isPattern(self, value) -> bool:
+        """
+        :param value: measure of a pattern
+        :return: True if the pattern is a periodic correlated pattern
+        """
+        return value[0] >= _minSup and value[1] <= _maxPer and value[2] >= _minAllConf and value[3] <= _maxPerAllConf
 
 
 class EPCPGrowth(_ab._periodicCorrelatedPatterns):
@@ -58,6 +58,7 @@ import pandas as pd
 from deprecated import deprecated
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
+from PAMI.frequentPattern.basic import conditionalTree as _ct
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 
 _maxPer = float()
@@ -65,46 +66,13 @@ _minSup = float()
 _lno = int()
 
 
-class _Node(object):
+class _Tree(_ct.ConditionalTree):
     """
-    A class used to represent the node of frequentPatternTree
+    A class used to represent the frequentPatternGrowth tree structure. Nodes store their timestamps and the
+    pattern-growth search is provided by the shared conditional tree runtime.
 
     :Attributes:
 
-        item : int
-            storing item of a node
-        timeStamps : list
-            To maintain the timestamps of transaction at the end of the branch
-        parent : node
-            To maintain the parent of every node
-        children : list
-            To maintain the children of node
-
-    :Methods:
-
-        addChild(itemName)
-            storing the children to their respective parent nodes
-    """
-
-    def __init__(self, item, children) -> None:
-        self.item = item
-        self.children = children
-        self.parent = None
-        self.timeStamps = []
-
-    def addChild(self, node) -> None:
-        self.children[node.item] = node
-        node.parent = self
-
-
-class _Tree(object):
-    """
-    A class used to represent the frequentPatternGrowth tree structure
-
-    :Attributes:
-
-        root : Node
-            Represents the root node of the tree
         summaries : dictionary
             storing the nodes with same item name
         info : dictionary
@@ -112,98 +80,14 @@ class _Tree(object):
 
     :Methods:
 
-        addTransaction(transaction)
-            creating transaction as a branch in frequentPatternTree
-        getConditionalPatterns(Node)
-            generates the conditional patterns from tree for specific node
-        conditionalTransactions(prefixPaths,Support)
-            takes the prefixPath of a node and support at child of the path and extract the frequent items from
-            prefixPaths and generates prefixPaths with items which are frequent
-        remove(Node)
-            removes the node from tree once after generating all the patterns respective to the node
-        generatePatterns(Node)
-            tarts from the root node of the tree and mines the periodic-frequent patterns
+        getSupportAndPeriod(timeStamps)
+            calculates the support and periodicity with list of timestamps
+        measure(timeStamps, pattern)
+            support and periodicity of a pattern
+        isPromising(value)
+            checks the support and periodicity of an item
     """
 
-    def __init__(self) -> None:
-        self.root = _Node(None, {})
-        self.summaries = {}
-        self.info = {}
-
-    def addTransaction(self, transaction, tid) -> None:
-        """
-        adding transaction into tree
-
-        :param transaction : it represents the one transaction in database
-        :type transaction : list
-        :param tid : represents the timestamp of transaction
-        :type tid : list
-        :return: None
-        """
-        currentNode = self.root
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = _Node(transaction[i], {})
-                currentNode.addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].append(newNode)
-                else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
-            else:
-                currentNode = currentNode.children[transaction[i]]
-        currentNode.timeStamps = currentNode.timeStamps + tid
-
-    def getConditionalPatterns(self, alpha) -> Tuple[List[List], List[List], Dict]:
-        """
-        generates all the conditional patterns of respective node
-
-        :param alpha : it represents the Node in tree
-        :type alpha : Node
-        """
-        finalPatterns = []
-        finalSets = []
-        for i in self.summaries[alpha]:
-            set1 = i.timeStamps
-            set2 = []
-            while i.parent.item is not None:
-                set2.append(i.parent.item)
-                i = i.parent
-            if len(set2) > 0:
-                set2.reverse()
-                finalPatterns.append(set2)
-                finalSets.append(set1)
-        finalPatterns, finalSets, info = self.conditionalTransactions(finalPatterns, finalSets)
-        return finalPatterns, finalSets, info
-
-    @staticmethod
-    def generateTimeStamps(node) -> List:
-        finalTimeStamps = node.timeStamps
-        return finalTimeStamps
-
-    def removeNode(self, nodeValue):
-        """
-        removing the node from tree
-
-        :param nodeValue : it represents the node in tree
-        type nodeValue : node
-        """
-        for i in self.summaries[nodeValue]:
-            i.parent.timeStamps = i.parent.timeStamps + i.timeStamps
-            del i.parent.children[nodeValue]
-
-    def getTimeStamps(self, alpha):
-        """
-        to get all the timestamps related to a node in tree
-
-        :param alpha: node of a tree
-        :return: timestamps of a node
-        """
-        temporary = []
-        for i in self.summaries[alpha]:
-            temporary += i.timeStamps
-        return temporary
-
     @staticmethod
     def getSupportAndPeriod(timeStamps):
         """
@@ -226,59 +110,22 @@ class _Tree(object):
         per = max(per, _lno - cur)
         return [sup, per]
 
-    def conditionalTransactions(self, conditionalPatterns, conditionalTimeStamps):
+    def measure(self, timeStamps, pattern) -> List[int]:
         """
-        It generates the conditional patterns with periodic frequent items
+        calculates the support and periodicity of a pattern
 
-        :param conditionalPatterns : conditionalPatterns generated from conditionalPattern method for respective node
-        type conditionalPatterns : list
-        :param conditionalTimeStamps : represents the timestamps of conditional patterns of a node
-        :type conditionalTimeStamps : list
+        :param timeStamps: timestamps of the pattern
+        :param pattern: the pattern being measured
+        :return: support, periodicity
         """
-        global _maxPer, _minSup
-        pat = []
-        timeStamps = []
-        data1 = {}
-        for i in range(len(conditionalPatterns)):
-            for j in conditionalPatterns[i]:
-                if j in data1:
-                    data1[j] = data1[j] + conditionalTimeStamps[i]
-                else:
-                    data1[j] = conditionalTimeStamps[i]
-        updatedDictionary = {}
-        for m in data1:
-            updatedDictionary[m] = self.getSupportAndPeriod(data1[m])
-        updatedDictionary = {k: v for k, v in updatedDictionary.items() if v[0] >= _minSup and v[1] <= _maxPer}
-        count = 0
-        for p in conditionalPatterns:
-            p1 = [v for v in p if v in updatedDictionary]
-            trans = sorted(p1, key=lambda x: (updatedDictionary.get(x)[0], -x), reverse=True)
-            if len(trans) > 0:
-                pat.append(trans)
-                timeStamps.append(conditionalTimeStamps[count])
-            count += 1
-        return pat, timeStamps, updatedDictionary
-
-    def generatePatterns(self, prefix):
-        """
-        generates the patterns
-
-        :param prefix : forms the combination of items
-        :type prefix : list
-        """
-        for i in sorted(self.summaries, key=lambda x: (self.info.get(x)[0], -x)):
-            pattern = prefix[:]
-            pattern.append(i)
-            yield pattern, self.info[i]
-            patterns, timeStamps, info = self.getConditionalPatterns(i)
-            conditionalTree = _Tree()
-            conditionalTree.info = info.copy()
-            for pat in range(len(patterns)):
-                conditionalTree.addTransaction(patterns[pat], timeStamps[pat])
-            if len(patterns) > 0:
-                for q in conditionalTree.generatePatterns(pattern):
-                    yield q
-            self.removeNode(i)
+        return self.getSupportAndPeriod(timeStamps)
+
+    def isPromising(self, value) -> bool:
+        """
+        :param value: support and periodicity of an item
+        :return: True if the item is periodic-frequent
+        """
+        return value[0] >= _minSup and value[1] <= _maxPer
 
 
 class PFPGrowthPlus(_ab._periodicFrequentPatterns):
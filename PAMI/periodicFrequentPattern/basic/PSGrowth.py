@@ -55,9 +55,8 @@ __copyright__ = """
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 import pandas as pd
 from deprecated import deprecated
-from itertools import combinations as _combinations
-from PAMI.periodicFrequentPattern.basic import abstract as _ab
-from typing import List, Dict, Tuple, Set, Union, Any, Generator  
+from PAMI.frequentPattern.basic import conditionalTree as _ct
+from typing import List, Dict, Tuple, Set, Union, Any, Generator
 
 _pfList = []
 _minSup = int()
@@ -65,248 +64,33 @@ _maxPer = int()
 _lno = int()
 
 
-class _Interval(object):
-    """
-    To represent the timestamp interval of a node in summaries
-    """
-
-    def __init__(self, start, end, per, sup) -> None:
-        self.start = start
-        self.end = end
-        self.per = per
-        self.sup = sup
-
-
-class _NodeSummaries(object):
-    """
-    To define the summaries of timeStamps of a node
-
-    :Attributes:
-
-        totalSummaries : list
-            stores the summaries of timestamps
-
-    :Methods:
-
-        insert(timeStamps)
-            inserting and merging the timestamps into the summaries of a node
-    """
-
-    def __init__(self) -> None:
-        self.totalSummaries = []
-
-    def insert(self, tid) -> List[_Interval]:
-        """ To insert and merge the timeStamps into summaries of a node
-            :param tid: timeStamps of a node
-            :return: summaries of a node
-        """
-        k = self.totalSummaries[-1]
-        diff = tid - k.end
-        if diff <= _maxPer:
-            k.end = tid
-            k.per = max(diff, k.per)
-            #             print(k.per)
-            k.sup += 1
-        else:
-            self.totalSummaries.append(_Interval(tid, tid, 0, 1))
-        return self.totalSummaries
-
-
-def _merge(summariesX, summariesY) -> List[_Interval]:
-    """
-    To Merge the timeStamps
-
-    :param summariesX:  TimeStamps of a one itemSet
-    :param summariesY:  TimeStamps of a one itemSet
-    :return:  Merged timestamp of both itemSets
+def getPeriodAndSupport(timeStamps) -> List[int]:
     """
-    iter1 = 0
-    iter2 = 0
-    updatedSummaries = []
-    l1 = len(summariesX)
-    l2 = len(summariesY)
-    while 1:
-        if summariesX[iter1].start < summariesY[iter2].start:
-            if summariesX[iter1].end < summariesY[iter2].start:
-                diff = summariesY[iter2].start - summariesX[iter1].end
-                if diff > _maxPer:
-                    updatedSummaries.append(_Interval(summariesX[iter1].start,
-                                                     summariesX[iter1].end, summariesX[iter1].per,
-                                                     summariesX[iter1].sup))
-                    iter1 += 1
-                    if iter1 >= l1:
-                        ck = 1
-                        break
-                else:
-                    per1 = max(diff, summariesX[iter1].per)
-                    per1 = max(per1, summariesY[iter2].per)
-                    updatedSummaries.append(
-                        _Interval(summariesX[iter1].start, summariesY[iter2].end, per1,
-                                 summariesX[iter1].sup + summariesY[iter2].sup))
-                    iter1 += 1
-                    iter2 += 1
-                    if iter1 >= l1:
-                        ck = 1
-                        break
-
-                    if iter2 >= l2:
-                        ck = 2
-                        break
-
-            else:
-                if summariesX[iter1].end > summariesY[iter2].end:
-                    updatedSummaries.append(_Interval(summariesX[iter1].start, summariesX[iter1].end,
-                                                     summariesX[iter1].per,
-                                                     summariesX[iter1].sup + summariesY[iter2].sup))
-                else:
-                    per1 = max(summariesX[iter1].per, summariesY[iter2].per)
-                    updatedSummaries.append(
-                        _Interval(summariesX[iter1].start, summariesY[iter2].end, per1,
-                                 summariesX[iter1].sup + summariesY[iter2].sup))
-                iter1 += 1
-                iter2 += 1
-                if iter1 >= l1:
-                    ck = 1
-                    break
-
-                if iter2 >= l2:
-                    ck = 2
-                    break
-        else:
-            if summariesY[iter2].end < summariesX[iter1].start:
-                diff = summariesX[iter1].start - summariesY[iter2].end
-                if diff > _maxPer:
-                    updatedSummaries.append(_Interval(summariesY[iter2].start, summariesY[iter2].end,
-                                                     summariesY[iter2].per, summariesY[iter2].sup))
-                    iter2 += 1
-                    if iter2 >= l2:
-                        ck = 2
-                        break
-                else:
-                    per1 = max(diff, summariesY[iter2].per)
-                    per1 = max(per1, summariesX[iter1].per)
-                    updatedSummaries.append(
-                        _Interval(summariesY[iter2].start, summariesX[iter1].end, per1,
-                                 summariesY[iter2].sup + summariesX[iter1].sup))
-                    iter2 += 1
-                    iter1 += 1
-                    if iter2 >= l2:
-                        ck = 2
-                        break
-
-                    if iter1 >= l1:
-                        ck = 1
-                        break
+    Calculates the period and support of the interval summaries of a pattern
 
-            else:
-                if summariesY[iter2].end > summariesX[iter1].end:
-                    updatedSummaries.append(_Interval(summariesY[iter2].start, summariesY[iter2].end,
-                                                     summariesY[iter2].per,
-                                                     summariesY[iter2].sup + summariesX[iter1].sup))
-                else:
-                    per1 = max(summariesY[iter2].per, summariesX[iter1].per)
-                    updatedSummaries.append(
-                        _Interval(summariesY[iter2].start, summariesX[iter1].end, per1,
-                                 summariesY[iter2].sup + summariesX[iter1].sup))
-                iter2 += 1
-                iter1 += 1
-                if iter2 >= l2:
-                    ck = 2
-                    break
-
-                if iter1 >= l1:
-                    ck = 1
-                    break
-    if ck == 1:
-        while iter2 < l2:
-            updatedSummaries.append(summariesY[iter2])
-            iter2 += 1
-    else:
-        while iter1 < l1:
-            updatedSummaries.append(summariesX[iter1])
-            iter1 += 1
-    updatedSummaries = _update(updatedSummaries)
-
-    return updatedSummaries
-
-
-def _update(updatedSummaries) -> List[_Interval]:
-    """ After updating the summaries with first, last, and period elements in summaries
-
-    :param updatedSummaries: summaries that have been merged
-    :return: updated summaries of a node
-    """
-    summaries = [updatedSummaries[0]]
-    cur = updatedSummaries[0]
-    for i in range(1, len(updatedSummaries)):
-        v = (updatedSummaries[i].start - cur.end)
-        if cur.end > updatedSummaries[i].start or v <= _maxPer:
-            cur.end = max(updatedSummaries[i].end, cur.end)
-            cur.sup += updatedSummaries[i].sup
-            cur.per = max(cur.per, updatedSummaries[i].per)
-            cur.per = max(cur.per, v)
-        else:
-            summaries.append(updatedSummaries[i])
-        cur = summaries[-1]
-    return summaries
-
-
-class Node(object):
+    :param timeStamps: (start, end, period, support) intervals of a pattern, sorted by start
+    :return: support and periodicity
     """
-    A class used to represent the node of frequentPatternTree
-
-    :Attributes:
-
-        item : int
-            storing item of a node
-        timeStamps : list
-            To maintain the timeStamps of Database at the end of the branch
-        parent : node
-            To maintain the parent of every node
-        children : list
-            To maintain the children of node
-
-    :Methods:
-
-            addChild(itemName)
-                storing the children to their respective parent nodes
-        """
-
-    def __init__(self, item, children) -> None:
-        """
-        Initializing the Node class
-
-        :param item: Storing the item of a node
-        :type item: int
-        :param children: To maintain the children of a node
-        :type children: dict
-        :return: None
-        """
-        self.item = item
-        self.children = children
-        self.parent = None
-        self.timeStamps = _NodeSummaries()
-
-    def addChild(self, node) -> None:
-        """
-        Appends the children node details to a parent node
-
-        :param node: children node
-        :return: appending children node to parent node
-        """
-        self.children[node.item] = node
-        node.parent = self
+    cur = 0
+    per = 0
+    sup = 0
+    for start, end, period, support in timeStamps:
+        per = max(per, start - cur, period)
+        if per > _maxPer:
+            return [0, 0]
+        cur = end
+        sup += support
+    per = max(per, _lno - cur)
+    return [sup, per]
 
 
-class _Tree(object):
+class _Tree(_ct.IntervalTree):
     """
-
-    A class used to represent the frequentPatternGrowth tree structure
+    A class used to represent the frequentPatternGrowth tree structure. Nodes store the summaries of their timestamps
+    as intervals, and the pattern-growth search is provided by the shared conditional tree runtime.
 
     :Attributes:
 
-        root : Node or None
-            Represents the root node of the tree
         summaries : dictionary
             storing the nodes with same item name
         info : dictionary
@@ -314,257 +98,28 @@ class _Tree(object):
 
     :Methods:
 
-            addTransaction(Database)
-                creating Database as a branch in frequentPatternTree
-            addConditionalTransactions(prefixPaths, supportOfItems)
-                construct the conditional tree for prefix paths
-            getConditionalPatterns(Node)
-                generates the conditional patterns from tree for specific node
-            conditionalTransaction(prefixPaths,Support)
-                takes the prefixPath of a node and support at child of the path and extract the frequent items from
-                prefixPaths and generates prefixPaths with items which are frequent
-            remove(Node)
-                removes the node from tree once after generating all the patterns respective to the node
-            generatePatterns(Node)
-                starts from the root node of the tree and mines the periodic-frequent patterns
-
+        measure(timeStamps, pattern)
+            support and periodicity of a pattern
+        isPromising(value)
+            checks the support and periodicity of an item
     """
 
-    def __init__(self) -> None:
-        self.root = Node(None, {})
-        self.summaries = {}
-        self.info = {}
-
-    def addTransaction(self, transaction, tid) -> None:
+    def measure(self, timeStamps, pattern) -> List[int]:
         """
-        Adding transaction into the tree
+        calculates the support and periodicity of a pattern
 
-        :param transaction: it represents the one transaction in a database
-        :type transaction: list
-        :param tid: represents the timestamp of a transaction
-        :type tid: list
-        :return: None
+        :param timeStamps: interval summaries of the pattern
+        :param pattern: the pattern being measured
+        :return: support, periodicity
         """
-        currentNode = self.root
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = Node(transaction[i], {})
-                currentNode.addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].append(newNode)
-                else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
-            else:
-                currentNode = currentNode.children[transaction[i]]
-        if len(currentNode.timeStamps.totalSummaries) != 0:
-            currentNode.timeStamps.insert(tid)
-        else:
-            currentNode.timeStamps.totalSummaries.append(_Interval(tid, tid, 0, 1))
+        return getPeriodAndSupport(timeStamps)
 
-    def addConditionalPatterns(self, transaction, tid) -> None:
+    def isPromising(self, value) -> bool:
         """
-        To add the conditional transactions in to conditional tree
-
-        :param transaction: conditional transaction list of a node
-        :param tid: timestamp of a conditional transaction
-        :return: the conditional tree of a node
+        :param value: support and periodicity of an item
+        :return: True if the item is periodic-frequent
         """
-        currentNode = self.root
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = Node(transaction[i], {})
-                currentNode.addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].append(newNode)
-                else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
-            else:
-                currentNode = currentNode.children[transaction[i]]
-        if len(currentNode.timeStamps.totalSummaries) != 0:
-            currentNode.timeStamps.totalSummaries = _merge(currentNode.timeStamps.totalSummaries, tid)
-        else:
-            currentNode.timeStamps.totalSummaries = tid
-
-    def getConditionalPatterns(self, alpha) -> Tuple[List[List[int]], List[List[_Interval]], Dict[int, Tuple[int, int]]]:
-        """
-        To mine the conditional patterns of a node
-
-        :param alpha: starts from the leaf node of a tree
-        :return: the conditional patterns of a node
-        """
-        finalPatterns = []
-        finalSets = []
-        for i in self.summaries[alpha]:
-            set1 = i.timeStamps.totalSummaries
-            set2 = []
-            while i.parent.item is not None:
-                set2.append(i.parent.item)
-                i = i.parent
-            if len(set2) > 0:
-                set2.reverse()
-                finalPatterns.append(set2)
-                finalSets.append(set1)
-        finalPatterns, finalSets, info = conditionalTransactions(finalPatterns, finalSets)
-        return finalPatterns, finalSets, info
-
-    def removeNode(self, nodeValue) -> None:
-        """
-        to remove the node from the tree by pushing the timeStamps of leaf node to the parent node
-
-        :param nodeValue: name of node to be deleted
-        :return: removes the node from the tree
-        """
-        for i in self.summaries[nodeValue]:
-            if len(i.parent.timeStamps.totalSummaries) != 0:
-                i.parent.timeStamps.totalSummaries = _merge(i.parent.timeStamps.totalSummaries,
-                                                           i.timeStamps.totalSummaries)
-            else:
-                i.parent.timeStamps.totalSummaries = i.timeStamps.totalSummaries
-            del i.parent.children[nodeValue]
-            del i
-        del self.summaries[nodeValue]
-
-    def getTimeStamps(self, alpha) -> List[_Interval]:
-        """
-        To get the timeStamps of a respective node
-
-        :param alpha: name of node for the timeStamp
-        :return: timeStamps of a node
-        """
-        temp = []
-        for i in self.summaries[alpha]:
-            temp += i.timeStamps
-        return temp
-
-    def check(self) -> int:
-        """
-        To the total number of child and their summaries
-        :return: int
-        """
-        k = self.root
-        while len(k.children) != 0:
-            if len(k.children) > 1:
-                return 1
-            if len(k.children) != 0 and len(k.timeStamps.totalSummaries) > 0:
-                return 1
-            for j in k.children:
-                v = k.children[j]
-                k = v
-        return -1
-
-    def generatePatterns(self, prefix):
-        """
-        Generating the patterns from the tree
-
-        :param prefix: empty list to form the combinations
-        :return: returning the periodic-frequent patterns from the tree
-        """
-        global _pfList
-        for i in sorted(self.summaries, key=lambda x: (self.info.get(x)[0], -x)):
-            pattern = prefix[:]
-            pattern.append(_pfList[i])
-            yield pattern, self.info[i]
-            patterns, timeStamps, info = self.getConditionalPatterns(i)
-            conditionalTree = _Tree()
-            conditionalTree.info = info.copy()
-            for pat in range(len(patterns)):
-                conditionalTree.addConditionalPatterns(patterns[pat], timeStamps[pat])
-            find = conditionalTree.check()
-            if find == 1:
-                del patterns, timeStamps, info
-                for cp in conditionalTree.generatePatterns(pattern):
-                    yield cp
-            else:
-                if len(conditionalTree.info) != 0:
-                    j = []
-                    for r in timeStamps:
-                        j += r
-                    inf = getPeriodAndSupport(j)
-                    patterns[0].reverse()
-                    upp = []
-                    for jm in patterns[0]:
-                        upp.append(_pfList[jm])
-                    allSubsets = _subLists(upp)
-                    # print(upp,inf)
-                    for pa in allSubsets:
-                        yield pattern + pa, inf
-                del patterns, timeStamps, info
-                del conditionalTree
-            self.removeNode(i)
-
-
-def _subLists(itemSet) -> List[List[int]]:
-    """
-    Forms all the subsets of given itemSet
-
-    :param itemSet: itemSet or a list of periodic-frequent items
-    :return: subsets of itemSet
-    """
-    subs = []
-    for i in range(1, len(itemSet) + 1):
-        temp = [list(x) for x in _combinations(itemSet, i)]
-        if len(temp) > 0:
-            subs.extend(temp)
-
-    return subs
-
-
-def getPeriodAndSupport(timeStamps) -> List[int]:
-    """
-    Calculates the period and support of list of timeStamps
-
-    :param timeStamps: timeStamps of a  pattern or item
-    :return: support and periodicity
-    """
-    cur = 0
-    per = 0
-    sup = 0
-    for j in range(len(timeStamps)):
-        per = max(per, timeStamps[j].start - cur)
-        per = max(per, timeStamps[j].per)
-        if per > _maxPer:
-            return [0, 0]
-        cur = timeStamps[j].end
-        sup += timeStamps[j].sup
-    per = max(per, _lno - cur)
-    return [sup, per]
-
-
-def conditionalTransactions(patterns, timestamp) -> Tuple[List[List[int]], List[List[_Interval]], Dict[int, Tuple[int, int]]]:
-    """
-    To sort and update the conditional transactions by removing the items which fails frequency
-    and periodicity conditions
-
-    :param patterns: conditional patterns of a node
-    :param timestamp: timeStamps of a conditional pattern
-    :return: conditional transactions with their respective timeStamps
-    """
-    global _minSup, _maxPer
-    pat = []
-    timeStamps = []
-    data1 = {}
-    for i in range(len(patterns)):
-        for j in patterns[i]:
-            if j in data1:
-                data1[j] = _merge(data1[j], timestamp[i])
-            else:
-                data1[j] = timestamp[i]
-
-    updatedDict = {}
-    for m in data1:
-        updatedDict[m] = getPeriodAndSupport(data1[m])
-    updatedDict = {k: v for k, v in updatedDict.items() if v[0] >= _minSup and v[1] <= _maxPer}
-    count = 0
-    for p in patterns:
-        p1 = [v for v in p if v in updatedDict]
-        trans = sorted(p1, key=lambda x: (updatedDict.get(x)[0], -x), reverse=True)
-        if len(trans) > 0:
-            pat.append(trans)
-            timeStamps.append(timestamp[count])
-        count += 1
-    return pat, timeStamps, updatedDict
+        return value[0] >= _minSup and value[1] <= _maxPer
 
 
 class PSGrowth(_ab._periodicFrequentPatterns):
@@ -813,7 +368,7 @@ class PSGrowth(_ab._periodicFrequentPatterns):
         :type sampleDict: dict
         :return: Returns the root node of the tree
         """
-        rootNode = _Tree()
+        rootNode = _Tree(self._maxPer)
         rootNode.info = info.copy()
         k = 0
         for line in self._Database:
@@ -827,39 +382,40 @@ class PSGrowth(_ab._periodicFrequentPatterns):
                 basket = list2[1:]
                 basket.sort()
                 list2[1:] = basket[0:]
-                rootNode.addTransaction(list2[1:], list2[0])
+                rootNode.addTransaction(list2[1:], [(list2[0], list2[0], 0, 1)])
         return rootNode
 
-    @deprecated("It is recommended to use mine() instead of mine() for mining process")
+    def _exactValues(self, patterns, items) -> Generator[Tuple[List[int], List[int]], None, None]:
+        """
+        The interval summaries of the tree bound the period of a pattern by the periods of their overlapping intervals,
+        so that the support and periodicity of the patterns found are computed again from the transactions containing
+        them
+
+        :param patterns: the patterns found, each with its support and periodicity bound
+        :param items: the one length periodic-frequent items
+        :return: every pattern with its support and periodicity
+        """
+        timeStamps = _ab._np.array([int(tr[0]) for tr in self._Database])
+        tids = {}
+        for tid, tr in enumerate(self._Database):
+            for item in tr[1:]:
+                if item in items:
+                    tids.setdefault(self._rank[item], []).append(tid)
+        tids = {item: _ab._np.unique(tidList) for item, tidList in tids.items()}
+        for pattern, value in patterns:
+            rows = tids[pattern[0]]
+            for item in pattern[1:]:
+                rows = _ab._np.intersect1d(rows, tids[item], assume_unique=True)
+            gaps = _ab._np.diff(timeStamps[rows], prepend=0, append=self._lno)
+            yield pattern, [len(rows), int(gaps.max())]
+
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
     def startMine(self) -> None:
         """
         Mining process will start from this function
         :return: None
         """
-        global _minSup, _maxPer, _lno, _pfList
-        self._startTime = _ab._time.time()
-        if self._iFile is None:
-            raise Exception("Please enter the file path or file name:")
-        if self._minSup is None:
-            raise Exception("Please enter the Minimum Support")
-        self._creatingItemSets()
-        OneLengthPeriodicItems, _pfList = self._OneLengthItems()
-        info = {self._rank[k]: v for k, v in OneLengthPeriodicItems.items()}
-        Tree = self._buildTree(info, OneLengthPeriodicItems)
-        patterns = Tree.generatePatterns([])
-        self._finalPatterns = {}
-        for i in patterns:
-            sample = str()
-            for k in i[0]:
-                sample = sample + k + "\t"
-            self._finalPatterns[sample] = i[1]
-        self._endTime = _ab._time.time()
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Periodic-Frequent patterns were generated successfully using PS-Growth algorithm ")
+        self.mine()
 
     def mine(self) -> None:
         """
@@ -878,11 +434,11 @@ class PSGrowth(_ab._periodicFrequentPatterns):
         Tree = self._buildTree(info, OneLengthPeriodicItems)
         patterns = Tree.generatePatterns([])
         self._finalPatterns = {}
-        for i in patterns:
+        for pattern, value in self._exactValues(patterns, OneLengthPeriodicItems):
             sample = str()
-            for k in i[0]:
-                sample = sample + k + "\t"
-            self._finalPatterns[sample] = i[1]
+            for k in pattern:
+                sample = sample + _pfList[k] + "\t"
+            self._finalPatterns[sample] = value
         self._endTime = _ab._time.time()
         self._memoryUSS = float()
         self._memoryRSS = float()
@@ -58,6 +58,7 @@ import pandas as pd
 from deprecated import deprecated
 
 from PAMI.periodicFrequentPattern.closed import abstract as _ab
+from PAMI.frequentPattern.closed import closedIndex as _closedIndex
 
 class CPFPMiner(_ab._periodicFrequentPatterns):
     """
@@ -196,11 +197,10 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
     _memoryUSS = float()
     _memoryRSS = float()
     _transaction = []
-    _hashing = {}
+    _index = None
     _mapSupport = {}
     _itemSetCount = 0
     _maxItemId = 0
-    _tableSize = 10000
     _tidList = {}
     _lno = 0
 
@@ -300,38 +300,6 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         periodicFrequentItems = [key for key, value in sorted(periodicFrequentItems.items(), key=lambda x: x[1])]
         return periodicFrequentItems
 
-    def _calculate(self, tidSet):
-        """
-        To calculate the weight if pattern based on the respective timeStamps
-
-        :param tidSet: timeStamps of the pattern
-        :return: the calculated weight of the timeStamps
-        """
-        hashcode = 0
-        for i in tidSet:
-            hashcode += i
-        if hashcode < 0:
-            hashcode = abs(0 - hashcode)
-        return hashcode % self._tableSize
-
-    def _contains(self, itemSet, val, hashcode):
-        """
-        To check if the key(hashcode) is in dictionary(hashing) variable
-
-        :param itemSet: generated periodic-frequent itemSet
-        :param val: support and periodicity of itemSet
-        :param hashcode: the key generated in calculate() method for every itemSet
-
-        :return: true if itemSet with same support present in dictionary(hashing) or else returns false
-        """
-        if self._hashing.get(hashcode) is None:
-            return False
-        for i in self._hashing[hashcode]:
-            itemSetX = i
-            if val[0] == self._hashing[hashcode][itemSetX][0] and set(itemSetX).issuperset(itemSet):
-                return True
-        return False
-
     def _getPeriodAndSupport(self, timeStamps):
         """
         Calculates the periodicity and support of timeStamps
@@ -374,17 +342,12 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         prefix.sort()
         val = self._getPeriodAndSupport(tidSetX)
         if val[0] >= self._minSup and val[1] <= self._maxPer:
-            hashcode = self._calculate(tidSetX)
-            if self._contains(prefix, val, hashcode) is False:
+            if self._index.insert(prefix, tidSetX, val[0]):
                 self._itemSetCount += 1
                 sample = str()
                 for i in prefix:
                     sample = sample + i + " "
                 self._finalPatterns[sample] = val
-            if hashcode not in self._hashing:
-                self._hashing[hashcode] = {tuple(prefix): val}
-            else:
-                self._hashing[hashcode][tuple(prefix)] = val
 
     def _processEquivalenceClass(self, prefix, itemSets, tidSets):
         """
@@ -455,49 +418,7 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         """
         Mining process will start from here
         """
-        self._startTime = _ab._time.time()
-        self._finalPatterns = {}
-        self._hashing = {}
-        periodicFrequentItems = self._scanDatabase()
-        for i in range(len(periodicFrequentItems)):
-            itemX = periodicFrequentItems[i]
-            if itemX is None:
-                continue
-            tidSetX = self._tidList[itemX]
-            itemSetX = [itemX]
-            itemSets = []
-            tidSets = []
-            for j in range(i + 1, len(periodicFrequentItems)):
-                itemJ = periodicFrequentItems[j]
-                if itemJ is None:
-                    continue
-                tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetX).intersection(tidSetJ))
-                if len(y1) < self._minSup:
-                    continue
-                if len(tidSetX) == len(tidSetJ) and len(y1) is len(tidSetX):
-                    periodicFrequentItems.insert(j, None)
-                    itemSetX.append(itemJ)
-                elif len(tidSetX) < len(tidSetJ) and len(y1) is len(tidSetX):
-                    itemSetX.append(itemJ)
-                elif len(tidSetX) > len(tidSetJ) and len(y1) is len(tidSetJ):
-                    periodicFrequentItems.insert(j, None)
-                    itemSets.append(itemJ)
-                    tidSets.append(y1)
-                else:
-
-                    itemSets.append(itemJ)
-                    tidSets.append(y1)
-            if len(itemSets) > 0:
-                self._processEquivalenceClass(itemSetX, itemSets, tidSets)
-            self._save([], itemSetX, tidSetX)
-        self._endTime = _ab._time.time()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Closed periodic frequent patterns were generated successfully using CPFPMiner algorithm ")
+        self.mine()
 
     def mine(self):
         """
@@ -505,7 +426,7 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         """
         self._startTime = _ab._time.time()
         self._finalPatterns = {}
-        self._hashing = {}
+        self._index = _closedIndex.ClosedIndex()
         periodicFrequentItems = self._scanDatabase()
         for i in range(len(periodicFrequentItems)):
             itemX = periodicFrequentItems[i]
@@ -51,6 +51,7 @@ __copyright__ = """
 
 
 from PAMI.periodicFrequentPattern.maximal import abstract as _ab
+from PAMI.frequentPattern.maximal import maximalIndex as _maximalIndex
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
@@ -132,7 +133,6 @@ class _Tree(object):
         self.root = _Node(None, {})
         self.summaries = {}
         self.info = {}
-        #self.maximalTree = _MPTree()
 
     def addTransaction(self, transaction: List[Any], tid: List[int]) -> None:
         """
@@ -221,120 +221,17 @@ class _Tree(object):
             for k in info:
                 tail.append(k)
             sub = head + tail
-            if maximalTree.checkerSub(sub) == 1:
+            if not maximalTree.hasSuperset(sub):
                 for pat in range(len(condPattern)):
                     conditionalTree.addTransaction(condPattern[pat], timeStamps[pat])
                 if len(condPattern) >= 1:
-                    conditionalTree.generatePatterns(pattern, patterns, maximalTree)
+                    conditionalTree.generatePatterns(pattern, patterns, maximalTree.conditionalIndex([i]))
                 else:
-                    maximalTree.addTransaction(pattern)
-                    patterns[tuple(pattern)] = self.info[i]
+                    maximalTree.add(pattern)
+                    patterns[tuple(sorted(pattern))] = self.info[i]
             self.removeNode(i)
 
 
-class _MNode(object):
-    """
-    A class used to represent the node of frequentPatternTree
-
-    :Attributes:
-
-        item : int
-            storing item of a node
-        children : list
-            To maintain the children of node
-
-    :Methods:
-
-        addChild(itemName)
-            storing the children to their respective parent nodes
-    """
-    def __init__(self, item: Any, children: Dict[Any, Any]) -> None:
-        self.item = item
-        self.children = children
-
-    def addChild(self, node: Any) -> None:
-        """
-        To add the children details to parent node children variable
-
-        :param node: children node
-        :return: adding children node to parent node
-        """
-        self.children[node.item] = node
-        node.parent = self
-
-
-class _MPTree(object):
-    """
-    A class used to represent the node of frequentPatternTree
-
-    :Attributes:
-
-        root : node
-            the root of a tree
-        summaries : dict
-            to store the items with same name into dictionary
-
-    :Methods:
-
-        addTransaction(itemSet)
-            the generated periodic-frequent pattern is added into maximal-tree
-        checkerSub(itemSet)
-            to check of subset of itemSet is present in tree
-    """
-    def __init__(self) -> None:
-        self.root = _MNode(None, {})
-        self.summaries = {}
-
-    def addTransaction(self, transaction: List[Any]) -> None:
-        """
-        to add the transaction in maximal tree
-
-        :param transaction: resultant periodic frequent pattern
-        :return: maximal tree
-        """
-        currentNode = self.root
-        transaction.sort()
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = _MNode(transaction[i], {})
-                currentNode.addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].insert(0, newNode)
-                else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
-            else:
-                currentNode = currentNode.children[transaction[i]]
-
-    def checkerSub(self, items: List[Any]) -> int:
-        """
-        To check subset present of items in the maximal tree
-
-        :param items: the pattern to check for subsets
-        :return: 1
-        """
-        items.sort(reverse=True)
-        item = items[0]
-        if item not in self.summaries:
-            return 1
-        else:
-            if len(items) == 1:
-                return 0
-        for t in self.summaries[item]:
-            cur = t.parent
-            i = 1
-            while cur.item is not None:
-                if items[i] == cur.item:
-                    i += 1
-                    if i == len(items):
-                        return 0
-                cur = cur.parent
-        return 1
-
-
-#maximalTree = _MPTree()
-
-
 def _getPeriodAndSupport(timeStamps: List[int]) -> List[Union[int, float]]:
     """
     To calculate the periodicity and support of a pattern with their respective timeStamps
@@ -709,7 +606,7 @@ class MaxPFGrowth(_ab._periodicFrequentPatterns):
         _info = {self._rank[k]: v for k, v in _generatedItems.items()}
         _Tree = self._buildTree(_updatedDatabases, _info)
         self._finalPatterns = {}
-        self._maximalTree = _MPTree()
+        self._maximalTree = _maximalIndex.MaximalIndex()
         _Tree.generatePatterns([], self._patterns, self._maximalTree)
         for x, y in self._patterns.items():
             pattern = str()
@@ -751,7 +648,7 @@ class MaxPFGrowth(_ab._periodicFrequentPatterns):
         _info = {self._rank[k]: v for k, v in _generatedItems.items()}
         _Tree = self._buildTree(_updatedDatabases, _info)
         self._finalPatterns = {}
-        self._maximalTree = _MPTree()
+        self._maximalTree = _maximalIndex.MaximalIndex()
         _Tree.generatePatterns([], self._patterns, self._maximalTree)
         for x, y in self._patterns.items():
             pattern = str()
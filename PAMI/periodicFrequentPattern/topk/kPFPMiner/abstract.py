@@ -23,6 +23,8 @@ from itertools import combinations as _c
 import os as _os
 import os.path as _ospath
 import psutil as _psutil
+import heapq as _heapq
+import numpy as _np
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
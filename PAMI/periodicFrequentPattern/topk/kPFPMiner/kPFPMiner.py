@@ -115,10 +115,10 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
             Scans the dataset or dataframes and stores in list format
         frequentOneItem()
             Generates one frequent patterns
-        eclatGeneration(candidateList)
-            It will generate the combinations of frequent items
-        generateFrequentPatterns(tidList)
-            It will generate the combinations of frequent items from a list of items
+        getPer_Sup(tids)
+            Calculates the periodicity of a pattern from its timestamps
+        bestFirstSearch(plist)
+            Discovers the top-k patterns in increasing order of periodicity using a priority queue
 
     **Executing the code on terminal:**
     ------------------------------------------
@@ -182,7 +182,7 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
     _memoryRSS = float()
     _Database = []
     _tidList = {}
-    lno = int()
+    _lastTs = int()
     _maximum = int()
 
     def _creatingItemSets(self):
@@ -221,29 +221,31 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
                     quit()
                     
     def getPer_Sup(self, tids):
-        tids.sort()
-        cur=0
-        per=list()
-        sup=0
-        #print(tids)
-        for i in range(len(tids)-1):
-            j = i + 1
-            #if tids[j] - cur <= periodicity:
-                #return [0,0]
-            per.append(tids[j] - cur)
-            cur = tids[j]
-        per.append(self.lno - cur)
-        return max(per)
+        """
+        Calculates the periodicity of a pattern, i.e. the largest gap between the start of the database, its sorted
+        timestamps and the last timestamp of the database
+
+        :param tids: sorted timestamps of the pattern
+        :type tids: numpy.ndarray or list
+        :return: periodicity of the pattern
+        :rtype: int
+        """
+        tids = _ab._np.asarray(tids)
+        if len(tids) == 0:
+            return self._lastTs
+        return int(max(tids[0], _ab._np.diff(tids).max(initial=0), self._lastTs - tids[-1]))
 
     def _frequentOneItem(self):
         """
         Generating one frequent patterns
+
+        :return: items sorted by increasing periodicity and decreasing support
+        :rtype: list
         """
         self._mapSupport = {}
         self._tidList = {}
         n = 0
         for line in self._Database:
-            self.lno += 1
             n = int(line[0])
             for i in range(1, len(line)):
                 si = line[i]
@@ -255,88 +257,72 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
                     self._mapSupport[si][1] = max(self._mapSupport[si][1], abs(n - self._mapSupport[si][2]))
                     self._mapSupport[si][2] = n
                     self._tidList[si].append(n)
+        self._lastTs = n
         for x, y in self._mapSupport.items():
             self._mapSupport[x][1] = max(self._mapSupport[x][1], abs(n - self._mapSupport[x][2]))
-        plist = [key for key, value in sorted(self._mapSupport.items(), key=lambda x: x[1], reverse=True)]
-        for i in plist:
-            if len(self._finalPatterns) >= self._k:
-                break
-            else:
-                self._finalPatterns[i] = self._mapSupport[i][1]
-        self._maximum = max([self._finalPatterns[i] for i in self._finalPatterns.keys()])
-        plist = list(self._finalPatterns.keys())
+            self._tidList[x] = _ab._np.array(self._tidList[x])
+        plist = sorted(self._mapSupport, key=lambda x: (self._mapSupport[x][1], -self._mapSupport[x][0], x))
         return plist
 
-
-    def _save(self, prefix, suffix, tidSetI):
-        """Saves the patterns that satisfy the periodic frequent property.
-
-        :param prefix: the prefix of a pattern
-        :type prefix: list
-        :param suffix: the suffix of a patterns
-        :type suffix: list
-        :param tidSetI: the timestamp of a patterns
-        :type tidSetI: list
+    def _push(self, queue, bounds, pattern, last, tids, per):
+        """
+        Pushes a candidate into the queue and raises the periodicity threshold once k candidates are known
+
+        :param queue: candidates ordered by periodicity, support and insertion order
+        :type queue: list
+        :param bounds: negated periodicities of the k best candidates pushed so far
+        :type bounds: list
+        :param pattern: items of the candidate
+        :type pattern: list
+        :param last: index of the last item of the candidate in the item order
+        :type last: int
+        :param tids: timestamps of the candidate
+        :type tids: numpy.ndarray
+        :param per: periodicity of the candidate
+        :type per: int
         """
+        if per > self._maximum:
+            return
+        self._sequence += 1
+        _ab._heapq.heappush(queue, (per, -len(tids), self._sequence, pattern, last, tids))
+        if len(bounds) < self._k:
+            _ab._heapq.heappush(bounds, -per)
+        elif per < -bounds[0]:
+            _ab._heapq.heapreplace(bounds, -per)
+        if len(bounds) == self._k:
+            self._maximum = -bounds[0]
+
+    def _bestFirstSearch(self, plist):
+        """
+        Discovers the top-k patterns in increasing order of periodicity.
 
-        if prefix is None:
-            prefix = suffix
-        else:
-            prefix = prefix + suffix
-        val = self.getPer_Sup(tidSetI)
-        sample = str()
-        for i in prefix:
-            sample = sample + i + " "
-        if len(self._finalPatterns) < self._k:
-            if val < self._maximum:
-                self._finalPatterns[sample] = val
-                self._finalPatterns = {k: v for k, v in sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                self._maximum = max([i for i in self._finalPatterns.values()])
-        else:
-            for x, y in sorted(self._finalPatterns.items(), key=lambda x: x[1], reverse=True):
-                if val < y:
-                    del self._finalPatterns[x]
-                    self._finalPatterns[sample] = val
-                    self._finalPatterns = {k: v for k, v in
-                                              sorted(self._finalPatterns.items(), key=lambda item: item[1],
-                                                     reverse=True)}
-                    self._maximum = max([i for i in self._finalPatterns.values()])
-                    return
-
-    def _Generation(self, prefix, itemSets, tidSets):
-        """Equivalence class is followed  and checks for the patterns generated for periodic-frequent patterns.
-
-        :param prefix:  main equivalence prefix
-        :type prefix: periodic-frequent item or pattern
-        :param itemSets: patterns which are items combined with prefix and satisfying the periodicity and frequent with their timestamps
-        :type itemSets: list
-        :param tidSets: timestamps of the items in the argument itemSets
-        :type tidSets: list
+        The periodicity of a pattern is never smaller than the periodicity of its subsets, so the candidate with the
+        smallest periodicity in the queue is always a top-k pattern. Every popped pattern is extended only with the
+        items that follow its last item, and an extension is skipped without intersecting the timestamps when the
+        periodicity of the pattern or of the item is already above the k-th periodicity found so far.
 
+        :param plist: items sorted by increasing periodicity
+        :type plist: list
         """
-        if len(itemSets) == 1:
-            i = itemSets[0]
-            tidI = tidSets[0]
-            self._save(prefix, [i], tidI)
-            return
-        for i in range(len(itemSets)):
-            itemI = itemSets[i]
-            if itemI is None:
-                continue
-            tidSetI = tidSets[i]
-            classItemSets = []
-            classTidSets = []
-            itemSetX = [itemI]
-            for j in range(i + 1, len(itemSets)):
-                itemJ = itemSets[j]
-                tidSetJ = tidSets[j]
-                y = list(set(tidSetI).intersection(tidSetJ))
-                if self.getPer_Sup(y) <= self._maximum:
-                    classItemSets.append(itemJ)
-                    classTidSets.append(y)
-            newPrefix = list(set(itemSetX)) + prefix
-            self._Generation(newPrefix, classItemSets, classTidSets)
-            self._save(prefix, list(set(itemSetX)), tidSetI)
+        queue = []
+        bounds = []
+        self._maximum = float('inf')
+        self._sequence = 0
+        for index, item in enumerate(plist):
+            self._push(queue, bounds, [item], index, self._tidList[item], self._mapSupport[item][1])
+        while queue and len(self._finalPatterns) < self._k:
+            per, _, _, pattern, last, tids = _ab._heapq.heappop(queue)
+            if len(pattern) == 1:
+                self._finalPatterns[pattern[0]] = per
+            else:
+                self._finalPatterns[" ".join(pattern) + " "] = per
+            for j in range(last + 1, len(plist)):
+                itemJ = plist[j]
+                if max(per, self._mapSupport[itemJ][1]) > self._maximum:
+                    break
+                y = _ab._np.intersect1d(tids, self._tidList[itemJ], assume_unique=True)
+                if len(y) > 0:
+                    self._push(queue, bounds, pattern + [itemJ], j, y, self.getPer_Sup(y))
 
     def _convert(self, value):
         """
@@ -357,40 +343,13 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
                 value = int(value)
         return value
 
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self):
         """
         Main function of the program
 
         """
-        self._startTime = _ab._time.time()
-        if self._iFile is None:
-            raise Exception("Please enter the file path or file name:")
-        if self._k is None:
-            raise Exception("Please enter the Minimum Support")
-        self._creatingItemSets()
-        self._k = self._convert(self._k)
-        plist = self._frequentOneItem()
-        for i in range(len(plist)):
-            itemI = plist[i]
-            tidSetI = self._tidList[itemI]
-            itemSetX = [itemI]
-            itemSets = []
-            tidSets = []
-            for j in range(i + 1, len(plist)):
-                itemJ = plist[j]
-                tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetI).intersection(tidSetJ))
-                if self.getPer_Sup(y1) <= self._maximum:
-                    itemSets.append(itemJ)
-                    tidSets.append(y1)
-            self._Generation(itemSetX, itemSets, tidSets)
-        print("kPFPMiner has successfully generated top-k frequent patterns")
-        self._endTime = _ab._time.time()
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
+        self.mine()
 
     def mine(self):
         """
@@ -403,22 +362,10 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
         if self._k is None:
             raise Exception("Please enter the Minimum Support")
         self._creatingItemSets()
-        self._k = self._convert(self._k)
+        self._k = int(self._convert(self._k))
+        self._finalPatterns = {}
         plist = self._frequentOneItem()
-        for i in range(len(plist)):
-            itemI = plist[i]
-            tidSetI = self._tidList[itemI]
-            itemSetX = [itemI]
-            itemSets = []
-            tidSets = []
-            for j in range(i + 1, len(plist)):
-                itemJ = plist[j]
-                tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetI).intersection(tidSetJ))
-                if self.getPer_Sup(y1) <= self._maximum:
-                    itemSets.append(itemJ)
-                    tidSets.append(y1)
-            self._Generation(itemSetX, itemSets, tidSets)
+        self._bestFirstSearch(plist)
         print("kPFPMiner has successfully generated top-k frequent patterns")
         self._endTime = _ab._time.time()
         self._memoryUSS = float()
@@ -426,6 +373,7 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
+
     def getMemoryUSS(self):
         """Total amount of USS memory consumed by the mining process will be retrieved from this function
 
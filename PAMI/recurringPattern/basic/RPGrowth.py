@@ -51,6 +51,7 @@ __copyright__ = """
 """
 
 from PAMI.recurringPattern.basic import abstract as _ab
+from PAMI.frequentPattern.basic import conditionalTree as _ct
 import pandas as pd
 from deprecated import deprecated
 from PAMI.recurringPattern.basic import abstract as _ab
@@ -61,171 +62,28 @@ _minRec = float()
 _lno = int()
 
 
-class _Node(object):
+class _Tree(_ct.ConditionalTree):
     """
-        A class used to represent the node of frequentPatternTree
+        A class used to represent the recurring pattern tree. Nodes store their timestamps and the pattern-growth
+        search is provided by the shared conditional tree runtime.
 
         :Attributes:
 
-            item : int or None
-                Storing item of a node
-            timeStamps : list
-                To maintain the timestamps of a database at the end of the branch
-            parent : node
-                To maintain the parent of every node
-            children : list
-                To maintain the children of a node
-
-        :Methods:
-
-            addChild(itemName)
-                Storing the children to their respective parent nodes
-        """
-
-    def __init__(self, item, children):
-        """ Initializing the Node class
-
-        :param item: Storing the item of a node
-        :type item: int or None
-        :param children: To maintain the children of a node
-        :type children: dict
-        """
-
-        self.item = item
-        self.children = children
-        self.parent = None
-        self.timeStamps = []
-
-    def addChild(self, node):
-        """
-        To add the children to a node
-
-        :param node: parent node in the tree
-        """
-
-        self.children[node.item] = node
-        node.parent = self
-
-
-class _Tree(object):
-    """
-        A class used to represent the frequentPatternGrowth tree structure
-
-        :Attributes:
-
-            root : Node
-                Represents the root node of the tree
-            summaries : dictionary
-                Storing the nodes with same item name
             info : dictionary
-                Stores the support of the items
+                Stores the recurring intervals and the support of the items
 
         :Methods:
 
-            addTransactions(Database)
-                Creating transaction as a branch in Recurring PatternTree
-            getConditionalPatterns(Node)
-                Generates the conditional patterns from tree for specific node
-            conditionalTransaction(prefixPaths,Support)
-                Takes the prefixPath of a node and support at child of the path and extract the frequent patterns from
-                prefixPaths and generates prefixPaths with items which are frequent
-            remove(Node)
-                Removes the node from tree once after generating all the patterns respective to the node
-            generatePatterns(Node)
-                Starts from the root node of the tree and mines the periodic-frequent patterns
-
-        """
-
-    def __init__(self):
-        self.root = _Node(None, {})
-        self.summaries = {}
-        self.info = {}
-
-    def addTransaction(self, transaction, tid):
-        """
-        Adding a transaction into tree
-
-        :param transaction: To represent the complete database
-        :type transaction: list
-        :param tid: To represent the timestamp of a database
-        :type tid: list
-        :return: rp-tree
+            getSupportAndPeriod(timeStamps)
+                Calculates the recurring intervals, periodic support and support of a list of timestamps
+            measure(timeStamps, pattern)
+                Recurring intervals and support of a pattern
+            isPromising(value)
+                Checks the periodic support of the recurring intervals
+            isPattern(value)
+                Checks the recurrence of a pattern
         """
 
-        currentNode = self.root
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = _Node(transaction[i], {})
-                currentNode.addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].append(newNode)
-                else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
-            else:
-                currentNode = currentNode.children[transaction[i]]
-        currentNode.timeStamps = currentNode.timeStamps + tid
-
-    def getConditionalPatterns(self, alpha):
-        """
-        Generates all the conditional patterns of a respective node
-
-        :param alpha: To represent a Node in the tree
-        :type alpha: Node
-        :return: A tuple consisting of finalPatterns, conditional pattern base and information
-        """
-        finalPatterns = []
-        finalSets = []
-        for i in self.summaries[alpha]:
-            set1 = i.timeStamps
-            set2 = []
-            while i.parent.item is not None:
-                set2.append(i.parent.item)
-                i = i.parent
-            if len(set2) > 0:
-                set2.reverse()
-                finalPatterns.append(set2)
-                finalSets.append(set1)
-        finalPatterns, finalSets, info = self.conditionalDatabases(finalPatterns, finalSets)
-        return finalPatterns, finalSets, info
-
-    @staticmethod
-    def generateTimeStamps(node):
-        """
-        To get the timestamps of a node
-
-        :param node: A node in the tree
-        :return: Timestamps of a node
-        """
-
-        finalTimeStamps = node.timeStamps
-        return finalTimeStamps
-
-    def removeNode(self, nodeValue):
-        """
-        Removing the node from tree
-
-        :param nodeValue: To represent a node in the tree
-        :type nodeValue: node
-        :return: Tree with their nodes updated with timestamps
-        """
-
-        for i in self.summaries[nodeValue]:
-            i.parent.timeStamps = i.parent.timeStamps + i.timeStamps
-            del i.parent.children[nodeValue]
-
-    def getTimeStamps(self, alpha):
-        """
-        To get all the timestamps of the nodes which share same item name
-
-        :param alpha: Node in a tree
-        :return: Timestamps of a  node
-        """
-        temporary = []
-        for i in self.summaries[alpha]:
-            temporary += i.timeStamps
-        return temporary
-
     @staticmethod
     def getSupportAndPeriod(timeStamps):
         """
@@ -264,65 +122,33 @@ class _Tree(object):
         # print(recli)
         return [recli, ps, len(timeStamps)]
 
-    def conditionalDatabases(self, conditionalPatterns, conditionalTimeStamps):
+    def measure(self, timeStamps, pattern):
         """
-        It generates the conditional patterns with periodic-frequent items
+        To calculate the recurring intervals and support of a pattern
 
-        :param conditionalPatterns: conditionalPatterns generated from conditionPattern method of a respective node
-        :type conditionalPatterns: list
-        :param conditionalTimeStamps: Represents the timestamps of a conditional patterns of a node
-        :type conditionalTimeStamps: list
-        :returns: Returns conditional transactions by removing non recurring items
+        :param timeStamps: Timestamps of the pattern
+        :param pattern: the pattern being measured
+        :return: recurring intervals, support
         """
+        value = self.getSupportAndPeriod(timeStamps)
+        return [value[0], value[2]]
 
-        global _maxPer, _minPS, _minRec
-        pat = []
-        timeStamps = []
-        data1 = {}
-        for i in range(len(conditionalPatterns)):
-            for j in conditionalPatterns[i]:
-                if j in data1:
-                    data1[j] = data1[j] + conditionalTimeStamps[i]
-                else:
-                    data1[j] = conditionalTimeStamps[i]
-        updatedDictionary = {}
-        for m in data1:
-            updatedDictionary[m] = self.getSupportAndPeriod(data1[m])
-        # print(updatedDictionary)
-        updatedDictionary = {k: [v[0],v[2]] for k, v in updatedDictionary.items() if v[1] >= (_minPS*_minRec)}
-        count = 0
-        for p in conditionalPatterns:
-            p1 = [v for v in p if v in updatedDictionary]
-            trans = sorted(p1, key=lambda x: (updatedDictionary.get(x)[1], -x), reverse=True)
-            if len(trans) > 0:
-                pat.append(trans)
-                timeStamps.append(conditionalTimeStamps[count])
-            count += 1
-        return pat, timeStamps, updatedDictionary
-
-    def generatePatterns(self, prefix):
-        """
-        Generates the patterns
-
-        :param prefix: Forms the combination of items
-        :type prefix: list
-        :returns: yields patterns with their recurrence and support
-        """
-        global _minRec
-        for i in sorted(self.summaries, key=lambda x: (self.info.get(x)[1], -x)):
-            pattern = prefix[:]
-            pattern.append(i)
-            if len(self.info.get(i)[0]) >= _minRec:
-                yield pattern, self.info[i]
-            patterns, timeStamps, info = self.getConditionalPatterns(i)
-            conditionalTree = _Tree()
-            conditionalTree.info = info.copy()
-            for pat in range(len(patterns)):
-                conditionalTree.addTransaction(patterns[pat], timeStamps[pat])
-            if len(patterns) > 0:
-                for q in conditionalTree.generatePatterns(pattern):
-                    yield q
-            self.removeNode(i)
+    def isPromising(self, value):
+        """
+        :param value: recurring intervals and support of an item
+        :return: True if the periodic support of the recurring intervals is at least minPS * minRec
+        """
+        return sum(interval[2] for interval in value[0]) >= (_minPS * _minRec)
+
+    def isPattern(self, value):
+        """
+        :param value: recurring intervals and support of a pattern
+        :return: True if the pattern is recurring
+        """
+        return len(value[0]) >= _minRec
+
+    def support(self, value):
+        return value[1]
 
 
 class RPGrowth(_ab._recurringPatterns):
@@ -373,6 +373,8 @@ class RHUIM(_ab._utilityPatterns):
                Total amount of runtime taken by the mining process will be retrieved from this function
         backTrackingRHUIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
                A method to mine the RHUIs Recursively
+        exploreItem(transactionsOfP, itemsToKeep, idx, e, prefixLength, utilitySumP)
+               A method to mine the RHUIs of the subtree of one item of the prefix
         useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep)
                A method to calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
@@ -480,6 +482,12 @@ class RHUIM(_ab._utilityPatterns):
         self._startTime = _ab._time.time()
         self._dataset = _Dataset(self._iFile, self._sep)
         self._finalPatterns = {}
+        self._candidateCount = 0
+        self._patternCount = 0
+        self._utilityBinArrayLU = {}
+        self._utilityBinArraySU = {}
+        self._oldNamesToNewNames = {}
+        self._newNamesToOldNames = {}
         self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(self._dataset)
         _minUtil = int(self._minUtil)
         _minUR = float(self._minUR)
@@ -540,75 +548,98 @@ class RHUIM(_ab._utilityPatterns):
         """
         self._candidateCount += len(itemsToExplore)
         for idx, e in enumerate(itemsToExplore):
-            transactionsPe = []
-            utilityPe = 0
-            utilitySumPe = utilitySumP + self._singleItemSetsUtilities[e]
-            previousTransaction = transactionsOfP[0]
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == transactionsOfP[0]:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities,
-                                                                   previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                            consecutiveMergeCount += 1
+            self._exploreItem(transactionsOfP, itemsToKeep, idx, e, prefixLength, utilitySumP)
+
+    def _exploreItem(self, transactionsOfP: list, itemsToKeep: list, idx: int, e: int, prefixLength: int,
+                     utilitySumP: int) -> None:
+        """
+        A method to mine the RHUIs of the subtree of P U {e}
+
+        :Attributes:
+
+        :param transactionsOfP: the list of transactions containing the current prefix P
+        :type transactionsOfP: list
+        :param itemsToKeep: the list of secondary items in the p-projected database
+        :type itemsToKeep: list
+        :param idx: position of e in the list of primary items
+        :type idx: int
+        :param e: the item appended to P
+        :type e: int
+        :param prefixLength: current prefixLength
+        :type prefixLength: int
+        :param utilitySumP: a variable to hold sum of utilities of all items in P
+        :type utilitySumP int
+        :return: None
+        """
+        transactionsPe = []
+        utilityPe = 0
+        utilitySumPe = utilitySumP + self._singleItemSetsUtilities[e]
+        previousTransaction = transactionsOfP[0]
+        consecutiveMergeCount = 0
+        for transaction in transactionsOfP:
+            items = transaction.getItems()
+            if e in items:
+                positionE = items.index(e)
+                if transaction.getLastPosition() == positionE:
+                    utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
+                else:
+                    projectedTransaction = transaction.projectTransaction(positionE)
+                    utilityPe += projectedTransaction.prefixUtility
+                    if previousTransaction == transactionsOfP[0]:
+                        previousTransaction = projectedTransaction
+                    elif self._isEqual(projectedTransaction, previousTransaction):
+                        if consecutiveMergeCount == 0:
+                            items = previousTransaction.items[previousTransaction.offset:]
+                            utilities = previousTransaction.utilities[previousTransaction.offset:]
+                            itemsCount = len(items)
+                            positionPrevious = 0
+                            positionProjection = projectedTransaction.offset
+                            while positionPrevious < itemsCount:
+                                utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
+                                positionPrevious += 1
+                                positionProjection += 1
+                            previousTransaction.prefixUtility += projectedTransaction.prefixUtility
+                            sumUtilities = previousTransaction.prefixUtility
+                            previousTransaction = _Transaction(items, utilities,
+                                                               previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
+                            previousTransaction.prefixUtility = sumUtilities
                         else:
-                            transactionsPe.append(previousTransaction)
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != transactionsOfP[0]:
-                transactionsPe.append(previousTransaction)
-            self._temp[prefixLength] = self._newNamesToOldNames[e]
-            utility_ratio_pe = float(utilityPe / utilitySumPe)
-            if (utilityPe >= self._minUtil) and (utility_ratio_pe * 100 >= self._minUR):
-                self._output(prefixLength, utilityPe, utility_ratio_pe)
-            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep)
-            newItemsToKeep = []
-            newItemsToExplore = []
-            for l in range(idx + 1, len(itemsToKeep)):
-                itemK = itemsToKeep[l]
-                utility_sum_pek = utilitySumPe + self._singleItemSetsUtilities[itemK]
-                subtree_utility_ratio = float(self._utilityBinArraySU[itemK] / utility_sum_pek)
-                local_utility_ratio = float(self._utilityBinArrayLU[itemK] / utility_sum_pek)
-                if self._utilityBinArraySU[itemK] >= self._minUtil and subtree_utility_ratio * 100 >= self._minUR:
-                    newItemsToExplore.append(itemK)
-                    newItemsToKeep.append(itemK)
-                elif self._utilityBinArrayLU[itemK] >= self._minUtil and local_utility_ratio * 100 >= self._minUR:
-                    newItemsToKeep.append(itemK)
-            self._backTrackingRHUIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1, utilitySumPe)
+                            positionPrevious = 0
+                            positionProjected = projectedTransaction.offset
+                            itemsCount = len(previousTransaction.items)
+                            while positionPrevious < itemsCount:
+                                previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
+                                    positionProjected]
+                                positionPrevious += 1
+                                positionProjected += 1
+                            previousTransaction.transactionUtility += projectedTransaction.transactionUtility
+                            previousTransaction.prefixUtility += projectedTransaction.prefixUtility
+                        consecutiveMergeCount += 1
+                    else:
+                        transactionsPe.append(previousTransaction)
+                        previousTransaction = projectedTransaction
+                        consecutiveMergeCount = 0
+                transaction.offset = positionE
+        if previousTransaction != transactionsOfP[0]:
+            transactionsPe.append(previousTransaction)
+        self._temp[prefixLength] = self._newNamesToOldNames[e]
+        utility_ratio_pe = float(utilityPe / utilitySumPe)
+        if (utilityPe >= self._minUtil) and (utility_ratio_pe * 100 >= self._minUR):
+            self._output(prefixLength, utilityPe, utility_ratio_pe)
+        self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep)
+        newItemsToKeep = []
+        newItemsToExplore = []
+        for l in range(idx + 1, len(itemsToKeep)):
+            itemK = itemsToKeep[l]
+            utility_sum_pek = utilitySumPe + self._singleItemSetsUtilities[itemK]
+            subtree_utility_ratio = float(self._utilityBinArraySU[itemK] / utility_sum_pek)
+            local_utility_ratio = float(self._utilityBinArrayLU[itemK] / utility_sum_pek)
+            if self._utilityBinArraySU[itemK] >= self._minUtil and subtree_utility_ratio * 100 >= self._minUR:
+                newItemsToExplore.append(itemK)
+                newItemsToKeep.append(itemK)
+            elif self._utilityBinArrayLU[itemK] >= self._minUtil and local_utility_ratio * 100 >= self._minUR:
+                newItemsToKeep.append(itemK)
+        self._backTrackingRHUIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1, utilitySumPe)
 
     def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: list, j: int, itemsToKeep: list) -> None:
         """
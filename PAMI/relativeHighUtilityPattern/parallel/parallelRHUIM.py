@@ -1,18 +1,18 @@
-#  parallelRHUIM is one of the fastest algorithm to mine High Utility ItemSets from transactional databases.
+#  parallelRHUIM mines Relative High Utility itemSets from transactional databases using several processes.
 #
 #    **Importing this algorithm into a python program**
 #    --------------------------------------------------------
 #
 #
-#             from PAMI.periodicFrequentPattern.parallel import parallelRHUIM as alg
+#             from PAMI.relativeHighUtilityPattern.parallel import parallelRHUIM as alg
 #
-#             obj = alg.parallelRHUIM(iFile, minUtil, ratio, '\t')
+#             obj = alg.parallelRHUIM(iFile, minUtil, minUR, '\t', threads=4)
 #
 #             obj.mine()
 #
-#             periodicFrequentPatterns = obj.getPatterns()
+#             relativeHighUtilityPatterns = obj.getPatterns()
 #
-#             print("Total number of Periodic Frequent Patterns:", len(periodicFrequentPatterns))
+#             print("Total number of Relative High Utility Patterns:", len(relativeHighUtilityPatterns))
 #
 #             obj.save(oFile)
 #
@@ -52,494 +52,174 @@ __copyright__ = """
 
 """
 
-import os
-import mmap
-import time
-import psutil
-from joblib import Parallel, delayed
+import multiprocessing
 
 from PAMI.relativeHighUtilityPattern.basic import abstract as _ab
+from PAMI.relativeHighUtilityPattern.basic import RHUIM as _RHUIM
 
-from PAMI.relativeHighUtilitytPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+_worker = {}
 
-class efimParallel(_ab._utilityPatterns):
-    """
-    :Description:   EFIM is one of the fastest algorithm to mine High Utility ItemSets from transactional databases.
-    
-    :Reference:   Zida, S., Fournier-Viger, P., Lin, J.CW. et al. EFIM: a fast and memory efficient algorithm for
-                  high-utility itemset mining. Knowl Inf Syst 51, 595–625 (2017). https://doi.org/10.1007/s10115-016-0986-0
-
-    :param  iFile: str :
-                   Name of the Input file to mine complete set of Relative High Utility patterns
-    :param  oFile: str :
-                   Name of the output file to store complete set of Relative High Utility patterns
-    :param  sep: str :
-                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
-    :param  minUtil: int :
-                   The minimum utility threshold.
-
-    
-    :Attributes:
-
-        inputFile (str): The input file path.
-        minUtil (int): The minimum utility threshold.
-        sep (str): The separator used in the input file.
-        threads (int): The number of threads to use.
-        Patterns (dict): A dictionary containing the discovered patterns.
-        rename (dict): A dictionary containing the mapping between the item IDs and their names.
-        runtime (float): The runtime of the algorithm in seconds.
-        memoryRSS (int): The Resident Set Size (RSS) memory usage of the algorithm in bytes.
-        memoryUSS (int): The Unique Set Size (USS) memory usage of the algorithm in bytes.
-
-    :Methods:
-
-        read_file(): Read the input file and return the filtered transactions, primary items, and secondary items.
-        binarySearch(arr, item): Perform a binary search on the given array to find the given item.
-        project(beta, file_data, secondary): Project the given beta itemset on the given database.
-        search(collections): Search for high utility itemsets in the given collections.
-        mine(): Start the EFIM algorithm.
-        savePatterns(outputFile): Save the patterns discovered by the algorithm to an output file.
-        getPatterns(): Get the patterns discovered by the algorithm.
-        getRuntime(): Get the runtime of the algorithm.
-        getMemoryRSS(): Get the Resident Set Size (RSS) memory usage of the algorithm.
-        getMemoryUSS(): Get the Unique Set Size (USS) memory usage of the algorithm.
-        printResults(): Print the results of the algorithm.
 
+def _attachWorker(miner, transactions, itemsToKeep, itemsToExplore):
     """
+    Initializes a worker process: keeps the sorted database and the upper bounds computed by the main process for all
+    the tasks. With the fork start method they are inherited without being copied.
 
-    def __init__(self, iFile, minUtil, ratio, sep="\t", threads=1):
-        super().__init__(iFile, minUtil, sep)
-        self.inputFile = iFile
-        self.minUtil = minUtil
-        self.sep = sep
-        self.Patterns = {}
-        self.rename = {}
-        self.threads = threads
-        self.ratio = ratio
-
-    # Read input file
-    def _read_file(self):
-        """
-        Read the input file and return the filtered transactions, primary items, and secondary items.
-
-        :return:
-            filtered_transactions (dict): A dictionary containing the filtered transactions.
-            primary (set): A set containing the primary items.
-            secondary (set): A set containing the secondary items.
-        
-        """
-
-
-        file_data = []
-        twu = {}
-
-        with open(self.inputFile, 'r') as f:
-            fd = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
-
-            for line in iter(fd.readline, b""):
-                line = line.decode('utf-8').strip().split(":")
-                
-                # Parse and process the line
-                line = [x.split(self.sep) for x in line]
-                weight = int(line[1][0])
-
-                # Update file data with the parsed items
-                file_data.append([line[0], [int(x) for x in line[2]]])
-
-                for k in line[0]:
-                    if k not in twu:
-                        twu[k] = weight
-                    else:
-                        twu[k] += weight
-
-        # Filter TWU dictionary based on minUtil (minimum utility threshold)
-        twu = {k: v for k, v in twu.items() if v >= self.minUtil}
-
-        # Sort TWU items by utility
-        twu = {k: v for k, v in sorted(twu.items(), key=lambda item: item[1], reverse=True)}
-
-        strToInt = {}
-        t = len(twu)
-        for k in twu.keys():
-            strToInt[k] = t
-            self.rename[t] = k
-            t -= 1
-
-        secondary = set(self.rename.keys())
-
-        # Filter and sort transactions
-        subtree = {}
-        filtered_transactions = {}
-        for col in file_data:
-            zipped = zip(col[0], col[1])
-            transaction = [(strToInt[x], y) for x, y in zipped if x in strToInt]
-            transaction = sorted(transaction, key=lambda x: x[0])
-            if len(transaction) > 0:
-                val = [x[1] for x in transaction]
-                key = [x[0] for x in transaction]
-                
-                fs = frozenset(key)
-
-                if fs not in filtered_transactions:
-                    filtered_transactions[fs] = [key, val, 0]
-                else:
-                    filtered_transactions[fs][1] = [x + y for x, y in zip(filtered_transactions[fs][1], val)]
-
-                subUtil = sum([x[1] for x in transaction])
-                temp = 0
-
-                for i in range(len(transaction)):
-                    item = key[i]
-                    if item not in subtree:
-                        subtree[item] = subUtil - temp
-                    else:
-                        subtree[item] += subUtil - temp
-                    temp += val[i]
-
-        primary = [key for key in subtree.keys() if subtree[key] >= self.minUtil]
-
-        return filtered_transactions, primary, secondary
-    
-
-    def _binarySearch(self, arr, item):
-        """
-        Do a binary search on the given array to find the given item.
-
-        :Attributes:
-
-            arr (list): The array to search in.
-            item (int): The item to search for.
-
-        :return:
-
-            mid (int): The index of the item if found, -1 otherwise.
-        """
-
-        low = 0
-        high = len(arr) - 1
-        mid = 0
-
-        while low <= high:
-            mid = (high + low) // 2
-            if arr[mid] < item:
-                low = mid + 1
-            elif arr[mid] > item:
-                high = mid - 1
-            else:
-                return mid
-
-        return -1
-
-    def _project(self, beta, file_data, secondary):
-        """
-        Project the given beta itemset on the given database.
-
-        :Attributes:
-
-            beta (list): The beta itemset to project.
-            file_data (dict): The database to project on.
-            secondary (set): The set of secondary items.
-
-        :return:
-
-            projected_db (dict): The projected database.
-            local_utils (dict): The local utilities of the projected database.
-            subtree_utils (dict): The subtree utilities of the projected database.
-            utility (int): The utility of the projected database.
-
-        """
-
-
-        projected_db = {}
-        local_utils = {}
-        subtree_utils = {}
-        utility = 0     
-
-        added = set()
-
-        item = beta[-1]
-
-        temp = [v for k, v in file_data.items() if item in k]
-        start = time.time()
-
-        for v in temp:
-            index = self._binarySearch(v[0], item)
-
-            curr = v[1][index] + v[2]
-            utility += curr
-
-            newKey = []
-            newVal = []
-
-            for i in range(index+1, len(v[0])):
-                if v[0][i] in secondary:
-                    newKey.append(v[0][i])
-                    newVal.append(v[1][i])
-
-            if len(newKey) == 0:
-                continue
-
-            s = sum(newVal)
-            temp = 0
-
-            for i in range(len(newKey)):
-                if newKey[i] in added:
-                    local_utils[newKey[i]] += s + curr
-                    subtree_utils[newKey[i]] += s + curr - temp
-                else:
-                    local_utils[newKey[i]] = s + curr
-                    subtree_utils[newKey[i]] = s + curr - temp
-                    added.add(newKey[i])
-                
-                temp += newVal[i]
-            
-            fs = frozenset(newKey)
-
-            if fs not in projected_db:
-                projected_db[fs] = [newKey, newVal, curr]
-            else:
-                projected_db[fs][1] = [x + y for x, y in zip(projected_db[fs][1], newVal)]
-                projected_db[fs][2] += curr
+    :param miner: The miner holding the item names and the utility-bin arrays of the first level
 
-        nprimary = [key for key in subtree_utils.keys() if subtree_utils[key] >= self.minUtil]
-        nsecondary = set([key for key in local_utils.keys() if local_utils[key] >= self.minUtil])
+    :type miner: parallelRHUIM
 
-        return beta, projected_db, nsecondary, nprimary, utility
-    
+    :param transactions: The sorted transactions of the database
 
-    def _search(self, collections):
+    :type transactions: list
 
-        """
-        Search for frequent patterns in the given collections.
-
-        :Attributes:
-
-            collections (list): The collections to search in.
-        """
-
-        self.allStore = {}
-
-        if (self.threads > 1):
-            print("Im with the lads")
-            with Parallel(n_jobs=self.threads) as parallel:
-                a = 0
-                while len(collections) > 0:
-                    new_collections = []
-
-                    # print("Num of tasks:", sum(len(collections[i][2]) for i in range(len(collections))))
-                    results = parallel(delayed(self._project)(collections[i][0] + [collections[i][2][j]], collections[i][1], collections[i][3]) for i in range(len(collections)) for j in range(len(collections[i][2])))
-
-                    for i in range(len(results)):
-                        beta, projected_db, secondary, primary, utility = results[i]
-                        pattern = "\t".join([self.rename[x] for x in beta])
-                        if len(beta) == 1:
-                          self.allStore["\t".join([self.rename[x] for x in beta])] = utility
-                        if utility >= self.minUtil:
-                            if len(beta) == 1:
-                              self.Patterns[pattern] = [utility, 1.0]
-                            else:
-                              allutil = 0
-                              for x in beta:
-                                allutil += self.allStore[self.rename[x]]
-                              ratio = utility / allutil
-                              if ratio >= self.ratio:
-                                self.Patterns[pattern] = [utility, ratio]
-
-                        if len(primary) > 0:
-                            new_collections.append([beta, projected_db, primary, secondary])
-                    collections = new_collections
-
-        else:
-            # print("solo-ing")
-            a = 0
-            while len(collections) > 0:
-                new_collections = []
-                for i in range(len(collections)):
-                    for j in range(len(collections[i][2])):
-                        beta, projected_db, secondary, primary, utility = self._project(collections[i][0] + [collections[i][2][j]], collections[i][1], collections[i][3])
-                        if len(beta) == 1:
-                          self.allStore["\t".join([self.rename[x] for x in beta])] = utility
-                        pattern = "\t".join([self.rename[x] for x in beta])
-                        
-                        if utility >= self.minUtil:
-                            if len(beta) == 1:
-                              # self.Patterns[tuple(beta)] = utility
-                              self.Patterns[pattern] = [utility, 1.0]
-                            else:
-                              allutil = 0
-                              for x in beta:
-                                allutil += self.allStore[self.rename[x]]
-                              ratio = utility / allutil
-                              if ratio >= self.ratio:
-                                self.Patterns[pattern] = [utility, ratio]
-                        if len(primary) > 0:
-                            new_collections.append([beta, projected_db, primary, secondary])
-
-                collections = new_collections
-
-
-    @deprecated("It is recommended to use mine() instead of mine() for mining process")
-    def startMine(self):
-        """
-        Start the EFIM algorithm.
-        :returns: None
-        """
-
-        ps = psutil.Process(os.getpid())
-
-        self.start = time.time()
-
-        fileData, primary, secondary = self._read_file()
-
-        collection = [[[], fileData, primary, secondary]]
-
-        self._search(collection)
+    :param itemsToKeep: The secondary items of the database
 
-        self.memoryRSS = ps.memory_info().rss
-        self.memoryUSS = ps.memory_full_info().uss
+    :type itemsToKeep: list
 
-        end = time.time()
-        self.runtime = end - self.start
+    :param itemsToExplore: The primary items of the database
 
-    def Mine(self):
-        """
-        Start the EFIM algorithm.
-        :returns: None
-        """
-
-        ps = psutil.Process(os.getpid())
-
-        self.start = time.time()
-
-        fileData, primary, secondary = self._read_file()
+    :type itemsToExplore: list
+    """
+    _worker['miner'] = miner
+    _worker['transactions'] = transactions
+    _worker['itemsToKeep'] = itemsToKeep
+    _worker['itemsToExplore'] = itemsToExplore
 
-        collection = [[[], fileData, primary, secondary]]
 
-        self._search(collection)
+def _mineTask(idx):
+    """
+    Searches the subtree of a first-level item in a worker process.
 
-        self.memoryRSS = ps.memory_info().rss
-        self.memoryUSS = ps.memory_full_info().uss
+    :param idx: Position of the item in the primary items
 
-        end = time.time()
-        self.runtime = end - self.start
+    :type idx: int
 
-    def save(self, outFile):
-        """
-        Complete set of frequent patterns will be loaded in to an output file
+    :return: The patterns of the subtree and the number of candidates explored
+    """
+    miner = _worker['miner']
+    miner._finalPatterns = {}
+    miner._candidateCount = 0
+    miner._exploreItem(_worker['transactions'], _worker['itemsToKeep'], idx, _worker['itemsToExplore'][idx], 0, 0)
+    return miner._finalPatterns, miner._candidateCount
 
-        :param outFile: name of the output file
-        :type outFile: csv file
-        """
-        self.oFile = outFile
-        writer = open(self.oFile, 'w+')
-        for x, y in self.Patterns.items():
-            patternsAndSupport = x.strip() + ":" + str(y)
-            writer.write("%s \n" % patternsAndSupport)
-    
-    def getPatternsAsDataFrame(self):
-        """
-        Storing final patterns in a dataframe
 
-        :return: returning patterns in a dataframe
-        :rtype: pd.DataFrame
-            """
-        dataFrame = {}
-        data = []
-        for a, b in self.Patterns.items():
-            data.append([a.replace('\t', ' '), b])
-            dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Utility'])
+class parallelRHUIM(_RHUIM.RHUIM):
+    """
+    :Description:   parallelRHUIM mines Relative High Utility itemSets with several worker processes. The database is
+                    scanned, renamed and sorted once, and the utility-bin arrays of the first level are computed once
+                    by the main process. The search tree is then split by its first item: every worker takes the
+                    subtree of the next item, searches it exactly like RHUIM does and sends its patterns back, where
+                    they are merged as soon as they arrive. The patterns are the same as the ones of RHUIM.
 
-        return dataFrame
+    :Reference:   R. U. Kiran, P. Pallikila, J. M. Luna, P. Fournier-Viger, M. Toyoda and P. K. Reddy,
+                 "Discovering Relative High Utility Itemsets in Very Large Transactional Databases Using Null-Invariant Measure,"
+                  2021 IEEE International Conference on Big Data (Big Data), Orlando, FL, USA, 2021, pp. 252-262,
+                  doi: 10.1109/BigData52589.2021.9672064.
 
-    def getPatterns(self):
-        """
-        Get the patterns discovered by the algorithm.
+    :param  iFile: str :
+                   Name of the Input file to mine complete set of Relative High Utility patterns
+    :param  minUtil: int :
+                   The minimum utility threshold.
+    :param  minUR: float :
+                   The minimum utility ratio, in percent.
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  threads: int :
+                   The number of worker processes. With one thread the search runs in the main process.
 
-        Returns:
-            dict: A dictionary containing the discovered patterns.
-        """
-        return self.Patterns
+    :Attributes:
 
-    def getRuntime(self):
-        """
-        Get the runtime of the algorithm.
+        threads : int
+            The number of worker processes
 
-        :return: float: The runtime in seconds.
-        """
-        return self.runtime
+    **Methods to execute code on terminal**
+    -------------------------------------------
+    .. code-block:: console
 
-    def getMemoryRSS(self):
-        """
-        Get the Resident Set Size (RSS) memory usage of the algorithm.
+      Format:
 
-        :return: int: The RSS memory usage in bytes.
-        """
-        return self.memoryRSS
+      (.venv) $ python3 parallelRHUIM.py <inputFile> <outputFile> <minUtil> <minUR> <sep> <threads>
 
-    def getMemoryUSS(self):
-        """
-        Get the Unique Set Size (USS) memory usage of the algorithm.
+      Example usage:
 
-        :return: int: The USS memory usage in bytes.
-        """
-        return self.memoryUSS
+      (.venv) $ python3 parallelRHUIM.py sampleTDB.txt output.txt 35 20 '\t' 4
 
+    **Importing this algorithm into a python program**
+    -----------------------------------------------------
+    .. code-block:: python
 
-    def printResults(self):
-        """
-        This function is used to print the results
-        """
-        print("Total number of High Utility Patterns:", len(self.getPatterns()))
-        print("Total Memory in USS:", self.getMemoryUSS())
-        print("Total Memory in RSS", self.getMemoryRSS())
-        print("Total ExecutionTime in seconds:", self.getRuntime())
+            from PAMI.relativeHighUtilityPattern.parallel import parallelRHUIM as alg
 
+            obj=alg.parallelRHUIM("input.txt", 35, 20, threads=4)
 
-if __name__ == "__main__":
+            obj.mine()
 
-    # inputFile = 'EFIM/accidents_utility_spmf.txt'
-    # minUtil = 28000000
+            relativeHighUtilityPatterns = obj.getPatterns()
 
-    # # inputFile = 'EFIM/chainstore.txt'
-    # # minUtil = 2500000
+            print("Total number of Relative High Utility Patterns:", len(relativeHighUtilityPatterns))
 
-    # # inputFile = 'test.txt'
-    # # minUtil = 5
+            obj.save(oFile)
 
-    # # inputFile = "EFIM/BMS_utility_spmf.txt"
-    # # minUtil = 2025000
+            run = obj.getRuntime()
 
-    # # inputFile = "EFIM/Utility_pumsb.csv"
-    # # minUtil = 7500000
+            print("Total ExecutionTime in seconds:", run)
 
-    # sep = " "
-    # f = efimParallel(inputFile, minUtil, sep, 1)
-    # f.mine()
-    # print("# of patterns: " + str(len(f.getPatterns())))
-    # print("Time taken: " + str(f.getRuntime()))
-    # f.savePatterns("mine.txt")
+    **Credits:**
+    -----------------
+             The sequential search is the one of RHUIM, written by Pradeep Pallikila under the supervision of Professor Rage Uday Kiran.
 
+    """
 
+    def __init__(self, iFile: str, minUtil: int, minUR: float, sep: str = "\t", threads: int = 1) -> None:
+        super().__init__(iFile, minUtil, minUR, sep)
+        self.threads = int(threads)
+
+    def _backTrackingRHUIM(self, transactionsOfP: list, itemsToKeep: list, itemsToExplore: list, prefixLength: int,
+                           utilitySumP: int) -> None:
+        """
+        A method to mine the RHUIs. The subtrees of the first-level items are handed to the worker processes, and the
+        deeper levels are searched recursively by the worker which owns the subtree.
+
+        :param transactionsOfP: the list of transactions containing the current prefix P
+        :type transactionsOfP: list
+        :param itemsToKeep: the list of secondary items in the p-projected database
+        :type itemsToKeep: list
+        :param itemsToExplore: the list of primary items in the p-projected database
+        :type itemsToExplore: list
+        :param prefixLength: current prefixLength
+        :type prefixLength: int
+        :param utilitySumP: a variable to hold sum of utilities of all items in P
+        :type utilitySumP int
+        :return: None
+        """
+        if prefixLength > 0 or self.threads <= 1 or len(itemsToExplore) == 0:
+            super()._backTrackingRHUIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, utilitySumP)
+            return
+        self._candidateCount += len(itemsToExplore)
+        with multiprocessing.Pool(self.threads, initializer=_attachWorker,
+                                  initargs=(self, transactionsOfP, itemsToKeep, itemsToExplore)) as pool:
+            for patterns, candidateCount in pool.imap_unordered(_mineTask, range(len(itemsToExplore)), chunksize=1):
+                self._finalPatterns.update(patterns)
+                self._candidateCount += candidateCount
+        self._patternCount = len(self._finalPatterns)
+
+
+if __name__ == '__main__':
     _ap = str()
-    if len(_ab._sys.argv) == 4 or len(_ab._sys.argv) == 5:
-        if len(_ab._sys.argv) == 5:    #includes separator
-            _ap = efimParallel(_ab._sys.argv[1], int(_ab._sys.argv[3]), _ab._sys.argv[4])
-        if len(_ab._sys.argv) == 4:    #takes "\t" as a separator
-            _ap = efimParallel(_ab._sys.argv[1], int(_ab._sys.argv[3]))
+    if 5 <= len(_ab._sys.argv) <= 7:
+        if len(_ab._sys.argv) == 7:
+            _ap = parallelRHUIM(_ab._sys.argv[1], int(_ab._sys.argv[3]), float(_ab._sys.argv[4]), _ab._sys.argv[5],
+                                int(_ab._sys.argv[6]))
+        if len(_ab._sys.argv) == 6:
+            _ap = parallelRHUIM(_ab._sys.argv[1], int(_ab._sys.argv[3]), float(_ab._sys.argv[4]), _ab._sys.argv[5])
+        if len(_ab._sys.argv) == 5:
+            _ap = parallelRHUIM(_ab._sys.argv[1], int(_ab._sys.argv[3]), float(_ab._sys.argv[4]))
         _ap.mine()
-        print("Total number of High Utility Patterns:", len(_ap.getPatterns()))
+        print("Total number of Relative High Utility Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
         print("Total Memory in USS:", _ap.getMemoryUSS())
-        print("Total Memory in RSS",  _ap.getMemoryRSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
         print("Total ExecutionTime in seconds:", _ap.getRuntime())
     else:
-        _ap = efimParallel('Utility_T10I4D100K.csv', 150000, 0.1, '\t', 10)
-        _ap.mine()
-        print("Total number of High Utility Patterns:", len(_ap.getPatterns()))
-        _ap.save('UPGrowth_output.txt')
-        print("Total Memory in USS:", _ap.getMemoryUSS())
-        print("Total Memory in RSS", _ap.getMemoryRSS())
-        print("Total ExecutionTime in ms:", _ap.getRuntime())
         print("Error! The number of input parameters do not match the total number of parameters provided")
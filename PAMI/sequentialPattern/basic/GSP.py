@@ -53,12 +53,12 @@ __copyright__ = """
      Copyright (C)  2021 Rage Uday Kiran
 
 """
-import collections
-import itertools
 import pandas as pd
 from deprecated import deprecated
 
 from PAMI.sequentialPattern.basic import abstract as _ab
+from PAMI.sequentialPattern.basic import gspEngine as _gspEngine
+from PAMI.sequentialPattern.basic import sequenceDatabase as _sequenceDatabase
 
 _ab._sys.setrecursionlimit(10000)
 
@@ -85,7 +85,7 @@ class GSP(_ab._sequentialPatterns):
     :Attributes:
 
             iFile : str
-                Input file name or path of the input file
+                Input file name or path of the input file, or a sequenceDatabase.SequenceDatabase
             oFile : str
                 Name of the output file or the path of output file
             minSup: float or int or str
@@ -108,10 +108,8 @@ class GSP(_ab._sequentialPatterns):
                 To store the total amount of RSS memory consumed by the program
             Database : list
                 To store the transactions of a database in list
-            _xLenDatabase: dict
-                To store the datas in different sequence separated by sequence, rownumber, length.
-            _xLenDatabaseSame : dict
-                To store the datas in same sequence separated by sequence, rownumber, length.
+            _names : list
+                the name of every item, by item id
             _seqSep   :str
                 separator to separate each itemset
 
@@ -131,10 +129,10 @@ class GSP(_ab._sequentialPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
             getRuntime()
                 Total amount of runtime taken by the mining process will be retrieved from this function
-            candidateToFrequent(candidateList)
-                Generates frequent patterns from the candidate patterns
-            frequentToCandidate(frequentList, length)
-                Generates candidate patterns from the frequent patterns
+            _itemSets()
+                To make the itemsets of every sequence of the database
+            _patternName(pattern)
+                To convert a pattern of item ids to the pattern of item names
 
     **Methods to execute code on terminal**
     -------------------------------------------
@@ -200,13 +198,19 @@ class GSP(_ab._sequentialPatterns):
     _memoryUSS = float()
     _memoryRSS = float()
     _Database = []
-    _xLenDatabase={}
-    _xLenDatabaseSame = {}
+    _names = []
     def _creatingItemSets(self):
         """
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
+        if isinstance(self._iFile, str) or _sequenceDatabase.isSequenceDatabase(self._iFile):
+            try:
+                self._Database = _sequenceDatabase.load(self._iFile, self._sep, self._sepSeq)
+            except IOError:
+                print("File Not Found")
+                quit()
+            return
 
         if isinstance(self._iFile, _ab._pd.DataFrame):
             temp = []
@@ -227,38 +231,6 @@ class GSP(_ab._sequentialPatterns):
                     addList=[]
                     addList.append(temp[k+1])
             self._Database.append(addList)
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    temp.pop()
-                    self._Database.append(temp)
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sepSeq)]
-                            temp = [x for x in temp if x ]
-
-                            seq = []
-                            for i in temp:
-                                k = -2
-                                if len(i)>1:
-                                    seq.append(list(sorted(set(i.split()))))
-
-                                else:
-                                    seq.append(i)
-
-                            self._Database.append(seq)
-
-                except IOError:
-                    print("File Not Found")
-                    quit()
 
     def _convert(self, value):
         """
@@ -280,198 +252,54 @@ class GSP(_ab._sequentialPatterns):
         return value
 
 
-    def make1LenDatabase(self):
-        """
-        To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database
+    def _itemSets(self):
         """
+        To make the itemsets of every sequence of the database, an itemset read as a single string is a single item
 
-
-        idDatabase=[]
-        for line in self._Database:
-            x=[]
-            for seq in line:
-                
-                x+=list(itertools.chain.from_iterable(line))
-            
-            idDatabase+=list(sorted(set(x)))
-
-
-        newDatabase=collections.Counter(idDatabase)
-        newDatabase={i:v for i,v in newDatabase.items() if v>=self._minSup}
-        self._finalPatterns={str(i):v for i,v in newDatabase.items()}
-        
-    def list_split(self,L):
+        :return: the sequences as lists of itemsets
+        :rtype: list
         """
-        To convert the list to list separated by sepSeq
+        return [[[itemSet] if isinstance(itemSet, str) else itemSet for itemSet in line] for line in self._Database]
 
-        :param L:list pattren in one list
-        :return:  return_L:list pattern separated by each sequence  
-        """
-        return_L,tmp = [],[]
-        for val in L:
-            if val != self._sepSeq:
-                tmp.append(val)
-            elif val == self._sepSeq:
-                return_L.append(tmp)
-                tmp = []
-    
-        return_L.append(tmp)
-        return return_L
-    
-    def checkPattern(self,pattern,tra):
-        """
-        To check the pattern is included in tra 
-        param pattern:the candidate pattern 
-              tra:list     one transaction in data
-        :return:  0 :the pattern is not included
-                  1 :the pattern is included
-        """
-        seqNum=0
-        
-        for i in tra:
-            if set(pattern[seqNum]).issubset(set(i)):
-                seqNum+=1
-                if seqNum>=len(pattern):
-                    return 1
-        return 0
-            
-            
-        
-    def getSup(self,pattern):
-        """
-        count up the support of the pattern
-        :param pattren:list the candidate pattern 
-        :return:  sup:int  the support of the pattern
-        """
-        sup=0
-        pattern=self.list_split(pattern)
-        for seq in self._Database:
-            
-            sup+=self.checkPattern(pattern,seq)
-        return sup
-        
-    def make2LenDatabase(self):
+    def _patternName(self, pattern):
         """
-        To make 2 length frequent patterns by joining two one length patterns by breadth-first search technique  and update xlen Database to sequential database
-        :return:  nextPatterns:List  the patterns found
-       
-        """
-        self._xLenDatabase = {}
-        keyList=[i for i in self._finalPatterns.keys()]
-        keyNumber=0
-        nextPatterns=[]
-        
-        for key1 in keyList:
-            newPattern1=[key1,self._sepSeq,key1]
-            sup=self.getSup(newPattern1)
-            if sup>=self._minSup:
-                self._finalPatterns[tuple(newPattern1)]=sup
-                nextPatterns.append(newPattern1)
-            keyNumber+=1
-            for key2 in keyList[keyNumber:]:
-                newPattern1=[key1,self._sepSeq,key2]
-                sup=self.getSup(newPattern1)
-                if sup>=self._minSup:
-                    self._finalPatterns[tuple(newPattern1)]=sup
-                    nextPatterns.append(newPattern1)
-                newPattern2=[key2,self._sepSeq,key1]
-                sup=self.getSup(newPattern2)
-                if sup>=self._minSup:
-                    self._finalPatterns[tuple(newPattern2)]=sup
-                    nextPatterns.append(newPattern2)
-                newPattern3=list(sorted(set([key1,key2])))
-                sup=self.getSup(newPattern3)
-                if sup>=self._minSup:
-                    self._finalPatterns[tuple(newPattern3)]=sup
-                    nextPatterns.append(newPattern3)
-        return nextPatterns
-
-    def makeCandidateDatabase(self,patterns):
-        """
-        make the database to find new candidate
-        :param pattrens:list the patterns fond before
-        :return:  bothBefore:dict   the patterns have same item without last one item
-                  bothAfter:dict   the patterns have same item without first one item
-        """
-        before={}
-        after={}
-        
-        for pattern in patterns:
-            if pattern[-2]==self._sepSeq:
-                if tuple(pattern[:-2]) not in after.keys():
-                    after[tuple(pattern[:-2])]=[pattern[-2:]]
-                else:
-                    after[tuple(pattern[:-2])].append(pattern[-2:])
-            else:
-                if tuple(pattern[:-1]) not in after.keys():
-                    after[tuple(pattern[:-1])]=[[pattern[-1]]]
-                else:
-                    after[tuple(pattern[:-1])].append([pattern[-1]])
-            if pattern[1]==self._sepSeq:
-                if tuple(pattern[2:]) not in before.keys():
-                    before[tuple(pattern[2:])]=[pattern[:2]]
-                else:
-                    before[tuple(pattern[2:])].append(pattern[:2])
-            else:
-                if tuple(pattern[1:]) not in before.keys():
-                    before[tuple(pattern[1:])]=[[pattern[0]]]
-                else:
-                    before[tuple(pattern[1:])].append([pattern[0]])
-        bothBefore={i:v for i,v in before.items() if i in after.keys()}
-        bothAfter={i:v for i,v in after.items() if i in before.keys()}
-        return bothBefore, bothAfter
-        
-    def makeCandidate(self,patterns):
-        """
-        make the candidate patterns
-        :param pattrens:list the patterns found before
-        :return:  newPatterns:list  the candidate pattern
-        """
-        before,after=self.makeCandidateDatabase(patterns)
-        newPatterns=[]
-        for common in before.keys():
-            for b in before[common]:
-                for a in after[common]:
-                    newPattern=b+list(common)+a
-                    newPatterns.append(newPattern)
-        return newPatterns
-                
-        
-            
-    
-    def makexLenDatabase(self,patterns):
+        To convert a pattern of item ids to the pattern of item names
+
+        :param pattern: the pattern as a tuple of itemsets of item ids
+        :return: the name of a single item, or the items of the pattern with the itemset separator between itemsets
+        :rtype: str or tuple
         """
-        To make 3 or more length frequent patterns from pattern which the latest word is in different seq  by depth-first search technique  and update xlenDatabase to sequential database
+        if len(pattern) == 1 and len(pattern[0]) == 1:
+            return str(self._names[pattern[0][0]])
+        row = []
+        for itemSet in pattern:
+            if row:
+                row.append(self._sepSeq)
+            row.extend(self._names[i] for i in itemSet)
+        return tuple(row)
 
-        :param rowLen: row length of previous patterns.
-        :param bs : previous patterns without the latest one
-        :param latestWord : latest word of previous patterns
-        
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
+    def startMine(self):
+        """
+        Frequent pattern mining process will start from here
         """
-        patterns=self.makeCandidate(patterns)
-        nextPatterns=[]
-        for pattern in patterns:
-                sup=self.getSup(pattern)
-                if sup>=self._minSup:
-                    self._finalPatterns[tuple(pattern)]=sup
-                    nextPatterns.append(pattern)
-        return nextPatterns
-                    
-        
-       
+        self.mine()
 
     def mine(self):
         """
         Frequent pattern mining process will start from here
         """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
-        self.make1LenDatabase()
-        nextPatterns=self.make2LenDatabase()
-        while(len(nextPatterns)>0):
-            nextPatterns= self.makexLenDatabase(nextPatterns)
+        if isinstance(self._Database, _sequenceDatabase.SequenceDatabase):
+            database, self._names = self._Database.sequences(), list(self._Database.names)
+        else:
+            database, self._names = _gspEngine.fromItemsets(self._itemSets())
+        for pattern, support in _gspEngine.mine(database, self._minSup):
+            self._finalPatterns[self._patternName(pattern)] = support
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -56,8 +56,10 @@ __copyright__ = """
 import pandas as pd
 from deprecated import deprecated
 
-from PAMI.sequentialPatternMining.basic import abstract as _ab
-import copy
+from PAMI.sequentialPattern.basic import abstract as _ab
+from PAMI.sequentialPattern.basic import parallelSearch as _parallelSearch
+from PAMI.sequentialPattern.basic import prefixSpanEngine as _prefixSpanEngine
+from PAMI.sequentialPattern.basic import sequenceDatabase as _sequenceDatabase
 import re
 _ab._sys.setrecursionlimit(10000)
 
@@ -79,11 +81,16 @@ class PrefixSpan(_ab._sequentialPatterns):
                     Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  sepSeq: str :
+                   The token ending an itemset in the input file, "-1" by default. A "-2" token ends a sequence, and files
+                   separating the itemsets with ":" are read with sepSeq=":".
+    :param  workers: int :
+                   The number of worker processes mining the first-item projections. With one worker the mining runs in the main process.
 
     :Attributes:
 
         iFile : str
-            Input file name or path of the input file
+            Input file name or path of the input file, or a sequenceDatabase.SequenceDatabase
         oFile : str
             Name of the output file or the path of output file
         minSup : float or int or str
@@ -106,6 +113,10 @@ class PrefixSpan(_ab._sequentialPatterns):
             To store the total amount of RSS memory consumed by the program
         Database : list
             To store the transactions of a database in list
+        _names : list
+            the name of every item, by item id
+        _workers : int
+            the number of worker processes
 
     :Methods:
 
@@ -191,12 +202,25 @@ class PrefixSpan(_ab._sequentialPatterns):
     _memoryUSS = float()
     _memoryRSS = float()
     _Database = []
-    _sepDatabase={}
+    _names = []
+    _workers = 1
+
+    def __init__(self, iFile, minSup, sep="\t", sepSeq="-1", workers=1):
+        super().__init__(iFile, minSup, sep, sepSeq)
+        self._workers = int(workers)
+
     def _creatingItemSets(self):
         """
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
+        if isinstance(self._iFile, str) or _sequenceDatabase.isSequenceDatabase(self._iFile):
+            try:
+                self._Database = _sequenceDatabase.load(self._iFile, self._sep, self._sepSeq)
+            except IOError:
+                print("File Not Found")
+                quit()
+            return
 
         if isinstance(self._iFile, _ab._pd.DataFrame):
             temp = []
@@ -208,39 +232,6 @@ class PrefixSpan(_ab._sequentialPatterns):
 
             for k in temp:
                 self._Database.append(set(k))
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._Database.append(set(temp))
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(':')]
-                            temp = [x for x in temp if x ]
-
-                            seq = []
-                            for i in temp:
-                                if len(i)>1:
-                                   for i in list(sorted(set(i.split()))):
-                                       seq.append(i)
-                                   seq.append(":")
-
-                                else:
-                                    seq.append(i)
-                                    seq.append(":")
-                            self._Database.append(seq)
-
-
-                except IOError:
-                    print("File Not Found")
-                    quit()
 
     def _convert(self, value):
         """
@@ -260,279 +251,71 @@ class PrefixSpan(_ab._sequentialPatterns):
             else:
                 value = int(value)
         return value
-    def makeNext(self,sepDatabase,startrow):
-        """
-        To get next pattern by adding head word to next sequence of startrow
 
-        :param sepDatabase: dict
-            what words and rows startrow have to add it.
-        :param startrow:
-            the patterns get before
+    def _itemSets(self):
         """
-        for head in sepDatabase.keys():
-            newrow=[i for i in startrow]
-
-            if len(sepDatabase[head])>=self._minSup:
-                if newrow!=[]:
-                    newrow.append(":")
-                newrow.append(head)
-                newrow.append(":")
-                if str(newrow) not in self._finalPatterns:
-                    self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    give = []
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                elif len(sepDatabase[head]) > self._finalPatterns[str(newrow)]:
-                    self._finalPatterns[str(newrow)] = len(sepDatabase[head])
-                    give = []
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-
-
-
-    def makeSupDatabase(self,database,head):
+        To split the transactions of the database into the lists of their itemsets
         """
-        To delete not frequent words without words in the latest sequence
+        for line in self._Database:
+            sequence = [[]]
+            for item in line:
+                if item == ":":
+                    sequence.append([])
+                else:
+                    sequence[-1].append(item)
+            yield [itemSet for itemSet in sequence if itemSet]
 
-        :param database: list
-            database of lines having same startrow and head word
-        :param head:list
-         words in the latest sequence
-        :return: changed database
+    def _patternName(self, pattern):
         """
+        To convert a pattern of item ids to the pattern of item names
 
-        supDatabase={}
-        alreadyInData=[]
-        newDatabase = []
-        for line in database:
-            alreadyInLine = []
-            for data in line:
-                    if data not in alreadyInLine:
-                        if data not in alreadyInData:
-                            supDatabase[data]=1
-                            alreadyInData.append(data)
-                        else:
-                            supDatabase[data]+=1
-                        alreadyInLine.append(data)
-        for line in database:
-                newLine=[]
-                for i in line:
-                    if supDatabase[i]>=self._minSup or i in head:
-                        if len(newLine)>1:
-                            if (newLine[-1]!=":" or i!=":"):
-                                newLine.append(i)
-                        else:
-                            newLine.append(i)
-                newDatabase.append(newLine)
-
-        return newDatabase
-
-    def makeNextSame(self,sepDatabase,startrow):
-        """
-         To get next pattern by adding head word to the latest sequence of startrow
-
-        :param sepDatabase: dict
-            what words and rows startrow have to add it
-        :param startrow:
-            the patterns get before
-        """
-        for head in sepDatabase.keys():
-
-            if len(sepDatabase[head])>=self._minSup:
-                newrow = startrow.copy()
-                newrow.append(head)
-                newrow.append(":")
-                if str(newrow) not in self._finalPatterns.keys():
-                    self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    if ":" in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                elif len(sepDatabase[head])>self._finalPatterns[str(newrow)]:
-                    self._finalPatterns[str(newrow)] = len(sepDatabase[head])
-                    if ":" in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-    def makeSeqDatabaseFirst(self,database):
+        :param pattern: the pattern as a tuple of itemsets of item ids
+        :return: the pattern as it is stored in the final patterns
+        :rtype: str
         """
-        To make 1 length sequence dataset list which start from same word. It was stored only 1 from 1 line.
+        row = []
+        for itemSet in pattern:
+            row.extend(self._names[i] for i in itemSet)
+            row.append(":")
+        return str(row)
 
-        :param database:
-            To store the transactions of a database in list
-        """
-        startrow=[]
-        seqDatabase={}
-
-        for line in database:
-            alreadyInLine=[]
-            for data in range(len(line)):
-                if line[data] not in alreadyInLine and line[data]!=":":
-                    if line[data] not in seqDatabase.keys():
-                        seqDatabase[line[data]]=[]
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-                    else:
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-
-        if len(seqDatabase)>0:
-            self.makeNext(seqDatabase,startrow)
-
-    def serchSame(self,database,startrow,give):
-        """
-        To get 2 or more length patterns in same sequence.
-
-        :param database: list
-            To store the transactions of a database in list which have same startrow and head word
-        :param startrow: list
-            the patterns get before
-        :param give: list
-            the word in the latest sequence of startrow
-        """
-        sepDatabaseSame={}
-        sepDatabaseSame[startrow[-1]]=[]
-        for line in database:
-            addLine=0
-            i=0
-            if len(line)>1:
-                while line[i]!=":":
-                    if line[i]==startrow[-1]:
-                        sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                        addLine=1
-                        break
-                    i+=1
-                if addLine!=1:
-                    ok=[]
-                    while i <len(line):
-                        if line[i]==":":
-                            ok=[]
-                        elif line[i]==startrow[-1]:
-                            ok.append("sk1")
-                        for x in give:
-                            if x==line[i]:
-                                ok.append(x)
-                        if len(ok)==1+len(give):
-                            sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                            break
-                        i+=1
-        startrow2=[startrow[0]]
-        startrow.append(":")
-        if str(startrow) not in self._finalPatterns.keys():
-                self.makeNextSame(sepDatabaseSame,startrow2)
-        elif self._finalPatterns[str(startrow)]<len(sepDatabaseSame[startrow[-2]]):
-            self.makeNextSame(sepDatabaseSame,startrow2)
-        return sepDatabaseSame[startrow[-2]]
-
-    def getSameSeq(self,startrow):
+    def _savePattern(self, pattern, support):
         """
-         To get words in the latest sequence
-        :param startrow: the patterns get before
+        To store a frequent pattern found by the search
 
+        :param pattern: the pattern as a tuple of itemsets of item ids
+        :param support: the support of the pattern
         """
-        give = []
-        newrow = startrow.copy()
-        while newrow[-1] != ":":
-            y = newrow.pop()
-            give.append(y)
-        return give
-
-    def makeSeqDatabaseSame(self,database,startrow):
-        """
-        To make sequence dataset list which start from same word(head). It was stored only 1 from 1 line.
-        And it separated by having head in the latest sequence of startrow or not.
-
-        :param database:
-                To store the transactions of a database in list
-        :param startrow: the patterns get before
-
-        """
-        seqDatabase={}
-        seqDatabaseSame={}
-        for line in database:
-            if len(line)>1:
-                alreadyInLine=[]
-                i = 0
-                while line[i] != ":":
-                        if line[i] not in seqDatabaseSame:
-                            if ":" in startrow:
-                                give=self.getSameSeq(startrow)
-                            else:
-                                give=startrow.copy()
-                            newrow= [startrow[-1], line[i]]
-                            seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                        i += 1
-                same=0
-                while len(line)>i:
-                    if line[i]!=":":
-                        if line[i] not in alreadyInLine:
-                            if line[i] not in seqDatabase:
-                                seqDatabase[line[i]]=[]
-                            seqDatabase[line[i]].append(line[i + 1:])
-                            alreadyInLine.append(line[i])
-                        if line[i]==startrow[-1]:
-                            same=1
-
-                        elif same==1 and line[i] not in seqDatabaseSame:
-                            if ":" in startrow:
-                                give=self.getSameSeq(startrow)
-                            else:
-                                give=startrow.copy()
-                            newrow= [startrow[-1], line[i]]
-                            seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                    else:
-                        same=0
-                    i+=1
-
-
-        if len(seqDatabase)!=0:
-            self.makeNext(seqDatabase,startrow)
-        if len(seqDatabaseSame)!=0:
-            self.makeNextSame(seqDatabaseSame,startrow)
-
+        self._finalPatterns[self._patternName(pattern)] = support
 
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
     def startMine(self):
         """
         Frequent pattern mining process will start from here
         """
-        self._Database = []
-        self._startTime = _ab._time.time()
-        self._creatingItemSets()
-        self._Database=self.makeSupDatabase(self._Database,"")
-        self._minSup = self._convert(self._minSup)
-        self.makeSeqDatabaseFirst(self._Database)
-        self._endTime = _ab._time.time()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Frequent patterns were generated successfully using prefixSpan algorithm ")
+        self.mine()
 
     def mine(self):
         """
         Frequent pattern mining process will start from here
         """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
-        self._Database=self.makeSupDatabase(self._Database,"")
         self._minSup = self._convert(self._minSup)
-        self.makeSeqDatabaseFirst(self._Database)
+        if isinstance(self._Database, _sequenceDatabase.SequenceDatabase):
+            sequences, positions, items = self._Database.occurrences()
+            self._names = list(self._Database.names)
+            store = _prefixSpanEngine.SequenceStore.fromOccurrences(sequences, positions, items, len(self._names),
+                                                                    len(self._Database))
+        else:
+            store, self._names = _prefixSpanEngine.fromItemsets(self._itemSets())
+        space = _prefixSpanEngine.ProjectionSpace(store, self._minSup)
+        roots = space.roots()
+        for pattern, positions in roots:
+            self._savePattern(pattern, space.store.support(positions))
+        _parallelSearch.search(space, roots, self._savePattern, self._workers)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
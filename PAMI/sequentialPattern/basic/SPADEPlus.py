@@ -59,6 +59,8 @@ import pandas as pd
 from deprecated import deprecated
 
 from PAMI.sequentialPattern.basic import abstract as _ab
+from PAMI.sequentialPattern.basic import sequenceDatabase as _sequenceDatabase
+from PAMI.sequentialPattern.basic import spadeEngine as _spadeEngine
 
 _ab._sys.setrecursionlimit(10000)
 
@@ -107,11 +109,13 @@ class SPADEPlus(_ab._sequentialPatterns):
             memoryRSS : float
                 To store the total amount of RSS memory consumed by the program
             Database : list
-                To store the transactions of a database in list
+                To store the transactions of a database in list, and then the id-list of every frequent item
+            _names : list
+                the name of every item, by item id
             _xLenDatabase: dict
-                To store the datas in different sequence separated by sequence, rownumber, length.
+                To store the id-lists of the patterns whose latest word is in a different itemset, by length, pattern prefix and latest word.
             _xLenDatabaseSame : dict
-                To store the datas in same sequence separated by sequence, rownumber, length.
+                To store the id-lists of the patterns whose latest word is in the same itemset, by length, pattern prefix and latest word.
             _seqSep   :str
                 separator to separate each itemset
             _maxLen:int
@@ -119,6 +123,9 @@ class SPADEPlus(_ab._sequentialPatterns):
             _maxGap   :int
                 to store the maximum gap of sequence pattern
                 gap means the length of interval between two itemsets
+                the support of a pattern counts the sequences where its consecutive itemsets are at most maxGap itemsets
+                apart. The classes are joined from their frequent members, so that a longer pattern whose subpatterns
+                are not frequent under the gap may be missed.
 
     :Methods:
 
@@ -205,6 +212,7 @@ class SPADEPlus(_ab._sequentialPatterns):
         self._memoryUSS = float()
         self._memoryRSS = float()
         self._Database = []
+        self._names = []
         self._sepDatabase={}
         self._maxLen=maxlen
         self._maxGap=maxGap
@@ -216,6 +224,13 @@ class SPADEPlus(_ab._sequentialPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
+        if isinstance(self._iFile, str) or _sequenceDatabase.isSequenceDatabase(self._iFile):
+            try:
+                self._Database = _sequenceDatabase.load(self._iFile, self._sep, self._sepSeq)
+            except IOError:
+                print("File Not Found")
+                quit()
+            return
 
         if isinstance(self._iFile, _ab._pd.DataFrame):
             temp = []
@@ -236,38 +251,6 @@ class SPADEPlus(_ab._sequentialPatterns):
                     addList=[]
                     addList.append(temp[k+1])
             self._Database.append(addList)
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    temp.pop()
-                    self._Database.append(temp)
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sepSeq)]
-                            temp = [x for x in temp if x ]
-
-                            seq = []
-                            for i in temp:
-                                k = -2
-                                if len(i)>1:
-                                    seq.append(list(sorted(set(i.split()))))
-
-                                else:
-                                    seq.append(i)
-
-                            self._Database.append(seq)
-
-                except IOError:
-                    print("File Not Found")
-                    quit()
 
     def _convert(self, value):
         """
@@ -291,126 +274,77 @@ class SPADEPlus(_ab._sequentialPatterns):
 
     def make1LenDatabase(self):
         """
-        To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database
-        """
-
-        idDatabase={}
-        alreadyInData=[]
-        lineNumber=0
-        alreadyInLine={}
-        for line in self._Database:
-            seqNumber=0
-            for seq in line:
-
-                for data in seq:
-                    if data in alreadyInData:
-                        if lineNumber in alreadyInLine[data]:
-                            idDatabase[data][lineNumber].append(seqNumber)
-                        else:
-                            idDatabase[data][lineNumber] = []
-                            idDatabase[data][lineNumber].append(seqNumber)
-                            alreadyInLine[data].append(lineNumber)
-                    else:
-                        idDatabase[data]={}
-                        idDatabase[data][lineNumber]=[]
-                        idDatabase[data][lineNumber].append(seqNumber)
-                        alreadyInData.append(data)
-                        alreadyInLine[data]=[]
-                        alreadyInLine[data].append(lineNumber)
-
-
-
-                seqNumber+=1
-            lineNumber+=1
-
-        newDatabase={i :idDatabase[i] for i in idDatabase.keys()}
-        for key in idDatabase.keys():
-            if len(idDatabase[key].keys())<self._minSup:
-                newDatabase.pop(key)
-            else:
-                self._finalPatterns[str(key)]=len(idDatabase[key].keys())
-        self._Database=newDatabase
-    def checkGap(self,time1,time2):
-        item=[]
-        nextList=time1
-        for i in time2:
-            
-            for k in nextList:
-                if i-k<=self._maxGap:
-                    if i-k>0:
-                        item.append(i)
-                        break
-                else:
-                    time1.remove(k)
-            nextList=time1
-                    
-        return item 
+        To make 1 length frequent patterns and the id-lists of the frequent items. The items are given integer ids in the
+        order of their names, so that the ids of an itemset sort like its items.
+        """
+        if isinstance(self._Database, _sequenceDatabase.SequenceDatabase):
+            sequences, positions, items = self._Database.occurrences()
+            self._names = list(self._Database.names)
+            appearance = self._Database.firstAppearance().tolist()
+        else:
+            ids = {}
+            sequences, positions, items = [], [], []
+            for lineNumber, line in enumerate(self._Database):
+                for seqNumber, seq in enumerate(line):
+                    for data in seq:
+                        sequences.append(lineNumber)
+                        positions.append(seqNumber)
+                        items.append(ids.setdefault(data, len(ids)))
+            self._names = sorted(ids)
+            rank = [0] * len(ids)
+            for i, name in enumerate(self._names):
+                rank[ids[name]] = i
+            items = [rank[i] for i in items]
+            appearance = [rank[i] for i in ids.values()]
+        idLists = _spadeEngine.idLists(sequences, positions, items, len(self._names))
+        self._Database = {}
+        for i in appearance:
+            if idLists[i].support >= self._minSup:
+                self._Database[i] = idLists[i]
+                self._finalPatterns[(i,)] = idLists[i].support
+
+    def _temporalJoin(self, before, latestWord):
+        """
+        To join an id-list with the id-list of an item, keeping the occurrences of the item which are at most maxGap
+        itemsets after an occurrence of the pattern. The item is joined with its own id-list rather than with the id-list
+        of a pattern of the same class, whose occurrences only follow the prefix of the class within maxGap.
+
+        :param before: id-list of the earlier pattern
+        :param latestWord: the later item
+        :return: id-list of the joined pattern
+        """
+        return _spadeEngine.temporalJoin(before, self._Database[latestWord], self._maxGap)
 
     def make2LenDatabase(self):
         """
         To make 2 length frequent patterns by joining two one length patterns by breadth-first search technique  and update xlen Database to sequential database
         """
         self._xLenDatabase = {}
-        keyList=[i for i in self._Database.keys()]
-        nextDatabase={i:{} for i in self._Database.keys()}
-        nextDatabaseSame={i:{} for i in self._Database.keys()}
-        keyNumber=-1
-        for key1 in keyList:
-            keyNumber+=1
+        self._xLenDatabaseSame = {}
+        keyList = [i for i in self._Database.keys()]
+        nextDatabase = {i: {} for i in self._Database.keys()}
+        nextDatabaseSame = {i: {} for i in self._Database.keys()}
+        for keyNumber, key1 in enumerate(keyList):
             for key2 in keyList[keyNumber:]:
-                if key1!=key2:
-
-
-                    if len(self._Database[key1].keys())>=len(self._Database[key1].keys()):
-                        nextDatabase[key1][key2] = {}
-                        nextDatabase[key2][key1] = {}
-                        nextDatabaseSame[key1][key2] = {}
-
-                        for seq in self._Database[key2].keys():
-                            if seq in self._Database[key1].keys():
-                                x=self.checkGap(self._Database[key2][seq],self._Database[key1][seq])
-                                if len(x) != 0:
-                                    nextDatabase[key2][key1][seq]=x
-                                x = self.checkGap(self._Database[key1][seq],self._Database[key2][seq])
-                                if len(x) != 0:
-                                    nextDatabase[key1][key2][seq]=x
-                                x=list(sorted(set(self._Database[key1][seq])&set(self._Database[key2][seq])))
-                                if len(x)!=0:
-                                    nextDatabaseSame[key1][key2][seq]=x
-                    else:
-                        nextDatabase[key1][key2] = {}
-                        nextDatabase[key2][key1] = {}
-                        nextDatabaseSame[key1][key2] = {}
-
-                        for seq in self._Database[key1].keys():
-                            x = self.checkGap(self._Database[key2][seq],self._Database[key1][seq])
-                            if len(x)!=0:
-                                nextDatabase[key2][key1][seq]=0
-                            x = self.checkGap(self._Database[key1][seq],self._Database[key2][seq])
-                            if len(x)!=0:
-                                nextDatabase[key1][key2][seq]=x
-                            x= list(
-                                sorted(set(self._Database[key1][seq]) & set(self._Database[key2][seq])))
-                            if len(x)!=0:
-                                nextDatabaseSame[key1][key2][seq]=x
+                if key1 != key2:
+                    nextDatabase[key1][key2] = self._temporalJoin(self._Database[key1], key2)
+                    nextDatabase[key2][key1] = self._temporalJoin(self._Database[key2], key1)
+                    nextDatabaseSame[key1][key2] = _spadeEngine.equalityJoin(self._Database[key1], self._Database[key2])
                 else:
-                    nextDatabase[key1][key2] = {}
-                    for seq in self._Database[key2].keys():
-                        if len(self._Database[key1][seq])>=2:
-                            nextDatabase[key1][key2][seq]= self.checkGap(self._Database[key1][seq],self._Database[key2][seq])
+                    nextDatabase[key1][key2] = self._temporalJoin(self._Database[key1], key2)
         self._xLenDatabase[2] = {tuple([i]): {} for i in nextDatabase.keys()}
         for key1 in nextDatabase.keys():
             for key2 in nextDatabase[key1].keys():
-                if len(nextDatabase[key1][key2].keys())>=self._minSup:
-                    self._finalPatterns[str((key1,self._sepSeq,key2,self._sepSeq))]=len(nextDatabase[key1][key2].keys())
-                    self._xLenDatabase[2][tuple([key1])][key2]=nextDatabase[key1][key2]
-        self._xLenDatabaseSame[2]={tuple([i]): {} for i in nextDatabaseSame.keys()}
+                if nextDatabase[key1][key2].support >= self._minSup:
+                    self._finalPatterns[(key1, self._sepSeq, key2, self._sepSeq)] = nextDatabase[key1][key2].support
+                    self._xLenDatabase[2][tuple([key1])][key2] = nextDatabase[key1][key2]
+        self._xLenDatabaseSame[2] = {tuple([i]): {} for i in nextDatabaseSame.keys()}
         for key1 in nextDatabaseSame.keys():
             for key2 in nextDatabaseSame[key1].keys():
-                if len(nextDatabaseSame[key1][key2].keys()) >= self._minSup:
-                    self._finalPatterns[str((key1,key2,self._sepSeq))]=len(nextDatabaseSame[key1][key2].keys())
-                    self._xLenDatabaseSame[2][tuple([key1])][key2]={i:nextDatabaseSame[key1][key2][i] for i in nextDatabaseSame[key1][key2].keys()}
-                    self._xLenDatabaseSame[2][tuple([key2])][key1] = {i: nextDatabaseSame[key1][key2][i] for i in nextDatabaseSame[key1][key2].keys()}
+                if nextDatabaseSame[key1][key2].support >= self._minSup:
+                    self._finalPatterns[(key1, key2, self._sepSeq)] = nextDatabaseSame[key1][key2].support
+                    self._xLenDatabaseSame[2][tuple([key1])][key2] = nextDatabaseSame[key1][key2]
+                    self._xLenDatabaseSame[2][tuple([key2])][key1] = nextDatabaseSame[key1][key2]
 
     def make3LenDatabase(self):
         """
@@ -423,162 +357,56 @@ class SPADEPlus(_ab._sequentialPatterns):
             for k in self._xLenDatabaseSame[2][i].keys():
                 self.makexLenDatabaseSame(2,i,k)
 
-    def makexLenDatabase(self, rowLen, bs, latestWord):
-            """
-            To make "rowLen" length frequent patterns from pattern which the latest word is in same seq  by joining "rowLen"self._sepSeq length patterns by depth-first search technique  and update xlenDatabase to sequential database
-
-            :param rowLen: row length of patterns.
-            :param bs : patterns without the latest one
-            :param latestWord : latest word of patterns
-            """
-            if rowLen+1 not in self._xLenDatabase:
-                self._xLenDatabase[rowLen+1]={}
-                self._xLenDatabaseSame[rowLen+1]={}
-            for latestWord2 in self._xLenDatabase[rowLen][bs].keys():
-                if latestWord != latestWord2:
-                    
-                    if len(self._xLenDatabase[rowLen][bs][latestWord].keys()) <= len(self._xLenDatabase[rowLen][bs][latestWord2].keys()):
-                        next={}
-                        next2={}
-                        nextSame={}
-
-                        for seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                            if seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                                if self._xLenDatabase[rowLen][bs][latestWord2][seq]!=[] and self._xLenDatabase[rowLen][bs][latestWord][seq]!=[]:
-                                    if rowLen<self._maxLen:
-                                        x = self.checkGap(self._xLenDatabase[rowLen][bs][latestWord][seq],self._xLenDatabase[rowLen][bs][latestWord2][seq])
-                                        if len(x) != 0:
-                                            next[seq] = x
-                                        x = self.checkGap(self._xLenDatabase[rowLen][bs][latestWord2][seq],self._xLenDatabase[rowLen][bs][latestWord][seq])
-                                        if len(x) != 0:
-                                            next2[seq] = x
-                                    x = list(sorted(set(self._xLenDatabase[rowLen][bs][latestWord][seq]) & set(
-                                        self._xLenDatabase[rowLen][bs][latestWord2][seq])))
-                                    if len(x) != 0:
-                                        nextSame[seq] = x
-                        if len(next)>=self._minSup:
-                            nextRow,nextbs= self.makeNextRow(bs,latestWord,latestWord2)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                self._finalPatterns[str(nextRow)] = len(next)
-                                if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                    self._xLenDatabase[rowLen + 1][nextbs]={}
-                                self._xLenDatabase[rowLen+1][nextbs][latestWord2]={i:next[i] for i in next }
-                                self.makexLenDatabase(rowLen+1,nextbs,latestWord2)
-                        if len(next2)>=self._minSup:
-                            nextRow,nextbs = self.makeNextRow(bs, latestWord2, latestWord)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                    self._xLenDatabase[rowLen + 1][nextbs]={}
-                                self._finalPatterns[str(nextRow)] = len(next2)
-                                self._xLenDatabase[rowLen+1][nextbs][latestWord] = {i:next2[i] for i in next2 }
-                                self.makexLenDatabase(rowLen+1, nextbs, latestWord)
-                        if len(nextSame) >= self._minSup:
-                            nextRow,nextbs ,nextlste= self.makeNextRowSame3(bs, latestWord, latestWord2)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabaseSame[rowLen + 1]:
-                                    self._xLenDatabaseSame[rowLen + 1][nextbs]={}
-                                self._finalPatterns[str(nextRow)] = len(nextSame)
-                                self._xLenDatabaseSame[rowLen+1][nextbs][nextlste]={i:nextSame[i] for i in nextSame }
-                                self.makexLenDatabaseSame(rowLen+1, nextbs, nextlste)
-
-                    else:
-                        next = {}
-                        next2 = {}
-                        nextSame = {}
-
-                        for seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                            if seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                                if self._xLenDatabase[rowLen][bs][latestWord2][seq] != [] and self._xLenDatabase[rowLen][bs][latestWord][seq] != []:
-                                    if rowLen<self._maxLen:
-                                        x = self.checkGap(self._xLenDatabase[rowLen][bs][latestWord][seq],self._xLenDatabase[rowLen][bs][latestWord2][seq])
-                                        if len(x)!=0:
-                                            next[seq]=x
-                                        x= self.checkGap(self._xLenDatabase[rowLen][bs][latestWord2][seq],self._xLenDatabase[rowLen][bs][latestWord][seq])
-                                        if len(x)!=0:
-                                            next2[seq]=x
-                                    x= list(sorted(set(self._xLenDatabase[rowLen][bs][latestWord][seq]) & set(
-                                            self._xLenDatabase[rowLen][bs][latestWord2][seq])))
-                                    if len(x)!=0:
-                                        nextSame[seq]=x
-                        if len(next) >= self._minSup:
-                            nextRow,nextbs = self.makeNextRow(bs, latestWord, latestWord2)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                    self._xLenDatabase[rowLen+1][nextbs]={}
-                                self._finalPatterns[str(nextRow)] = len(next)
-                                self._xLenDatabase[rowLen + 1][nextbs][latestWord2] ={i:next[i] for i in next }
-                                self.makexLenDatabase(rowLen+1, nextbs, latestWord2)
-                        if len(next2) >= self._minSup:
-                            nextRow,nextbs = self.makeNextRow(bs, latestWord2, latestWord)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                    self._xLenDatabase[rowLen + 1][nextbs]={}
-                                self._finalPatterns[str(nextRow)] = len(next2)
-                                self._xLenDatabase[rowLen+1][nextbs][latestWord] = {i:next2[i] for i in next2 }
-                                self.makexLenDatabase(rowLen+1, nextbs, latestWord)
-                        if len(nextSame) >= self._minSup:
-                            nextRow,nextbs,nextlate = self.makeNextRowSame3(bs,latestWord,latestWord2)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabaseSame[rowLen + 1]:
-                                    self._xLenDatabaseSame[rowLen + 1][nextbs]={}
-                                self._finalPatterns[str(nextRow)] = len(nextSame)
-                                self._xLenDatabaseSame[rowLen+1][nextbs][nextlate] = {i:nextSame[i] for i in nextSame}
-                                self.makexLenDatabaseSame(rowLen+1, nextbs, nextlate)
+    def _addPattern(self, rowLen, nextRow, nextbs, latestWord, idList, same=False):
+        """
+        To store a frequent pattern with its id-list and to search its extensions
 
-                else:
-                    next= {}
-                    if rowLen<self._maxLen:
-                        for seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                            if len(self._xLenDatabase[rowLen][bs][latestWord][seq])>=2:
-                                next[seq]= self.checkGap(self._xLenDatabase[rowLen][bs][latestWord][seq],self._xLenDatabase[rowLen][bs][latestWord][seq])
-                        if len(next) >= self._minSup:
-                            nextRow, nextbs= self.makeNextRow(bs,latestWord,latestWord2)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabase[rowLen+1]:
-                                    self._xLenDatabase[rowLen+1][nextbs]={}
-                                self._finalPatterns[str(nextRow)] = len(next)
-                                self._xLenDatabase[rowLen+1][nextbs][latestWord2] ={i:next[i] for i in next }
-                                self.makexLenDatabase(rowLen+1, nextbs, latestWord2)
-            if bs in self._xLenDatabaseSame[rowLen]:
-                for latestWord2 in self._xLenDatabaseSame[rowLen][bs]:
-
-
-                        if len(self._xLenDatabase[rowLen][bs][latestWord].keys()) <= len(
-                                self._xLenDatabaseSame[rowLen][bs][latestWord2].keys()):
-                            next = {}
-
-                            for seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                                if seq in self._xLenDatabaseSame[rowLen][bs][latestWord2].keys():
-                                    if self._xLenDatabaseSame[rowLen][bs][latestWord2][seq] != []:
-                                        x=self.checkGap(self._xLenDatabaseSame[rowLen][bs][latestWord2][seq],self._xLenDatabase[rowLen][bs][latestWord][seq])
-                                        if len(x) != 0:
-                                            next[seq] = x
-                            if len(next) >= self._minSup:
-
-                                nextRow ,nextbs= self.makeNextRowSame(bs, latestWord2, latestWord)
-                                if str(nextRow) not in self._finalPatterns.keys():
-                                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                                    self._finalPatterns[str(nextRow)] = len(next)
-                                    self._xLenDatabase[rowLen + 1][nextbs][latestWord] = {i:next[i] for i in next }
-                                    self.makexLenDatabase(rowLen + 1, nextbs, latestWord)
-
-                        else:
-                            next = {}
-                            for seq in self._xLenDatabaseSame[rowLen][bs][latestWord2].keys():
-                                if seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                                    if self._xLenDatabaseSame[rowLen][bs][latestWord2][seq] != [] :
-                                        x= self.checkGap(self._xLenDatabaseSame[rowLen][bs][latestWord2][seq],self._xLenDatabase[rowLen][bs][latestWord][seq])
-                                        if len(x) != 0:
-                                            next[seq] = x
-                            if len(next) >= self._minSup:
-                                nextRow,nextbs = self.makeNextRowSame(bs, latestWord2, latestWord)
-                                if str(nextRow) not in self._finalPatterns.keys():
-                                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                                    self._finalPatterns[str(nextRow)] = len(next)
-                                    self._xLenDatabase[rowLen+1][nextbs][latestWord] = {i:next[i] for i in next }
-                                    self.makexLenDatabase(rowLen + 1, nextbs,latestWord)
+        :param rowLen: row length of the patterns it was joined from.
+        :param nextRow : the pattern
+        :param nextbs : the pattern without the latest word
+        :param latestWord : latest word of the pattern
+        :param idList : id-list of the pattern
+        :param same : whether the latest word is in the same itemset as the previous one
+        """
+        if idList.support < self._minSup:
+            return
+        self._finalPatterns[nextRow] = idList.support
+        if same:
+            self._xLenDatabaseSame[rowLen + 1].setdefault(nextbs, {})[latestWord] = idList
+            self.makexLenDatabaseSame(rowLen + 1, nextbs, latestWord)
+        else:
+            self._xLenDatabase[rowLen + 1].setdefault(nextbs, {})[latestWord] = idList
+            self.makexLenDatabase(rowLen + 1, nextbs, latestWord)
+
+    def makexLenDatabase(self, rowLen, bs, latestWord):
+        """
+        To make "rowLen" length frequent patterns from pattern which the latest word is in same seq  by joining "rowLen"self._sepSeq length patterns by depth-first search technique  and update xlenDatabase to sequential database
+
+        :param rowLen: row length of patterns.
+        :param bs : patterns without the latest one
+        :param latestWord : latest word of patterns
+        """
+        if rowLen+1 not in self._xLenDatabase:
+            self._xLenDatabase[rowLen+1]={}
+            self._xLenDatabaseSame[rowLen+1]={}
+        idList = self._xLenDatabase[rowLen][bs][latestWord]
+        for latestWord2, idList2 in self._xLenDatabase[rowLen][bs].items():
+            nextRow, nextbs = self.makeNextRow(bs, latestWord, latestWord2)
+            if rowLen < self._maxLen and nextRow not in self._finalPatterns:
+                self._addPattern(rowLen, nextRow, nextbs, latestWord2, self._temporalJoin(idList, latestWord2))
+            if latestWord != latestWord2:
+                nextRow, nextbs = self.makeNextRow(bs, latestWord2, latestWord)
+                if rowLen < self._maxLen and nextRow not in self._finalPatterns:
+                    self._addPattern(rowLen, nextRow, nextbs, latestWord, self._temporalJoin(idList2, latestWord))
+                nextRow, nextbs, nextlast = self.makeNextRowSame3(bs, latestWord, latestWord2)
+                if nextRow not in self._finalPatterns:
+                    self._addPattern(rowLen, nextRow, nextbs, nextlast, _spadeEngine.equalityJoin(idList, idList2),
+                                     True)
+        if bs in self._xLenDatabaseSame[rowLen]:
+            for latestWord2, idList2 in self._xLenDatabaseSame[rowLen][bs].items():
+                nextRow, nextbs = self.makeNextRowSame(bs, latestWord2, latestWord)
+                if nextRow not in self._finalPatterns:
+                    self._addPattern(rowLen, nextRow, nextbs, latestWord, self._temporalJoin(idList2, latestWord))
 
     def makexLenDatabaseSame(self, rowLen, bs, latestWord):
         """
@@ -591,87 +419,19 @@ class SPADEPlus(_ab._sequentialPatterns):
         if rowLen + 1 not in self._xLenDatabase:
             self._xLenDatabase[rowLen + 1] = {}
             self._xLenDatabaseSame[rowLen + 1] = {}
-       
-        if bs in self._xLenDatabase[rowLen]:
-            for latestWord2 in self._xLenDatabase[rowLen][bs]:
-                if rowLen<self._maxLen:
-                    if len(self._xLenDatabaseSame[rowLen][bs][latestWord].keys()) <= len(self._xLenDatabase[rowLen][bs][latestWord2].keys()):
-                        next = {}
-    
-                        for seq in self._xLenDatabaseSame[rowLen][bs][latestWord].keys():
-                            if seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                                if self._xLenDatabaseSame[rowLen][bs][latestWord][seq] != []:
-                                    x= self.checkGap(self._xLenDatabaseSame[rowLen][bs][latestWord][seq],self._xLenDatabase[rowLen][bs][latestWord2][seq])
-                                    if len(x) != 0:
-                                        next[seq] = x
-                        if len(next) >= self._minSup:
-                            nextRow ,nextbs= self.makeNextRowSame(bs, latestWord, latestWord2)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                    self._xLenDatabase[rowLen + 1][nextbs] = {}
-                                self._finalPatterns[str(nextRow)] = len(next)
-                                self._xLenDatabase[rowLen + 1][nextbs][latestWord2]= {i:next[i] for i in next}
-                                self.makexLenDatabase(rowLen + 1, nextbs, latestWord2)
-    
-                    else:
-                        next = {}
-    
-                        for seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                            if seq in self._xLenDatabaseSame[rowLen][bs][latestWord].keys():
-                                if self._xLenDatabaseSame[rowLen][bs][latestWord][seq] != []:
-                                    x= self.checkGap(self._xLenDatabaseSame[rowLen][bs][latestWord][seq],self._xLenDatabase[rowLen][bs][latestWord2][seq])
-                                    if len(x) != 0:
-                                        next[seq] = x
-                        if len(next) >= self._minSup:
-                            nextRow,nextbs = self.makeNextRowSame(bs, latestWord, latestWord2)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                    self._xLenDatabase[rowLen + 1][nextbs] = {}
-                                self._finalPatterns[str(nextRow)] = len(next)
-                                self._xLenDatabase[rowLen + 1][nextbs][latestWord2] = {i:next[i] for i in next}
-                                self.makexLenDatabase(rowLen + 1,nextbs, latestWord2)
+        idList = self._xLenDatabaseSame[rowLen][bs][latestWord]
+        if bs in self._xLenDatabase[rowLen] and rowLen < self._maxLen:
+            for latestWord2, idList2 in self._xLenDatabase[rowLen][bs].items():
+                nextRow, nextbs = self.makeNextRowSame(bs, latestWord, latestWord2)
+                if nextRow not in self._finalPatterns:
+                    self._addPattern(rowLen, nextRow, nextbs, latestWord2, self._temporalJoin(idList, latestWord2))
         if bs in self._xLenDatabaseSame[rowLen]:
-            for latestWord2 in self._xLenDatabaseSame[rowLen][bs]:
-                if latestWord2!=latestWord:
-                    if len(self._xLenDatabaseSame[rowLen][bs][latestWord].keys()) <= len(
-                            self._xLenDatabaseSame[rowLen][bs][latestWord2].keys()):
-                        next = {}
-
-                        for seq in self._xLenDatabaseSame[rowLen][bs][latestWord].keys():
-                            if seq in self._xLenDatabaseSame[rowLen][bs][latestWord2].keys():
-                                x= list(sorted(set(self._xLenDatabaseSame[rowLen][bs][latestWord][seq]) & set(
-                                        self._xLenDatabaseSame[rowLen][bs][latestWord2][seq])))
-                                if len(x) != 0:
-                                    next[seq] = x
-                        if len(next) >= self._minSup:
-
-                                nextRow, nextbs,nextLate= self.makeNextRowSame2(bs, latestWord, latestWord2)
-                                if str(nextRow) not in self._finalPatterns.keys():
-                                    if nextbs not in self._xLenDatabaseSame[rowLen+1]:
-                                        self._xLenDatabaseSame[rowLen + 1][nextbs] = {}
-
-                                    self._finalPatterns[str(nextRow)] = len(next)
-                                    self._xLenDatabaseSame[rowLen + 1][nextbs][nextLate] = {i:next[i] for i in next}
-                                    self.makexLenDatabaseSame(rowLen + 1, nextbs, nextLate)
-                    else:
-                        next = {}
-
-                        for seq in self._xLenDatabaseSame[rowLen][bs][latestWord2].keys():
-                            if seq in self._xLenDatabaseSame[rowLen][bs][latestWord].keys():
-                                x= list(sorted(set(self._xLenDatabaseSame[rowLen][bs][latestWord][seq]) & set(
-                                        self._xLenDatabaseSame[rowLen][bs][latestWord2][seq])))
-                                if len(x) != 0:
-                                    next[seq] = x
-                        if len(next) >= self._minSup:
-
-                                nextRow, nextbs,nextLate= self.makeNextRowSame2(bs, latestWord, latestWord2)
-                                if str(nextRow) not in self._finalPatterns.keys():
-                                    if nextbs not in self._xLenDatabaseSame[rowLen+1]:
-                                        self._xLenDatabaseSame[rowLen + 1][nextbs] = {}
-
-                                    self._finalPatterns[str(nextRow)] = len(next)
-                                    self._xLenDatabaseSame[rowLen + 1][nextbs][nextLate] = {i:next[i] for i in next}
-                                    self.makexLenDatabaseSame(rowLen + 1, nextbs, nextLate)
+            for latestWord2, idList2 in self._xLenDatabaseSame[rowLen][bs].items():
+                if latestWord2 != latestWord:
+                    nextRow, nextbs, nextLate = self.makeNextRowSame2(bs, latestWord, latestWord2)
+                    if nextRow not in self._finalPatterns:
+                        self._addPattern(rowLen, nextRow, nextbs, nextLate,
+                                         _spadeEngine.equalityJoin(idList, idList2), True)
 
     def makeNextRow(self,bs, latestWord, latestWord2):
         """
@@ -758,36 +518,40 @@ class SPADEPlus(_ab._sequentialPatterns):
         bs2 = bs + (x2,)
         return  bs2,bs,x2
 
+    def _patternName(self, row):
+        """
+        To convert a pattern of item ids to the pattern of item names
+
+        :param row: the pattern as a tuple of item ids and itemset separators
+        :return: the pattern as it is stored in the final patterns
+        :rtype: str
+        """
+        if len(row) == 1:
+            return str(self._names[row[0]])
+        return str(tuple(i if i == self._sepSeq else self._names[i] for i in row))
+
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
     def startMine(self):
         """
         Frequent pattern mining process will start from here
         """
-        self._Database = []
-        self._startTime = _ab._time.time()
-        self._creatingItemSets()
-        self._minSup = self._convert(self._minSup)
-        self.make1LenDatabase()
-        self.make2LenDatabase()
-        self.make3LenDatabase()
-        self._endTime = _ab._time.time()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Sequential Frequent patterns were generated successfully using SPADE algorithm ")
+        self.mine()
 
     def mine(self):
         """
         Frequent pattern mining process will start from here
         """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
         self.make1LenDatabase()
         self.make2LenDatabase()
         self.make3LenDatabase()
+        self._finalPatterns = {self._patternName(row): sup for row, sup in self._finalPatterns.items()}
+        self._xLenDatabase = {}
+        self._xLenDatabaseSame = {}
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
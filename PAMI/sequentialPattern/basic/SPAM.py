@@ -58,6 +58,9 @@ import pandas as pd
 from deprecated import deprecated
 
 from PAMI.sequentialPattern.basic import abstract as _ab
+from PAMI.sequentialPattern.basic import parallelSearch as _parallelSearch
+from PAMI.sequentialPattern.basic import sequenceDatabase as _sequenceDatabase
+from PAMI.sequentialPattern.basic import spamEngine as _spamEngine
 _ab._sys.setrecursionlimit(10000)
 
 class SPAM(_ab._sequentialPatterns):
@@ -77,11 +80,13 @@ class SPAM(_ab._sequentialPatterns):
                     Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  workers: int :
+                   The number of worker processes mining the subtrees of the frequent items. With one worker the mining runs in the main process.
 
     :Attributes:
 
             iFile : str
-                Input file name or path of the input file
+                Input file name or path of the input file, or a sequenceDatabase.SequenceDatabase
             oFile : str
                 Name of the output file or the path of output file
             minSup : float or int or str
@@ -104,12 +109,14 @@ class SPAM(_ab._sequentialPatterns):
                 To store the total amount of RSS memory consumed by the program
             Database : list
                 To store the sequences of a database in list
-            _idDatabase : dict
-                To store the sequences of a database by bit map
-            _maxSeqLen:
-                the maximum length of subsequence in sequence.
+            _index : spamEngine.BitmapIndex
+                To store the sequences of a database by bit map, as uint64 words of the frequent items
+            _names : list
+                the name of every frequent item, by rank
             _seqSep   :str
                 separator to separate each itemset
+            _workers : int
+                the number of worker processes
 
     :Methods:
 
@@ -118,11 +125,9 @@ class SPAM(_ab._sequentialPatterns):
             _convert(value):
                 To convert the user specified minSup value
             make2BitDatabase():
-                To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database
-            DfsPruning(items,sStep,iStep):
+                To make the bitmaps of the frequent items and the 1 length frequent patterns
+            DfsPruning(items,bitmap,sStep,iStep):
                 the main algorithm of spam. This can search sstep and istep items and find next patterns, its sstep, and its istep. And call this function again by using them. Recursion until there are no more items available for exploration.
-            Sstep(s):
-                To convert bit to ssteo bit.The first time you get 1, you set it to 0 and subsequent ones to 1.(like 010101=>001111, 00001001=>00000111)
             mine()
                 Mining process will start from here
             getPatterns()
@@ -202,14 +207,27 @@ class SPAM(_ab._sequentialPatterns):
     _memoryUSS = float()
     _memoryRSS = float()
     _Database = []
-    _idDatabase={}
-    _maxSeqLen=0
+    _index = None
+    _names = []
     _sepSeq=""
+    _workers = 1
+
+    def __init__(self, iFile, minSup, sep="\t", sepSeq="-1", workers=1):
+        super().__init__(iFile, minSup, sep, sepSeq)
+        self._workers = int(workers)
+
     def _creatingItemSets(self):
         """
         Storing the complete sequences of the database/input file in a database variable
         """
         self._Database = []
+        if isinstance(self._iFile, str) or _sequenceDatabase.isSequenceDatabase(self._iFile):
+            try:
+                self._Database = _sequenceDatabase.load(self._iFile, self._sep, self._sepSeq)
+            except IOError:
+                print("File Not Found")
+                quit()
+            return
 
         if isinstance(self._iFile, _ab._pd.DataFrame):
             temp = []
@@ -230,38 +248,6 @@ class SPAM(_ab._sequentialPatterns):
                     addList=[]
                     addList.append(temp[k+1])
             self._Database.append(addList)
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    temp.pop()
-                    self._Database.append(temp)
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sepSeq)]
-                            temp = [x for x in temp if x ]
-
-                            seq = []
-                            for i in temp:
-                                k = -2
-                                if len(i)>1:
-                                    seq.append(list(sorted(set(i.split()))))
-
-                                else:
-                                    seq.append(i)
-
-                            self._Database.append(seq)
-
-                except IOError:
-                    print("File Not Found")
-                    quit()
 
     def _convert(self, value):
         """
@@ -285,39 +271,29 @@ class SPAM(_ab._sequentialPatterns):
 
     def make2BitDatabase(self):
         """
-        To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database
+        To make the bitmaps of the frequent items and the 1 length frequent patterns. The items are given integer ids in
+        the order of their first appearance in the database.
         """
-        self._maxSeqLen=max([len(i) for i in self._Database])
-        lineNumber=0
-        idDatabase={}
-        for line in self._Database:
-            seqNumber=1
-            for seq in line:
-
-                for data in seq:
-                    if data in idDatabase:
-                        while lineNumber+1!=len(idDatabase[data]):
-                            idDatabase[data].append(0)
-                        idDatabase[data][lineNumber]+=int(2**(self._maxSeqLen-seqNumber))
-
-                    else:
-                        idDatabase[data]=[]
-                        while lineNumber+1!=len(idDatabase[data]):
-                            idDatabase[data].append(0)
-                        idDatabase[data][lineNumber]+=(int(2 ** (self._maxSeqLen-seqNumber)))
-
-                seqNumber+=1
-            lineNumber+=1
-        for key,val in idDatabase.items():
-
-            sup=self.countSup(val)
-            while lineNumber+1!=len(idDatabase[key]):
-                            idDatabase[key].append(0)
-            if sup>=self._minSup:
-                self._finalPatterns[str(key)+self._sep+"-2"]=sup
-                self._idDatabase[str(key)]=val
-
-    def DfsPruning(self,items,sStep,iStep):
+        if isinstance(self._Database, _sequenceDatabase.SequenceDatabase):
+            order = self._Database.firstAppearance()
+            sequences, positions, items = self._Database.occurrences(order)
+            names = [self._Database.names[i] for i in order.tolist()]
+        else:
+            ids = {}
+            sequences, positions, items = [], [], []
+            for lineNumber, line in enumerate(self._Database):
+                for seqNumber, seq in enumerate(line):
+                    for data in seq:
+                        sequences.append(lineNumber)
+                        positions.append(seqNumber)
+                        items.append(ids.setdefault(data, len(ids)))
+            names = list(ids)
+        self._index = _spamEngine.BitmapIndex(sequences, positions, items, len(self._Database), self._minSup)
+        self._names = [str(names[item]) for item in self._index.items.tolist()]
+        for name, sup in zip(self._names, self._index.supports.tolist()):
+            self._finalPatterns[name + self._sep + "-2"] = sup
+
+    def DfsPruning(self, items, bitmap, sStep, iStep):
         """
         the main algorithm of spam. This can search sstep and istep items and find next patterns, its sstep, and its istep. And call this function again by using them. Recursion until there are no more items available for exploration.
 
@@ -325,111 +301,67 @@ class SPAM(_ab._sequentialPatterns):
 
         items : str
             The pattrens I got before
+        bitmap : tuple
+            The bitmap of "items"
         sStep : list
-            Items presumed to have "sstep" relationship with "items".(sstep is What appears later like a-b and a-c)
+            Ranks of the items presumed to have "sstep" relationship with "items".(sstep is What appears later like a-b and a-c)
         iStep : list
-            Items presumed to have "istep" relationship with "items"(istep is What appears in same time like ab and ac)
+            Ranks of the items presumed to have "istep" relationship with "items"(istep is What appears in same time like ab and ac)
 
         """
-        Snext=[]
-        Inext=[]
-        ns = self.Sstep(self._idDatabase[items])
-        for i in sStep:
-            nnext=[]
-            for k in  range(len(self._idDatabase[items])):
-                nandi=ns[k] & self._idDatabase[i][k]
-                nnext.append(nandi)
-
-
-            sup=self.countSup(nnext)
-            if sup>=self._minSup:
-                key=items+self._sep+self._sepSeq+self._sep+i
-                self._finalPatterns[key+self._sep+self._sepSeq+self._sep+"-2"]=sup
-                self._idDatabase[key]=nnext
-                Snext.append(i)
-
-        for i in Snext:
-            key = items+self._sep+self._sepSeq+self._sep+i
-            self.DfsPruning(key,Snext,[k for k in Snext if self._Database.index(i)<self._Database.index(k)])
-        for i in iStep:
-            nnext = []
-
-            for k in range(len(self._idDatabase[items])):
-                nandi = self._idDatabase[items][k] & self._idDatabase[i][k]
-                nnext.append(nandi)
-            sup=self.countSup(nnext)
-            if sup>=self._minSup:
-                key=items+self._sep+str(i)
-                self._finalPatterns[key+self._sep+self._sepSeq+self._sep+"-2"]=sup
-                self._idDatabase[key]=nnext
-                Inext.append(i)
-        for i in Inext:
-            key = items +self._sep +str(i)
-            self.DfsPruning(key,Snext,[k for k in Inext if self._Database.index(i)<self._Database.index(k)])
-
-    def Sstep(self,s):
+        Snext = []
+        for i, nnext, sup in self._index.sExtensions(bitmap, sStep):
+            key = items + self._sep + self._sepSeq + self._sep + self._names[i]
+            self._finalPatterns[key + self._sep + self._sepSeq + self._sep + "-2"] = sup
+            Snext.append((i, key, nnext))
+        sItems = [i for i, _, _ in Snext]
+        for i, key, nnext in Snext:
+            self.DfsPruning(key, nnext, sItems, [k for k in sItems if i < k])
+        Inext = []
+        for i, nnext, sup in self._index.iExtensions(bitmap, iStep):
+            key = items + self._sep + self._names[i]
+            self._finalPatterns[key + self._sep + self._sepSeq + self._sep + "-2"] = sup
+            Inext.append((i, key, nnext))
+        iItems = [i for i, _, _ in Inext]
+        for i, key, nnext in Inext:
+            self.DfsPruning(key, nnext, sItems, [k for k in iItems if i < k])
+
+    def _savePattern(self, pattern, support):
         """
-        To convert bit to Sstep bit.The first time you get 1, you set it to 0 and subsequent ones to 1.(like 010101=>001111, 00001001=>00000111)
-
-
-        :param s:list
-            to store each bit sequence
-        :return:
-            nextS:list to store the bit sequence converted by sstep
+        To store a frequent pattern found by the parallel search
 
+        :param pattern: the pattern as a tuple of itemsets of ranks
+        :param support: the support of the pattern
         """
-        nextS=[]
-        for bins in s:
-            binS=str(bin(bins))
+        key = (self._sep + self._sepSeq + self._sep).join(self._sep.join(self._names[i] for i in itemSet)
+                                                           for itemSet in pattern)
+        self._finalPatterns[key + self._sep + self._sepSeq + self._sep + "-2"] = support
 
-
-            LenNum=2
-            for i in range(len(binS)-2):
-                if binS[LenNum] == "1":
-
-                    binS = binS[:LenNum] + "0" + binS[LenNum + 1:]
-                    while len(binS)-1!=LenNum:
-                        LenNum += 1
-                        binS = binS[:LenNum] + "1" + binS[LenNum + 1:]
-                    break
-                LenNum+=1
-            nextS.append(int(binS, 0))
-
-
-        return nextS
-
-    def countSup(self,n):
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
+    def startMine(self):
         """
-        count support
-
-        :param n:list
-                to store each bit sequence
-        :return:
-            count: int support of this list
+        Frequent pattern mining process will start from here
         """
-        count=0
-        for i in n:
-            if "1" in str(bin(i)):
-                count+=1
-        return count
+        self.mine()
 
-    def startMine(self):
+    def mine(self):
         """
         Frequent pattern mining process will start from here
         """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
         self.make2BitDatabase()
-        self._Database = [i for i in self._idDatabase.keys()]
-        for i in self._Database:
-            x=[]
-            for j in self._Database:
-                if self._Database.index(i)<self._Database.index(j):
-                    x.append(j)
-
-            self.DfsPruning(i,self._Database,x)
+        if self._workers > 1:
+            space = _spamEngine.SubtreeSpace(self._index)
+            _parallelSearch.search(space, space.roots(), self._savePattern, self._workers)
+        else:
+            ranks = list(range(len(self._index)))
+            for i in ranks:
+                self.DfsPruning(self._names[i], self._index.bitmap(i), ranks, ranks[i + 1:])
+        self._index = None
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
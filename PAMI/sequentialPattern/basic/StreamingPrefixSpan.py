@@ -0,0 +1,358 @@
+# Streaming Prefix Span discovers the approximate sequential frequent patterns of a stream of events, such as a
+# clickstream, without buffering the stream into a sequence database.
+# The events are grouped into the sequences of their sessions with a session timeout, and the sequences are counted in
+# batches by lossy counting on a prefix tree over a landmark or a sliding window.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#
+#             import PAMI.sequentialPattern.basic.StreamingPrefixSpan as alg
+#
+#             obj = alg.StreamingPrefixSpan(iFile, minSup, epsilon, timeout, batchSize, windowSize, sep)
+#
+#             obj.mine()
+#
+#             frequentPatterns = obj.getPatterns()
+#
+#             print("Total number of Frequent Patterns:", len(frequentPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternsAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+
+__copyright__ = """
+ Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+     Copyright (C)  2021 Rage Uday Kiran
+"""
+
+from deprecated import deprecated
+
+from PAMI.sequentialPattern.basic import abstract as _ab
+from PAMI.sequentialPattern.basic import sequenceStream as _sequenceStream
+import re
+
+
+class StreamingPrefixSpan(_ab._sequentialPatterns):
+    """
+    :Description:
+        * Streaming Prefix Span discovers the approximate sequential frequent patterns of a stream of (session, timestamp, event) tuples.
+        * The events of a session form a sequence, the events sharing a timestamp forming an itemset, and a sequence is closed once the stream moves more than timeout past its last event.
+        * The closed sequences are counted in batches by lossy counting on a prefix tree, and the patterns of the window are exported after every batch in the format of PrefixSpan.getPatterns().
+        * The support of an exported pattern is at most its support in the window and at least its support minus epsilon times the length of the window, and no pattern supported by minSup sequences of the window is missed.
+        * The guarantee needs minSup above epsilon times the length of the window. The window of the whole stream keeps growing, so it needs a fractional minSup, and mining stops with an exception once a count minSup falls to epsilon times the length of the window.
+
+    :Reference:   G. S. Manku, R. Motwani: Approximate Frequency Counts over Data Streams. VLDB 2002: 346-357
+
+    :param  iFile: str :
+                   Name of the input file, a data frame with the columns Session, Timestamp and Event, or any iterable of lines or of (session, timestamp, event) tuples
+    :param  minSup: float or int or str :
+                    minSup measure constraints the minimum number of sequences of the window where a pattern must appear
+                    Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
+    :param  epsilon: float :
+                   The largest underestimation of a support, as a fraction of the length of the window. It must be below minSup.
+    :param  timeout: float :
+                   The largest time between two events of the same sequence
+    :param  batchSize: int :
+                   The number of sequences counted at once, and between two exports. It should be at least 1 / epsilon.
+    :param  windowSize: int :
+                   The number of batches of a sliding window. With None the window is the whole stream, and minSup must be a fraction of it.
+    :param  sep: str :
+                   This variable is used to distinguish the session, the timestamp and the event of a line. The default seperator is tab space.
+    :param  maxLength: int :
+                   The largest number of itemsets of a pattern
+
+    :Attributes:
+
+        iFile : str
+            Input file name or path of the input file
+        minSup : float or int or str
+            The user can specify minSup either in count or proportion of the window length.
+            If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
+            Otherwise, it will be treated as float.
+            Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
+        sep : str
+            This variable is used to distinguish the fields of a line. The default seperator is tab space or \t.
+        startTime : float
+            To record the start time of the mining process
+        endTime : float
+            To record the completion time of the mining process
+        finalPatterns : dict
+            Storing the patterns of the last window in a dictionary variable
+        memoryUSS : float
+            To store the total amount of USS memory consumed by the program
+        memoryRSS : float
+            To store the total amount of RSS memory consumed by the program
+
+    :Methods:
+
+        mine()
+            Mining process will start from here
+        windowPatterns()
+            Patterns of every window, as soon as its last batch closes
+        getPatterns()
+            Complete set of patterns will be retrieved with this function
+        save(oFile)
+            Complete set of frequent patterns will be loaded in to a output file
+        getPatternsAsDataFrame()
+            Complete set of frequent patterns will be loaded in to a dataframe
+        getMemoryUSS()
+            Total amount of USS memory consumed by the mining process will be retrieved from this function
+        getMemoryRSS()
+            Total amount of RSS memory consumed by the mining process will be retrieved from this function
+        getRuntime()
+            Total amount of runtime taken by the mining process will be retrieved from this function
+
+    **Methods to execute code on terminal**
+    ------------------------------------------
+    .. code-block:: console
+
+
+       Format:
+
+       (.venv) $ python3 StreamingPrefixSpan.py <inputFile> <outputFile> <minSup> <epsilon> <timeout> <batchSize> <windowSize>
+
+       Example usage:
+
+       (.venv) $ python3 StreamingPrefixSpan.py events.txt patterns.txt 0.05 0.01 1800 1000 4
+
+
+               .. note:: minSup will be considered in support count or frequency, and windowSize is optional
+
+
+    **Importing this algorithm into a python program**
+    -----------------------------------------------------
+    .. code-block:: python
+
+            import PAMI.sequentialPattern.basic.StreamingPrefixSpan as alg
+
+            obj = alg.StreamingPrefixSpan(iFile, minSup, epsilon, timeout, batchSize)
+
+            for window, patterns in obj.windowPatterns():
+
+                print(window, len(patterns))
+
+            print("Total number of Frequent Patterns:", len(obj.getPatterns()))
+    """
+
+    _minSup = float()
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _memoryUSS = float()
+    _memoryRSS = float()
+
+    def __init__(self, iFile, minSup, epsilon, timeout, batchSize, windowSize=None, sep="\t", maxLength=float("inf")):
+        super().__init__(iFile, minSup, sep)
+        self._epsilon = float(epsilon)
+        self._timeout = float(timeout)
+        self._batchSize = int(batchSize)
+        self._windowSize = None if windowSize is None else int(windowSize)
+        self._maxLength = maxLength
+
+    def _convert(self, value, length):
+        """
+        To convert the user specified minSup value
+
+        :param value: user specified minSup value
+        :param length: number of sequences of the window
+        :return: converted type
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (length * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (length * value)
+            else:
+                value = int(value)
+        return value
+
+    def _patternName(self, pattern):
+        """
+        To convert a pattern of the tree to the pattern as it is stored in the final patterns
+
+        :param pattern: the pattern as a tuple of itemsets of item names
+        :return: the pattern in the format of PrefixSpan
+        :rtype: str
+        """
+        row = []
+        for itemSet in pattern:
+            row.extend(itemSet)
+            row.append(":")
+        return str(row)
+
+    def windowPatterns(self):
+        """
+        Mines the stream and yields the patterns of the window every time a batch of sequences closes. The input is read
+        lazily, so it can be an endless iterable of lines such as a socket or a file being tailed.
+
+        :return: (start, end) sequence ids of every window and its patterns in the format of PrefixSpan.getPatterns()
+        :rtype: Iterator[tuple]
+        :raises Exception: once minSup is not above epsilon times the length of the window
+        """
+        if self._epsilon <= 0:
+            raise Exception("Please enter a positive epsilon")
+        tree = _sequenceStream.LossySequenceTree(self._epsilon, self._windowSize, self._maxLength)
+        events = _sequenceStream.readEvents(self._iFile, self._sep)
+        end = 0
+        for batch in _sequenceStream.batches(_sequenceStream.sessions(events, self._timeout), self._batchSize):
+            tree.addBatch(batch)
+            end += len(batch)
+            minSup = self._convert(self._minSup, tree.length)
+            if minSup <= self._epsilon * tree.length:
+                raise Exception("minSup must be above epsilon times the length of the window, %s sequences, to find "
+                                "every frequent pattern. Please enter a fractional minSup above epsilon"
+                                % (self._epsilon * tree.length))
+            self._finalPatterns = {self._patternName(pattern): support for pattern, support in tree.patterns(minSup)}
+            yield (end - tree.length, end), self._finalPatterns
+
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
+    def startMine(self):
+        """
+        Frequent pattern mining process will start from here
+        """
+        self.mine()
+
+    def mine(self):
+        """
+        Frequent pattern mining process will start from here
+        """
+        self._finalPatterns = {}
+        self._startTime = _ab._time.time()
+        for _ in self.windowPatterns():
+            pass
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Frequent patterns were generated successfully using StreamingPrefixSpan algorithm ")
+
+    def getMemoryUSS(self):
+        """
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryUSS
+
+    def getMemoryRSS(self):
+        """
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryRSS
+
+    def getRuntime(self):
+        """
+        Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self):
+        """
+        Storing final frequent patterns in a dataframe
+
+        :return: returning frequent patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+        data = [[a, b] for a, b in self._finalPatterns.items()]
+        return _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
+
+    def save(self, outFile):
+        """
+        Complete set of frequent patterns will be loaded in to an output file
+
+        :param outFile: name of the output file
+        :type outFile: csv file
+        """
+        self._oFile = outFile
+        with open(self._oFile, 'w+') as writer:
+            for x, y in self._finalPatterns.items():
+                pattern = ""
+                x = re.sub("[\\['\\]]", "", x)
+                for i in x.split(","):
+                    pattern = pattern + "\t" + str(i)
+                writer.write("%s \n" % (pattern + str(y)))
+
+    def getPatterns(self):
+        """
+        Function to send the set of frequent patterns after completion of the mining process
+
+        :return: returning frequent patterns
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def printResults(self):
+        """
+        This function is used to print the results
+        """
+        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:", self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 7 or len(_ab._sys.argv) == 8:
+        if len(_ab._sys.argv) == 8:
+            _ap = StreamingPrefixSpan(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5],
+                                      _ab._sys.argv[6], _ab._sys.argv[7])
+        if len(_ab._sys.argv) == 7:
+            _ap = StreamingPrefixSpan(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5],
+                                      _ab._sys.argv[6])
+        _ap.mine()
+        _Patterns = _ap.getPatterns()
+        print("Total number of Frequent Patterns:", len(_Patterns))
+        _ap.save(_ab._sys.argv[2])
+        _memUSS = _ap.getMemoryUSS()
+        print("Total Memory in USS:", _memUSS)
+        _memRSS = _ap.getMemoryRSS()
+        print("Total Memory in RSS", _memRSS)
+        _run = _ap.getRuntime()
+        print("Total ExecutionTime in ms:", _run)
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
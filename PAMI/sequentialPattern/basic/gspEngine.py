@@ -0,0 +1,249 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Level-wise candidate generation and counting for the GSP sequential miner.
+
+A pattern is a tuple of itemsets, each a sorted tuple of integer item ids. The candidates of length k + 1 join every
+frequent pattern of length k with the frequent patterns whose first k - 1 items are its last k - 1 items, and a candidate
+is kept only if all its contiguous subsequences of length k are frequent: the ones without an item of its first or last
+itemset, or without an item of an itemset of two or more items.
+
+The candidates of a level are stored in a prefix trie keyed by item. A node has the children adding an item to its last
+itemset and the children starting a new itemset with an item, and the node ending a candidate keeps its index. The
+supports of all the candidates are counted with one pass over each data sequence, which walks the trie depth-first from
+the itemsets where its items occur: every (node, itemset) pair is visited at most once per sequence, and every candidate
+reached is counted once.
+"""
+
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, FrozenSet, Hashable, Iterable, Iterator, List, Sequence, Tuple
+
+Pattern = Tuple[Tuple[int, ...], ...]
+IndexedSequence = Tuple[List[FrozenSet[int]], Dict[int, List[int]]]
+
+
+class _Node:
+    """
+    :Description: Node of the candidate trie.
+
+    :Attributes:
+
+        itemChildren : dict
+            The child of every item added to the last itemset
+        sequenceChildren : dict
+            The child of every item starting a new itemset
+        candidate : int
+            The index of the candidate ending at the node, -1 for none
+    """
+
+    __slots__ = ('itemChildren', 'sequenceChildren', 'candidate')
+
+    def __init__(self) -> None:
+        self.itemChildren = {}
+        self.sequenceChildren = {}
+        self.candidate = -1
+
+
+class CandidateTrie:
+    """
+    :Description: Prefix trie of the candidates of one level, keyed by item.
+
+    :Attributes:
+
+        candidates : list
+            The candidates, by index
+
+    :Methods:
+
+        contained(itemSets, positions)
+            Indexes of the candidates contained in a sequence
+        supports(sequences)
+            Support of every candidate
+    """
+
+    def __init__(self, candidates: Sequence[Pattern]) -> None:
+        self.candidates = list(candidates)
+        self._root = _Node()
+        for index, pattern in enumerate(self.candidates):
+            node = self._root
+            for itemSet in pattern:
+                children = node.sequenceChildren
+                for item in itemSet:
+                    node = children.setdefault(item, _Node())
+                    children = node.itemChildren
+            node.candidate = index
+
+    def contained(self, itemSets: Sequence[FrozenSet[int]], positions: Dict[int, List[int]]) -> List[int]:
+        """
+        Indexes of the candidates contained in a sequence
+
+        :param itemSets: the itemsets of the sequence
+        :type itemSets: list
+        :param positions: the sorted positions of the itemsets containing every item of the sequence
+        :type positions: dict
+        :return: the index of every contained candidate, once
+        :rtype: list
+        """
+        found = set()
+        seen = set()
+        stack = [(self._root, -1)]
+        while stack:
+            node, eid = stack.pop()
+            if node.candidate >= 0:
+                found.add(node.candidate)
+            if eid >= 0:
+                itemSet = itemSets[eid]
+                for item, child in node.itemChildren.items():
+                    if item in itemSet and (child, eid) not in seen:
+                        seen.add((child, eid))
+                        stack.append((child, eid))
+            for item, child in node.sequenceChildren.items():
+                later = positions.get(item)
+                if later is None:
+                    continue
+                for nextEid in later[bisect_right(later, eid):]:
+                    if (child, nextEid) not in seen:
+                        seen.add((child, nextEid))
+                        stack.append((child, nextEid))
+        return list(found)
+
+    def supports(self, sequences: Iterable[IndexedSequence]) -> List[int]:
+        """
+        Support of every candidate, with one pass over each sequence
+
+        :param sequences: the itemsets and item positions of every sequence
+        :type sequences: list
+        :return: the support of every candidate, by index
+        :rtype: list
+        """
+        counts = [0] * len(self.candidates)
+        for itemSets, positions in sequences:
+            for index in self.contained(itemSets, positions):
+                counts[index] += 1
+        return counts
+
+
+def _dropFirst(pattern: Pattern) -> Pattern:
+    return pattern[1:] if len(pattern[0]) == 1 else (pattern[0][1:],) + pattern[1:]
+
+
+def _dropLast(pattern: Pattern) -> Pattern:
+    return pattern[:-1] if len(pattern[-1]) == 1 else pattern[:-1] + (pattern[-1][:-1],)
+
+
+def _contiguous(pattern: Pattern) -> Iterator[Pattern]:
+    last = len(pattern) - 1
+    for j, itemSet in enumerate(pattern):
+        if len(itemSet) > 1:
+            for k in range(len(itemSet)):
+                yield pattern[:j] + (itemSet[:k] + itemSet[k + 1:],) + pattern[j + 1:]
+        elif j == 0 or j == last:
+            yield pattern[:j] + pattern[j + 1:]
+
+
+def pairs(items: Sequence[int]) -> List[Pattern]:
+    """
+    Candidates of length 2 of the frequent items
+
+    :param items: the frequent items, in increasing order
+    :type items: list
+    :return: every sequence of two items and every itemset of two items
+    :rtype: list
+    """
+    result = []
+    for first in items:
+        for second in items:
+            result.append(((first,), (second,)))
+            if first < second:
+                result.append(((first, second),))
+    return result
+
+
+def candidates(frequent: Sequence[Pattern]) -> List[Pattern]:
+    """
+    Candidates of length k + 1 of the frequent patterns of length k, for k of 2 or more
+
+    :param frequent: the frequent patterns of length k
+    :type frequent: list
+    :return: the joined candidates whose contiguous subsequences of length k are all frequent
+    :rtype: list
+    """
+    known = set(frequent)
+    byPrefix = {}
+    for pattern in frequent:
+        byPrefix.setdefault(_dropLast(pattern), []).append(pattern)
+    result = []
+    for first in frequent:
+        for second in byPrefix.get(_dropFirst(first), ()):
+            item = second[-1][-1]
+            if len(second[-1]) == 1:
+                candidate = first + ((item,),)
+            else:
+                candidate = first[:-1] + (first[-1] + (item,),)
+            if all(pattern in known for pattern in _contiguous(candidate)):
+                result.append(candidate)
+    return result
+
+
+def fromItemsets(database: Iterable[Iterable[Iterable[Hashable]]]) -> Tuple[List[List[Tuple[int, ...]]], List[Hashable]]:
+    """
+    Recodes a database of sequences of itemsets of item names to item ids
+
+    :param database: the sequences, each a list of itemsets
+    :type database: list
+    :return: the sequences of sorted itemsets of ids and the name of every id, the ids following the order of the names
+    :rtype: tuple
+    """
+    database = [[set(itemSet) for itemSet in sequence] for sequence in database]
+    names = sorted({item for sequence in database for itemSet in sequence for item in itemSet})
+    ids = {name: i for i, name in enumerate(names)}
+    return [[tuple(sorted(ids[item] for item in itemSet)) for itemSet in sequence] for sequence in database], names
+
+
+def mine(database: Sequence[Sequence[Tuple[int, ...]]], minSup: float) -> Iterator[Tuple[Pattern, int]]:
+    """
+    Frequent patterns of a database, level by level
+
+    :param database: the sequences of itemsets of item ids
+    :type database: list
+    :param minSup: the minimum support
+    :type minSup: float
+    :return: every frequent pattern and its support, shorter patterns first
+    :rtype: iterator
+    """
+    counts = Counter(item for sequence in database for item in {i for itemSet in sequence for i in itemSet})
+    items = sorted(item for item, support in counts.items() if support >= minSup)
+    for item in items:
+        yield ((item,),), counts[item]
+    frequentItems = set(items)
+    sequences = []
+    for sequence in database:
+        itemSets = [frozenset(frequentItems.intersection(itemSet)) for itemSet in sequence]
+        positions = {}
+        for eid, itemSet in enumerate(itemSets):
+            for item in itemSet:
+                positions.setdefault(item, []).append(eid)
+        if positions:
+            sequences.append((itemSets, positions))
+    level = pairs(items)
+    while level:
+        supports = CandidateTrie(level).supports(sequences)
+        frequent = [pattern for pattern, support in zip(level, supports) if support >= minSup]
+        for pattern, support in zip(level, supports):
+            if support >= minSup:
+                yield pattern, support
+        level = candidates(frequent)
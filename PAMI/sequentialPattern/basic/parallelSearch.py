@@ -0,0 +1,178 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Process-parallel depth-first search for the sequential miners.
+
+The subtrees of the search tree of a sequential miner are independent once their root is known: the first-item
+projections of PrefixSpan, the subtrees of SPAM and the equivalence classes of SPADE. A search space describes the tree
+with three methods:
+
+* expand(task) returns the patterns of the children of a node, as (pattern, support) pairs, and the tasks of the
+  children.
+* weight(task) returns an estimate of the work of the subtree of a node, e.g., the size of its projection.
+* split(task), which is optional, does what expand does for the tasks the main process hands to the workers. A space
+  whose tasks share large data, like the id-lists of an equivalence class of SPADE, can keep that data itself before the
+  workers start, and return tasks which only refer to it.
+
+The tasks are handed to a pool of worker processes, which search their subtrees and send the patterns back, where they
+are passed to a sink as soon as they arrive. The space is given to the workers through the pool initializer, so with the
+fork start method the database is inherited rather than copied, and only the tasks are pickled. A task heavier than a
+share of the total work is expanded once by the main process, and its children are scheduled instead of it, so that a
+few large first items do not keep one worker busy while the others are idle. The tasks are scheduled heaviest first.
+
+poolMap is the pool itself, also used by the miners which are not sequential, like efimParallel: a worker builds its
+state once with an initializer, and every task is a call of a function with that state.
+"""
+
+import multiprocessing
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+_worker = {}
+
+
+def _attachWorker(initializer: Callable[..., Any], initargs: Tuple, work: Callable[[Any, Any], Any]) -> None:
+    """
+    Initializes a worker process: builds its state and keeps it for all the tasks
+
+    :param initializer: the function building the state of the worker
+    :type initializer: function
+    :param initargs: the arguments of the initializer
+    :type initargs: tuple
+    :param work: the function called with the state and a task
+    :type work: function
+    """
+    _worker['state'] = initializer(*initargs)
+    _worker['work'] = work
+
+
+def _runTask(task: Any) -> Any:
+    """
+    Runs a task in a worker process
+
+    :param task: the task
+    :type task: object
+    :return: the result of the task
+    :rtype: object
+    """
+    return _worker['work'](_worker['state'], task)
+
+
+def poolMap(work: Callable[[Any, Any], Any], tasks: Iterable[Any], workers: int,
+            initializer: Callable[..., Any], initargs: Tuple = (), ordered: bool = False) -> Iterator[Any]:
+    """
+    Runs the tasks in a pool of worker processes, one task at a time per worker
+
+    :param work: the function called in a worker with its state and a task. It must be defined at the top of a module.
+    :type work: function
+    :param tasks: the tasks
+    :type tasks: list
+    :param workers: the number of worker processes
+    :type workers: int
+    :param initializer: the function called once in every worker with initargs, which returns the state of the worker
+    :type initializer: function
+    :param initargs: the arguments of the initializer
+    :type initargs: tuple
+    :param ordered: whether the results are returned in the order of the tasks, instead of as soon as they are done
+    :type ordered: bool
+    :return: the result of every task
+    :rtype: iterator
+    """
+    with multiprocessing.Pool(workers, initializer=_attachWorker, initargs=(initializer, initargs, work)) as pool:
+        results = pool.imap if ordered else pool.imap_unordered
+        yield from results(_runTask, tasks, chunksize=1)
+
+
+def _keepSpace(space: Any) -> Any:
+    """
+    Initializes a worker process of a search: keeps the search space for all the tasks
+
+    :param space: the search space
+    :type space: object
+    :return: the search space
+    :rtype: object
+    """
+    return space
+
+
+def subtree(space: Any, task: Any) -> Iterator[Tuple[Any, int]]:
+    """
+    Searches the subtree of a node depth-first, the patterns of the node itself are not returned
+
+    :param space: the search space
+    :type space: object
+    :param task: the node
+    :type task: object
+    :return: the pattern and support of every descendant of the node
+    :rtype: iterator
+    """
+    stack = [task]
+    while stack:
+        patterns, children = space.expand(stack.pop())
+        yield from patterns
+        stack.extend(reversed(children))
+
+
+def _mineTask(space: Any, task: Any) -> List[Tuple[Any, int]]:
+    """
+    Searches the subtree of a task in a worker process
+
+    :param space: the search space
+    :type space: object
+    :param task: the node
+    :type task: object
+    :return: the patterns of the subtree
+    :rtype: list
+    """
+    return list(subtree(space, task))
+
+
+def search(space: Any, roots: Iterable[Any], sink: Callable[[Any, int], None], workers: int = 1,
+           splitFactor: int = 4) -> None:
+    """
+    Searches the subtrees of the roots, with several processes when workers is more than one
+
+    :param space: the search space
+    :type space: object
+    :param roots: the nodes to search from, their own patterns are not searched
+    :type roots: list
+    :param sink: the function called with every pattern and its support
+    :type sink: function
+    :param workers: the number of worker processes. With one worker the search runs in the main process.
+    :type workers: int
+    :param splitFactor: a root heavier than the total weight divided by workers * splitFactor is split into its children
+    :type splitFactor: int
+    """
+    tasks = list(roots)
+    if workers <= 1:
+        for task in tasks:
+            for pattern, support in subtree(space, task):
+                sink(pattern, support)
+        return
+    limit = sum(space.weight(task) for task in tasks) / (workers * splitFactor)
+    split = getattr(space, 'split', space.expand)
+    balanced = []
+    for task in tasks:
+        if space.weight(task) > limit:
+            patterns, children = split(task)
+            for pattern, support in patterns:
+                sink(pattern, support)
+            balanced.extend(children)
+        else:
+            balanced.append(task)
+    balanced.sort(key=space.weight, reverse=True)
+    for patterns in poolMap(_mineTask, balanced, workers, _keepSpace, (space,)):
+        for pattern, support in patterns:
+            sink(pattern, support)
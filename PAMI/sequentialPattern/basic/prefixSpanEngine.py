@@ -0,0 +1,428 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Pseudo-projection for the PrefixSpan family of sequential miners.
+
+The sequence database is stored once as flat int64 arrays with one entry per item occurrence, ordered by sequence,
+itemset and item: the item id, the sequence id (sid) and itemset position (eid) of the occurrence, and the flat
+positions where its itemset and its sequence end. The items are integer ids in the order of their names, so the items of
+an itemset are sorted.
+
+A projected database is never copied. It is the array of the flat positions where the earliest match of the prefix ends,
+one per supporting sequence, and the sid of every entry is read from the store. All the extensions of a prefix are found
+from one gather of the suffixes of its projection:
+
+* a sequence extension by an item is its first occurrence in a later itemset.
+* an itemset extension by a larger item is its first occurrence in an itemset containing the last itemset of the prefix,
+  after the occurrence of the last item of the prefix. Containment is a searchsorted over the (itemset, item) pairs.
+
+Patterns are tuples of itemsets, each a tuple of item ids, and :func:`mine` yields them one at a time in depth-first
+order, so that the caller decides how to keep them. :class:`ProjectionSpace` describes the same search for
+parallelSearch, which mines the first-item projections in several processes.
+"""
+
+from typing import Dict, Hashable, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as _np
+
+from PAMI.sequentialPattern.basic import parallelSearch as _parallelSearch
+
+Pattern = Tuple[Tuple[int, ...], ...]
+
+
+def _ranges(rows: _np.ndarray, starts: _np.ndarray, ends: _np.ndarray) -> Tuple[_np.ndarray, _np.ndarray]:
+    lengths = ends - starts
+    offsets = _np.repeat(starts - _np.cumsum(lengths) + lengths, lengths)
+    return _np.repeat(rows, lengths), offsets + _np.arange(len(offsets))
+
+
+class SequenceStore:
+    """
+    :Description: Flat arrays of the item occurrences of a sequence database.
+
+    :Attributes:
+
+        items : numpy.ndarray
+            Item id of every occurrence
+        sids : numpy.ndarray
+            Sequence id of every occurrence
+        eids : numpy.ndarray
+            Itemset position of every occurrence in its sequence
+        itemsetEnds : numpy.ndarray
+            Flat position following the itemset of every occurrence
+        sequenceEnds : numpy.ndarray
+            Flat position following the sequence of every occurrence
+        numberOfItems : int
+            Number of item ids
+        numberOfSequences : int
+            Number of sequences, including the empty ones
+        supports : numpy.ndarray
+            Number of sequences containing every item id
+
+    :Methods:
+
+        fromOccurrences(sequences, positions, items, numberOfItems, numberOfSequences)
+            Builds the store from lists of occurrences
+        restrict(minSup)
+            Store without the infrequent items
+        firstOccurrences(minSup)
+            Projections of the frequent items
+        extensions(positions, lastItemset, minSup)
+            Frequent extensions of a projected prefix
+        occurrences(minSup)
+            All the occurrences of the frequent items
+        gapExtensions(positions, minSup, maxGap)
+            Frequent extensions of a prefix under a gap constraint
+    """
+
+    __slots__ = ('items', 'sids', 'eids', 'itemsetEnds', 'sequenceEnds', 'numberOfItems', 'numberOfSequences',
+                 'supports', '_pairs', '_itemsets', '_previous', '_eidKeys')
+
+    def __init__(self, items: _np.ndarray, sids: _np.ndarray, eids: _np.ndarray, numberOfItems: int,
+                 numberOfSequences: int) -> None:
+        self.items = items
+        self.sids = sids
+        self.eids = eids
+        self.numberOfItems = numberOfItems
+        self.numberOfSequences = numberOfSequences
+        size = len(items)
+        newItemset = _np.ones(size, dtype=bool)
+        newItemset[1:] = (sids[1:] != sids[:-1]) | (eids[1:] != eids[:-1])
+        self._itemsets = _np.cumsum(newItemset) - 1
+        itemsetStarts = _np.flatnonzero(newItemset)
+        self.itemsetEnds = _np.append(itemsetStarts[1:], size)[self._itemsets]
+        sequenceStarts = _np.searchsorted(sids, _np.arange(numberOfSequences + 1))
+        self.sequenceEnds = sequenceStarts[1:][sids]
+        self._pairs = self._itemsets * max(numberOfItems, 1) + items
+        self._eidKeys = sids * (int(eids.max()) + 1 + size if size else 1) + eids
+        order = _np.lexsort((_np.arange(size), sids, items))
+        repeated = _np.zeros(size, dtype=bool)
+        repeated[1:] = (items[order][1:] == items[order][:-1]) & (sids[order][1:] == sids[order][:-1])
+        self._previous = _np.full(size, -1, dtype=_np.int64)
+        self._previous[order[1:][repeated[1:]]] = order[:-1][repeated[1:]]
+        self.supports = _np.bincount(items[self._previous < 0], minlength=numberOfItems)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @classmethod
+    def fromOccurrences(cls, sequences: Sequence[int], positions: Sequence[int], items: Sequence[int],
+                        numberOfItems: int, numberOfSequences: int) -> 'SequenceStore':
+        """
+        Builds the store from lists of occurrences, in any order
+
+        :param sequences: sid of every occurrence
+        :type sequences: list
+        :param positions: eid of every occurrence
+        :type positions: list
+        :param items: item id of every occurrence
+        :type items: list
+        :param numberOfItems: number of item ids
+        :type numberOfItems: int
+        :param numberOfSequences: number of sequences
+        :type numberOfSequences: int
+        :return: the store, repeated occurrences are kept once
+        :rtype: SequenceStore
+        """
+        sequences = _np.asarray(sequences, dtype=_np.int64)
+        positions = _np.asarray(positions, dtype=_np.int64)
+        items = _np.asarray(items, dtype=_np.int64)
+        order = _np.lexsort((items, positions, sequences))
+        sequences, positions, items = sequences[order], positions[order], items[order]
+        if len(order):
+            new = _np.ones(len(order), dtype=bool)
+            new[1:] = (items[1:] != items[:-1]) | (sequences[1:] != sequences[:-1]) | (positions[1:] != positions[:-1])
+            sequences, positions, items = sequences[new], positions[new], items[new]
+        return cls(items, sequences, positions, numberOfItems, numberOfSequences)
+
+    def restrict(self, minSup: float) -> 'SequenceStore':
+        """
+        Drops the occurrences of the items supported by less than minSup sequences. The eids are kept, so the gaps
+        between itemsets do not change.
+
+        :param minSup: the minimum support
+        :type minSup: float
+        :return: the restricted store, with the same item ids
+        :rtype: SequenceStore
+        """
+        keep = self.supports[self.items] >= minSup
+        return SequenceStore(self.items[keep], self.sids[keep], self.eids[keep], self.numberOfItems,
+                             self.numberOfSequences)
+
+    def firstOccurrences(self, minSup: float) -> Iterator[Tuple[int, _np.ndarray]]:
+        """
+        Projections of the items supported by at least minSup sequences
+
+        :param minSup: the minimum support
+        :type minSup: float
+        :return: every frequent item in increasing order, with the position of its first occurrence in every sequence
+        :rtype: iterator
+        """
+        return iter(self._group(_np.flatnonzero(self._previous < 0), minSup).items())
+
+    def _contains(self, positions: _np.ndarray, items: Sequence[int]) -> _np.ndarray:
+        keep = _np.ones(len(positions), dtype=bool)
+        for item in items:
+            keys = self._itemsets[positions] * max(self.numberOfItems, 1) + item
+            found = _np.minimum(_np.searchsorted(self._pairs, keys), len(self._pairs) - 1)
+            keep &= self._pairs[found] == keys
+        return keep
+
+    def _group(self, positions: _np.ndarray, minSup: float) -> Dict[int, _np.ndarray]:
+        items = self.items[positions]
+        supports = _np.bincount(items, minlength=self.numberOfItems)
+        keep = supports[items] >= minSup
+        positions, items = positions[keep], items[keep]
+        order = _np.argsort(items, kind='stable')
+        positions, items = positions[order], items[order]
+        candidates, starts = _np.unique(items, return_index=True)
+        ends = _np.append(starts[1:], len(items))
+        return {int(item): positions[start:end] for item, start, end in zip(candidates, starts, ends)}
+
+    def _firsts(self, rows: _np.ndarray, positions: _np.ndarray, minSup: float) -> Dict[int, _np.ndarray]:
+        if not len(positions):
+            return {}
+        keys = self.items[positions] * (int(rows.max()) + 1) + rows
+        order = _np.lexsort((positions, keys))
+        first = _np.ones(len(order), dtype=bool)
+        first[1:] = keys[order][1:] != keys[order][:-1]
+        return self._group(positions[order][first], minSup)
+
+    def extensions(self, positions: _np.ndarray, lastItemset: Sequence[int], minSup: float,
+                   sequenceExtensions: bool = True) -> Tuple[Dict[int, _np.ndarray], Dict[int, _np.ndarray]]:
+        """
+        Frequent extensions of a prefix from its projection
+
+        :param positions: flat position where the earliest match of the prefix ends, in every supporting sequence
+        :type positions: numpy.ndarray
+        :param lastItemset: item ids of the last itemset of the prefix, in increasing order
+        :type lastItemset: tuple
+        :param minSup: the minimum support
+        :type minSup: float
+        :param sequenceExtensions: whether the sequence extensions are looked for
+        :type sequenceExtensions: bool
+        :return: the projections of the sequence extensions and of the itemset extensions, by item id
+        :rtype: tuple
+        """
+        rows, suffix = _ranges(_np.arange(len(positions)), positions + 1, self.sequenceEnds[positions])
+        sExtensions = {}
+        if sequenceExtensions:
+            starts = self.itemsetEnds[positions][rows]
+            later = (suffix >= starts) & (self._previous[suffix] < starts)
+            sExtensions = self._group(suffix[later], minSup)
+        last = self.items[suffix] == lastItemset[-1]
+        anchors, anchorRows = suffix[last], rows[last]
+        keep = self._contains(anchors, lastItemset[:-1])
+        anchors = _np.concatenate((positions, anchors[keep]))
+        anchorRows = _np.concatenate((_np.arange(len(positions)), anchorRows[keep]))
+        rows, same = _ranges(anchorRows, anchors + 1, self.itemsetEnds[anchors])
+        return sExtensions, self._firsts(rows, same, minSup)
+
+
+    def occurrences(self, minSup: float) -> Iterator[Tuple[int, _np.ndarray]]:
+        """
+        All the occurrences of the items supported by at least minSup sequences
+
+        :param minSup: the minimum support
+        :type minSup: float
+        :return: every frequent item in increasing order, with the positions of all its occurrences
+        :rtype: iterator
+        """
+        return iter(self._groupAll(_np.arange(len(self.items)), minSup).items())
+
+    def support(self, positions: _np.ndarray) -> int:
+        """
+        Number of sequences of a projection
+
+        :param positions: flat positions, in increasing order
+        :type positions: numpy.ndarray
+        :return: the number of distinct sids of the positions
+        :rtype: int
+        """
+        sids = self.sids[positions]
+        return int(_np.count_nonzero(sids[1:] != sids[:-1])) + 1 if len(sids) else 0
+
+    def _groupAll(self, positions: _np.ndarray, minSup: float) -> Dict[int, _np.ndarray]:
+        items = self.items[positions]
+        order = _np.lexsort((positions, items))
+        positions, items = positions[order], items[order]
+        new = _np.ones(len(order), dtype=bool)
+        new[1:] = (items[1:] != items[:-1]) | (positions[1:] != positions[:-1])
+        positions, items = positions[new], items[new]
+        sids = self.sids[positions]
+        newSequence = _np.ones(len(positions), dtype=bool)
+        newSequence[1:] = (items[1:] != items[:-1]) | (sids[1:] != sids[:-1])
+        supports = _np.bincount(items[newSequence], minlength=self.numberOfItems)
+        candidates, starts = _np.unique(items, return_index=True)
+        ends = _np.append(starts[1:], len(items))
+        return {int(item): positions[start:end] for item, start, end in zip(candidates, starts, ends)
+                if supports[item] >= minSup}
+
+    def gapExtensions(self, positions: _np.ndarray, minSup: float, maxGap: float, sequenceExtensions: bool = True) \
+            -> Tuple[Dict[int, _np.ndarray], Dict[int, _np.ndarray]]:
+        """
+        Frequent extensions of a prefix from all the ends of its matches. The earliest match is not enough under a gap
+        constraint, as a later match may have an extension within the gap that the earliest one has not.
+
+        :param positions: flat positions where the matches of the prefix end, in increasing order
+        :type positions: numpy.ndarray
+        :param minSup: the minimum support
+        :type minSup: float
+        :param maxGap: sequence extensions are looked for less than maxGap itemsets after the end of a match
+        :type maxGap: float
+        :param sequenceExtensions: whether the sequence extensions are looked for
+        :type sequenceExtensions: bool
+        :return: the ends of the matches of the sequence extensions and of the itemset extensions, by item id
+        :rtype: tuple
+        """
+        rows = _np.arange(len(positions))
+        sExtensions = {}
+        if sequenceExtensions:
+            ends = _np.searchsorted(self._eidKeys, self._eidKeys[positions] + int(_np.ceil(min(maxGap, len(self.items)))))
+            ends = _np.maximum(ends, self.itemsetEnds[positions])
+            _, later = _ranges(rows, self.itemsetEnds[positions], ends)
+            sExtensions = self._groupAll(later, minSup)
+        _, same = _ranges(rows, positions + 1, self.itemsetEnds[positions])
+        return sExtensions, self._groupAll(same, minSup)
+
+
+def fromItemsets(database: Iterable[Iterable[Iterable[Hashable]]]) -> Tuple[SequenceStore, List[Hashable]]:
+    """
+    Builds the store of a database of sequences of itemsets of item names
+
+    :param database: the sequences, each a list of itemsets
+    :type database: list
+    :return: the store and the name of every item id, the ids following the order of the names
+    :rtype: tuple
+    """
+    ids = {}
+    sequences, positions, items = [], [], []
+    numberOfSequences = 0
+    for sid, sequence in enumerate(database):
+        numberOfSequences = sid + 1
+        for eid, itemset in enumerate(sequence):
+            for item in itemset:
+                sequences.append(sid)
+                positions.append(eid)
+                items.append(ids.setdefault(item, len(ids)))
+    names = sorted(ids)
+    rank = _np.zeros(len(ids), dtype=_np.int64)
+    for i, name in enumerate(names):
+        rank[ids[name]] = i
+    items = rank[_np.asarray(items, dtype=_np.int64)] if items else items
+    return SequenceStore.fromOccurrences(sequences, positions, items, len(ids), numberOfSequences), names
+
+
+class ProjectionSpace:
+    """
+    :Description: Search space of PrefixSpan for parallelSearch. A task is a pattern and its projection.
+
+    :Attributes:
+
+        store : SequenceStore
+            The sequence database, without the infrequent items
+        minSup : float
+            The minimum support
+        maxLength : float
+            The largest number of itemsets of a pattern
+        maxGap : float
+            The consecutive itemsets of a pattern match less than maxGap itemsets apart
+
+    :Methods:
+
+        roots()
+            Tasks of the frequent items
+        expand(task)
+            Frequent extensions of a pattern and their tasks
+        weight(task)
+            Number of occurrences in the suffixes of a projection
+    """
+
+    def __init__(self, store: SequenceStore, minSup: float, maxLength: float = float("inf"),
+                 maxGap: float = float("inf")) -> None:
+        self.store = store.restrict(minSup)
+        self.minSup = minSup
+        self.maxLength = maxLength
+        self.maxGap = maxGap
+
+    def roots(self) -> List[Tuple[Pattern, _np.ndarray]]:
+        """
+        Tasks of the frequent items
+
+        :return: pattern and projection of every frequent item, in increasing order
+        :rtype: list
+        """
+        if self.maxGap == float("inf"):
+            roots = self.store.firstOccurrences(self.minSup)
+        else:
+            roots = self.store.occurrences(self.minSup)
+        return [(((item,),), positions) for item, positions in roots]
+
+    def _extensions(self, pattern: Pattern, positions: _np.ndarray) \
+            -> Tuple[Dict[int, _np.ndarray], Dict[int, _np.ndarray]]:
+        if self.maxGap == float("inf"):
+            return self.store.extensions(positions, pattern[-1], self.minSup, len(pattern) < self.maxLength)
+        return self.store.gapExtensions(positions, self.minSup, self.maxGap, len(pattern) < self.maxLength)
+
+    def expand(self, task: Tuple[Pattern, _np.ndarray]) \
+            -> Tuple[List[Tuple[Pattern, int]], List[Tuple[Pattern, _np.ndarray]]]:
+        """
+        Frequent extensions of a pattern, the itemset extensions first
+
+        :param task: the pattern and its projection
+        :type task: tuple
+        :return: the extended patterns with their supports, and their tasks
+        :rtype: tuple
+        """
+        pattern, positions = task
+        sExtensions, iExtensions = self._extensions(pattern, positions)
+        children = [(pattern[:-1] + (pattern[-1] + (item,),), projection) for item, projection in iExtensions.items()]
+        children += [(pattern + ((item,),), projection) for item, projection in sExtensions.items()]
+        return [(child, self.store.support(projection)) for child, projection in children], children
+
+    def weight(self, task: Tuple[Pattern, _np.ndarray]) -> int:
+        """
+        Number of occurrences in the suffixes of a projection, which bounds the work of the first expansion
+
+        :param task: the pattern and its projection
+        :type task: tuple
+        :return: the weight of the task
+        :rtype: int
+        """
+        positions = task[1]
+        return int((self.store.sequenceEnds[positions] - positions).sum())
+
+
+def mine(store: SequenceStore, minSup: float, maxLength: float = float("inf"), maxGap: float = float("inf")) \
+        -> Iterator[Tuple[Pattern, int]]:
+    """
+    Depth-first PrefixSpan over the pseudo-projections of a store
+
+    :param store: the sequence database
+    :type store: SequenceStore
+    :param minSup: the minimum support
+    :type minSup: float
+    :param maxLength: the largest number of itemsets of a pattern
+    :type maxLength: float
+    :param maxGap: the consecutive itemsets of a pattern match less than maxGap itemsets apart
+    :type maxGap: float
+    :return: every frequent pattern with its support
+    :rtype: iterator
+    """
+    space = ProjectionSpace(store, minSup, maxLength, maxGap)
+    for root in space.roots():
+        yield root[0], space.store.support(root[1])
+        yield from _parallelSearch.subtree(space, root)
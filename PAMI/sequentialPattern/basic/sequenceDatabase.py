@@ -0,0 +1,397 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Sequence database shared by the sequential miners.
+
+The items are recoded to integer ids following the sorted order of their names, and the database is kept as three flat
+arrays: the item ids of all the itemsets one after another, every itemset sorted and without repeated items, the end of
+every itemset in the items, and the end of every sequence in the itemsets. A database is built from the text format of
+the miners, where the items are separated by sep, -1 ends an itemset and -2 ends a sequence, from the output of
+PAMI.extras.syntheticDataGenerator.SequentialDatabase, or from lists of itemsets.
+
+A database is saved in a binary file: a magic number, the sizes of the arrays and of the names, the sequence ends and
+itemset ends as little-endian int64, the items as little-endian int32 and the names as a JSON list. Opening the file
+memory maps the arrays instead of reading them, so a large database is shared by the processes opening it and only the
+pages a miner touches are read. A database, or the path of its binary file, is accepted as the input file of the
+sequential miners, and they read their text files with load(), so that a file gives the same patterns in both forms.
+"""
+
+import json as _json
+import os as _os
+from typing import Any, Hashable, Iterable, Iterator, List, Optional, Tuple
+from urllib.request import urlopen as _urlopen
+
+import numpy as _np
+import validators as _validators
+
+from PAMI.extras.syntheticDataGenerator.SequentialDatabase import SequentialDatabase as _SequentialDatabase
+
+_magic = b'PAMISEQ1'
+_headerSize = len(_magic) + 4 * 8
+
+
+class SequenceDatabase:
+    """
+    :Description: Sequences of itemsets stored as flat NumPy arrays of item ids.
+
+    :Attributes:
+
+        names : list
+            Name of every item id, the ids follow the sorted order of the names
+        items : numpy.ndarray
+            Item ids of all the itemsets, one after another, every itemset sorted and without repeated items
+        itemsetEnds : numpy.ndarray
+            Position in items after the last item of every itemset
+        sequenceEnds : numpy.ndarray
+            Position in itemsetEnds after the last itemset of every sequence
+
+    :Methods:
+
+        occurrences(order)
+            Sequence, itemset position and item id of every item of the database
+        sequences()
+            Itemsets of item ids of every sequence
+        itemSets()
+            Itemsets of item names of every sequence
+        firstAppearance()
+            Item ids in the order of their first appearance
+        save(path)
+            Saves the database in a binary file
+
+    **Sample run of the importing code:**
+    ----------------------------------------
+    .. code-block:: python
+
+            from PAMI.sequentialPattern.basic import sequenceDatabase as _sequenceDatabase
+
+            database = _sequenceDatabase.load("sampleSequence.txt", " ")
+
+            database.save("sampleSequence.seq")
+
+            from PAMI.sequentialPattern.basic import PrefixSpan
+
+            obj = PrefixSpan.PrefixSpan(_sequenceDatabase.load("sampleSequence.seq"), 10)
+
+            obj.mine()
+    """
+
+    def __init__(self, names: List[Hashable], items: _np.ndarray, itemsetEnds: _np.ndarray,
+                 sequenceEnds: _np.ndarray) -> None:
+        self.names = names
+        self.items = items
+        self.itemsetEnds = itemsetEnds
+        self.sequenceEnds = sequenceEnds
+
+    def __len__(self) -> int:
+        return len(self.sequenceEnds)
+
+    def _itemsetSequences(self) -> Tuple[_np.ndarray, _np.ndarray]:
+        """
+        Sequence and position in its sequence of every itemset
+
+        :return: the sid and the eid of every itemset
+        :rtype: tuple
+        """
+        sequenceEnds = _np.asarray(self.sequenceEnds, dtype=_np.int64)
+        starts = _np.concatenate(([0], sequenceEnds[:-1])).astype(_np.int64)
+        sids = _np.repeat(_np.arange(len(sequenceEnds), dtype=_np.int64), sequenceEnds - starts)
+        return sids, _np.arange(len(sids), dtype=_np.int64) - starts[sids]
+
+    def occurrences(self, order: Optional[_np.ndarray] = None) -> Tuple[_np.ndarray, _np.ndarray, _np.ndarray]:
+        """
+        Sequence, itemset position and item id of every item of the database
+
+        :param order: item ids in the order of their new ids, for the miners numbering the items in another order, e.g.,
+                      firstAppearance(). The items missing from it are dropped.
+        :type order: numpy.ndarray
+        :return: the sid, eid and item id of every item, in the order of the database
+        :rtype: tuple
+        """
+        sids, eids = self._itemsetSequences()
+        itemsetEnds = _np.asarray(self.itemsetEnds, dtype=_np.int64)
+        rows = _np.repeat(_np.arange(len(itemsetEnds), dtype=_np.int64),
+                          _np.diff(_np.concatenate(([0], itemsetEnds))))
+        items = _np.asarray(self.items, dtype=_np.int64)
+        if order is not None:
+            rank = _np.full(len(self.names), -1, dtype=_np.int64)
+            rank[_np.asarray(order, dtype=_np.int64)] = _np.arange(len(order), dtype=_np.int64)
+            items = rank[items]
+            kept = items >= 0
+            rows, items = rows[kept], items[kept]
+        return sids[rows], eids[rows], items
+
+    def sequences(self) -> List[List[Tuple[int, ...]]]:
+        """
+        Itemsets of item ids of every sequence
+
+        :return: every sequence as a list of sorted tuples of item ids
+        :rtype: list
+        """
+        items = _np.asarray(self.items).tolist()
+        itemsetEnds = _np.asarray(self.itemsetEnds).tolist()
+        result = []
+        start = 0
+        itemset = 0
+        for end in _np.asarray(self.sequenceEnds).tolist():
+            sequence = []
+            for itemsetEnd in itemsetEnds[itemset:end]:
+                sequence.append(tuple(items[start:itemsetEnd]))
+                start = itemsetEnd
+            itemset = end
+            result.append(sequence)
+        return result
+
+    def itemSets(self) -> List[List[List[Hashable]]]:
+        """
+        Itemsets of item names of every sequence
+
+        :return: every sequence as a list of itemsets, each a list of item names sorted by name
+        :rtype: list
+        """
+        names = self.names
+        return [[[names[item] for item in itemSet] for itemSet in sequence] for sequence in self.sequences()]
+
+    def firstAppearance(self) -> _np.ndarray:
+        """
+        Item ids in the order of their first appearance in the database
+
+        :return: the ids of the items of the database
+        :rtype: numpy.ndarray
+        """
+        ids, first = _np.unique(_np.asarray(self.items, dtype=_np.int64), return_index=True)
+        return ids[_np.argsort(first, kind='stable')]
+
+    def save(self, path: str) -> None:
+        """
+        Saves the database in a binary file, which load() memory maps
+
+        :param path: path of the file
+        :type path: str
+        """
+        names = _json.dumps(list(self.names)).encode('utf-8')
+        header = _np.array([len(self.items), len(self.itemsetEnds), len(self.sequenceEnds), len(names)], dtype='<i8')
+        with open(path, 'wb') as f:
+            f.write(_magic)
+            f.write(header.tobytes())
+            f.write(_np.asarray(self.sequenceEnds, dtype='<i8').tobytes())
+            f.write(_np.asarray(self.itemsetEnds, dtype='<i8').tobytes())
+            f.write(_np.asarray(self.items, dtype='<i4').tobytes())
+            f.write(names)
+
+
+def _fromIds(names: List[Hashable], items: List[int], itemsetEnds: List[int], sequenceEnds: List[int]) \
+        -> SequenceDatabase:
+    """
+    Builds a database from items numbered in any order, every itemset without repeated items
+
+    :param names: name of every item id
+    :type names: list
+    :param items: item ids of all the itemsets
+    :type items: list
+    :param itemsetEnds: end of every itemset in the items
+    :type itemsetEnds: list
+    :param sequenceEnds: end of every sequence in the itemsets
+    :type sequenceEnds: list
+    :return: the database, with the ids following the sorted order of the names
+    :rtype: SequenceDatabase
+    """
+    order = sorted(range(len(names)), key=names.__getitem__)
+    rank = _np.empty(len(names), dtype=_np.int64)
+    rank[order] = _np.arange(len(names), dtype=_np.int64)
+    items = rank[_np.asarray(items, dtype=_np.int64)]
+    itemsetEnds = _np.asarray(itemsetEnds, dtype=_np.int64)
+    rows = _np.repeat(_np.arange(len(itemsetEnds), dtype=_np.int64), _np.diff(_np.concatenate(([0], itemsetEnds))))
+    items = items[_np.lexsort((items, rows))]
+    return SequenceDatabase([names[i] for i in order], items.astype(_np.int32), itemsetEnds,
+                            _np.asarray(sequenceEnds, dtype=_np.int64))
+
+
+def fromItemsets(database: Iterable[Iterable[Iterable[Hashable]]]) -> SequenceDatabase:
+    """
+    Builds a database from sequences of itemsets of item names. Empty itemsets are dropped.
+
+    :param database: the sequences, each a list of itemsets
+    :type database: list
+    :return: the database
+    :rtype: SequenceDatabase
+    """
+    ids = {}
+    items, itemsetEnds, sequenceEnds = [], [], []
+    for sequence in database:
+        for itemSet in sequence:
+            length = len(items)
+            items.extend({ids.setdefault(item, len(ids)) for item in itemSet})
+            if len(items) > length:
+                itemsetEnds.append(len(items))
+        sequenceEnds.append(len(itemsetEnds))
+    return _fromIds(list(ids), items, itemsetEnds, sequenceEnds)
+
+
+def _textSequences(lines: Iterable[str], sep: str, sepSeq: str, sepEnd: str) -> Iterator[List[List[str]]]:
+    """
+    Splits the lines of the text format into itemsets, blank lines are skipped
+
+    :param lines: the lines
+    :type lines: iterable
+    :param sep: separator of the items, any white space when it is a white space
+    :type sep: str
+    :param sepSeq: token ending an itemset
+    :type sepSeq: str
+    :param sepEnd: token ending a sequence, the rest of its line is ignored
+    :type sepEnd: str
+    :return: the itemsets of item names of every sequence
+    :rtype: iterator
+    """
+    for line in lines:
+        tokens = line.split() if sep.isspace() else [token.strip() for token in line.split(sep)]
+        tokens = [token for token in tokens if token]
+        if not tokens:
+            continue
+        sequence, itemSet = [], []
+        for token in tokens:
+            if token == sepSeq:
+                sequence.append(itemSet)
+                itemSet = []
+            elif token == sepEnd:
+                break
+            else:
+                itemSet.append(token)
+        sequence.append(itemSet)
+        yield sequence
+
+
+def fromText(source: str, sep: str = '\t', sepSeq: str = '-1', sepEnd: str = '-2') -> SequenceDatabase:
+    """
+    Builds a database from a file in the text format of the sequential miners, one sequence per line
+
+    :param source: path or URL of the file
+    :type source: str
+    :param sep: separator of the items, any white space when it is a white space
+    :type sep: str
+    :param sepSeq: token ending an itemset
+    :type sepSeq: str
+    :param sepEnd: token ending a sequence
+    :type sepEnd: str
+    :return: the database
+    :rtype: SequenceDatabase
+    """
+    if _validators.url(source):
+        lines = (line.decode('utf-8') for line in _urlopen(source))
+        return fromItemsets(_textSequences(lines, sep, sepSeq, sepEnd))
+    with open(source, 'r', encoding='utf-8') as f:
+        return fromItemsets(_textSequences(f, sep, sepSeq, sepEnd))
+
+
+def fromSequentialDatabase(generator: _SequentialDatabase) -> SequenceDatabase:
+    """
+    Builds a database from the sequences created by PAMI.extras.syntheticDataGenerator.SequentialDatabase
+
+    :param generator: the generator, after create()
+    :type generator: SequentialDatabase
+    :return: the database, the names of the items are their numbers as strings
+    :rtype: SequenceDatabase
+    """
+    separator = str(generator.seqSep)
+    database = []
+    for line in generator.db:
+        sequence = [[]]
+        for item in line:
+            if str(item) == separator:
+                sequence.append([])
+            else:
+                sequence[-1].append(str(item))
+        database.append(sequence)
+    return fromItemsets(database)
+
+
+def _isBinary(path: str) -> bool:
+    """
+    Checks whether a path is a binary database file
+
+    :param path: the path
+    :type path: str
+    :return: True if the file starts with the magic number
+    :rtype: bool
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(_magic)) == _magic
+    except (OSError, TypeError, ValueError):
+        return False
+
+
+def isSequenceDatabase(source: Any) -> bool:
+    """
+    Checks whether the input of a miner is a database or the path of a binary database file
+
+    :param source: the input file of a miner
+    :type source: object
+    :return: True for a database or the path of its binary file
+    :rtype: bool
+    """
+    return isinstance(source, SequenceDatabase) or (isinstance(source, str) and _isBinary(source))
+
+
+def _open(path: str) -> SequenceDatabase:
+    """
+    Opens a binary database file, memory mapping its arrays
+
+    :param path: path of the file
+    :type path: str
+    :return: the database
+    :rtype: SequenceDatabase
+    """
+    with open(path, 'rb') as f:
+        f.seek(len(_magic))
+        numberOfItems, numberOfItemsets, numberOfSequences, namesSize = \
+            _np.frombuffer(f.read(4 * 8), dtype='<i8').tolist()
+        offset = _headerSize + 8 * (numberOfSequences + numberOfItemsets) + 4 * numberOfItems
+        f.seek(offset)
+        names = _json.loads(f.read(namesSize).decode('utf-8'))
+
+    def array(dtype: str, start: int, length: int) -> _np.ndarray:
+        if length == 0:
+            return _np.zeros(0, dtype=dtype)
+        return _np.memmap(path, dtype=dtype, mode='r', offset=start, shape=(length,))
+
+    sequenceEnds = array('<i8', _headerSize, numberOfSequences)
+    itemsetEnds = array('<i8', _headerSize + 8 * numberOfSequences, numberOfItemsets)
+    items = array('<i4', _headerSize + 8 * (numberOfSequences + numberOfItemsets), numberOfItems)
+    return SequenceDatabase(names, items, itemsetEnds, sequenceEnds)
+
+
+def load(source: Any, sep: str = '\t', sepSeq: str = '-1', sepEnd: str = '-2') -> SequenceDatabase:
+    """
+    Loads a sequence database
+
+    :param source: path of a binary database file, path or URL of a file in the text format, a SequentialDatabase
+                   generator, or a database loaded before, which is returned as it is
+    :param sep: separator of the items of the text format
+    :type sep: str
+    :param sepSeq: token ending an itemset in the text format
+    :type sepSeq: str
+    :param sepEnd: token ending a sequence in the text format
+    :type sepEnd: str
+    :return: the database
+    :rtype: SequenceDatabase
+    """
+    if isinstance(source, SequenceDatabase):
+        return source
+    if isinstance(source, _SequentialDatabase):
+        return fromSequentialDatabase(source)
+    if not _validators.url(source) and _os.path.isfile(source) and _isBinary(source):
+        return _open(source)
+    return fromText(source, sep, sepSeq, sepEnd)
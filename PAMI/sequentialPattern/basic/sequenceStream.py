@@ -0,0 +1,354 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Approximate sequential pattern mining over a stream of events, for the streaming sequential miners.
+
+The stream is read lazily, one (session, timestamp, event) tuple at a time, from a file, a URL, a data frame or any
+iterable of lines such as an open socket or a file being tailed. The events of a session are grouped into a sequence,
+the events sharing a timestamp forming one itemset, and the sequence is closed once the stream has moved more than a
+timeout past its last event.
+
+The closed sequences are counted in batches by lossy counting on a prefix tree, a node per pattern, with the batch
+variant of Manku and Motwani:
+
+* a batch is mined once by the pseudo-projections of prefixSpanEngine, guided by the tree. A node of the tree gets the
+  exact support of its pattern in the batch, and a pattern which is not in the tree is added when it is supported by
+  at least epsilon times the size of the batch. The node keeps the sequence from which it is counted, and the patterns
+  before it are bounded by epsilon times their number.
+* over a landmark window, a node is dropped once its count and its bound are at most epsilon times the length of the
+  stream. Over a sliding window of batches, the node keeps its count in every batch of the window, and is dropped once
+  none of them reaches epsilon times the size of its batch, so that a batch where a pattern is not counted always
+  bounds it by epsilon times its size.
+
+A node is only dropped with its children, so the tree stays closed under prefixes. The count of a pattern is never
+above its support in the window, and never below it by more than epsilon times the length of the window, so reporting
+the counts above minSup minus epsilon times that length misses no pattern supported by minSup sequences, as long as
+minSup is above epsilon times that length.
+"""
+
+import heapq as _heapq
+from collections import deque as _deque
+from typing import Any, Hashable, Iterable, Iterator, List, Optional, Tuple
+from urllib.request import urlopen as _urlopen
+
+import pandas as _pd
+import validators as _validators
+
+from PAMI.sequentialPattern.basic import prefixSpanEngine as _prefixSpanEngine
+
+Event = Tuple[Hashable, float, str]
+NamedPattern = Tuple[Tuple[str, ...], ...]
+
+
+def _parseLine(line: Any, sep: str) -> Optional[Event]:
+    """
+    Splits a line of the form session, timestamp and event
+
+    :param line: line of the input, str or bytes
+    :param sep: separator of the fields
+    :type sep: str
+    :return: session, timestamp and event, or None for a blank line
+    :rtype: tuple
+    """
+    if isinstance(line, bytes):
+        line = line.decode("utf-8")
+    fields = [x.strip() for x in line.strip("\r\n").split(sep)]
+    fields = [x for x in fields if x]
+    if not fields:
+        return None
+    return fields[0], float(fields[1]), fields[2]
+
+
+def readEvents(source: Any, sep: str) -> Iterator[Event]:
+    """
+    Reads the events of a stream lazily
+
+    :param source: path or URL of a file, a data frame with the columns Session, Timestamp and Event, or any iterable
+                   of lines in the file format or of (session, timestamp, event) tuples
+    :param sep: separator of the fields of a line
+    :type sep: str
+    :return: session, timestamp and event of every event, in stream order
+    :rtype: Iterator[tuple]
+    """
+    if isinstance(source, _pd.DataFrame):
+        for session, timestamp, event in zip(source['Session'], source['Timestamp'], source['Event']):
+            yield session, float(timestamp), str(event)
+        return
+    if isinstance(source, str):
+        if _validators.url(source):
+            lines = _urlopen(source)
+        else:
+            try:
+                lines = open(source, 'r', encoding='utf-8')
+            except IOError:
+                print("File Not Found")
+                quit()
+        with lines:
+            for line in lines:
+                event = _parseLine(line, sep)
+                if event is not None:
+                    yield event
+        return
+    for line in source:
+        if isinstance(line, (str, bytes)):
+            line = _parseLine(line, sep)
+            if line is None:
+                continue
+        session, timestamp, event = line
+        yield session, float(timestamp), str(event)
+
+
+def sessions(events: Iterable[Event], timeout: float) -> Iterator[List[List[str]]]:
+    """
+    Groups a stream of events into the sequences of their sessions. A sequence is produced as soon as an event more than
+    timeout after its last event is read, and the open sequences are produced at the end of the stream, the ones whose
+    last event is the oldest first.
+
+    :param events: stream of events
+    :type events: Iterable[tuple]
+    :param timeout: largest time between two events of the same sequence
+    :type timeout: float
+    :return: the itemsets of every sequence, the events of an itemset sharing a timestamp
+    :rtype: Iterator[list]
+    """
+    opened = {}
+    expiries = []
+    arrivals = 0
+    for session, timestamp, event in events:
+        while expiries and timestamp - expiries[0][0] > timeout:
+            last, _, key = _heapq.heappop(expiries)
+            if key in opened and opened[key][0][-1] == last:
+                yield [sorted(itemSet) for itemSet in opened.pop(key)[1]]
+        if session not in opened:
+            opened[session] = ([], [])
+        times, itemSets = opened[session]
+        if times and times[-1] == timestamp:
+            itemSets[-1].add(event)
+            continue
+        if times and times[-1] > timestamp:
+            # a late event goes to the itemset of its timestamp, the expiry of the session does not move
+            position = next(i for i, time in enumerate(times) if time >= timestamp)
+            if times[position] == timestamp:
+                itemSets[position].add(event)
+            else:
+                times.insert(position, timestamp)
+                itemSets.insert(position, {event})
+            continue
+        times.append(timestamp)
+        itemSets.append({event})
+        arrivals += 1
+        _heapq.heappush(expiries, (timestamp, arrivals, session))
+    for _, itemSets in sorted(opened.values(), key=lambda state: state[0][-1]):
+        yield [sorted(itemSet) for itemSet in itemSets]
+
+
+def batches(sequences: Iterable[list], batchSize: int) -> Iterator[list]:
+    """
+    Groups a stream of sequences into batches. A batch is produced as soon as its last sequence has been read, and the
+    unfinished last batch is produced at the end of the stream.
+
+    :param sequences: stream of sequences
+    :type sequences: Iterable[list]
+    :param batchSize: number of sequences of a batch
+    :type batchSize: int
+    :return: the batches of the stream
+    :rtype: Iterator[list]
+    """
+    batch = []
+    for sequence in sequences:
+        batch.append(sequence)
+        if len(batch) == batchSize:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class _Node:
+    """
+    A pattern of the tree, counted since the start-th sequence of the stream
+
+    :Attributes:
+
+        count : int
+            Support of the pattern in the batches of the window since it is counted
+        start : int
+            Number of sequences of the stream before the pattern is counted
+        supports : dict
+            Support of the pattern in every batch of a sliding window where it is counted, by batch index
+        children : dict
+            The node of every extension, by item name and whether it extends the last itemset
+    """
+
+    __slots__ = ('count', 'start', 'supports', 'children')
+
+    def __init__(self, start: int) -> None:
+        self.count = 0
+        self.start = start
+        self.supports = {}
+        self.children = {}
+
+
+class LossySequenceTree:
+    """
+    :Description: Prefix tree of the patterns of a stream of sequences, counted in batches by lossy counting over a
+                  landmark or a sliding window.
+
+    :Attributes:
+
+        epsilon : float
+            Largest underestimation of a support, as a fraction of the length of the window
+        windowSize : int or None
+            Number of batches of a sliding window, None for a landmark window
+        maxLength : float
+            The largest number of itemsets of a pattern
+        length : int
+            Number of sequences of the window
+
+    :Methods:
+
+        addBatch(sequences)
+            Counts a batch of sequences, slides the window and drops the rare patterns
+        patterns(minSup)
+            Patterns whose count may reach minSup in the window
+        nodes()
+            Number of patterns of the tree
+    """
+
+    def __init__(self, epsilon: float, windowSize: Optional[int] = None, maxLength: float = float("inf")) -> None:
+        self.epsilon = float(epsilon)
+        self.windowSize = windowSize
+        self.maxLength = maxLength
+        self.length = 0
+        self._root = _Node(0)
+        self._seen = 0
+        self._batches = 0
+        self._sizes = _deque()
+
+    def _windowStart(self) -> int:
+        return self._seen - self.length
+
+    def _bound(self, node: _Node) -> float:
+        return self.epsilon * max(node.start - self._windowStart(), 0)
+
+    def _count(self, node: _Node, support: int) -> None:
+        node.count += support
+        if self.windowSize is not None:
+            node.supports[self._batches] = support
+
+    def _slide(self) -> None:
+        oldest = self._batches - self.windowSize
+        self.length -= self._sizes.popleft()
+        stack = list(self._root.children.values())
+        while stack:
+            node = stack.pop()
+            node.count -= node.supports.pop(oldest, 0)
+            stack.extend(node.children.values())
+
+    def addBatch(self, sequences: List[List[List[Hashable]]]) -> None:
+        """
+        Counts a batch of sequences, slides the window and drops the rare patterns
+
+        :param sequences: the itemsets of every sequence of the batch
+        :type sequences: list
+        """
+        if self.windowSize is not None and len(self._sizes) == self.windowSize:
+            self._slide()
+        store, names = _prefixSpanEngine.fromItemsets(sequences)
+        threshold = max(self.epsilon * len(sequences), 1)
+        start = self._seen
+        self._seen += len(sequences)
+        self.length += len(sequences)
+        self._sizes.append(len(sequences))
+        stack = [(self._root, None, None)]
+        while stack:
+            node, pattern, positions = stack.pop()
+            minSup = 1 if node.children else threshold
+            if pattern is None:
+                extensions = [((names[item], False), ((item,),), projection)
+                              for item, projection in store.firstOccurrences(minSup)]
+            else:
+                sExtensions, iExtensions = store.extensions(positions, pattern[-1], minSup,
+                                                            len(pattern) < self.maxLength)
+                extensions = [((names[item], True), pattern[:-1] + (pattern[-1] + (item,),), projection)
+                              for item, projection in iExtensions.items()]
+                extensions += [((names[item], False), pattern + ((item,),), projection)
+                               for item, projection in sExtensions.items()]
+            for key, extended, projection in extensions:
+                support = store.support(projection)
+                child = node.children.get(key)
+                if child is None:
+                    if support < threshold:
+                        continue
+                    child = node.children[key] = _Node(start)
+                self._count(child, support)
+                stack.append((child, extended, projection))
+        self._batches += 1
+        self._prune()
+
+    def _rare(self, node: _Node) -> bool:
+        if self.windowSize is None:
+            return node.count + self._bound(node) <= self.epsilon * self._seen
+        sizes = list(self._sizes)
+        first = self._batches - len(sizes)
+        return all(support < self.epsilon * sizes[batch - first] for batch, support in node.supports.items())
+
+    def _prune(self) -> None:
+        order = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children.values())
+        for node in reversed(order):
+            node.children = {key: child for key, child in node.children.items()
+                             if child.children or not self._rare(child)}
+
+    def patterns(self, minSup: float) -> Iterator[Tuple[NamedPattern, int]]:
+        """
+        Patterns whose count reaches minSup minus epsilon times the length of the window. When minSup is above epsilon
+        times the length, every pattern supported by minSup sequences of the window is reported, and the count of a
+        pattern is at most its support.
+
+        :param minSup: the minimum support in the window
+        :type minSup: float
+        :return: every reported pattern, as a tuple of itemsets of item names, with its count
+        :rtype: Iterator[tuple]
+        """
+        threshold = minSup - self.epsilon * self.length
+        stack = [(self._root, ())]
+        while stack:
+            node, pattern = stack.pop()
+            for (name, extends), child in node.children.items():
+                extended = pattern[:-1] + (pattern[-1] + (name,),) if extends else pattern + ((name,),)
+                if child.count >= max(threshold, 1):
+                    yield extended, child.count
+                stack.append((child, extended))
+
+    def nodes(self) -> int:
+        """
+        Number of patterns of the tree
+
+        :return: the number of nodes, the root excluded
+        :rtype: int
+        """
+        total = 0
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            total += len(node.children)
+            stack.extend(node.children.values())
+        return total
@@ -0,0 +1,321 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Vertical id-lists for the SPADE family of sequential miners.
+
+The id-list of a pattern is a pair of parallel int64 arrays, the sequence ids (sids) and the itemset positions (eids) of
+the occurrences of its last item, sorted by sid and then by eid. Both joins of SPADE are merges of two sorted arrays:
+
+* the temporal join keeps the occurrences of the second list that follow an occurrence of the first one in the same
+  sequence, optionally within a maximum gap. The closest preceding occurrence of every element is found with a single
+  searchsorted over the (sid, eid) pairs encoded as one integer.
+* the equality join keeps the occurrences common to both lists, found the same way.
+
+The support of an id-list is its number of distinct sids. The bitmap id-lists used by bitSPADE keep one uint64 row per
+sid instead, and join with the S-step transform of the SPAM engine.
+
+ClassSpace is the search over the equivalence classes of SPADE for parallelSearch, where every class is searched on its
+own from the id-lists of its members.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as _np
+
+from PAMI.sequentialPattern.basic import spamEngine as _spamEngine
+
+
+class IdList:
+    """
+    :Description: Occurrences of a pattern as (sid, eid) arrays sorted by sid and eid.
+
+    :Attributes:
+
+        sids : numpy.ndarray
+            Sequence id of every occurrence
+        eids : numpy.ndarray
+            Itemset position of every occurrence in its sequence
+        support : int
+            Number of distinct sequences of the occurrences
+    """
+
+    __slots__ = ('sids', 'eids', 'support')
+
+    def __init__(self, sids: _np.ndarray, eids: _np.ndarray) -> None:
+        self.sids = sids
+        self.eids = eids
+        self.support = int(_np.count_nonzero(sids[1:] != sids[:-1])) + 1 if len(sids) else 0
+
+    def __len__(self) -> int:
+        return len(self.sids)
+
+    def keys(self, width: int) -> _np.ndarray:
+        """
+        Encodes every occurrence as sid * width + eid, which keeps the sort order
+
+        :param width: a bound on the eids
+        :type width: int
+        :return: the encoded occurrences
+        :rtype: numpy.ndarray
+        """
+        return self.sids * width + self.eids
+
+
+def idLists(sequences: Sequence[int], positions: Sequence[int], items: Sequence[int], numberOfItems: int) \
+        -> List[IdList]:
+    """
+    Builds the id-list of every item from the occurrences of a database
+
+    :param sequences: sid of every occurrence
+    :type sequences: list
+    :param positions: eid of every occurrence
+    :type positions: list
+    :param items: item id of every occurrence
+    :type items: list
+    :param numberOfItems: number of item ids
+    :type numberOfItems: int
+    :return: the id-list of every item id, repeated occurrences are kept once
+    :rtype: list
+    """
+    sequences = _np.asarray(sequences, dtype=_np.int64)
+    positions = _np.asarray(positions, dtype=_np.int64)
+    items = _np.asarray(items, dtype=_np.int64)
+    order = _np.lexsort((positions, sequences, items))
+    sequences, positions, items = sequences[order], positions[order], items[order]
+    if len(order):
+        new = _np.ones(len(order), dtype=bool)
+        new[1:] = (items[1:] != items[:-1]) | (sequences[1:] != sequences[:-1]) | (positions[1:] != positions[:-1])
+        sequences, positions, items = sequences[new], positions[new], items[new]
+    bounds = _np.searchsorted(items, _np.arange(numberOfItems + 1))
+    return [IdList(sequences[bounds[i]:bounds[i + 1]], positions[bounds[i]:bounds[i + 1]])
+            for i in range(numberOfItems)]
+
+
+def _width(*lists: IdList) -> int:
+    return max((int(idList.eids.max()) for idList in lists if len(idList)), default=0) + 1
+
+
+def temporalJoin(before: IdList, after: IdList, maxGap: float = float("inf")) -> IdList:
+    """
+    Keeps the occurrences of after which follow an occurrence of before in the same sequence, at most maxGap itemsets
+    later
+
+    :param before: id-list of the earlier pattern
+    :type before: IdList
+    :param after: id-list of the later item
+    :type after: IdList
+    :param maxGap: the largest allowed distance between the two eids
+    :type maxGap: float
+    :return: id-list of the joined pattern
+    :rtype: IdList
+    """
+    if not len(before) or not len(after):
+        return IdList(after.sids[:0], after.eids[:0])
+    width = _width(before, after)
+    preceding = _np.searchsorted(before.keys(width), after.keys(width)) - 1
+    found = preceding >= 0
+    preceding[~found] = 0
+    keep = found & (before.sids[preceding] == after.sids)
+    if maxGap != float("inf"):
+        keep &= after.eids - before.eids[preceding] <= maxGap
+    return IdList(after.sids[keep], after.eids[keep])
+
+
+def equalityJoin(first: IdList, second: IdList) -> IdList:
+    """
+    Keeps the occurrences shared by two id-lists, i.e., the itemsets containing the last items of both
+
+    :param first: an id-list
+    :type first: IdList
+    :param second: an id-list
+    :type second: IdList
+    :return: id-list of the joined pattern
+    :rtype: IdList
+    """
+    if not len(first) or not len(second):
+        return IdList(first.sids[:0], first.eids[:0])
+    width = _width(first, second)
+    keys = second.keys(width)
+    positions = _np.minimum(_np.searchsorted(keys, first.keys(width)), len(keys) - 1)
+    keep = keys[positions] == first.keys(width)
+    return IdList(first.sids[keep], first.eids[keep])
+
+
+class BitmapIdList:
+    """
+    :Description: Occurrences of a pattern as one uint64 bitmap row per sequence, the bits being the eids.
+
+    :Attributes:
+
+        sids : numpy.ndarray
+            Id of every sequence containing the pattern, in increasing order
+        bits : numpy.ndarray
+            Bitmap row of every sequence
+        support : int
+            Number of sequences containing the pattern
+    """
+
+    __slots__ = ('sids', 'bits', 'support')
+
+    def __init__(self, sids: _np.ndarray, bits: _np.ndarray) -> None:
+        self.sids = sids
+        self.bits = bits
+        self.support = len(sids)
+
+    def __len__(self) -> int:
+        return self.support
+
+    @classmethod
+    def fromIdList(cls, idList: IdList, words: int) -> 'BitmapIdList':
+        """
+        Packs an id-list into bitmap rows
+
+        :param idList: the id-list
+        :type idList: IdList
+        :param words: number of uint64 words of a row
+        :type words: int
+        :return: the bitmap id-list
+        :rtype: BitmapIdList
+        """
+        sids, rows = _np.unique(idList.sids, return_inverse=True)
+        bits = _np.zeros((len(sids), words), dtype=_np.uint64)
+        _np.bitwise_or.at(bits, (rows, idList.eids >> 6),
+                          _np.left_shift(_np.uint64(1), (idList.eids & 63).astype(_np.uint64)))
+        return cls(sids, bits)
+
+
+def _bitmapJoin(firstSids: _np.ndarray, firstBits: _np.ndarray, second: BitmapIdList) -> BitmapIdList:
+    sids, inFirst, inSecond = _np.intersect1d(firstSids, second.sids, assume_unique=True, return_indices=True)
+    bits = firstBits[inFirst] & second.bits[inSecond]
+    keep = bits.any(axis=1)
+    return BitmapIdList(sids[keep], bits[keep])
+
+
+def bitmapTemporalJoin(before: BitmapIdList, after: BitmapIdList) -> BitmapIdList:
+    """
+    Keeps the occurrences of after which follow the first occurrence of before in the same sequence
+
+    :param before: bitmap id-list of the earlier pattern
+    :type before: BitmapIdList
+    :param after: bitmap id-list of the later item
+    :type after: BitmapIdList
+    :return: bitmap id-list of the joined pattern
+    :rtype: BitmapIdList
+    """
+    return _bitmapJoin(before.sids, _spamEngine.sStep(before.bits), after)
+
+
+def bitmapEqualityJoin(first: BitmapIdList, second: BitmapIdList) -> BitmapIdList:
+    """
+    Keeps the occurrences shared by two bitmap id-lists
+
+    :param first: a bitmap id-list
+    :type first: BitmapIdList
+    :param second: a bitmap id-list
+    :type second: BitmapIdList
+    :return: bitmap id-list of the joined pattern
+    :rtype: BitmapIdList
+    """
+    return _bitmapJoin(first.sids, first.bits, second)
+
+
+class ClassSpace:
+    """
+    :Description: Search space of SPADE over equivalence classes for parallelSearch. An atom is a pattern, as a tuple of
+                  itemsets of item ids, whether its last item was added to the last itemset of its prefix, and its
+                  id-list. A task is an atom with the atoms of its class, or the key of a class kept by the space. The
+                  classes split by the main process are kept by the space, so that the workers inherit them instead of
+                  receiving a copy with every task.
+
+    :Attributes:
+
+        minSup : int
+            The minimum support of a pattern
+
+    :Methods:
+
+        roots()
+            Tasks of the frequent items
+        expand(task)
+            Frequent patterns of the class of an atom and their tasks
+        split(task)
+            Same as expand, the class is kept by the space
+        weight(task)
+            Number of occurrences to join for the class of an atom
+    """
+
+    def __init__(self, lists: Dict[int, IdList], minSup: int) -> None:
+        self.minSup = minSup
+        self._classes = {0: [(((item,),), False, lists[item]) for item in sorted(lists)]}
+
+    def roots(self) -> List[tuple]:
+        """
+        Tasks of the frequent items
+
+        :return: the task of every frequent item, by item id
+        :rtype: list
+        """
+        return [(atom, 0) for atom in self._classes[0]]
+
+    def _members(self, task: tuple) -> list:
+        members = task[1]
+        return self._classes[members] if isinstance(members, int) else members
+
+    def expand(self, task: tuple) -> Tuple[List[tuple], List[tuple]]:
+        """
+        Frequent patterns of the class of an atom, joined from the atom and the atoms of its own class
+
+        :param task: the atom and the atoms of its class
+        :type task: tuple
+        :return: the patterns with their supports, and their tasks
+        :rtype: tuple
+        """
+        pattern, isItemSetAtom, idList = task[0]
+        last = pattern[-1][-1]
+        members = []
+        for other, otherIsItemSetAtom, otherIdList in self._members(task):
+            item = other[-1][-1]
+            if not otherIsItemSetAtom:
+                members.append((pattern + ((item,),), False, temporalJoin(idList, otherIdList)))
+            if last < item and isItemSetAtom == otherIsItemSetAtom:
+                members.append((pattern[:-1] + (pattern[-1] + (item,),), True, equalityJoin(idList, otherIdList)))
+        members = [atom for atom in members if atom[2].support >= self.minSup]
+        return [(atom[0], atom[2].support) for atom in members], [(atom, members) for atom in members]
+
+    def split(self, task: tuple) -> Tuple[List[tuple], List[tuple]]:
+        """
+        Same as expand, the new class is kept by the space and the tasks only refer to it
+
+        :param task: the atom and the atoms of its class
+        :type task: tuple
+        :return: the patterns with their supports, and their tasks
+        :rtype: tuple
+        """
+        patterns, children = self.expand(task)
+        key = len(self._classes)
+        self._classes[key] = [atom for atom, _ in children]
+        return patterns, [(atom, key) for atom, _ in children]
+
+    def weight(self, task: tuple) -> int:
+        """
+        Number of occurrences to join for the class of an atom
+
+        :param task: the atom and the atoms of its class
+        :type task: tuple
+        :return: the weight of the task
+        :rtype: int
+        """
+        return len(task[0][2]) * len(self._members(task))
@@ -0,0 +1,263 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Vertical bitmaps for the SPAM family of sequential miners.
+
+The bitmap of an item has one row per sequence and one bit per itemset of the sequence, packed into uint64 words: the
+itemset at position p of a sequence is bit p % 64 of word p // 64 of its row. The items of the database are integer ids,
+and all the item bitmaps are stacked into a single (items x sequences x words) array.
+
+The bitmap of a pattern only keeps the rows of the sequences containing it, together with the ids of these sequences.
+Extending a pattern ANDs its bitmap, or its S-step transform for a sequence extension, with the matching rows of the
+bitmaps of all the candidate items at once, in batches that bound the memory of the intermediate array. The support of
+every candidate is the number of non-zero rows of its result.
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as _np
+
+_ones = _np.uint64(0xFFFFFFFFFFFFFFFF)
+_one = _np.uint64(1)
+_batchSize = 1 << 22
+
+Bitmap = Tuple[_np.ndarray, _np.ndarray]
+
+
+def sStep(bits: _np.ndarray) -> _np.ndarray:
+    """
+    S-step transform of the rows of a bitmap: in every row the lowest set bit and the bits below it are cleared and all
+    the bits above it are set, so that the result marks the itemsets following the first occurrence of the pattern.
+
+    :param bits: rows of a bitmap, one uint64 word per column
+    :type bits: numpy.ndarray
+    :return: the transformed rows, rows without any set bit stay empty
+    :rtype: numpy.ndarray
+    """
+    nonzero = bits != 0
+    first = nonzero.argmax(axis=1)
+    rows = _np.arange(len(bits))
+    word = bits[rows, first]
+    lowest = word & (~word + _one)
+    result = _np.where(_np.arange(bits.shape[1]) > first[:, None], _ones, _np.uint64(0))
+    result[rows, first] = ~(lowest | (lowest - _one))
+    result[~nonzero.any(axis=1)] = 0
+    return result
+
+
+class BitmapIndex:
+    """
+    :Description: Bitmaps of the frequent items of a sequence database.
+
+    :Attributes:
+
+        items : numpy.ndarray
+            Id of every frequent item, in increasing order
+        supports : numpy.ndarray
+            Support of every frequent item
+        words : int
+            Number of uint64 words of a row
+
+    :Methods:
+
+        bitmap(rank)
+            Bitmap of the frequent item of a rank
+        sExtensions(bitmap, candidates)
+            Frequent sequence extensions of a pattern
+        iExtensions(bitmap, candidates)
+            Frequent itemset extensions of a pattern
+
+    **Sample run of the importing code:**
+    ----------------------------------------
+    .. code-block:: python
+
+            from PAMI.sequentialPattern.basic import spamEngine as _spamEngine
+
+            # sequences <(0 1) 2> and <0 2>, given as sequence, itemset position and item of every occurrence
+
+            index = _spamEngine.BitmapIndex([0, 0, 0, 1, 1], [0, 0, 1, 0, 1], [0, 1, 2, 0, 2], 2, 2)
+
+            for rank, bitmap, support in index.sExtensions(index.bitmap(0), range(len(index.items))):
+
+                print(index.items[rank], support)
+    """
+
+    def __init__(self, sequences: Sequence[int], positions: Sequence[int], items: Sequence[int],
+                 numberOfSequences: int, minSup: float) -> None:
+        sequences = _np.asarray(sequences, dtype=_np.int64)
+        positions = _np.asarray(positions, dtype=_np.int64)
+        items = _np.asarray(items, dtype=_np.int64)
+        self._minSup = minSup
+        self.words = int(positions.max()) // 64 + 1 if len(positions) else 1
+        pairs = _np.unique(items * max(numberOfSequences, 1) + sequences)
+        ids, supports = _np.unique(pairs // max(numberOfSequences, 1), return_counts=True)
+        frequent = supports >= minSup
+        self.items = ids[frequent]
+        self.supports = supports[frequent]
+        rank = _np.full(int(ids[-1]) + 1 if len(ids) else 0, -1, dtype=_np.int64)
+        rank[self.items] = _np.arange(len(self.items))
+        ranks = rank[items] if len(items) else items
+        kept = ranks >= 0
+        self._bitmaps = _np.zeros((len(self.items), numberOfSequences, self.words), dtype=_np.uint64)
+        _np.bitwise_or.at(self._bitmaps, (ranks[kept], sequences[kept], positions[kept] >> 6),
+                          _np.left_shift(_one, (positions[kept] & 63).astype(_np.uint64)))
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def bitmap(self, rank: int) -> Bitmap:
+        """
+        Returns the bitmap of a frequent item
+
+        :param rank: position of the item in items
+        :type rank: int
+        :return: ids of the sequences containing the item and their rows
+        :rtype: tuple
+        """
+        bits = self._bitmaps[rank]
+        sequences = _np.flatnonzero(bits.any(axis=1))
+        return sequences, bits[sequences]
+
+    def _extend(self, sequences: _np.ndarray, bits: _np.ndarray, candidates: Sequence[int]) \
+            -> List[Tuple[int, Bitmap, int]]:
+        """
+        ANDs rows with the same rows of the bitmaps of the candidates, and keeps the frequent results
+
+        :param sequences: ids of the rows
+        :type sequences: numpy.ndarray
+        :param bits: the rows
+        :type bits: numpy.ndarray
+        :param candidates: ranks of the candidate items
+        :type candidates: list
+        :return: rank, bitmap and support of every frequent result, in the order of the candidates
+        :rtype: list
+        """
+        result = []
+        candidates = _np.asarray(candidates, dtype=_np.int64)
+        if len(sequences) < self._minSup or not len(candidates):
+            return result
+        step = max(1, _batchSize // (len(sequences) * self.words))
+        for begin in range(0, len(candidates), step):
+            batch = candidates[begin:begin + step]
+            joined = self._bitmaps[batch[:, None], sequences] & bits
+            nonzero = joined.any(axis=2)
+            supports = nonzero.sum(axis=1)
+            for k in _np.flatnonzero(supports >= self._minSup).tolist():
+                keep = nonzero[k]
+                result.append((int(batch[k]), (sequences[keep], joined[k][keep]), int(supports[k])))
+        return result
+
+    def sExtensions(self, bitmap: Bitmap, candidates: Sequence[int]) -> List[Tuple[int, Bitmap, int]]:
+        """
+        Finds the frequent sequence extensions of a pattern, i.e., the candidate items occurring in a later itemset than
+        the end of the first occurrence of the pattern
+
+        :param bitmap: bitmap of the pattern
+        :type bitmap: tuple
+        :param candidates: ranks of the candidate items
+        :type candidates: list
+        :return: rank, bitmap of the extended pattern and support of every frequent extension
+        :rtype: list
+        """
+        sequences, bits = bitmap
+        transformed = sStep(bits)
+        keep = transformed.any(axis=1)
+        return self._extend(sequences[keep], transformed[keep], candidates)
+
+    def iExtensions(self, bitmap: Bitmap, candidates: Sequence[int]) -> List[Tuple[int, Bitmap, int]]:
+        """
+        Finds the frequent itemset extensions of a pattern, i.e., the candidate items occurring in the last itemset of
+        the pattern
+
+        :param bitmap: bitmap of the pattern
+        :type bitmap: tuple
+        :param candidates: ranks of the candidate items
+        :type candidates: list
+        :return: rank, bitmap of the extended pattern and support of every frequent extension
+        :rtype: list
+        """
+        sequences, bits = bitmap
+        return self._extend(sequences, bits, candidates)
+
+
+class SubtreeSpace:
+    """
+    :Description: Search space of SPAM for parallelSearch. A task is a pattern of ranks, its bitmap and the ranks of the
+                  candidates of its sequence and itemset extensions, as in the depth-first pruning of SPAM.
+
+    :Attributes:
+
+        index : BitmapIndex
+            The bitmaps of the frequent items
+
+    :Methods:
+
+        roots()
+            Tasks of the frequent items
+        expand(task)
+            Frequent extensions of a pattern and their tasks
+        weight(task)
+            Number of rows to join for the extensions of a pattern
+    """
+
+    def __init__(self, index: BitmapIndex) -> None:
+        self.index = index
+
+    def roots(self) -> List[tuple]:
+        """
+        Tasks of the frequent items
+
+        :return: the task of every frequent item, in the order of the ranks
+        :rtype: list
+        """
+        ranks = list(range(len(self.index)))
+        return [(((rank,),), self.index.bitmap(rank), ranks, ranks[rank + 1:]) for rank in ranks]
+
+    def expand(self, task: tuple) -> Tuple[List[tuple], List[tuple]]:
+        """
+        Frequent extensions of a pattern. The sequence extensions are the candidates of the sequence extensions of
+        their children, and the larger itemset extensions are the candidates of the itemset extensions.
+
+        :param task: the pattern, its bitmap and its candidates
+        :type task: tuple
+        :return: the extended patterns with their supports, and their tasks
+        :rtype: tuple
+        """
+        pattern, bitmap, sStep, iStep = task
+        sNext = self.index.sExtensions(bitmap, sStep)
+        sItems = [rank for rank, _, _ in sNext]
+        iNext = self.index.iExtensions(bitmap, iStep)
+        iItems = [rank for rank, _, _ in iNext]
+        patterns, children = [], []
+        for rank, nextBitmap, support in sNext:
+            patterns.append((pattern + ((rank,),), support))
+            children.append((pattern + ((rank,),), nextBitmap, sItems, [k for k in sItems if rank < k]))
+        for rank, nextBitmap, support in iNext:
+            patterns.append((pattern[:-1] + (pattern[-1] + (rank,),), support))
+            children.append((pattern[:-1] + (pattern[-1] + (rank,),), nextBitmap, sItems,
+                             [k for k in iItems if rank < k]))
+        return patterns, children
+
+    def weight(self, task: tuple) -> int:
+        """
+        Number of rows to join for the extensions of a pattern
+
+        :param task: the pattern, its bitmap and its candidates
+        :type task: tuple
+        :return: the weight of the task
+        :rtype: int
+        """
+        return len(task[1][0]) * (len(task[2]) + len(task[3]))
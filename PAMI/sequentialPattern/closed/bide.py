@@ -0,0 +1,370 @@
+# BIDE is an algorithm to discover closed sequential patterns in a sequence database. A sequential pattern is closed if no
+# pattern containing it has the same support. This algorithm checks the closure of a pattern with its forward and
+# backward extensions, without keeping the patterns found so far, and prunes the prefixes without closed extensions.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.sequentialPattern.closed import bide as alg
+#
+#             iFile = 'sampleDB.txt'
+#
+#             minSup = 10  # can also be specified between 0 and 1
+#
+#             obj = alg.bide(iFile, minSup)
+#
+#             obj.mine()
+#
+#             closedPatterns = obj.getPatterns()
+#
+#             print("Total number of Closed Sequential Patterns:", len(closedPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternsAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import re
+from deprecated import deprecated
+
+from PAMI.sequentialPattern.basic import parallelSearch as _parallelSearch
+from PAMI.sequentialPattern.basic import prefixSpanEngine as _prefixSpanEngine
+from PAMI.sequentialPattern.basic import sequenceDatabase as _sequenceDatabase
+from PAMI.sequentialPattern.closed import abstract as _ab
+from PAMI.sequentialPattern.closed import bideEngine as _bideEngine
+
+
+class bide(_ab._frequentPatterns):
+    """
+    :Description:
+        * BIDE is an algorithm to discover closed sequential patterns in a sequence database.
+        * It grows the patterns depth-first over the pseudo-projections of PrefixSpan, and decides whether a pattern is
+          closed from its forward extensions, found by the growth, and its backward extensions, found in the maximum
+          periods of its supporting sequences.
+        * The BackScan pruning drops a prefix when an item can be inserted in it in all its supporting sequences, as none
+          of its extensions is closed then.
+
+    :Reference:   J. Wang, J. Han: BIDE: Efficient Mining of Frequent Closed Sequences. ICDE 2004: 79-90
+
+    :param  iFile: str :
+                   Name of the Input file to mine complete set of closed sequential patterns
+    :param  minSup: float or int or str :
+                    minSup measure constraints the minimum number of sequences in a database where a pattern must appear
+                    Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in an itemset. The default seperator is tab space. However, the users can override their default separator.
+    :param  workers: int :
+                   The number of worker processes mining the first-item projections. With one worker the mining runs in the main process.
+
+    :Attributes:
+
+        iFile : str
+            Input file name or path of the input file, or a sequenceDatabase.SequenceDatabase. In the text format the
+            itemsets are ended by -1 and the sequences by -2
+        oFile : str
+            Name of the output file or the path of output file
+        minSup : float or int or str
+            The user can specify minSup either in count or proportion of database size.
+            If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
+            Otherwise, it will be treated as float.
+            Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
+        sep : str
+            This variable is used to distinguish items from one another in an itemset. The default seperator is tab space or \\t.
+            However, the users can override their default separator.
+        startTime : float
+            To record the start time of the mining process
+        endTime : float
+            To record the completion time of the mining process
+        finalPatterns : dict
+            Storing the complete set of patterns in a dictionary variable
+        memoryUSS : float
+            To store the total amount of USS memory consumed by the program
+        memoryRSS : float
+            To store the total amount of RSS memory consumed by the program
+        Database : sequenceDatabase.SequenceDatabase
+            To store the sequences of the database
+        _names : list
+            the name of every item, by item id
+        _workers : int
+            the number of worker processes
+
+    :Methods:
+
+        mine()
+            Mining process will start from here
+        getPatterns()
+            Complete set of patterns will be retrieved with this function
+        save(oFile)
+            Complete set of closed patterns will be loaded in to a output file
+        getPatternsAsDataFrame()
+            Complete set of closed patterns will be loaded in to a dataframe
+        getMemoryUSS()
+            Total amount of USS memory consumed by the mining process will be retrieved from this function
+        getMemoryRSS()
+            Total amount of RSS memory consumed by the mining process will be retrieved from this function
+        getRuntime()
+            Total amount of runtime taken by the mining process will be retrieved from this function
+
+    **Methods to execute code on terminal**
+    ------------------------------------------
+    .. code-block:: console
+
+
+       Format:
+
+       (.venv) $ python3 bide.py <inputFile> <outputFile> <minSup>
+
+       Example usage:
+
+       (.venv) $ python3 bide.py sampleDB.txt patterns.txt 10
+
+
+               .. note:: minSup will be considered in support count or frequency
+
+
+    **Importing this algorithm into a python program**
+    -----------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.sequentialPattern.closed import bide as alg
+
+            obj = alg.bide(iFile, minSup)
+
+            obj.mine()
+
+            closedPatterns = obj.getPatterns()
+
+            print("Total number of Closed Sequential Patterns:", len(closedPatterns))
+
+            obj.save(oFile)
+
+            Df = obj.getPatternsAsDataFrame()
+
+            memUSS = obj.getMemoryUSS()
+
+            print("Total Memory in USS:", memUSS)
+
+            memRSS = obj.getMemoryRSS()
+
+            print("Total Memory in RSS", memRSS)
+
+            run = obj.getRuntime()
+
+            print("Total ExecutionTime in seconds:", run)
+    """
+
+    _minSup = float()
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _memoryUSS = float()
+    _memoryRSS = float()
+    _Database = []
+    _names = []
+    _workers = 1
+
+    def __init__(self, iFile, minSup, sep="\t", workers=1):
+        super().__init__(iFile, minSup, sep)
+        self._workers = int(workers)
+
+    def _convert(self, value):
+        """
+        To convert the user specified minSup value
+
+        :param value: user specified minSup value
+        :return: converted type
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (len(self._Database) * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (len(self._Database) * value)
+            else:
+                value = int(value)
+        return value
+
+    def _patternName(self, pattern):
+        """
+        To convert a pattern of item ids to the pattern of item names
+
+        :param pattern: the pattern as a tuple of itemsets of item ids
+        :return: the pattern as it is stored in the final patterns, in the format of PrefixSpan
+        :rtype: str
+        """
+        row = []
+        for itemSet in pattern:
+            row.extend(self._names[i] for i in itemSet)
+            row.append(":")
+        return str(row)
+
+    def _savePattern(self, pattern, support):
+        """
+        To store a closed pattern found by the search
+
+        :param pattern: the pattern as a tuple of itemsets of item ids
+        :param support: the support of the pattern
+        """
+        self._finalPatterns[self._patternName(pattern)] = support
+
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
+    def startMine(self):
+        """
+        Closed sequential pattern mining process will start from here
+        """
+        self.mine()
+
+    def mine(self):
+        """
+        Closed sequential pattern mining process will start from here
+        """
+        self._finalPatterns = {}
+        self._startTime = _ab._time.time()
+        self._Database = _sequenceDatabase.load(self._iFile, self._sep)
+        self._minSup = self._convert(self._minSup)
+        self._names = list(self._Database.names)
+        sequences, positions, items = self._Database.occurrences()
+        store = _prefixSpanEngine.SequenceStore.fromOccurrences(sequences, positions, items, len(self._names),
+                                                                len(self._Database))
+        space = _bideEngine.ClosedSpace(store, self._minSup)
+        roots = space.roots()
+        for node in roots:
+            for pattern, support in node.closedPatterns():
+                self._savePattern(pattern, support)
+        _parallelSearch.search(space, roots, self._savePattern, self._workers)
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Closed sequential patterns were generated successfully using BIDE algorithm ")
+
+    def getMemoryUSS(self):
+        """
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryUSS
+
+    def getMemoryRSS(self):
+        """
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryRSS
+
+    def getRuntime(self):
+        """
+        Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self):
+        """
+        Storing final closed patterns in a dataframe
+
+        :return: returning closed patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+
+        data = []
+        for a, b in self._finalPatterns.items():
+            data.append([a, b])
+        return _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
+
+    def save(self, outFile):
+        """
+        Complete set of closed patterns will be loaded in to an output file
+
+        :param outFile: name of the output file
+        :type outFile: csv file
+        """
+        self._oFile = outFile
+        with open(self._oFile, 'w+') as writer:
+            for x, y in self._finalPatterns.items():
+                pattern = ""
+                x = re.sub("[\\['\\]]", "", x)
+                for i in x.split(","):
+                    pattern = pattern + "\t" + str(i)
+                writer.write("%s \n" % (pattern + str(y)))
+
+    def getPatterns(self):
+        """
+        Function to send the set of closed patterns after completion of the mining process
+
+        :return: returning closed patterns
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def printResults(self):
+        """
+        This function is used to print the results
+        """
+        print("Total number of Closed Sequential Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:", self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 4 or len(_ab._sys.argv) == 5:
+        if len(_ab._sys.argv) == 5:
+            _ap = bide(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
+        if len(_ab._sys.argv) == 4:
+            _ap = bide(_ab._sys.argv[1], _ab._sys.argv[3])
+        _ap.mine()
+        _Patterns = _ap.getPatterns()
+        print("Total number of Closed Sequential Patterns:", len(_Patterns))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
@@ -0,0 +1,783 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Bi-directional extension checking for the BIDE closed sequential miner.
+
+The search is the depth-first PrefixSpan over pseudo-projections: a prefix is kept as the itemsets of its instances in
+its supporting sequences, one row per sequence. A pattern is closed when no pattern with one more item has the same
+support, which BIDE decides without keeping the patterns found so far:
+
+* a forward extension appends an item to the pattern, as a new last itemset or in its last itemset. Its support is the
+  one of a child of the prefix, which the search computes anyway.
+* a backward extension inserts an item anywhere else. An item can be inserted before the j-th itemset of a pattern
+  in every supporting sequence iff it occurs between the (j - 1)-th itemset of the first instance of the pattern and the
+  j-th itemset of its last instance, the maximum period, and it can be added to the j-th itemset iff an itemset
+  containing both occurs between the (j - 1)-th itemset of the first instance and the (j + 1)-th itemset of the last.
+
+BackScan prunes a prefix with the same tests on the semi-maximum periods, which end at the itemsets of the last
+instance of the prefix ending at its first instance: such an item can be inserted in every extension of the prefix
+too, so that none of them is closed.
+
+The instances are read from two arrays over the itemsets of the database and the frequent items: the last itemset at or
+before every itemset of its sequence containing every item, and the next one at or after it. Every search step is then
+a gather of these arrays at the itemsets of a projection, for all the rows and all the items at once:
+
+* the sequence extensions of a prefix are the next itemsets of every item after the last itemset of its first
+  instance, and the itemset extensions follow the next itemsets of the items of the last itemset until they meet.
+  Only the items extending the parent are candidates, as an extension of a child extends its parent too.
+* an item occurs in a period iff its last itemset before the end of the period is after its start. The candidate items
+  of all the periods are checked on growing batches of rows, so that most of them are dropped on the first rows.
+* the instances and the periods of a prefix are computed once and handed to its children, which start from them and
+  walk back from their new last itemset until they meet the instances of the parent.
+
+A child supported by the sequences of its parent whose semi-maximum periods did not move has no item in them, as
+BackScan would have pruned the parent, and it only scans its new periods.
+
+The children of all the prefixes of a node by the same kind of extension are computed together, and they are the next
+node, so that the work of a step does not depend on the number of prefixes. On top of it:
+
+* the maximum periods of a child are checked first, and its semi-maximum ones only for the items found in them, as a
+  semi-maximum period is in the maximum one. A child with a forward extension of the same support is not closed, and
+  it only checks its semi-maximum periods.
+* a child without frequent extensions is not pruned, as it has no children, and the maximum periods alone decide if
+  it is closed.
+* the itemset extensions of the items give the pairs of items occurring in an itemset in enough sequences, and only
+  these pairs extend an itemset.
+* the sequences containing every item are kept as bitsets, and a candidate item of a period must occur in every
+  supporting sequence of the child.
+"""
+
+import functools as _functools
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as _np
+
+from PAMI.sequentialPattern.basic import parallelSearch as _parallelSearch
+from PAMI.sequentialPattern.basic import prefixSpanEngine as _prefixSpanEngine
+
+Pattern = Tuple[Tuple[int, ...], ...]
+
+
+def _padded(itemSets: Sequence[Sequence[int]], padding: int, width: int = 0) -> _np.ndarray:
+    width = max([width] + [len(itemSet) for itemSet in itemSets])
+    padded = _np.full((len(itemSets), width), padding, dtype=_np.int64)
+    for row, itemSet in enumerate(itemSets):
+        padded[row, :len(itemSet)] = itemSet
+    return padded
+
+
+class InstanceIndex:
+    """
+    :Description: Last and next itemsets containing every frequent item of a sequence database. The itemsets are
+                  numbered in the order of the store, and an array holds one row per itemset and one column per
+                  frequent item.
+
+    :Attributes:
+
+        store : SequenceStore
+            The sequence database
+        columns : numpy.ndarray
+            Item id of every column
+        padding : int
+            The column after the ones of the items, which every itemset contains
+        supports : numpy.ndarray
+            Number of sequences containing the item of every column
+        sequenceStarts : numpy.ndarray
+            First itemset of the sequence of every itemset
+        sequenceEnds : numpy.ndarray
+            Itemset following the sequence of every itemset
+        firstItemsets : numpy.ndarray
+            First itemset of every non-empty sequence
+        sequences : numpy.ndarray
+            Number of the sequence of every itemset among the non-empty ones
+        containing : numpy.ndarray
+            Sequences containing the item of every column, packed in bits, one row per column
+        lasts : numpy.ndarray
+            Last itemset at or before every itemset in its sequence containing every column, -1 for none. The extra
+            last row is -1, so that the itemset -1 contains nothing.
+        nexts : numpy.ndarray
+            Next itemset at or after every itemset in its sequence containing every column, the number of itemsets for
+            none. The extra last row holds the number of itemsets.
+
+    :Methods:
+
+        columnOf(item)
+            Column of a frequent item
+        lastAt(itemsets, columns)
+            Last itemsets at or before some itemsets containing some columns
+        nextAt(itemsets, columns)
+            Next itemsets at or after some itemsets containing some columns
+        lastContaining(upper, columns)
+            Last itemsets before some itemsets containing some columns
+        lastInstances(upper, itemSet)
+            Last itemsets before some itemsets containing an itemset
+        nextContaining(lower, columns)
+            Next itemsets at or after some itemsets containing some columns
+        pairFirsts(minSup)
+            First itemset of every sequence containing every frequent pair of columns
+    """
+
+    __slots__ = ('store', 'columns', 'padding', 'supports', 'sequenceStarts', 'sequenceEnds', 'firstItemsets',
+                 'sequences', 'containing', 'lasts', 'nexts', '_columnOf', '_lasts', '_nexts', '_occurrences', '_itemsets')
+
+    def __init__(self, store: _prefixSpanEngine.SequenceStore, minSup: float) -> None:
+        self.store = store
+        size = len(store)
+        self.columns = _np.flatnonzero(store.supports >= minSup)
+        self.padding = len(self.columns)
+        self.supports = store.supports[self.columns]
+        self._columnOf = _np.full(store.numberOfItems, -1, dtype=_np.int64)
+        self._columnOf[self.columns] = _np.arange(len(self.columns))
+        newItemset = _np.ones(size, dtype=bool)
+        newItemset[1:] = (store.sids[1:] != store.sids[:-1]) | (store.eids[1:] != store.eids[:-1])
+        itemsets = _np.cumsum(newItemset) - 1
+        count = int(itemsets[-1]) + 1 if size else 0
+        sids = store.sids[newItemset]
+        newSequence = _np.ones(count, dtype=bool)
+        newSequence[1:] = sids[1:] != sids[:-1]
+        self.firstItemsets = _np.flatnonzero(newSequence)
+        self.sequences = _np.cumsum(newSequence) - 1
+        self.sequenceStarts = self.firstItemsets[self.sequences]
+        self.sequenceEnds = _np.append(self.firstItemsets[1:], count)[self.sequences]
+        dtype = _np.int32 if (count + 1) * (self.padding + 1) < 2 ** 31 else _np.int64
+        occurrences = self._columnOf[store.items]
+        self.lasts = _np.full((count + 1, self.padding + 1), -1, dtype=dtype)
+        self.lasts[itemsets, occurrences] = itemsets
+        _np.maximum.accumulate(self.lasts[:count], axis=0, out=self.lasts[:count])
+        self.lasts[:count][self.lasts[:count] < self.sequenceStarts[:, None]] = -1
+        self.lasts[:count, self.padding] = _np.arange(count)
+        self.nexts = _np.full((count + 1, self.padding + 1), count, dtype=dtype)
+        self.nexts[itemsets, occurrences] = itemsets
+        reverse = self.nexts[count - 1::-1] if count else self.nexts[:0]
+        _np.minimum.accumulate(reverse, axis=0, out=reverse)
+        self.nexts[:count][self.nexts[:count] >= self.sequenceEnds[:, None]] = count
+        self.nexts[:count, self.padding] = _np.arange(count)
+        self._lasts, self._nexts = self.lasts.ravel(), self.nexts.ravel()
+        frequent = occurrences >= 0
+        self._occurrences, self._itemsets = occurrences[frequent], itemsets[frequent]
+        containing = _np.zeros((self.padding, len(self.firstItemsets)), dtype=bool)
+        containing[self._occurrences, self.sequences[self._itemsets]] = True
+        self.containing = _np.packbits(containing, axis=1)
+
+    def __len__(self) -> int:
+        return len(self.lasts) - 1
+
+    def columnOf(self, item: int) -> int:
+        """
+        Column of a frequent item
+
+        :param item: the item id
+        :type item: int
+        :return: the column of the item
+        :rtype: int
+        """
+        return int(self._columnOf[item])
+
+    def lastAt(self, itemsets: _np.ndarray, columns: _np.ndarray) -> _np.ndarray:
+        """
+        Last itemsets at or before some itemsets containing some columns, gathered from the flat array
+
+        :param itemsets: the itemsets, -1 for none
+        :type itemsets: numpy.ndarray
+        :param columns: the column of every itemset
+        :type columns: numpy.ndarray
+        :return: the entries of lasts
+        :rtype: numpy.ndarray
+        """
+        return _np.take(self._lasts, itemsets * (self.padding + 1) + columns)
+
+    def nextAt(self, itemsets: _np.ndarray, columns: _np.ndarray) -> _np.ndarray:
+        """
+        Next itemsets at or after some itemsets containing some columns, gathered from the flat array
+
+        :param itemsets: the itemsets, the number of itemsets for none
+        :type itemsets: numpy.ndarray
+        :param columns: the column of every itemset
+        :type columns: numpy.ndarray
+        :return: the entries of nexts
+        :rtype: numpy.ndarray
+        """
+        return _np.take(self._nexts, itemsets * (self.padding + 1) + columns)
+
+    def lastContaining(self, upper: _np.ndarray, columns: _np.ndarray) -> _np.ndarray:
+        """
+        Last itemsets before some itemsets containing some columns, in the sequences of these itemsets
+
+        :param upper: itemset every itemset found must be before
+        :type upper: numpy.ndarray
+        :param columns: columns every itemset found must contain, one row per itemset, padded with the padding column
+        :type columns: numpy.ndarray
+        :return: the last itemset before every upper itemset containing its columns, below its sequence for none
+        :rtype: numpy.ndarray
+        """
+        found = _np.asarray(upper, dtype=_np.int64) - 1
+        if columns.shape[1] == 1:
+            return self.lastAt(found, columns[:, 0]).astype(_np.int64)
+        pending = _np.arange(len(found))
+        while len(pending):
+            current = found[pending]
+            update = current
+            for column in columns[pending].T:
+                update = self.lastAt(update, column)
+            moved = update != current
+            found[pending] = update
+            pending = pending[moved]
+        return found
+
+    def lastInstances(self, upper: _np.ndarray, itemSet: Sequence[int]) -> _np.ndarray:
+        """
+        Last itemsets before some itemsets containing an itemset, in the sequences of these itemsets
+
+        :param upper: itemset every itemset found must be before
+        :type upper: numpy.ndarray
+        :param itemSet: columns every itemset found must contain
+        :type itemSet: tuple
+        :return: the last itemset before every upper itemset containing the itemset, below its sequence for none
+        :rtype: numpy.ndarray
+        """
+        found = _np.asarray(upper, dtype=_np.int64) - 1
+        if len(itemSet) == 1:
+            return self.lastAt(found, itemSet[0]).astype(_np.int64)
+        pending = _np.arange(len(found))
+        while len(pending):
+            current = found[pending]
+            update = current
+            for column in itemSet:
+                update = self.lastAt(update, column)
+            moved = update != current
+            found[pending] = update
+            pending = pending[moved]
+        return found
+
+    def nextContaining(self, lower: _np.ndarray, columns: _np.ndarray) -> _np.ndarray:
+        """
+        Next itemsets at or after some itemsets containing some columns, in the sequences of these itemsets
+
+        :param lower: itemset every itemset found must be at or after
+        :type lower: numpy.ndarray
+        :param columns: columns every itemset found must contain, one row per itemset, padded with the padding column
+        :type columns: numpy.ndarray
+        :return: the next itemset at or after every lower itemset containing its columns, the number of itemsets for
+                 none
+        :rtype: numpy.ndarray
+        """
+        found = _np.asarray(lower, dtype=_np.int64).copy()
+        pending = _np.arange(len(found))
+        while len(pending):
+            current = found[pending]
+            update = current
+            for column in columns[pending].T:
+                update = self.nextAt(update, column)
+            moved = update != current
+            found[pending] = update
+            pending = pending[moved]
+        return found
+
+    def pairFirsts(self, minSup: float) -> Tuple[_np.ndarray, _np.ndarray, _np.ndarray]:
+        """
+        First itemset of every sequence containing every pair of columns occurring together in at least minSup
+        sequences
+
+        :param minSup: the minimum support
+        :type minSup: float
+        :return: the lower and the upper column of every pair, and the first itemset of a sequence containing both
+        :rtype: tuple
+        """
+        occurrences = _np.arange(len(self._itemsets))
+        ends = _np.searchsorted(self._itemsets, self._itemsets, side='right')
+        rows, others = _prefixSpanEngine._ranges(occurrences, occurrences + 1, ends)
+        lower = _np.minimum(self._occurrences[rows], self._occurrences[others])
+        upper = _np.maximum(self._occurrences[rows], self._occurrences[others])
+        itemsets = self._itemsets[rows]
+        keys = lower * self.padding + upper
+        order = _np.lexsort((itemsets, keys))
+        keys, itemsets = keys[order], itemsets[order]
+        first = _np.ones(len(keys), dtype=bool)
+        first[1:] = (keys[1:] != keys[:-1]) | (self.sequenceStarts[itemsets[1:]] != self.sequenceStarts[itemsets[:-1]])
+        keys, itemsets = keys[first], itemsets[first]
+        keep = _np.bincount(keys, minlength=self.padding * self.padding)[keys] >= minSup
+        keys, itemsets = keys[keep], itemsets[keep]
+        return keys // self.padding, keys % self.padding, itemsets
+
+
+class Node:
+    """
+    :Description: Prefixes of the search of BIDE which are children of the same node by the same kind of extension,
+                  with the itemsets of their instances and the first instances of their frequent extensions. The rows
+                  of the prefixes are stacked in their order, and their itemsets have the same numbers of items.
+
+    :Attributes:
+
+        patterns : list
+            Every prefix, a tuple of itemsets of item ids
+        columns : list
+            The columns of the items of every itemset of the prefixes, one array per itemset with one row per prefix
+        offsets : numpy.ndarray
+            First row of every prefix, then the number of rows
+        firsts : numpy.ndarray
+            Itemsets of the first instance, one row per supporting sequence
+        lastInFirst : numpy.ndarray
+            Itemsets of the last instance ending at the last itemset of the first instance
+        lastInLast : numpy.ndarray
+            Itemsets of the last instance, below -1 in the rows of a prefix with a forward extension
+        sColumns : numpy.ndarray
+            Columns of the sequence extensions frequent for some prefix
+        sNext : numpy.ndarray
+            Last itemset of the first instance of every sequence extension in every row, the number of itemsets of the
+            database for none or when the extension of the prefix is not frequent
+        iColumns : numpy.ndarray
+            Columns of the itemset extensions frequent for some prefix
+        iNext : numpy.ndarray
+            Last itemset of the first instance of every itemset extension in every row, the number of itemsets of the
+            database for none or when the extension of the prefix is not frequent
+        closed : numpy.ndarray
+            Whether every prefix is a closed pattern
+
+    :Methods:
+
+        closedPatterns()
+            The closed prefixes with their supports
+    """
+
+    __slots__ = ('patterns', 'columns', 'offsets', 'firsts', 'lastInFirst', 'lastInLast', 'sColumns', 'sNext',
+                 'iColumns', 'iNext', 'closed')
+
+    def __init__(self, patterns: List[Pattern], columns: List[_np.ndarray], offsets: _np.ndarray, firsts: _np.ndarray,
+                 lastInFirst: _np.ndarray, lastInLast: Optional[_np.ndarray] = None) -> None:
+        self.patterns = patterns
+        self.columns = columns
+        self.offsets = offsets
+        self.firsts = firsts
+        self.lastInFirst = lastInFirst
+        self.lastInLast = lastInLast
+        self.sColumns = self.iColumns = _np.zeros(0, dtype=_np.int64)
+        self.sNext = self.iNext = _np.zeros((len(firsts), 0), dtype=_np.int64)
+        self.closed = _np.zeros(len(patterns), dtype=bool)
+
+    @property
+    def supports(self) -> _np.ndarray:
+        return _np.diff(self.offsets)
+
+    def closedPatterns(self) -> List[Tuple[Pattern, int]]:
+        """
+        The closed prefixes with their supports
+
+        :return: every closed prefix with its support
+        :rtype: list
+        """
+        supports = self.supports.tolist()
+        return [(self.patterns[prefix], supports[prefix]) for prefix in _np.flatnonzero(self.closed).tolist()]
+
+
+@_functools.lru_cache(maxsize=None)
+def _layout(n: int) -> Tuple[_np.ndarray, _np.ndarray, _np.ndarray, _np.ndarray]:
+    position, into = _np.arange(n), _np.arange(n - 1)
+    zeros, ones = _np.zeros(n, dtype=_np.int64), _np.ones(n, dtype=_np.int64)
+    return (_np.concatenate((position, into + 1, position, position + 1)),
+            _np.concatenate((zeros, -ones[1:], zeros, -ones)),
+            _np.concatenate((position, into, position + n, position + n)),
+            _np.concatenate((zeros, ones[1:], zeros, ones)))
+
+
+class Periods:
+    """
+    :Description: The semi-maximum and maximum periods of some children, whose rows are stacked. The period of an item
+                  inserted before the j-th itemset of a pattern starts after the (j - 1)-th itemset of its first
+                  instance and ends at the j-th itemset of a last instance, and the one of an item added to the j-th
+                  itemset runs from the j-th itemset of the first instance to the one of the last. The periods are
+                  numbered as the semi-maximum ones before every itemset, into every itemset but the last, then the
+                  maximum ones before and into every itemset.
+
+    :Attributes:
+
+        starts : numpy.ndarray
+            First row of every child
+        supports : numpy.ndarray
+            Number of rows of every child
+        lowers : numpy.ndarray
+            The itemset before the sequence, then the itemsets of the first instance, one row per supporting sequence
+        uppers : numpy.ndarray
+            The itemsets of the last instance ending at the first one, then the ones of the last instance
+        lowerColumn : numpy.ndarray
+            Column of lowers of every period, after which it starts
+        lowerShift : numpy.ndarray
+            Shift of the lower itemset of every period
+        upperColumn : numpy.ndarray
+            Column of uppers of every period, before which it ends
+        upperShift : numpy.ndarray
+            Shift of the upper itemset of every period
+        required : numpy.ndarray
+            Columns of the itemset of every period of every child, padded with the padding column
+
+    :Methods:
+
+        bounds(rows, periods)
+            Itemsets before and after some periods
+    """
+
+    __slots__ = ('starts', 'supports', 'lowers', 'uppers', 'lowerColumn', 'lowerShift', 'upperColumn', 'upperShift',
+                 'required')
+
+    def __init__(self, starts: _np.ndarray, supports: _np.ndarray, lowers: _np.ndarray, uppers: _np.ndarray,
+                 columns: List[_np.ndarray], padding: int) -> None:
+        self.starts, self.supports, self.lowers, self.uppers = starts, supports, lowers, uppers
+        n = len(columns)
+        self.lowerColumn, self.lowerShift, self.upperColumn, self.upperShift = _layout(n)
+        width = max(itemSet.shape[1] for itemSet in columns)
+        self.required = _np.full((len(starts), 4 * n - 1, width), padding, dtype=_np.int64)
+        for j, itemSet in enumerate(columns):
+            if j < n - 1:
+                self.required[:, n + j, :itemSet.shape[1]] = itemSet
+            self.required[:, 3 * n - 1 + j, :itemSet.shape[1]] = itemSet
+
+    def bounds(self, rows: _np.ndarray, periods: _np.ndarray) -> Tuple[_np.ndarray, _np.ndarray]:
+        """
+        Itemsets before and after some periods
+
+        :param rows: the rows
+        :type rows: numpy.ndarray
+        :param periods: the period of every row
+        :type periods: numpy.ndarray
+        :return: the itemset before every period and the one after it
+        :rtype: tuple
+        """
+        return (_np.take(self.lowers, rows * self.lowers.shape[1] + self.lowerColumn[periods]) + self.lowerShift[periods],
+                _np.take(self.uppers, rows * self.uppers.shape[1] + self.upperColumn[periods]) + self.upperShift[periods])
+
+
+class ClosedSpace:
+    """
+    :Description: Search space of BIDE for parallelSearch. A task is a Node, whose prefixes BackScan did not prune, and
+                  the patterns of its children are the closed ones. The children of a node by the same kind of
+                  extension are built together, with the rows of all of them stacked, and they are the next node.
+
+    :Attributes:
+
+        store : SequenceStore
+            The sequence database, without the infrequent items
+        minSup : float
+            The minimum support
+        index : InstanceIndex
+            The last and next itemsets of the frequent items of the store
+        pairs : numpy.ndarray
+            Whether the item of a column occurs in an itemset with the one of a following column in enough sequences,
+            which the itemset extensions of the roots give. A child only extends its last itemset with such items.
+
+    :Methods:
+
+        roots()
+            Nodes of the frequent items
+        expand(node)
+            Closed children of the prefixes of a node and the nodes of their children
+        weight(node)
+            Number of itemsets in the suffixes of a projection
+    """
+
+    def __init__(self, store: _prefixSpanEngine.SequenceStore, minSup: float) -> None:
+        self.store = store.restrict(minSup)
+        self.minSup = minSup
+        self.index = InstanceIndex(self.store, minSup)
+        self.pairs = None
+
+    def _lastInstances(self, columns: List[_np.ndarray], kinds: _np.ndarray, result: _np.ndarray) -> _np.ndarray:
+        """
+        Walks back instances from their last itemsets, every itemset being the last one containing its items before
+        the next. A row stops as soon as it meets the itemsets it inherits, and the ones of a row which inherits none
+        are below -1.
+
+        :return: the number of leading itemsets of every row which are the inherited ones
+        """
+        settled = _np.zeros(len(result), dtype=_np.int64)
+        pending = _np.arange(len(result))
+        for j in range(result.shape[1] - 2, -1, -1):
+            found = self.index.lastContaining(result[pending, j + 1], columns[j][kinds[pending]])
+            changed = found != result[pending, j]
+            settled[pending[~changed]] = j + 1
+            pending = pending[changed]
+            result[pending, j] = found[changed]
+            if not len(pending):
+                break
+        return settled
+
+    def _candidates(self, periods: Periods, active: _np.ndarray, depth: int = 4) \
+            -> Tuple[_np.ndarray, _np.ndarray, _np.ndarray]:
+        """
+        Items as frequent as some children occurring in some of their periods in their first supporting sequences,
+        without the required columns of the period, and in every supporting sequence.
+
+        :return: the children, the periods and the items
+        """
+        index, padding = self.index, self.index.padding
+        count, width = active.shape
+        frequent = _np.append(index.supports, 0)
+        found = [], [], []
+        step = max(1, (1 << 22) // (width * (padding + 1) * depth))
+        for start in range(0, count, step):
+            stop = min(start + step, count)
+            rows = periods.starts[start:stop, None] + _np.minimum(_np.arange(depth), periods.supports[start:stop, None] - 1)
+            lower, upper = periods.bounds(rows[:, :, None], _np.arange(width))
+            alive = (_np.take(index.lasts, upper - 1, axis=0) > lower[:, :, :, None]).all(axis=1)
+            alive[_np.arange(stop - start)[:, None, None], _np.arange(width)[:, None], periods.required[start:stop]] = False
+            alive &= active[start:stop, :, None]
+            alive &= (frequent >= periods.supports[start:stop, None])[:, None, :]
+            for result, values in zip(found, _np.nonzero(alive)):
+                result.append(values + start if result is found[0] else values)
+        children, period, items = (_np.concatenate(values) for values in found)
+        members = _np.zeros((count, len(index.firstItemsets)), dtype=bool)
+        members[_np.repeat(_np.arange(count), periods.supports), index.sequences[periods.lowers[:, 1]]] = True
+        members = _np.packbits(members, axis=1)
+        keep = ~(members[children] & ~index.containing[items]).any(axis=1)
+        return children[keep], period[keep], items[keep]
+
+    def _fits(self, periods: Periods, children: _np.ndarray, period: _np.ndarray, items: _np.ndarray) \
+            -> Tuple[_np.ndarray, _np.ndarray, _np.ndarray]:
+        """
+        Items occurring in some periods of every supporting sequence of some children, in an itemset with the required
+        columns of the period. The period of an itemset runs from the first to the last itemset containing the required
+        columns, so that an item found at either end is in such an itemset, and only the ones found in between are
+        checked.
+
+        :return: the children, the periods and the items which fit
+        """
+        index = self.index
+        inserted = periods.lowerShift < 0
+        start, size = 0, 32
+        while len(children):
+            supports = periods.supports[children]
+            size = min(size, int(supports.max()) - start)
+            if size <= 0:
+                break
+            rows = periods.starts[children, None] + _np.minimum(_np.arange(start, start + size), supports[:, None] - 1)
+            lower, upper = periods.bounds(rows, period[:, None])
+            occurrence = index.lastAt(upper - 1, items[:, None])
+            alive = occurrence > lower
+            into = _np.flatnonzero(inserted[period])
+            if len(into):
+                found, row = _np.nonzero(alive[into] & (occurrence[into] > lower[into] + 1)
+                                         & (occurrence[into] < upper[into] - 1))
+                if len(found):
+                    found = into[found]
+                    columns = _np.column_stack((periods.required[children[found], period[found]], items[found]))
+                    alive[found, row] = index.lastContaining(occurrence[found, row] + 1, columns) > lower[found, row]
+            alive = alive.all(axis=1)
+            children, period, items = children[alive], period[alive], items[alive]
+            start, size = start + size, size * 8
+        return children, period, items
+
+    def _children(self, node: Node, itemSetExtensions: bool) -> Tuple[List[Tuple[Pattern, int]], Optional[Node]]:
+        """
+        Children of the prefixes of a node by their itemset or their sequence extensions. The rows of the children are
+        stacked in the order of their prefixes and of their extensions, and every step runs on all of them at once.
+
+        :return: the closed children with their supports, and the node of the children BackScan does not prune
+        """
+        index, count = self.index, len(self.index)
+        candidates, candidateNext = (node.iColumns, node.iNext) if itemSetExtensions else (node.sColumns, node.sNext)
+        if not len(candidates):
+            return [], None
+        parentSupports = node.supports
+        parents = _np.repeat(_np.arange(len(parentSupports)), parentSupports)
+        rows, candidate = _np.nonzero(candidateNext < count)
+        keys = parents[rows] * len(candidates) + candidate
+        order = _np.argsort(keys, kind='stable')
+        rows, candidate, keys = rows[order], candidate[order], keys[order]
+        last = candidateNext[rows, candidate].astype(_np.int64)
+        new = _np.ones(len(keys), dtype=bool)
+        new[1:] = keys[1:] != keys[:-1]
+        starts = _np.flatnonzero(new)
+        kinds = _np.cumsum(new) - 1
+        offsets = _np.append(starts, len(keys))
+        supports = _np.diff(offsets)
+        prefix = parents[rows[starts]]
+        extensions = candidates[candidate[starts]]
+        n = len(node.columns) + (0 if itemSetExtensions else 1)
+        columns = [itemSet[prefix] for itemSet in node.columns[:n - 1]]
+        if itemSetExtensions:
+            columns.append(_np.column_stack((node.columns[-1][prefix], extensions)))
+        else:
+            columns.append(extensions[:, None])
+        lowers = _np.empty((len(rows), n + 1), dtype=_np.int64)
+        lowers[:, 1:-1] = node.firsts[rows, :n - 1]
+        lowers[:, -1] = last
+        lowers[:, 0] = index.sequenceStarts[lowers[:, 1]] - 1
+        firsts = lowers[:, 1:]
+        uppers = _np.empty((len(rows), 2 * n), dtype=_np.int64)
+        uppers[:, :n - 1] = node.lastInFirst[rows, :n - 1]
+        uppers[:, n - 1] = last
+        lastInFirst = uppers[:, :n]
+        ends = index.sequenceEnds[last]
+        sColumns = node.sColumns
+        sNext = index.nextAt(_np.where(last + 1 < ends, last + 1, count)[:, None], sColumns)
+        sSupports = _np.add.reduceat(sNext < count, starts, axis=0, dtype=_np.int64)
+        iColumns = node.iColumns if itemSetExtensions else node.sColumns
+        allowed = iColumns > extensions[:, None]
+        root = not node.columns
+        if root:
+            lower, upper, itemsets = index.pairFirsts(self.minSup)
+            self.pairs = _np.zeros((index.padding, index.padding), dtype=bool)
+            self.pairs[lower, upper] = True
+        if self.pairs is not None:
+            allowed &= self.pairs[extensions][:, iColumns]
+            kept = allowed.any(axis=0)
+            iColumns, allowed = iColumns[kept], allowed[:, kept]
+        if root:
+            # the first itemsets of the pairs are the ones of the itemset extensions of the roots
+            iNext = _np.full((len(rows), len(iColumns)), count, dtype=index.nexts.dtype)
+            kindOf = _np.full(index.padding, -1, dtype=_np.int64)
+            kindOf[extensions] = _np.arange(len(extensions))
+            keep = kindOf[lower] >= 0
+            lower, upper, itemsets = lower[keep], upper[keep], itemsets[keep]
+            sequences = index.sequences[itemsets]
+            size = len(index.firstItemsets)
+            found = _np.searchsorted(kinds * size + rows, kindOf[lower] * size + sequences)
+            iNext[found, _np.searchsorted(iColumns, upper)] = itemsets
+        else:
+            iNext = _np.where(allowed[kinds], index.nextAt(last[:, None], iColumns), count)
+            found, candidate = _np.nonzero((iNext > last[:, None]) & (iNext < count))
+            if len(found):
+                itemSet = _np.column_stack((columns[-1][kinds[found]], iColumns[candidate]))
+                iNext[found, candidate] = index.nextContaining(iNext[found, candidate], itemSet)
+        iSupports = _np.add.reduceat(iNext < count, starts, axis=0, dtype=_np.int64)
+        closing = ~((sSupports == supports[:, None]).any(axis=1) | (iSupports == supports[:, None]).any(axis=1))
+        # pruning a child without frequent extensions saves nothing, and the maximum periods decide if it is closed, so
+        # that only the others walk back the last instances ending at their first ones, with the last instances of the
+        # closing children
+        growing = (sSupports >= self.minSup).any(axis=1) | (iSupports >= self.minSup).any(axis=1)
+        walked = _np.flatnonzero(growing[kinds])
+        selected = _np.flatnonzero(closing[kinds])
+        instances = _np.empty((len(walked) + len(selected), n), dtype=_np.int64)
+        instances[:len(walked)] = lastInFirst[walked]
+        instances[len(walked):, -1] = index.lastContaining(ends[selected], columns[-1][kinds[selected]])
+        instances[len(walked):, :-1] = -2 if node.lastInLast is None else node.lastInLast[rows[selected], :n - 1]
+        settled = self._lastInstances(columns, kinds[_np.concatenate((walked, selected))], instances)
+        settled = _np.minimum.reduceat(_np.append(settled[:len(walked)], n + 1), _np.cumsum(supports * growing) - supports * growing)
+        settled[~growing] = n + 1
+        settled[growing & (supports < parentSupports[prefix])] = 0
+        uppers[walked, :n] = instances[:len(walked)]
+        uppers[:, n:] = lastInFirst
+        uppers[selected, n:] = instances[len(walked):]
+        periods = Periods(starts, supports, lowers, uppers, columns, index.padding)
+        position = _np.arange(n)
+        semiActive = _np.hstack((position >= settled[:, None], position[:-1] >= settled[:, None] - 1))
+        active = _np.hstack((semiActive & ~closing[:, None], _np.repeat(closing[:, None], 2 * n, axis=1)))
+        semi = 2 * n - 1
+        pruned = _np.zeros(len(extensions), dtype=bool)
+        closed = closing.copy()
+        if active.any():
+            fitting, period, items = self._fits(periods, *self._candidates(periods, active))
+            pruned[fitting[period < semi]] = True
+            closed[fitting[period >= semi]] = False
+            # a semi-maximum period is in the maximum one, with the same required columns
+            period -= semi
+            inner = _np.flatnonzero(period >= 0)
+            inner = inner[period[inner] < semi]
+            inner = inner[semiActive[fitting[inner], period[inner]]]
+            if len(inner):
+                pruned[self._fits(periods, fitting[inner], period[inner], items[inner])[0]] = True
+        kept = _np.flatnonzero(~pruned)
+        if not len(kept):
+            return [], None
+        keptRows = ~pruned[kinds] if pruned.any() else slice(None)
+        items = index.columns[extensions[kept]].tolist()
+        if itemSetExtensions:
+            patterns = [node.patterns[p][:-1] + (node.patterns[p][-1] + (item,),)
+                        for p, item in zip(prefix[kept].tolist(), items)]
+        else:
+            patterns = [node.patterns[p] + ((item,),) for p, item in zip(prefix[kept].tolist(), items)]
+        lastInLast = _np.where(closing[kinds][:, None], uppers[:, n:], -2)
+        child = Node(patterns, [itemSet[kept] for itemSet in columns], _np.append(0, _np.cumsum(supports[kept])),
+                     firsts[keptRows], lastInFirst[keptRows], lastInLast[keptRows])
+        childKinds = _np.repeat(_np.arange(len(kept)), supports[kept])
+        frequent = sSupports[kept] >= self.minSup
+        union = frequent.any(axis=0)
+        child.sColumns = sColumns[union]
+        child.sNext = _np.where(frequent[:, union][childKinds], sNext[keptRows][:, union], count)
+        frequent = iSupports[kept] >= self.minSup
+        union = frequent.any(axis=0)
+        child.iColumns = iColumns[union]
+        child.iNext = _np.where(frequent[:, union][childKinds], iNext[keptRows][:, union], count)
+        child.closed = closed[kept]
+        return child.closedPatterns(), child
+
+    def roots(self) -> List[Node]:
+        """
+        Nodes of the frequent items
+
+        :return: the node of every frequent item that BackScan does not prune, in increasing order
+        :rtype: list
+        """
+        index, count = self.index, len(self.index)
+        empty = _np.zeros((len(index.firstItemsets), 0), dtype=_np.int64)
+        root = Node([()], [], _np.array([0, len(empty)]), empty, empty)
+        root.sColumns = _np.arange(len(index.columns))
+        root.sNext = index.nexts[index.firstItemsets][:, :-1]
+        node = self._children(root, False)[1]
+        if node is None:
+            return []
+        roots = []
+        for prefix, (a, b) in enumerate(zip(node.offsets[:-1].tolist(), node.offsets[1:].tolist())):
+            child = Node(node.patterns[prefix:prefix + 1], [itemSet[prefix:prefix + 1] for itemSet in node.columns],
+                         _np.array([0, b - a]), node.firsts[a:b], node.lastInFirst[a:b], node.lastInLast[a:b])
+            kept = (node.sNext[a:b] < count).any(axis=0)
+            child.sColumns, child.sNext = node.sColumns[kept], node.sNext[a:b, kept]
+            kept = (node.iNext[a:b] < count).any(axis=0)
+            child.iColumns, child.iNext = node.iColumns[kept], node.iNext[a:b, kept]
+            child.closed = node.closed[prefix:prefix + 1]
+            roots.append(child)
+        return roots
+
+    def expand(self, node: Node) -> Tuple[List[Tuple[Pattern, int]], List[Node]]:
+        """
+        Closed children of the prefixes of a node, the itemset extensions first
+
+        :param node: the node
+        :type node: Node
+        :return: the closed children with their supports, and the nodes of the children BackScan does not prune
+        :rtype: tuple
+        """
+        patterns, children = self._children(node, True)
+        sPatterns, sChildren = self._children(node, False)
+        node.sColumns = node.iColumns = node.sColumns[:0]
+        node.sNext = node.iNext = node.sNext[:, :0]
+        return patterns + sPatterns, [child for child in (children, sChildren) if child is not None]
+
+    def weight(self, node: Node) -> int:
+        """
+        Number of itemsets in the suffixes of a projection, which bounds the work of the first expansion
+
+        :param node: the node
+        :type node: Node
+        :return: the weight of the node
+        :rtype: int
+        """
+        return int((self.index.sequenceEnds[node.firsts[:, -1]] - node.firsts[:, -1]).sum())
+
+
+def mine(store: _prefixSpanEngine.SequenceStore, minSup: float) -> Iterator[Tuple[Pattern, int]]:
+    """
+    Depth-first BIDE over the pseudo-projections of a store
+
+    :param store: the sequence database
+    :type store: SequenceStore
+    :param minSup: the minimum support
+    :type minSup: float
+    :return: every closed frequent pattern with its support
+    :rtype: iterator
+    """
+    space = ClosedSpace(store, minSup)
+    for root in space.roots():
+        yield from root.closedPatterns()
+        yield from _parallelSearch.subtree(space, root)
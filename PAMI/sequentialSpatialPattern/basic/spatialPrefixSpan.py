@@ -15,8 +15,11 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import PAMI.sequentialSpatialPattern.basic.abstract as _ab
+from PAMI.georeferencedFrequentSequencePattern.basic import neighbourhoodEngine as _neighbourhoodEngine
+from PAMI.sequentialPattern.basic import prefixSpanEngine as _prefixSpanEngine
+from PAMI.sequentialPattern.basic import sequenceDatabase as _sequenceDatabase
 import sys
-import copy
+from deprecated import deprecated
 sys.setrecursionlimit(10000)
 
 class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
@@ -25,6 +28,9 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
         This program employs Prifix Span property (or downward closure property) to  reduce the search space effectively.
         This algorithm employs depth-first search technique to find the complete set of frequent patterns in a
         transactional database.
+        The pseudo-projections are extended only by the items which are neighbours of all the items of the pattern, looked up
+        in a bitset of the neighbourhoods built once from the neighbourhood file. Two items are neighbours when either of them
+        lists the other.
         Reference:
         ----------
            J. Pei, J. Han, B. Mortazavi-Asl, J. Wang, H. Pinto, Q. Chen, U. Dayal, M. Hsu: Mining Sequential Patterns by Pattern-Growth: The PrefixSpan Approach. IEEE Trans. Knowl. Data Eng. 16(11): 1424-1440 (2004)
@@ -51,8 +57,8 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
                 To store the total amount of USS memory consumed by the program
             memoryRSS : float
                 To store the total amount of RSS memory consumed by the program
-            Database : list
-                To store the transactions of a database in list
+            Database : sequenceDatabase.SequenceDatabase
+                To store the sequences of the database
             maxLength:int
                 to store the maximum length of sequence pattern
             maxGap   :int
@@ -76,10 +82,6 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
             getRuntime()
                 Total amount of runtime taken by the mining process will be retrieved from this function
-            candidateToFrequent(candidateList)
-                Generates frequent patterns from the candidate patterns
-            frequentToCandidate(frequentList, length)
-                Generates candidate patterns from the frequent patterns
             mapNeighbours()
                 read the neighbor file and make neighbor map.
 
@@ -133,7 +135,7 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
         self._memoryUSS = float()
         self._memoryRSS = float()
         self._Database = []
-        self._sepDatabase={}
+        self._names = []
         self._maxLength=maxlen
         self._maxGap=maxGap
         self._NeighboursMap = {}
@@ -162,8 +164,7 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
                     line = line.decode("utf-8")
                     temp = [i.rstrip() for i in line.split(self._sep)]
                     temp = [x for x in temp if x]
-                    if temp[0] in self._Database.keys():
-                        self._NeighboursMap[temp[0]] = temp[1:]
+                    self._NeighboursMap[temp[0]] = temp[1:]
             else:
                 try:
                     with open(self._nFile, 'r', encoding='utf-8') as f:
@@ -180,6 +181,9 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
             Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
+        if _sequenceDatabase.isSequenceDatabase(self._iFile):
+            self._Database = _sequenceDatabase.load(self._iFile)
+            return
 
         if isinstance(self._iFile, _ab._pd.DataFrame):
             temp = []
@@ -192,39 +196,11 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
             for k in temp:
                 self._Database.append(set(k))
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._Database.append(set(temp))
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split('-1')]
-                            temp = [x for x in temp if x ]
-                            temp.pop()
-
-                            seq = []
-                            for i in temp:
-                                if len(i)>1:
-                                   for i in list(sorted(set(i.split()))):
-                                       seq.append(i)
-                                   seq.append(-1)
-
-                                else:
-                                    seq.append(i)
-                                    seq.append(-1)
-                            self._Database.append(seq)
-
-
-                except IOError:
-                    print("File Not Found")
-                    quit()
+            try:
+                self._Database = _sequenceDatabase.load(self._iFile, self._sep)
+            except IOError:
+                print("File Not Found")
+                quit()
 
     def _convert(self, value):
         """
@@ -243,290 +219,52 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
             else:
                 value = int(value)
         return value
-    def makeNext(self,sepDatabase,startrow):
+    def _patternName(self, pattern):
         """
-         To get next pattern by adding head word to next sequence of startrow
-        :param sepDatabase: dict
-            what words and rows startrow have to add it
-        :param startrow:
-            the patterns get before
+        To convert a pattern of item ids to the pattern of item names
+        :param pattern: the pattern as a tuple of itemsets of item ids
+        :return: the pattern as it is stored in the final patterns, every itemset followed by -1
+        :rtype: str
         """
-        for head in sepDatabase.keys():
-            if head not in self._NeighboursMap.keys():
-                continue
-            newrow=[i for i in startrow]
-            checkrow={i for i in startrow if i!=-1}
-
-            if len(sepDatabase[head])>=self._minSup  and checkrow.issubset(self._NeighboursMap[head]):
-                if newrow!=[]:
-                    newrow.append(-1)
-                newrow.append(head)
-                newrow.append(-1)
-                if str(newrow) not in self._finalPatterns:
-                    self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    give = []
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                elif len(sepDatabase[head]) > self._finalPatterns[str(newrow)]:
-                    self._finalPatterns[str(newrow)] = len(sepDatabase[head])
-                    give = []
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-
-
-
-    def makeSupDatabase(self,database,head):
+        row = []
+        for itemSet in pattern:
+            row.extend(self._names[i] for i in itemSet)
+            row.append(-1)
+        return str(row)
+
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
+    def startMine(self):
         """
-         To delete not frequent words without words in latest sequence
-        :param database: list
-            database of lines have same startrow and head word
-        :param head:list
-         words in latest sequence
-        :return: changed database
-
-        """
-
-        supDatabase={}
-        alreadyInData=[]
-        newDatabase = []
-
-        for line in database:
-            alreadyInLine = []
-            for data in line:
-                    if data not in alreadyInLine:
-                        if data not in alreadyInData:
-                            supDatabase[data]=1
-                            alreadyInData.append(data)
-                        else:
-                            supDatabase[data]+=1
-                        alreadyInLine.append(data)
-        for line in database:
-                newLine=[]
-                for i in line:
-                    if supDatabase[i]>=self._minSup or i in head:
-                        if len(newLine)>1:
-                            if (newLine[-1]!=-1 or i!=-1):
-                                newLine.append(i)
-                        else:
-                            newLine.append(i)
-                newDatabase.append(newLine)
-
-        return newDatabase
-
-    def makeNextSame(self,sepDatabase,startrow):
-        """
-         To get next pattern by adding head word to latest sequence of startrow
-        :param sepDatabase: dict
-            what words and rows startrow have to add it
-        :param startrow:
-            the patterns get before
-        """
-        for head in sepDatabase.keys():
-            if head not in self._NeighboursMap.keys():
-                continue
-            checkrow = {i for i in startrow if i != -1}
-            if len(sepDatabase[head])>=self._minSup and checkrow.issubset(self._NeighboursMap[head]):
-                newrow = startrow.copy()
-                newrow.append(head)
-                newrow.append(-1)
-
-                if str(newrow) not in self._finalPatterns.keys():
-                    self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    if -1 in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                elif len(sepDatabase[head])>self._finalPatterns[str(newrow)]:
-                    self._finalPatterns[str(newrow)] = len(sepDatabase[head])
-                    if -1 in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-
-
-
-
-
-
-
-
-    def makeSeqDatabaseFirst(self,database):
-        """
-        To make 1 length sequence dataset list which start from same word. It was stored only 1 from 1 line.
-        :param database:
-                To store the transactions of a database in list
-        """
-        startrow=[]
-        seqDatabase={}
-
-        for line in database:
-            alreadyInLine=[]
-            for data in range(len(line)):
-                if line[data] not in alreadyInLine and line[data]!=-1:
-                    if line[data] not in seqDatabase.keys():
-                        seqDatabase[line[data]]=[]
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-                    else:
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-
-        if len(seqDatabase)>0:
-            self.makeNext(seqDatabase,startrow)
-
-    def serchSame(self,database,startrow,give):
-        """
-         To get 2 or more length patterns in same sequence.
-        :param database: list
-            To store the transactions of a database in list which have same startrow and head word
-        :param startrow: list
-            the patterns get before
-        :param give: list
-            the word in latest sequence of startrow
-        :return:
-        """
-        sepDatabaseSame={}
-        sepDatabaseSame[startrow[-1]]=[]
-        for line in database:
-            addLine=0
-            i=0
-            if len(line)>1:
-                while line[i]!=-1:
-                    if line[i]==startrow[-1]:
-                        sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                        addLine=1
-                        break
-                    i+=1
-                if addLine!=1:
-                    ok=[]
-                    while i <len(line):
-                        if line[i]==-1:
-                            ok=[]
-                        elif line[i]==startrow[-1]:
-                            ok.append("sk1")
-                        for x in give:
-                            if x==line[i]:
-                                ok.append(x)
-                        if len(ok)==1+len(give):
-                            sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                            break
-                        i+=1
-        startrow2=[startrow[0]]
-        startrow.append(-1)
-        if str(startrow) not in self._finalPatterns.keys():
-                self.makeNextSame(sepDatabaseSame,startrow2)
-        elif self._finalPatterns[str(startrow)]<len(sepDatabaseSame[startrow[-2]]):
-            self.makeNextSame(sepDatabaseSame,startrow2)
-        return sepDatabaseSame[startrow[-2]]
-
-    def getSameSeq(self,startrow):
-        """
-         To get words in latest sequence
-        :param startrow:
-         the patterns get before
-        :return:
-        """
-        give = []
-        newrow = startrow.copy()
-        while newrow[-1] != -1:
-            y = newrow.pop()
-            give.append(y)
-        return give
-
-
-    def makeSeqDatabaseSame(self,database,startrow):
+            Frequent pattern mining process will start from here
         """
-            To make sequence dataset list which start from same word(head). It was stored only 1 from 1 line.
-            And it separated by having head in latest sequence of startrow or not.
-
-            :param database:
-                    To store the transactions of a database in list
-            :param startrow: list
-                    the patterns get before
-
-            """
-        seqDatabase={}
-        seqDatabaseSame={}
-        seqLength=startrow.count(-1)+1
-        for line in database:
-            if len(line)>1:
-                alreadyInLine=[]
-                i = 0
-                while line[i] != -1:
-                        if line[i] not in seqDatabaseSame:
-                            if -1 in startrow:
-                                give=self.getSameSeq(startrow)
-                            else:
-                                give=startrow.copy()
-                            newrow= [startrow[-1], line[i]]
-                            seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                        i += 1
-                same=0
-                seqCount=0
-                if self._maxLength>seqLength:
-                    while len(line)>i and self._maxGap>seqCount:
-                        if line[i]!=-1:
-                            if line[i] not in alreadyInLine:
-                                if line[i] not in seqDatabase:
-                                    seqDatabase[line[i]]=[]
-                                seqDatabase[line[i]].append(line[i + 1:])
-                                alreadyInLine.append(line[i])
-                            if line[i]==startrow[-1]:
-                                same=1
-
-
-                            elif same==1 and line[i] not in seqDatabaseSame:
-                                if -1 in startrow:
-                                    give=self.getSameSeq(startrow)
-                                else:
-                                    give=startrow.copy()
-                                newrow= [startrow[-1], line[i]]
-                                seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                        else:
-                            same=0
-                            seqCount+=1
-                        i+=1
-
-
-        if len(seqDatabase)!=0:
-            self.makeNext(seqDatabase,startrow)
-        if len(seqDatabaseSame)!=0:
-            self.makeNextSame(seqDatabaseSame,startrow)
-
-
+        self.mine()
 
     def mine(self):
         """
             Frequent pattern mining process will start from here
         """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
-        self._Database=self.makeSupDatabase(self._Database,"")
+        if not isinstance(self._Database, _sequenceDatabase.SequenceDatabase):
+            self._Database = _sequenceDatabase.fromItemsets(self._Database)
         self._minSup = self._convert(self._minSup)
         self._mapNeighbours()
-        self.makeSeqDatabaseFirst(self._Database)
+        self._names = list(self._Database.names)
+        store = _prefixSpanEngine.SequenceStore.fromOccurrences(*self._Database.occurrences(), len(self._names),
+                                                                len(self._Database))
+        neighbours = _neighbourhoodEngine.NeighbourBits.fromMap(self._NeighboursMap, self._names)
+        for pattern, support in _neighbourhoodEngine.projectionMine(store, self._minSup, neighbours,
+                                                                    float(self._maxLength), float(self._maxGap)):
+            self._finalPatterns[self._patternName(pattern)] = support
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
         self._memoryRSS = float()
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
-        print("Frequent patterns were generated successfully using Apriori algorithm ")
+        print("Spatial sequential patterns were generated successfully using spatialPrefixSpan algorithm ")
 
     def getMemoryUSS(self):
         """Total amount of USS memory consumed by the mining process will be retrieved from this function
@@ -53,6 +53,7 @@ __copyright__ = """
 """
 
 from PAMI.weightedFrequentPattern.basic import abstract as _fp
+from PAMI.frequentPattern.basic import conditionalTree as _ct
 from typing import List, Dict, Tuple, Union, Generator
 import pandas as pd
 from deprecated import deprecated
@@ -66,57 +67,13 @@ _weights = {}
 _fp._sys.setrecursionlimit(20000)
 
 
-class _Node:
+class _Tree(_ct.CountTree):
     """
-    A class used to represent the node of frequentPatternTree
+    A class used to represent the frequentPatternGrowth tree structure. Nodes store their frequency and the
+    pattern-growth search is provided by the shared conditional tree runtime.
 
     :Attributes:
 
-        itemId: int
-            storing item of a node
-
-        counter: int
-            To maintain the support of node
-
-        parent: node
-            To maintain the parent of node
-
-        children: list
-            To maintain the children of node
-
-    :Methods:
-
-        addChild(node)
-            Updates the nodes children list and parent for the given node
-    """
-
-    def __init__(self, item: str, children: list) -> None:
-        self.itemId = item
-        self.counter = 1
-        self.parent = None
-        self.children = children
-
-    def addChild(self, node: '_Node') -> None:
-        """
-        Retrieving the child from the tree
-
-        :param node: Children node
-        :type node: _Node
-        :return: Updates the children nodes and parent nodes
-        """
-        self.children[node.itemId] = node
-        node.parent = self
-
-
-class _Tree:
-    """
-    A class used to represent the frequentPatternGrowth tree structure
-
-    :Attributes:
-
-        root : Node
-            The first node of the tree set to Null.
-
         summaries : dictionary
             Stores the nodes itemId which shares same itemId
 
@@ -127,117 +84,31 @@ class _Tree:
 
         addTransaction(transaction, freq)
             adding items of  transactions into the tree as nodes and freq is the count of nodes
-        getFinalConditionalPatterns(node)
-            getting the conditional patterns from fp-tree for a node
-        getConditionalPatterns(patterns, frequencies)
-            sort the patterns by removing the items with lower minSup
+        measure(freq, pattern)
+            frequency of a pattern in the conditional patterns
+        isPromising(freq)
+            checks the frequency and weighted frequency of an item
         generatePatterns(prefix)
             generating the patterns from fp-tree
     """
 
-    def __init__(self) -> None:
-        self.root = _Node(None, {})
-        self.summaries = {}
-        self.info = {}
-
-    def addTransaction(self, transaction: List[str], count: int) -> None:
+    def measure(self, freq: int, pattern: List[int]) -> int:
+        """
+        :param freq: frequency of a pattern in the conditional patterns
+        :param pattern: the pattern being measured
+        :return: frequency of the pattern
         """
-        Adding transaction into tree
+        return freq
 
-        :param transaction: it represents the one transaction in database
-        :type transaction: list
-        :param count: frequency of item
-        :type count: int
-        :return: None
+    def isPromising(self, freq: int) -> bool:
         """
-        # This method takes transaction as input and returns the tree
-        currentNode = self.root
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = _Node(transaction[i], {})
-                newNode.freq = count
-                currentNode.addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].append(newNode)
-                else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
-            else:
-                currentNode = currentNode.children[transaction[i]]
-                currentNode.freq += count
-
-    def getFinalConditionalPatterns(self, alpha: str) -> Tuple[List[List[str]], List[int], Dict[str, int]]:
-        """
-        Generates the conditional patterns for a node
-
-        :param alpha: node to generate conditional patterns
-        :return: returns conditional patterns, frequency of each item in conditional patterns
-        """
-        finalPatterns = []
-        finalFreq = []
-        for i in self.summaries[alpha]:
-            set1 = i.freq
-            set2 = []
-            while i.parent.itemId is not None:
-                set2.append(i.parent.itemId)
-                i = i.parent
-            if len(set2) > 0:
-                set2.reverse()
-                finalPatterns.append(set2)
-                finalFreq.append(set1)
-        finalPatterns, finalFreq, info = self.getConditionalTransactions(finalPatterns, finalFreq)
-        return finalPatterns, finalFreq, info
+        :param freq: frequency of an item in the conditional patterns
+        :return: True if the item is frequent and weighted frequent
+        """
+        return freq >= _minSup and freq * _miniWeight > _minSup
 
-    @staticmethod
-    def getConditionalTransactions(ConditionalPatterns: List[List[str]], conditionalFreq: List[int]) -> Tuple[List[List[str]], List[int], Dict[str, int]]:
-        """
-        To calculate the frequency of items in conditional patterns and sorting the patterns
-
-        :param ConditionalPatterns: paths of a node
-        :param conditionalFreq: frequency of each item in the path
-        :return: conditional patterns and frequency of each item in transactions
-        """
-        global _minSup, _miniWeight
-        pat = []
-        freq = []
-        data1 = {}
-        for i in range(len(ConditionalPatterns)):
-            for j in ConditionalPatterns[i]:
-                if j in data1:
-                    data1[j] += conditionalFreq[i]
-                else:
-                    data1[j] = conditionalFreq[i]
-        up_dict = {k: v for k, v in data1.items() if v >= _minSup and v * _miniWeight > _minSup}
-        count = 0
-        for p in ConditionalPatterns:
-            p1 = [v for v in p if v in up_dict]
-            trans = sorted(p1, key=lambda x: (up_dict.get(x), -x), reverse=True)
-            if len(trans) > 0:
-                pat.append(trans)
-                freq.append(conditionalFreq[count])
-            count += 1
-        return pat, freq, up_dict
-
-    def generatePatterns(self, prefix: List[str]) -> Generator[Tuple[List[str], int], None, None]:
-        """
-        To generate the frequent patterns
-
-        :param prefix: an empty list
-        :return: Frequent patterns that are extracted from fp-tree
-        """
-        global _miniWeight, _maxWeight, _minWeight, _minSup
-        for i in sorted(self.summaries, key=lambda x: (self.info.get(x), -x)):
-            pattern = prefix[:]
-            pattern.append(i)
-            yield pattern, self.info[i]
-            patterns, freq, info = self.getFinalConditionalPatterns(i)
-            conditionalTree = _Tree()
-            conditionalTree.info = info.copy()
-            for pat in range(len(patterns)):
-                conditionalTree.addTransaction(patterns[pat], freq[pat])
-            if len(patterns) > 0:
-                for q in conditionalTree.generatePatterns(pattern):
-                    yield q
+    def support(self, freq: int) -> int:
+        return freq
 
 
 class WFIM(_fp._weightedFrequentPatterns):
@@ -52,6 +52,7 @@ __copyright__ = """
 """
 
 from PAMI.weightedFrequentRegularPattern.basic import abstract as _fp
+from PAMI.frequentPattern.basic import conditionalTree as _ct
 import pandas as pd
 from deprecated import deprecated
 from typing import List, Dict
@@ -65,175 +66,32 @@ _wf = {}
 _fp._sys.setrecursionlimit(20000)
 
 
-class _Node:
+class _Tree(_ct.ConditionalTree):
     """
-    A class used to represent the node of frequentPatternTree
+    A class used to represent the frequentPatternGrowth tree structure. Nodes store their timestamps and the
+    pattern-growth search is provided by the shared conditional tree runtime. Only the weighted frequent patterns are
+    extended.
 
     :Attributes:
 
-        itemId: int
-            storing item of a node
-
-        counter: int
-            To maintain the support of node
-
-        parent: node
-            To maintain the parent of node
-
-        children: list
-            To maintain the children of node
-
-    :Methods:
-
-        addChild(node)
-            Updates the nodes children list and parent for the given node
-
-    """
-
-    def __init__(self, item: int, children: dict) -> None:
-        """
-        Initializing the Node class
-
-        :param item: Storing the item of a node
-        :type item: int or None
-        :param children: To maintain the children of a node
-        :type children: dict
-        :return: None
-        """
-
-        self.item = item
-        self.children = children
-        self.parent = None
-        self.timeStamps = []
-
-    def addChild(self, node) -> None:
-        """
-        To add the children to a node
-
-        :param node: parent node in the tree
-        :return: None
-        """
-
-        self.children[node.item] = node
-        node.parent = self
-
-
-class _Tree:
-    """
-    A class used to represent the frequentPatternGrowth tree structure
-
-    :Attributes:
-
-        root : Node
-            The first node of the tree set to Null.
-
         summaries : dictionary
             Stores the nodes itemId which shares same itemId
 
         info : dictionary
-            frequency of items in the transactions
+            support, regularity and weighted frequency of items in the transactions
 
     :Methods:
-        addTransaction(transaction, freq)
-            adding items of  transactions into the tree as nodes and freq is the count of nodes
-        getFinalConditionalPatterns(node)
-            getting the conditional patterns from fp-tree for a node
-        getConditionalPatterns(patterns, frequencies)
-            sort the patterns by removing the items with lower minSup
-        generatePatterns(prefix)
-            generating the patterns from fp-tree
+        getSupportAndPeriod(timeStamps, pattern)
+            calculates the support, regularity and weighted frequency of a pattern
+        measure(timeStamps, pattern)
+            measure of a pattern used by the conditional databases
+        isPromising(value)
+            checks the support and regularity of an item
+        isPattern(value)
+            checks the weighted frequency of a pattern
     """
 
-    def __init__(self) -> None:
-        self.root = _Node(None, {})
-        self.summaries = {}
-        self.info = {}
-
-    def addTransaction(self, transaction: list, tid: list) -> None:
-        """
-        Adding a transaction into tree
-
-        :param transaction: To represent the complete database
-        :type transaction: list
-        :param tid: To represent the timestamp of a database
-        :type tid: list
-        :return: pfp-growth tree
-        """
-        currentNode = self.root
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = _Node(transaction[i], {})
-                currentNode.addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].append(newNode)
-                else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
-            else:
-                currentNode = currentNode.children[transaction[i]]
-        currentNode.timeStamps = currentNode.timeStamps + tid
-
-    def getConditionalPatterns(self, alpha, pattern) -> tuple:
-        """
-        Generates all the conditional patterns of a respective node
-
-        :param alpha: To represent a Node in the tree
-        :type alpha: Node
-        :param pattern: prefix of the pattern
-        :type alpha: list
-        :return: A tuple consisting of finalPatterns, conditional pattern base and information
-        """
-        finalPatterns = []
-        finalSets = []
-        for i in self.summaries[alpha]:
-            set1 = i.timeStamps
-            set2 = []
-            while i.parent.item is not None:
-                set2.append(i.parent.item)
-                i = i.parent
-            if len(set2) > 0:
-                set2.reverse()
-                finalPatterns.append(set2)
-                finalSets.append(set1)
-        finalPatterns, finalSets, info = self.conditionalDatabases(finalPatterns, finalSets, pattern)
-        return finalPatterns, finalSets, info
-
-    @staticmethod
-    def generateTimeStamps(node) -> list:
-        """
-        To get the timestamps of a node
-
-        :param node: A node in the tree
-        :return: Timestamps of a node
-        """
-
-        finalTimeStamps = node.timeStamps
-        return finalTimeStamps
-
-    def removeNode(self, nodeValue) -> None:
-        """
-        Removing the node from tree
-
-        :param nodeValue: To represent a node in the tree
-        :type nodeValue: node
-        :return: Tree with their nodes updated with timestamps
-        """
-
-        for i in self.summaries[nodeValue]:
-            i.parent.timeStamps = i.parent.timeStamps + i.timeStamps
-            del i.parent.children[nodeValue]
-
-    def getTimeStamps(self, alpha) -> list:
-        """
-        To get all the timestamps of the nodes which share same item name
-
-        :param alpha: Node in a tree
-        :return: Timestamps of a  node
-        """
-        temporary = []
-        for i in self.summaries[alpha]:
-            temporary += i.timeStamps
-        return temporary
+    expandNonPatterns = False
 
     @staticmethod
     def getSupportAndPeriod(timeStamps: list, pattern: list) -> list:
@@ -264,65 +122,31 @@ class _Tree:
             return [0, 0]
         return [sup, max(per), wf]
 
-    def conditionalDatabases(self, conditionalPatterns: list, conditionalTimeStamps: list, pattern: list) -> tuple:
+    def measure(self, timeStamps: list, pattern: list) -> list:
         """
-        It generates the conditional patterns with periodic-frequent items
+        To calculate the support, regularity and weighted frequency of a pattern
 
-        :param conditionalPatterns: conditionalPatterns generated from conditionPattern method of a respective node
-        :type conditionalPatterns: list
-        :param conditionalTimeStamps: Represents the timestamps of a conditional patterns of a node
-        :type conditionalTimeStamps: list
-        :param pattern: prefix of the pattern
+        :param timeStamps: Timestamps of the pattern
+        :type timeStamps: list
+        :param pattern: the pattern being measured
         :type pattern: list
-        :returns: Returns conditional transactions by removing non-periodic and non-frequent items
-        """
-        global _WS, _regularity
-        pat = []
-        timeStamps = []
-        data1 = {}
-        for i in range(len(conditionalPatterns)):
-            for j in conditionalPatterns[i]:
-                if j in data1:
-                    data1[j] = data1[j] + conditionalTimeStamps[i]
-                else:
-                    data1[j] = conditionalTimeStamps[i]
-        updatedDictionary = {}
-        for m in data1:
-            updatedDictionary[m] = self.getSupportAndPeriod(data1[m], pattern + [m])
-        updatedDictionary = {k: v for k, v in updatedDictionary.items() if v[0] >= _WS and v[1] <= _regularity}
-        count = 0
-        for p in conditionalPatterns:
-            p1 = [v for v in p if v in updatedDictionary]
-            trans = sorted(p1, key=lambda x: (updatedDictionary.get(x)[0], -x), reverse=True)
-            if len(trans) > 0:
-                pat.append(trans)
-                timeStamps.append(conditionalTimeStamps[count])
-            count += 1
-        return pat, timeStamps, updatedDictionary
-
-    def generatePatterns(self, prefix: list) -> None:
-        """
-        Generates the patterns
-
-        :param prefix: Forms the combination of items
-        :type prefix: list
-        :returns: yields patterns with their support and periodicity
-        """
-        global _WS
-        for i in sorted(self.summaries, key=lambda x: (self.info.get(x)[0], -x)):
-            pattern = prefix[:]
-            pattern.append(i)
-            if self.info[i][2] >= _WS:
-                yield pattern, self.info[i]
-                patterns, timeStamps, info = self.getConditionalPatterns(i, pattern)
-                conditionalTree = _Tree()
-                conditionalTree.info = info.copy()
-                for pat in range(len(patterns)):
-                    conditionalTree.addTransaction(patterns[pat], timeStamps[pat])
-                if len(patterns) > 0:
-                    for q in conditionalTree.generatePatterns(pattern):
-                        yield q
-            self.removeNode(i)
+        :return: support, periodicity, weighted frequency
+        """
+        return self.getSupportAndPeriod(timeStamps, pattern)
+
+    def isPromising(self, value: list) -> bool:
+        """
+        :param value: measure of an item
+        :return: True if the item satisfies the weighted support and regularity constraints
+        """
+        return value[0] >= _WS and value[1] <= _regularity
+
+    def isPattern(self, value: list) -> bool:
+        """
+        :param value: measure of a pattern
+        :return: True if the pattern is weighted frequent
+        """
+        return value[2] >= _WS
 
 
 class WFRIMiner(_fp._weightedFrequentRegularPatterns):
@@ -0,0 +1,134 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_conditionalTree.py
+
+import random
+import unittest
+from itertools import combinations
+from PAMI.frequentPattern.basic import conditionalTree as ct
+
+_minSup = 3
+_maxPer = 6
+
+
+class _CountTree(ct.CountTree):
+
+    def measure(self, count, pattern):
+        return count
+
+    def isPromising(self, count):
+        return count >= _minSup
+
+    def support(self, count):
+        return count
+
+
+class _TimeStampTree(ct.ConditionalTree):
+
+    def measure(self, timeStamps, pattern):
+        return [len(timeStamps), sorted(timeStamps)]
+
+    def isPromising(self, value):
+        return value[0] >= _minSup
+
+
+class _IntervalTree(ct.IntervalTree):
+
+    def measure(self, intervals, pattern):
+        cur, per, sup = -1, 0, 0
+        for start, end, period, support in intervals:
+            per = max(per, start - cur, period)
+            cur = end
+            sup += support
+        return [sup, per]
+
+    def isPromising(self, value):
+        return value[0] >= _minSup and value[1] <= _maxPer
+
+
+def _periods(timeStamps):
+    return max(b - a for a, b in zip([-1] + timeStamps, timeStamps))
+
+
+def _bruteForce(database):
+    items = sorted({item for transaction in database for item in transaction})
+    patterns = {}
+    for length in range(1, len(items) + 1):
+        for pattern in combinations(items, length):
+            timeStamps = [ts for ts, transaction in enumerate(database) if set(pattern) <= set(transaction)]
+            if len(timeStamps) >= _minSup:
+                patterns[frozenset(pattern)] = timeStamps
+    return patterns
+
+
+def _mine(tree, database):
+    support = {}
+    for transaction in database:
+        for item in transaction:
+            support[item] = support.get(item, 0) + 1
+    frequent = {item for item, count in support.items() if count >= _minSup}
+    rank = {item: index for index, item in enumerate(sorted(frequent, key=lambda x: (-support[x], x)))}
+    for ts, transaction in enumerate(database):
+        ranked = sorted(rank[item] for item in transaction if item in frequent)
+        if ranked:
+            tree.addTransaction(ranked, [ts] if isinstance(tree.newPayload(), list) else 1)
+    if isinstance(tree.newPayload(), list):
+        tree.info = {rank[item]: [support[item], None] for item in frequent}
+    else:
+        tree.info = {rank[item]: support[item] for item in frequent}
+    names = {index: item for item, index in rank.items()}
+    return {frozenset(names[i] for i in pattern): value for pattern, value in tree.generatePatterns([])}
+
+
+def _mineIntervals(tree, database):
+    timeStamps = {}
+    for ts, transaction in enumerate(database):
+        for item in transaction:
+            timeStamps.setdefault(item, []).append(ts)
+    info = {item: [len(v), _periods(v)] for item, v in timeStamps.items()}
+    periodic = sorted((item for item, value in info.items() if tree.isPromising(value)), key=lambda x: (-info[x][0], x))
+    rank = {item: index for index, item in enumerate(periodic)}
+    for ts, transaction in enumerate(database):
+        ranked = sorted(rank[item] for item in transaction if item in rank)
+        if ranked:
+            tree.addTransaction(ranked, [(ts, ts, 0, 1)])
+    tree.info = {rank[item]: info[item] for item in periodic}
+    return {frozenset(periodic[i] for i in pattern): value for pattern, value in tree.generatePatterns([])}
+
+
+class TestConditionalTree(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.database = [rng.sample(range(8), rng.randint(1, 5)) for _ in range(40)]
+        self.expected = _bruteForce(self.database)
+
+    def test_count_payload(self):
+        patterns = _mine(_CountTree(), self.database)
+        self.assertEqual(patterns, {k: len(v) for k, v in self.expected.items()})
+
+    def test_timestamp_payload(self):
+        patterns = _mine(_TimeStampTree(), self.database)
+        self.assertEqual(set(patterns), set(self.expected))
+        for pattern, value in patterns.items():
+            if len(pattern) > 1:
+                self.assertEqual(value[1], self.expected[pattern])
+
+    def test_interval_payload(self):
+        patterns = _mineIntervals(_IntervalTree(_maxPer), self.database)
+        expected = {pattern: timeStamps for pattern, timeStamps in self.expected.items()
+                    if _periods(timeStamps) <= _maxPer}
+        self.assertEqual(set(patterns), set(expected))
+        for pattern, (support, period) in patterns.items():
+            self.assertEqual(support, len(expected[pattern]))
+            self.assertTrue(_periods(expected[pattern]) <= period <= _maxPer)
+
+    def test_measure_is_abstract(self):
+        class _Incomplete(ct.ConditionalTree):
+            pass
+
+        with self.assertRaises(TypeError):
+            _Incomplete()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/closed/test_closedIndex.py
+
+import unittest
+from PAMI.frequentPattern.closed import closedIndex as ci
+
+
+class TestClosedIndex(unittest.TestCase):
+
+    def test_superset_with_same_tidset_subsumes(self):
+        index = ci.ClosedIndex()
+        self.assertTrue(index.insert(['a', 'b', 'c'], {1, 2, 3}, 3))
+        self.assertTrue(index.isSubsumed(['a', 'c'], [3, 2, 1], 3))
+        self.assertFalse(index.insert(['b'], {1, 2, 3}, 3))
+        self.assertFalse(index.insert(['a', 'b', 'c'], {1, 2, 3}, 3))
+        self.assertEqual(len(index), 1)
+
+    def test_different_tidset_or_support_is_not_subsumed(self):
+        index = ci.ClosedIndex()
+        index.insert(['a', 'b'], {1, 2, 3}, 3)
+        self.assertFalse(index.isSubsumed(['a'], {1, 2, 4}, 3))
+        self.assertFalse(index.isSubsumed(['a'], {1, 2, 3}, 4))
+        self.assertFalse(index.isSubsumed(['a', 'd'], {1, 2, 3}, 3))
+        self.assertTrue(index.insert(['a'], {1, 2, 3, 4}, 4))
+
+    def test_fingerprint_ignores_order(self):
+        self.assertEqual(ci.ClosedIndex.fingerprint([5, 1, 3]), ci.ClosedIndex.fingerprint({1, 3, 5}))
+        self.assertLess(ci.ClosedIndex.fingerprint(range(1000)), 1 << 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/maximal/test_maximalIndex.py
+
+import random
+import unittest
+from PAMI.frequentPattern.maximal import maximalIndex as mi
+
+
+class TestMaximalIndex(unittest.TestCase):
+
+    def test_superset_lookup(self):
+        index = mi.MaximalIndex()
+        self.assertFalse(index.hasSuperset([1]))
+        index.add([1, 2, 3])
+        index.add([2, 4])
+        self.assertTrue(index.hasSuperset([3, 1]))
+        self.assertTrue(index.hasSuperset([4]))
+        self.assertFalse(index.hasSuperset([1, 4]))
+        self.assertFalse(index.hasSuperset([5]))
+
+    def test_conditional_index_focuses_and_propagates(self):
+        index = mi.MaximalIndex()
+        index.add([1, 2, 3])
+        index.add([2, 4])
+        conditional = index.conditionalIndex([1])
+        self.assertEqual(len(conditional), 1)
+        self.assertFalse(conditional.hasSuperset([1, 4]))
+        deeper = conditional.conditionalIndex([4])
+        deeper.add([1, 4, 5])
+        self.assertTrue(conditional.hasSuperset([1, 5]))
+        self.assertTrue(index.hasSuperset([4, 5]))
+        self.assertEqual(len(index), 3)
+
+    def test_matches_set_scan(self):
+        rng = random.Random(11)
+        index = mi.MaximalIndex()
+        stored = []
+        for _ in range(200):
+            pattern = rng.sample(range(20), rng.randint(1, 6))
+            expected = any(set(pattern) <= other for other in stored)
+            self.assertEqual(index.hasSuperset(pattern), expected)
+            if not expected:
+                index.add(pattern)
+                stored.append(set(pattern))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/georeferencedFrequentSequencePattern/basic/test_neighbourhoodEngine.py
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+from PAMI.georeferencedFrequentSequencePattern.basic import GFSPminer
+from PAMI.georeferencedFrequentSequencePattern.basic import neighbourhoodEngine as ne
+from PAMI.sequentialPattern.basic import prefixSpanEngine as pe
+from PAMI.sequentialPattern.basic import spadeEngine as se
+from PAMI.sequentialSpatialPattern.basic import spatialPrefixSpan
+
+
+def _georeferenced(patterns, names, neighbours):
+    def adjacent(a, b):
+        return a == b or names[b] in neighbours[names[a]] or names[a] in neighbours[names[b]]
+
+    return {pattern: support for pattern, support in patterns.items()
+            if all(adjacent(a, b) for itemSet in pattern for a in itemSet for other in pattern for b in other)}
+
+
+class TestNeighbourhoodEngine(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(3)
+        self.database = [[tuple(sorted(random.sample("abcdef", random.randint(1, 3))))
+                          for _ in range(random.randint(1, 6))] for _ in range(40)]
+        self.neighbours = {item: [other for other in "abcdef" if random.random() < 0.4] for item in "abcdef"}
+        self.store, self.names = pe.fromItemsets(self.database)
+        self.bits = ne.NeighbourBits.fromMap(self.neighbours, self.names)
+
+    def test_bits(self):
+        for i, name in enumerate(self.names):
+            expected = [j for j, other in enumerate(self.names)
+                        if i == j or other in self.neighbours[name] or name in self.neighbours[other]]
+            self.assertEqual(self.bits.adjacent(i, range(len(self.names))).nonzero()[0].tolist(), expected)
+
+    def test_engines_match_brute_force(self):
+        ids = {name: i for i, name in enumerate(self.names)}
+        occurrences = [(sid, eid, ids[item]) for sid, sequence in enumerate(self.database)
+                       for eid, itemSet in enumerate(sequence) for item in itemSet]
+        lists = {item: idList for item, idList in enumerate(se.idLists(*zip(*occurrences), len(self.names)))
+                 if idList.support >= 4}
+        expected = _georeferenced(dict(pe.mine(self.store, 4)), self.names, self.neighbours)
+        self.assertEqual(dict(ne.projectionMine(self.store, 4, self.bits)), expected)
+        self.assertEqual(dict(ne.classMine(lists, 4, self.bits)), expected)
+        for maxGap in (1, 2):
+            expected = _georeferenced(dict(pe.mine(self.store, 4, 3, maxGap)), self.names, self.neighbours)
+            self.assertEqual(dict(ne.projectionMine(self.store, 4, self.bits, 3, maxGap)), expected)
+
+    def test_miners(self):
+        expected = _georeferenced(dict(pe.mine(self.store, 4)), self.names, self.neighbours)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "input.txt")
+            with open(path, "w") as f:
+                for sequence in self.database:
+                    f.write(" -1 ".join(" ".join(itemSet) for itemSet in sequence) + " -1 -2\n")
+            neighbourhood = os.path.join(directory, "neighbours.txt")
+            with open(neighbourhood, "w") as f:
+                for item, others in self.neighbours.items():
+                    f.write("\t".join([item] + others) + "\n")
+            with contextlib.redirect_stdout(io.StringIO()):
+                gfsp = GFSPminer.GFSPminer(path, neighbourhood, 4)
+                gfsp.mine()
+                prefixSpan = spatialPrefixSpan.spatialPrefixSpan(path, neighbourhood, 4)
+                prefixSpan.mine()
+        rows = {pattern: [item for itemSet in pattern for item in [self.names[i] for i in itemSet] + [-1]]
+                for pattern in expected}
+        self.assertEqual(gfsp.getPatterns(), {str(tuple(rows[p])): s for p, s in expected.items()})
+        self.assertEqual(prefixSpan.getPatterns(), {str(rows[p]): s for p, s in expected.items()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilityPattern/basic/test_UPGrowth.py
+
+import random
+import unittest
+from itertools import combinations
+import pandas as pd
+from PAMI.highUtilityPattern.basic import EFIM, UPGrowth
+
+
+def _dataFrame(transactions):
+    return pd.DataFrame({'Transactions': [[str(item) for item, _ in transaction] for transaction in transactions],
+                         'Utilities': [[utility for _, utility in transaction] for transaction in transactions],
+                         'UtilitySum': [sum(utility for _, utility in transaction) for transaction in transactions]})
+
+
+def _randomTransactions(seed, repeats=False):
+    rng = random.Random(seed)
+    transactions = []
+    for _ in range(30):
+        items = rng.sample(range(1, 9), rng.randint(1, 6))
+        if repeats:
+            items.append(rng.choice(items))
+        transactions.append([(item, rng.randint(1, 10)) for item in items])
+    return transactions
+
+
+def _bruteForce(transactions, minUtil):
+    merged = []
+    for transaction in transactions:
+        utilities = {}
+        for item, utility in transaction:
+            utilities[item] = utilities.get(item, 0) + utility
+        merged.append(utilities)
+    items = sorted({item for utilities in merged for item in utilities})
+    patterns = {}
+    for length in range(1, len(items) + 1):
+        for itemset in combinations(items, length):
+            utility = sum(sum(utilities[item] for item in itemset) for utilities in merged
+                          if all(item in utilities for item in itemset))
+            if utility >= minUtil:
+                patterns[frozenset(str(item) for item in itemset)] = utility
+    return patterns
+
+
+def _patterns(miner):
+    miner.mine()
+    return {frozenset(x for x in pattern.split('\t') if x): int(utility)
+            for pattern, utility in miner.getPatterns().items()}
+
+
+class TestUPGrowth(unittest.TestCase):
+
+    def test_matches_efim_with_small_batches(self):
+        for seed in range(3):
+            transactions = _randomTransactions(seed)
+            for minUtil in (40, 80, 120, 200):
+                expected = _patterns(EFIM.EFIM(_dataFrame(transactions), minUtil))
+                self.assertEqual(expected, _bruteForce(transactions, minUtil))
+                for batchSize in (1, 3, 10000):
+                    result = _patterns(UPGrowth.UPGrowth(_dataFrame(transactions), minUtil, batchSize=batchSize))
+                    self.assertEqual(result, expected)
+
+    def test_repeated_items_are_merged(self):
+        for seed in range(3):
+            transactions = _randomTransactions(seed, repeats=True)
+            for minUtil in (60, 150):
+                for batchSize in (2, 10000):
+                    result = _patterns(UPGrowth.UPGrowth(_dataFrame(transactions), minUtil, batchSize=batchSize))
+                    self.assertEqual(result, _bruteForce(transactions, minUtil))
+
+
+if __name__ == '__main__':
+    unittest.main()
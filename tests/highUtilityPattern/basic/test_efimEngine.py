@@ -0,0 +1,102 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilityPattern/basic/test_efimEngine.py
+
+import random
+import unittest
+from unittest import mock
+import numpy as np
+from PAMI.highUtilityPattern.basic import efimEngine as ee
+
+
+def _database(transactions):
+    items = [[item for item, _ in transaction] for transaction in transactions]
+    utilities = [[utility for _, utility in transaction] for transaction in transactions]
+    return ee.ProjectedDatabase.fromTransactions(items, utilities, [sum(u) for u in utilities])
+
+
+def _rows(database):
+    return sorted((tuple(database.items[s:e].tolist()), tuple(database.utilities[s:e].tolist()), int(p), int(r))
+                  for s, e, p, r in zip(database.starts, database.ends, database.prefixUtilities,
+                                        database.remainingUtilities))
+
+
+class TestProjectedDatabase(unittest.TestCase):
+
+    def test_projection_and_merge(self):
+        database = _database([[(1, 2), (2, 3), (3, 4)], [(2, 5), (3, 1)], [(1, 1), (2, 1), (3, 2)]])
+        utility, support, projected = database.project(2)
+        self.assertEqual((utility, support), (9, 3))
+        self.assertEqual(len(projected), 1)
+        self.assertEqual(_rows(projected), [((3,), (7,), 9, 7)])
+        self.assertEqual(int(projected.supports[0]), 3)
+        utility, support, projected = database.project(3)
+        self.assertEqual((utility, support, len(projected)), (7, 3, 0))
+
+    def test_merges_identical_transactions_anywhere(self):
+        database = _database([[(1, 1), (2, 2), (3, 3)], [(1, 4), (3, 5)], [(1, 2), (2, 1), (3, 1)]])
+        utility, support, projected = database.project(1)
+        self.assertEqual((utility, support, projected.unmerged, len(projected)), (7, 3, 3, 2))
+        self.assertEqual(_rows(projected), [((2, 3), (3, 4), 3, 7), ((3,), (5,), 4, 5)])
+        self.assertEqual(sorted(projected.supports.tolist()), [1, 2])
+
+    def test_hash_collisions_are_not_merged(self):
+        # with base 1 the hash of a transaction is the sum of its items, so {1, 4} and {2, 3} collide
+        with mock.patch.object(ee, '_hashBase', 1), mock.patch.object(ee, '_hashInverse', 1):
+            database = _database([[(0, 1), (1, 1), (4, 2)], [(0, 1), (2, 3), (3, 4)], [(0, 1), (1, 5), (4, 6)]])
+            utility, support, projected = database.project(0)
+        self.assertEqual((utility, support, len(projected)), (3, 3, 2))
+        self.assertEqual(_rows(projected), [((1, 4), (6, 8), 2, 14), ((2, 3), (3, 4), 1, 7)])
+
+    def test_shared_memory_copy_projects_the_same(self):
+        database = _database([[(1, 2), (2, 3), (3, 4)], [(2, 5), (3, 1)], [(1, 1), (2, 1), (3, 2)]])
+        blocks, layout = database.toSharedMemory()
+        try:
+            shared, opened = ee.ProjectedDatabase.fromSharedMemory(layout)
+            for item in (1, 2, 3):
+                expected = database.project(item)
+                result = shared.project(item)
+                self.assertEqual(result[:2], expected[:2])
+                self.assertEqual(_rows(result[2]), _rows(expected[2]))
+            del shared, result
+            for block in opened:
+                block.close()
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def test_utility_bins_match_scan(self):
+        rng = random.Random(5)
+        transactions = []
+        for _ in range(60):
+            items = sorted(rng.sample(range(1, 9), rng.randint(1, 6)))
+            transactions.append([(item, rng.randint(1, 9)) for item in items])
+        database = _database(transactions)
+        keep = np.ones(9, dtype=bool)
+        keep[4] = False
+        for e in range(1, 9):
+            utility, support, projected = database.project(e)
+            expectedUtility = sum(u for t in transactions for i, u in t if i == e)
+            self.assertEqual(utility, expectedUtility)
+            self.assertEqual(support, sum(1 for t in transactions if e in dict(t)))
+            local, subtree = projected.utilityBins(keep, 9)
+            expectedLocal = [0] * 9
+            expectedSubtree = [0] * 9
+            for t in transactions:
+                d = dict(t)
+                if e not in d:
+                    continue
+                rest = [(i, u) for i, u in t if i > e]
+                remaining = sum(u for _, u in rest)
+                suffix = 0
+                for i, u in reversed(rest):
+                    if keep[i]:
+                        suffix += u
+                        expectedLocal[i] += d[e] + remaining
+                        expectedSubtree[i] += d[e] + suffix
+            self.assertEqual(local.tolist(), expectedLocal)
+            self.assertEqual(subtree.tolist(), expectedSubtree)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilityPattern/basic/test_utilityDatabase.py
+
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from PAMI.highUtilityPattern.basic import utilityDatabase as _utilityDatabase
+from PAMI.highUtilityPattern.basic import EFIM, HMiner, UPGrowth, efimParallel
+
+lines = ["3\t1\t2:9:2\t3\t4", "1\t3:5:1\t4", "2\t3\t4:12:6\t2\t4", "1\t2\t4\t5:13:3\t2\t2\t6",
+         "3\t4\t5:10:5\t3\t2", "1\t2\t3\t4:10:1\t4\t2\t3", "4\t5:9:4\t5"]
+
+
+def naive(text, sep):
+    transactions = []
+    for line in text.replace("\r", "").split("\n"):
+        if not line.strip():
+            continue
+        parts = line.split(":")
+        items = [x.strip() for x in parts[0].split(sep) if x.strip()]
+        utilities = [int(x) for x in parts[2].split(sep) if x.strip()]
+        transactions.append((items, utilities, int(parts[1])))
+    return transactions
+
+
+def write(directory, text):
+    path = os.path.join(directory, "input.txt")
+    with open(path, "w", newline="") as f:
+        f.write(text)
+    return path
+
+
+class TestUtilityDatabase(unittest.TestCase):
+
+    def test_parse_matches_the_lines(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for text, sep in (("\n".join(lines) + "\n", "\t"),
+                              ("b,a,:7:3,4,\r\n\na,08,c:6:1,2,3\r\nc:1:1", ","),
+                              ("x  y:3:1  2\n\ny z:4:2 2\n", " ")):
+                path = write(directory, text)
+                for chunkSize in (1 << 20, 7):
+                    database = _utilityDatabase.load(path, sep, chunkSize)
+                    self.assertEqual(list(database.transactions()), naive(text, sep))
+                    first = list(dict.fromkeys(x for items, _, _ in naive(text, sep) for x in items))
+                    self.assertEqual(database.names, first)
+
+    def test_tokens_are_checked_before_conversion(self):
+        with tempfile.TemporaryDirectory() as directory:
+            text = "7,- 3:4:1,3\n-7,3:5:2,3\n"
+            database = _utilityDatabase.load(write(directory, text), ",")
+            self.assertEqual(list(database.transactions()), naive(text, ","))
+            self.assertEqual(database.names, ['7', '- 3', '-7', '3'])
+            with self.assertRaises(ValueError):
+                _utilityDatabase.load(write(directory, "1,2:4:1,- 3\n"), ",")
+
+    def test_twu_and_processes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = write(directory, "\n".join(lines * 50) + "\n")
+            database = _utilityDatabase.load(path, "\t", 64)
+            self.assertEqual(len(database), 350)
+            twu = {}
+            for items, _, transactionUtility in database.transactions():
+                for item in items:
+                    twu[item] = twu.get(item, 0) + transactionUtility
+            self.assertEqual(dict(zip(database.names, database.twu.tolist())), twu)
+            parallel = _utilityDatabase.load(path, "\t", 64, processes=2)
+            self.assertEqual(list(parallel.transactions()), list(database.transactions()))
+            self.assertIs(_utilityDatabase.load(database), database)
+
+    def test_rename(self):
+        database = _utilityDatabase.UtilityDatabase(['a', 'b', 'c'], np.array([0, 1, 2, 1, 1, 0]),
+                                                    np.array([1, 2, 3, 4, 5, 6]), np.array([3, 1, 2]),
+                                                    np.array([6, 4, 11]))
+        items, utilities, starts, ends, transactionUtilities = database.rename(np.array([2, 0, 1]))
+        self.assertEqual(items.tolist(), [1, 2, 2])
+        self.assertEqual(utilities.tolist(), [3, 1, 6])
+        self.assertEqual((starts.tolist(), ends.tolist()), ([0, 2], [2, 3]))
+        self.assertEqual(transactionUtilities.tolist(), [4, 6])
+
+    def test_miners_share_a_loaded_database(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = write(directory, "\n".join(lines) + "\n")
+            database = _utilityDatabase.load(path)
+            frame = pd.DataFrame({'Transactions': [t for t, _, _ in database.transactions()],
+                                  'Utilities': [u for _, u, _ in database.transactions()],
+                                  'UtilitySum': database.transactionUtilities.tolist()})
+            for minUtil in (10, 15, 20):
+                expected = None
+                for miner in (EFIM.EFIM, HMiner.HMiner, UPGrowth.UPGrowth, efimParallel.efimParallel):
+                    for source in (path, database, frame):
+                        obj = miner(source, minUtil)
+                        obj.mine()
+                        patterns = {tuple(sorted(x for x in key.split("\t") if x)): int(value)
+                                    for key, value in obj.getPatterns().items()}
+                        if expected is None:
+                            expected = patterns
+                        self.assertEqual(patterns, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
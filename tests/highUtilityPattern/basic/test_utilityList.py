@@ -0,0 +1,38 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilityPattern/basic/test_utilityList.py
+
+import unittest
+import numpy as np
+from PAMI.highUtilityPattern.basic import utilityList as ul
+
+
+class TestUtilityList(unittest.TestCase):
+
+    def test_columns_and_totals(self):
+        x = ul.UtilityList('a', [1, 3, 4], utility=[5, 2, 1], remaining=[4, 0, 3])
+        self.assertEqual(len(x), 3)
+        self.assertEqual(x.utility.tolist(), [5, 2, 1])
+        self.assertEqual((x.total('utility'), x.total('remaining')), (8, 7))
+        with self.assertRaises(AttributeError):
+            x.missing
+
+    def test_intersect_is_a_merge_join(self):
+        x = ul.UtilityList('a', [1, 3, 4, 9], utility=[5, 2, 1, 7])
+        y = ul.UtilityList('b', [0, 3, 9, 12], utility=[1, 1, 9, 2])
+        tids, inX, inY = x.intersect(y)
+        self.assertEqual(tids.tolist(), [3, 9])
+        xy = ul.UtilityList('ab', tids, utility=x.utility[inX] + y.utility[inY])
+        self.assertEqual(xy.utility.tolist(), [3, 16])
+        self.assertEqual(x.take(inX).tids.tolist(), [3, 9])
+
+    def test_locate(self):
+        y = ul.UtilityList('b', [2, 5, 8], utility=[1, 2, 3])
+        found, positions = y.locate(np.array([1, 2, 8, 10]))
+        self.assertEqual(found.tolist(), [False, True, True, False])
+        self.assertEqual(positions[found].tolist(), [0, 2])
+        found, _ = ul.UtilityList('c', []).locate(np.array([1, 2]))
+        self.assertEqual(found.tolist(), [False, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
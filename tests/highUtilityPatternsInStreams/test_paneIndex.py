@@ -0,0 +1,63 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilityPatternsInStreams/test_paneIndex.py
+
+import unittest
+from PAMI.highUtilityPatternsInStreams import paneIndex as pi
+from PAMI.highUtilityPatternsInStreams import HUPMS as alg
+
+lines = ["a,b,c:6:1,2,3", "a,c:5:4,1", "b,c:3:2,1", "a,b:7:5,2",
+         "a,b,c:9:3,3,3", "c:2:2", "a,c:4:2,2", "b:1:1", "a,b,c:6:2,2,2"]
+
+
+def bruteForce(transactions, itemSet):
+    total = 0
+    for items, utilities, _ in transactions:
+        row = dict(zip(items, utilities))
+        if all(item in row for item in itemSet):
+            total += sum(row[item] for item in itemSet)
+    return total
+
+
+class TestPaneIndex(unittest.TestCase):
+
+    def test_read_skips_blank_lines_and_accepts_tuples(self):
+        stream = list(pi.readTransactions(["a,b:3:1,2\n", "\n", (["c"], [4], 4)], ","))
+        self.assertEqual(stream, [(["a", "b"], [1.0, 2.0], 3.0), (["c"], [4.0], 4.0)])
+
+    def test_panes_drop_unfinished_pane(self):
+        self.assertEqual([len(p) for p in pi.panes(range(7), 3)], [3, 3])
+
+    def test_sliding_utilities(self):
+        transactions = list(pi.readTransactions(lines, ","))
+        index = pi.PaneIndex(2)
+        for pane in pi.panes(transactions, 2):
+            index.addPane(pane)
+            if not index.isFull():
+                continue
+            window = transactions[index.start:index.end]
+            joins = {}
+            for itemSet in (["a"], ["a", "b"], ["a", "b", "c"], ["c", "b"], ["d"]):
+                self.assertEqual(index.utility(itemSet, joins), bruteForce(window, itemSet))
+        self.assertEqual((index.start, index.end), (4, 8))
+
+    def test_windows_are_emitted_lazily(self):
+        consumed = []
+
+        def stream():
+            for line in lines:
+                consumed.append(line)
+                yield line
+
+        miner = alg.HUPMS(stream(), "", 5, 2, 2)
+        windows = miner.windowPatterns()
+        window, patterns = next(windows)
+        self.assertEqual(window, (0, 4))
+        self.assertEqual(len(consumed), 4)
+        transactions = list(pi.readTransactions(lines[:4], ","))
+        for itemSet, utility in patterns:
+            self.assertEqual(utility, bruteForce(transactions, itemSet))
+        self.assertEqual([w for w, _ in windows], [(2, 6), (4, 8)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilitySpatialPattern/basic/test_neighbourhoodIndex.py
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from itertools import combinations
+from PAMI.highUtilitySpatialPattern.basic import neighbourhoodIndex as _neighbourhoodIndex
+from PAMI.highUtilitySpatialPattern.basic import SHUIM, HDSHUIM
+from PAMI.highUtilityGeoreferencedFrequentPattern.basic import SHUFIM
+
+transactions = ["a\tb\tc:9:2\t3\t4", "a\tc:5:1\t4", "b\tc\td:12:6\t2\t4", "a\tb\td\te:13:3\t2\t2\t6",
+                "c\td\te:10:5\t3\t2", "a\tb\tc\td:10:1\t4\t2\t3", "d\te:9:4\t5"]
+neighbours = ["a\tb\tc", "b\ta\tc\td", "c\ta\tb\td", "d\tb\tc\te", "e\td"]
+
+
+def rows():
+    result = []
+    for line in transactions:
+        parts = line.split(":")
+        result.append(dict(zip(parts[0].split("\t"), map(int, parts[2].split("\t")))))
+    return result
+
+
+def bruteForce(minUtil, minSup=0):
+    adjacent = {line.split("\t")[0]: set(line.split("\t")[1:]) for line in neighbours}
+    patterns = {}
+    for size in range(1, 6):
+        for itemSet in combinations("abcde", size):
+            if all(y in adjacent[x] for x, y in combinations(itemSet, 2)):
+                containing = [row for row in rows() if all(x in row for x in itemSet)]
+                utility = sum(sum(row[x] for x in itemSet) for row in containing)
+                if utility >= minUtil and len(containing) >= minSup:
+                    patterns[itemSet] = utility
+    return patterns
+
+
+def normalise(patterns):
+    return {tuple(sorted(key.split("\t"))): int(value[0] if isinstance(value, list) else value)
+            for key, value in patterns.items()}
+
+
+class TestNeighbourhoodIndex(unittest.TestCase):
+
+    def test_bitsets(self):
+        index = _neighbourhoodIndex.NeighbourhoodIndex({'a': ['b', 'c', 'x'], 'b': ['a'], 'x': ['a']},
+                                                       {'a': 0, 'b': 1, 'c': 2})
+        self.assertEqual(index.all, 0b111)
+        self.assertEqual(index.neighbours(0), 0b110)
+        self.assertEqual(index.neighbours(2), 0)
+        self.assertIn(1, index)
+        self.assertNotIn(2, index)
+        common = index.narrow(index.all, 0)
+        self.assertEqual(index.narrow(common, 1), 0)
+        self.assertEqual(index.narrow(index.neighbours(1), 0), 0)
+
+    def test_miners_match_brute_force(self):
+        adjacent = {line.split("\t")[0]: set(line.split("\t")[1:]) for line in neighbours}
+        with tempfile.TemporaryDirectory() as directory:
+            iFile = os.path.join(directory, "input.txt")
+            nFile = os.path.join(directory, "neighbours.txt")
+            with open(iFile, "w") as f:
+                for line, row in zip(transactions, rows()):
+                    pmus = [row[x] + sum(row[y] for y in row if y in adjacent[x]) for x in row]
+                    f.write(line + ":" + "\t".join(map(str, pmus)) + "\n")
+            with open(nFile, "w") as f:
+                f.write("\n".join(neighbours) + "\n")
+            for minUtil in (10, 20, 30):
+                for miner in (SHUIM.SHUIM(iFile, nFile, minUtil), HDSHUIM.HDSHUIM(iFile, nFile, minUtil)):
+                    miner.mine()
+                    self.assertEqual(normalise(miner.getPatterns()), bruteForce(minUtil))
+                obj = SHUFIM.SHUFIM(iFile, nFile, minUtil, 2)
+                with redirect_stdout(io.StringIO()):
+                    obj.mine()
+                self.assertEqual(normalise(obj.getPatterns()), bruteForce(minUtil, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
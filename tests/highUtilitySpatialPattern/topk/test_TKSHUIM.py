@@ -0,0 +1,60 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilitySpatialPattern/topk/test_TKSHUIM.py
+
+import os
+import tempfile
+import unittest
+from itertools import combinations
+from PAMI.highUtilitySpatialPattern.topk import TKSHUIM as alg
+
+transactions = ["a\tb\tc:9:2\t3\t4", "a\tc:5:1\t4", "b\tc\td:12:6\t2\t4", "a\tb\td:7:3\t2\t2",
+                "c\td:8:5\t3", "a\tb\tc\td:10:1\t4\t2\t3"]
+neighbours = ["a\tb\tc", "b\ta\tc\td", "c\ta\tb\td", "d\tb\tc"]
+
+
+def bruteForce(k):
+    rows = []
+    for line in transactions:
+        parts = line.split(":")
+        rows.append(dict(zip(parts[0].split("\t"), map(int, parts[2].split("\t")))))
+    adjacent = {line.split("\t")[0]: set(line.split("\t")[1:]) for line in neighbours}
+    utilities = []
+    for size in range(1, 5):
+        for itemSet in combinations("abcd", size):
+            if all(y in adjacent[x] for x, y in combinations(itemSet, 2)):
+                utility = sum(sum(row[x] for x in itemSet) for row in rows if all(x in row for x in itemSet))
+                if utility > 0:
+                    utilities.append(utility)
+    return sorted(utilities, reverse=True)[:k]
+
+
+class TestTKSHUIM(unittest.TestCase):
+
+    def test_top_k_heap(self):
+        topK = alg.TopKPatterns(2)
+        self.assertEqual(topK.add("a", 5), 0)
+        self.assertEqual(topK.add("b", 3), 3)
+        self.assertEqual(topK.add("c", 9), 5)
+        self.assertEqual(topK.add("d", 1), 5)
+        self.assertEqual(sorted(topK.heap), [(5, "a"), (9, "c")])
+        topK.raiseThreshold([4, 8, 2])
+        self.assertEqual((topK.floor, topK.threshold()), (4, 5))
+        topK.raiseThreshold([7])
+        self.assertEqual(topK.floor, 4)
+
+    def test_matches_brute_force(self):
+        with tempfile.TemporaryDirectory() as directory:
+            iFile = os.path.join(directory, "input.txt")
+            nFile = os.path.join(directory, "neighbours.txt")
+            with open(iFile, "w") as f:
+                f.write("\n".join(transactions) + "\n")
+            with open(nFile, "w") as f:
+                f.write("\n".join(neighbours) + "\n")
+            for k in (1, 3, 6):
+                obj = alg.TKSHUIM(iFile, nFile, k)
+                obj.mine()
+                self.assertEqual(sorted(obj.getPatterns().values(), reverse=True), bruteForce(k))
+
+
+if __name__ == '__main__':
+    unittest.main()
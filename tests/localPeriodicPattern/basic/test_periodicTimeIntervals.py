@@ -0,0 +1,60 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/localPeriodicPattern/basic/test_periodicTimeIntervals.py
+
+import random
+import unittest
+import numpy as np
+from PAMI.localPeriodicPattern.basic import periodicTimeIntervals as ptl
+
+
+def sequentialPTL(tsList, maxPer, maxSoPer, minDur, tsMax):
+    # Reference scan of the timestamps, one period at a time
+    start = -1
+    PTL = set()
+    tsPre = tsList[0]
+    soPer = maxSoPer
+    for ts in tsList[1:]:
+        per = ts - tsPre
+        if per <= maxPer and start == -1:
+            start = tsPre
+            soPer = maxSoPer
+        if start != -1:
+            soPer = max(0, soPer + per - maxPer)
+            if soPer > maxSoPer:
+                if tsPre - start >= minDur:
+                    PTL.add((start, tsPre))
+                start = -1
+        tsPre = ts
+    if start != -1:
+        soPer = max(0, soPer + tsMax - tsPre - maxPer)
+        if soPer > maxSoPer and tsPre - start >= minDur:
+            PTL.add((start, tsPre))
+        if soPer <= maxSoPer and tsMax - start >= minDur:
+            PTL.add((start, tsMax))
+    return PTL
+
+
+class TestPeriodicTimeIntervals(unittest.TestCase):
+
+    def test_matches_sequential_scan(self):
+        rng = random.Random(7)
+        for _ in range(500):
+            size = rng.randint(1, 300)
+            tsMax = rng.randint(size, 1000)
+            tsList = sorted(rng.sample(range(1, tsMax + 1), size))
+            maxPer, maxSoPer, minDur = rng.randint(1, 10), rng.randint(0, 10), rng.randint(0, 40)
+            expected = sequentialPTL(tsList, maxPer, maxSoPer, minDur, tsMax)
+            result = ptl.calculatePTL(np.array(tsList), maxPer, maxSoPer, minDur, tsMax)
+            self.assertEqual(ptl.intervalsToSet(result), expected)
+
+    def test_open_interval_end(self):
+        tsList = np.array([1, 2, 3, 4, 5])
+        self.assertEqual(ptl.intervalsToSet(ptl.calculatePTL(tsList, 2, 5, 1, 10)), {(1, 10)})
+        self.assertEqual(ptl.intervalsToSet(ptl.calculatePTL(tsList, 2, 5, 1, 10, closeAtTsMax=False)), {(1, 5)})
+
+    def test_single_timestamp(self):
+        self.assertEqual(ptl.calculatePTL(np.array([3]), 2, 2, 1, 10).shape, (0, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/multipleMinimumSupportBasedSequentialPattern/basic/test_misEngine.py
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+import numpy as np
+from PAMI.multipleMinimumSupportBasedSequentialPattern.basic import MMSBPrefixSpan, misEngine
+from PAMI.sequentialPattern.basic import prefixSpanEngine as pe
+
+
+def _lowestMis(patterns, mis):
+    return {pattern: support for pattern, support in patterns.items()
+            if support >= min(mis[item] for itemSet in pattern for item in itemSet)}
+
+
+class TestMisEngine(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(11)
+        self.database = [[tuple(sorted(random.sample("abcdefgh", random.randint(1, 3))))
+                          for _ in range(random.randint(1, 7))] for _ in range(40)]
+        self.store, self.names = pe.fromItemsets(self.database)
+
+    def test_closure(self):
+        keep, threshold = misEngine.closure(float("inf"), np.array([9., 3., 5.]), np.array([10, 2, 6]))
+        self.assertEqual(keep.tolist(), [True, False, True])
+        self.assertEqual(threshold, 5.)
+
+    def test_engine_matches_brute_force(self):
+        for _ in range(5):
+            mis = np.array([random.choice([2, 4, 8, 15, 30]) for _ in self.names], dtype=float)
+            for maxLength, maxGap in ((float("inf"), float("inf")), (3, float("inf")), (3, 1), (float("inf"), 2)):
+                expected = _lowestMis(dict(pe.mine(self.store, mis.min(), maxLength, maxGap)), mis)
+                self.assertEqual(dict(misEngine.mine(self.store, mis, maxLength, maxGap)), expected)
+
+    def test_miner(self):
+        mis = np.maximum(self.store.supports - 10, 4).astype(float)
+        mis[self.store.supports < 4] = float("inf")
+        expected = {}
+        for pattern, support in _lowestMis(dict(pe.mine(self.store, 4)), mis).items():
+            row = []
+            for itemSet in pattern:
+                row.extend(self.names[item] for item in itemSet)
+                row.append(-1)
+            expected[str(row)] = support
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "input.txt")
+            with open(path, "w") as f:
+                for sequence in self.database:
+                    f.write(" -1 ".join(" ".join(itemSet) for itemSet in sequence) + "\n")
+            with contextlib.redirect_stdout(io.StringIO()):
+                obj = MMSBPrefixSpan.MMSBprefixSpan(path, 4, 10, " ")
+                obj.mine()
+        self.assertEqual(obj.getPatterns(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
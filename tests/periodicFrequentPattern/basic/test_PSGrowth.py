@@ -0,0 +1,45 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/periodicFrequentPattern/basic/test_PSGrowth.py
+
+import contextlib
+import io
+import random
+import unittest
+from itertools import combinations
+import pandas as pd
+from PAMI.periodicFrequentPattern.basic import PSGrowth
+
+
+def _bruteForce(database, minSup, maxPer):
+    items = sorted({item for transaction in database for item in transaction})
+    patterns = {}
+    for length in range(1, len(items) + 1):
+        for pattern in combinations(items, length):
+            timeStamps = [ts for ts, transaction in enumerate(database, 1) if set(pattern) <= set(transaction)]
+            if len(timeStamps) < minSup:
+                continue
+            period = max(b - a for a, b in zip([0] + timeStamps, timeStamps + [len(database)]))
+            if period <= maxPer:
+                patterns[frozenset(pattern)] = [len(timeStamps), period]
+    return patterns
+
+
+class TestPSGrowth(unittest.TestCase):
+
+    def test_periods_are_exact(self):
+        for seed in range(3):
+            rng = random.Random(seed)
+            database = [[str(item) for item in rng.sample(range(9), rng.randint(1, 6))] for _ in range(60)]
+            dataFrame = pd.DataFrame({'TS': list(range(1, len(database) + 1)),
+                                      'Transactions': ['\t'.join(transaction) for transaction in database]})
+            for minSup, maxPer in ((10, 12), (15, 8)):
+                obj = PSGrowth.PSGrowth(dataFrame, minSup, maxPer)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    obj.mine()
+                patterns = {frozenset(item for item in pattern.split('\t') if item): value
+                            for pattern, value in obj.getPatterns().items()}
+                self.assertEqual(patterns, _bruteForce(database, minSup, maxPer))
+
+
+if __name__ == '__main__':
+    unittest.main()
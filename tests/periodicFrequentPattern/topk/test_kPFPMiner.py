@@ -0,0 +1,53 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/periodicFrequentPattern/topk/test_kPFPMiner.py
+
+import os
+import random
+import tempfile
+import unittest
+from itertools import combinations
+from PAMI.periodicFrequentPattern.topk.kPFPMiner.kPFPMiner import kPFPMiner
+
+
+def _periodicity(timeStamps, lastTs):
+    points = [0] + timeStamps + [lastTs]
+    return max(b - a for a, b in zip(points, points[1:]))
+
+
+def _bruteForce(database):
+    lastTs = len(database)
+    items = sorted({item for transaction in database for item in transaction})
+    periodicities = []
+    for length in range(1, len(items) + 1):
+        for pattern in combinations(items, length):
+            timeStamps = [ts + 1 for ts, transaction in enumerate(database) if set(pattern) <= set(transaction)]
+            if timeStamps:
+                periodicities.append(_periodicity(timeStamps, lastTs))
+    return sorted(periodicities)
+
+
+class TestKPFPMiner(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(3)
+        self.database = [rng.sample(['a', 'b', 'c', 'd', 'e', 'f'], rng.randint(1, 5)) for _ in range(60)]
+        handle, self.iFile = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handle, 'w') as f:
+            for ts, transaction in enumerate(self.database):
+                f.write('\t'.join([str(ts + 1)] + transaction) + '\n')
+
+    def tearDown(self):
+        os.remove(self.iFile)
+
+    def test_top_k_periodicities(self):
+        expected = _bruteForce(self.database)
+        for k in [1, 5, 20, 40]:
+            obj = kPFPMiner(self.iFile, k)
+            obj.mine()
+            patterns = obj.getPatterns()
+            self.assertEqual(len(patterns), k)
+            self.assertEqual(sorted(patterns.values()), expected[:k])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/relativeHighUtilityPattern/parallel/test_parallelRHUIM.py
+
+import os
+import random
+import tempfile
+import unittest
+from PAMI.relativeHighUtilityPattern.basic import RHUIM as sequential
+from PAMI.relativeHighUtilityPattern.parallel import parallelRHUIM as alg
+
+
+class TestParallelRHUIM(unittest.TestCase):
+
+    def test_same_patterns_as_RHUIM(self):
+        generator = random.Random(7)
+        with tempfile.TemporaryDirectory() as directory:
+            iFile = os.path.join(directory, "input.txt")
+            with open(iFile, "w") as f:
+                for _ in range(300):
+                    items = generator.sample(range(1, 16), generator.randint(1, 8))
+                    utilities = [generator.randint(1, 10) for _ in items]
+                    f.write("%s:%d:%s\n" % ("\t".join(map(str, items)), sum(utilities),
+                                            "\t".join(map(str, utilities))))
+            expected = sequential.RHUIM(iFile, 400, 30)
+            expected.mine()
+            self.assertGreater(len(expected.getPatterns()), 0)
+            for threads in (1, 3):
+                obj = alg.parallelRHUIM(iFile, 400, 30, threads=threads)
+                obj.mine()
+                self.assertEqual(obj.getPatterns(), expected.getPatterns())
+
+
+if __name__ == '__main__':
+    unittest.main()
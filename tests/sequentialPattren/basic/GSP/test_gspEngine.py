@@ -0,0 +1,68 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/GSP/test_gspEngine.py
+
+import random
+import unittest
+from PAMI.sequentialPattern.basic import gspEngine as ge
+
+
+def _contains(sequence, pattern):
+    position = 0
+    for itemSet in sequence:
+        if set(pattern[position]) <= set(itemSet):
+            position += 1
+            if position == len(pattern):
+                return True
+    return False
+
+
+def _bruteForce(database, minSup):
+    items = sorted({item for sequence in database for itemSet in sequence for item in itemSet})
+    patterns = {}
+
+    def grow(pattern):
+        for item in items:
+            candidates = [pattern + ((item,),)]
+            if pattern and item > pattern[-1][-1]:
+                candidates.append(pattern[:-1] + (pattern[-1] + (item,),))
+            for candidate in candidates:
+                support = sum(_contains(sequence, candidate) for sequence in database)
+                if support >= minSup:
+                    patterns[candidate] = support
+                    grow(candidate)
+
+    grow(())
+    return patterns
+
+
+class TestGSPEngine(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(8)
+        self.database = [[tuple(sorted(random.sample(range(6), random.randint(1, 3))))
+                          for _ in range(random.randint(0, 7))] for _ in range(50)]
+
+    def test_mine_matches_brute_force(self):
+        for minSup in (4, 8, 15):
+            self.assertEqual(dict(ge.mine(self.database, minSup)), _bruteForce(self.database, minSup))
+
+    def test_trie_counts_every_contained_candidate_once(self):
+        candidates = list(_bruteForce(self.database, 10))
+        supports = ge.CandidateTrie(candidates).supports(
+            ([frozenset(itemSet) for itemSet in sequence],
+             {item: [eid for eid, itemSet in enumerate(sequence) if item in itemSet]
+              for itemSet in sequence for item in itemSet})
+            for sequence in self.database)
+        self.assertEqual(supports, [sum(_contains(sequence, pattern) for sequence in self.database)
+                                    for pattern in candidates])
+
+    def test_candidates_are_pruned_by_contiguous_subsequences(self):
+        frequent = [((0,), (1,)), ((1,), (2,)), ((0, 1),), ((1, 2),)]
+        self.assertEqual(ge.candidates(frequent), [((0,), (1,), (2,))])
+        frequent.append(((0,), (2,)))
+        self.assertEqual(sorted(ge.candidates(frequent)), [((0,), (1,), (2,)), ((0,), (1, 2)), ((0, 1), (2,))])
+        self.assertEqual(ge.candidates([((0, 1),), ((1, 2),)]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
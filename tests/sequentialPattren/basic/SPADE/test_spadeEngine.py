@@ -0,0 +1,121 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/SPADE/test_spadeEngine.py
+
+import ast
+import contextlib
+import io
+import random
+import unittest
+from PAMI.sequentialPattern.basic import SPADEPlus
+from PAMI.sequentialPattern.basic import sequenceDatabase as _sequenceDatabase
+from PAMI.sequentialPattern.basic import spadeEngine as se
+
+
+def _idLists(database, numberOfItems):
+    sequences, positions, items = [], [], []
+    for sid, sequence in enumerate(database):
+        for position, itemSet in enumerate(sequence):
+            for item in itemSet:
+                sequences.append(sid)
+                positions.append(position)
+                items.append(item)
+    return se.idLists(sequences, positions, items, numberOfItems)
+
+
+def _occurrences(idList):
+    return sorted(zip(idList.sids.tolist(), idList.eids.tolist()))
+
+
+def _embeds(pattern, sequence, maxGap, start=0, previous=None):
+    if not pattern:
+        return True
+    stop = len(sequence) if previous is None else min(len(sequence), previous + maxGap + 1)
+    return any(set(pattern[0]) <= set(sequence[eid]) and _embeds(pattern[1:], sequence, maxGap, eid + 1, eid)
+               for eid in range(start, stop))
+
+
+def _gapPatterns(database, minSup, maxGap):
+    items = sorted({item for sequence in database for itemSet in sequence for item in itemSet})
+    patterns = {}
+    stack = [((item,),) for item in items]
+    while stack:
+        pattern = stack.pop()
+        support = sum(_embeds(pattern, sequence, maxGap) for sequence in database)
+        if support < minSup:
+            continue
+        patterns[pattern] = support
+        stack.extend(pattern + ((item,),) for item in items)
+        stack.extend(pattern[:-1] + (pattern[-1] + (item,),) for item in items if item > pattern[-1][-1])
+    return patterns
+
+
+def _spadePlusPatterns(database, minSup, maxGap):
+    with contextlib.redirect_stdout(io.StringIO()):
+        obj = SPADEPlus.SPADEPlus(_sequenceDatabase.fromItemsets(database), minSup, maxGap=maxGap)
+        obj.mine()
+    patterns = {}
+    for key, support in obj.getPatterns().items():
+        row = ast.literal_eval(key) if key.startswith('(') else (key, '-1')
+        pattern, itemSet = [], []
+        for item in row:
+            if item == '-1':
+                pattern.append(tuple(sorted(itemSet)))
+                itemSet = []
+            else:
+                itemSet.append(item)
+        if itemSet:
+            pattern.append(tuple(sorted(itemSet)))
+        patterns[tuple(pattern)] = support
+    return patterns
+
+
+class TestIdLists(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(11)
+        self.database = [[random.sample(range(5), random.randint(1, 3)) for _ in range(random.randint(1, 90))]
+                         for _ in range(40)]
+        self.lists = _idLists(self.database, 5)
+
+    def test_item_id_lists(self):
+        for item, idList in enumerate(self.lists):
+            expected = [(sid, eid) for sid, sequence in enumerate(self.database)
+                        for eid, itemSet in enumerate(sequence) if item in itemSet]
+            self.assertEqual(_occurrences(idList), expected)
+            self.assertEqual(idList.support, len({sid for sid, _ in expected}))
+
+    def test_joins_match_brute_force(self):
+        for first in range(5):
+            for second in range(5):
+                later = [(sid, eid) for sid, sequence in enumerate(self.database)
+                         for eid, itemSet in enumerate(sequence)
+                         if second in itemSet and any(first in s for s in sequence[:eid])]
+                self.assertEqual(_occurrences(se.temporalJoin(self.lists[first], self.lists[second])), later)
+                close = [(sid, eid) for sid, eid in later
+                         if any(first in s for s in self.database[sid][max(eid - 2, 0):eid])]
+                self.assertEqual(_occurrences(se.temporalJoin(self.lists[first], self.lists[second], 2)), close)
+                same = [(sid, eid) for sid, sequence in enumerate(self.database)
+                        for eid, itemSet in enumerate(sequence) if first in itemSet and second in itemSet]
+                self.assertEqual(_occurrences(se.equalityJoin(self.lists[first], self.lists[second])), same)
+                bitmaps = [se.BitmapIdList.fromIdList(self.lists[i], 2) for i in (first, second)]
+                self.assertEqual(se.bitmapTemporalJoin(*bitmaps).sids.tolist(), sorted({sid for sid, _ in later}))
+                self.assertEqual(se.bitmapEqualityJoin(*bitmaps).sids.tolist(), sorted({sid for sid, _ in same}))
+
+
+    def test_spade_plus_max_gap_matches_brute_force(self):
+        random.seed(3)
+        database = [[sorted(random.sample("abcde", random.randint(1, 2))) for _ in range(random.randint(1, 8))]
+                    for _ in range(40)]
+        for minSup, maxGap in ((6, 1), (6, 2), (10, 3)):
+            patterns = _spadePlusPatterns(database, minSup, maxGap)
+            expected = _gapPatterns(database, minSup, maxGap)
+            # consecutive itemsets at most maxGap apart, with the support counted under the gap
+            self.assertEqual({pattern: expected.get(pattern) for pattern in patterns}, patterns)
+            # the classes are joined from their frequent members, which finds every pattern of two items
+            self.assertEqual({pattern for pattern in expected if sum(map(len, pattern)) <= 2},
+                             {pattern for pattern in patterns if sum(map(len, pattern)) <= 2})
+            self.assertGreater(len(patterns), 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
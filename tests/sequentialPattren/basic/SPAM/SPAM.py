@@ -6,7 +6,7 @@ import warnings
 warnings.filterwarnings("ignore")
 
 # Apriori algorithm from PAMI
-def test_pami(dataset, min_sup=0.2):
+def test_pami(dataset, min_sup=0.02):
     dataset = [",".join(i) for i in dataset]
     with open("sample.csv", "w+") as f:
         f.write("\n".join(dataset))
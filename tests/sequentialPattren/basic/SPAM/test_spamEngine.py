@@ -0,0 +1,70 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/SPAM/test_spamEngine.py
+
+import random
+import unittest
+import numpy as np
+from PAMI.sequentialPattern.basic import spamEngine as se
+
+
+def _index(database, minSup):
+    sequences, positions, items = [], [], []
+    for sid, sequence in enumerate(database):
+        for position, itemSet in enumerate(sequence):
+            for item in itemSet:
+                sequences.append(sid)
+                positions.append(position)
+                items.append(item)
+    return se.BitmapIndex(sequences, positions, items, len(database), minSup)
+
+
+def _contains(sequence, pattern):
+    position = 0
+    for itemSet in pattern:
+        while position < len(sequence) and not set(itemSet) <= set(sequence[position]):
+            position += 1
+        if position == len(sequence):
+            return False
+        position += 1
+    return True
+
+
+class TestBitmapIndex(unittest.TestCase):
+
+    def test_s_step(self):
+        bits = np.array([[0b010100, 0], [0, 0b1000], [0, 0], [1 << 63, 0b1]], dtype=np.uint64)
+        result = se.sStep(bits)
+        full = np.uint64(0xFFFFFFFFFFFFFFFF)
+        self.assertEqual(result[0].tolist(), [int(~np.uint64(0b000111)), int(full)])
+        self.assertEqual(result[1].tolist(), [0, int(~np.uint64(0b1111))])
+        self.assertEqual(result[2].tolist(), [0, 0])
+        self.assertEqual(result[3].tolist(), [0, int(full)])
+
+    def test_extensions_match_brute_force(self):
+        random.seed(7)
+        database = [[random.sample(range(6), random.randint(1, 3)) for _ in range(random.randint(1, 80))]
+                    for _ in range(60)]
+        index = _index(database, 5)
+        self.assertEqual(index.words, 2)
+        ranks = list(range(len(index)))
+        for rank in ranks:
+            item = int(index.items[rank])
+            bitmap = index.bitmap(rank)
+            self.assertEqual(len(bitmap[0]), sum(_contains(s, [[item]]) for s in database))
+            found = {index.items[r]: support for r, _, support in index.sExtensions(bitmap, ranks)}
+            for other in index.items.tolist():
+                support = sum(_contains(s, [[item], [other]]) for s in database)
+                self.assertEqual(found.get(other, 0), support if support >= 5 else 0)
+            found = {index.items[r]: (b, support) for r, b, support in index.iExtensions(bitmap, ranks[rank + 1:])}
+            for other in index.items[rank + 1:].tolist():
+                support = sum(_contains(s, [[item, other]]) for s in database)
+                self.assertEqual(found[other][1] if other in found else 0, support if support >= 5 else 0)
+                if other in found:
+                    deeper = index.sExtensions(found[other][0], ranks)
+                    for r, _, count in deeper:
+                        self.assertEqual(count, sum(_contains(s, [[item, other], [int(index.items[r])]])
+                                                    for s in database))
+
+
+if __name__ == '__main__':
+    unittest.main()
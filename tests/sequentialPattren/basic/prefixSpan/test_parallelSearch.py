@@ -0,0 +1,68 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/prefixSpan/test_parallelSearch.py
+
+import random
+import unittest
+from PAMI.sequentialPattern.basic import parallelSearch as ps
+from PAMI.sequentialPattern.basic import prefixSpanEngine as pe
+from PAMI.sequentialPattern.basic import spadeEngine as se
+from PAMI.sequentialPattern.basic import spamEngine as sm
+
+
+def _search(space, roots, workers):
+    patterns = {}
+
+    def sink(pattern, support):
+        patterns[pattern] = support
+
+    ps.search(space, roots, sink, workers)
+    return patterns
+
+
+class TestParallelSearch(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(3)
+        self.database = [[tuple(sorted(random.sample(range(7), random.randint(1, 3))))
+                          for _ in range(random.randint(1, 6))] for _ in range(60)]
+        self.minSup = 5
+        self.sequences, self.positions, self.items = [], [], []
+        for sid, sequence in enumerate(self.database):
+            for eid, itemSet in enumerate(sequence):
+                for item in itemSet:
+                    self.sequences.append(sid)
+                    self.positions.append(eid)
+                    self.items.append(item)
+        store, names = pe.fromItemsets(self.database)
+        self.expected = {tuple(tuple(names[i] for i in itemSet) for itemSet in pattern): support
+                         for pattern, support in pe.mine(store, self.minSup) if len(pattern) + len(pattern[0]) > 2}
+
+    def test_prefix_span_projections(self):
+        store, names = pe.fromItemsets(self.database)
+        space = pe.ProjectionSpace(store, self.minSup)
+        for workers in (1, 3):
+            patterns = _search(space, space.roots(), workers)
+            patterns = {tuple(tuple(names[i] for i in itemSet) for itemSet in pattern): support
+                        for pattern, support in patterns.items()}
+            self.assertEqual(patterns, self.expected)
+
+    def test_spam_subtrees(self):
+        index = sm.BitmapIndex(self.sequences, self.positions, self.items, len(self.database), self.minSup)
+        items = index.items.tolist()
+        for workers in (1, 3):
+            space = sm.SubtreeSpace(index)
+            patterns = _search(space, space.roots(), workers)
+            patterns = {tuple(tuple(items[i] for i in itemSet) for itemSet in pattern): support
+                        for pattern, support in patterns.items()}
+            self.assertEqual(patterns, self.expected)
+
+    def test_spade_equivalence_classes(self):
+        lists = se.idLists(self.sequences, self.positions, self.items, 7)
+        lists = {item: idList for item, idList in enumerate(lists) if idList.support >= self.minSup}
+        for workers in (1, 3):
+            space = se.ClassSpace(lists, self.minSup)
+            self.assertEqual(_search(space, space.roots(), workers), self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
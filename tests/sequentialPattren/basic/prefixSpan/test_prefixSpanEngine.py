@@ -0,0 +1,63 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/prefixSpan/test_prefixSpanEngine.py
+
+import random
+import unittest
+from PAMI.sequentialPattern.basic import prefixSpanEngine as pe
+
+
+def _contains(sequence, pattern, maxGap):
+    ends = {eid for eid, itemSet in enumerate(sequence) if set(pattern[0]) <= set(itemSet)}
+    for itemSet in pattern[1:]:
+        ends = {eid for eid in range(len(sequence))
+                if set(itemSet) <= set(sequence[eid]) and any(0 < eid - end < maxGap for end in ends)}
+    return bool(ends)
+
+
+def _bruteForce(database, minSup, maxLength, maxGap):
+    items = sorted({item for sequence in database for itemSet in sequence for item in itemSet})
+    patterns = {}
+
+    def grow(pattern):
+        for item in items:
+            candidates = [pattern + ((item,),)] if len(pattern) < maxLength else []
+            if pattern and item > pattern[-1][-1]:
+                candidates.append(pattern[:-1] + (pattern[-1] + (item,),))
+            for candidate in candidates:
+                support = sum(_contains(sequence, candidate, maxGap) for sequence in database)
+                if support >= minSup:
+                    patterns[candidate] = support
+                    grow(candidate)
+
+    grow(())
+    return patterns
+
+
+class TestSequenceStore(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(5)
+        self.database = [[tuple(sorted(random.sample(range(6), random.randint(1, 3))))
+                          for _ in range(random.randint(0, 7))] for _ in range(40)]
+        self.store, self.names = pe.fromItemsets(self.database)
+
+    def _mine(self, maxLength, maxGap):
+        return {tuple(tuple(self.names[i] for i in itemSet) for itemSet in pattern): support
+                for pattern, support in pe.mine(self.store, 6, maxLength, maxGap)}
+
+    def test_supports(self):
+        for item, support in enumerate(self.store.supports.tolist()):
+            self.assertEqual(support, sum(any(self.names[item] in s for s in sequence) for sequence in self.database))
+
+    def test_mine_matches_brute_force(self):
+        self.assertEqual(self._mine(float("inf"), float("inf")), _bruteForce(self.database, 6, float("inf"),
+                                                                             float("inf")))
+        self.assertEqual(self._mine(2, float("inf")), _bruteForce(self.database, 6, 2, float("inf")))
+
+    def test_gap_constraint(self):
+        for maxGap in (1, 2, 3):
+            self.assertEqual(self._mine(3, maxGap), _bruteForce(self.database, 6, 3, maxGap))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/streamingPrefixSpan/test_sequenceStream.py
+
+import ast
+import contextlib
+import io
+import random
+import unittest
+from PAMI.sequentialPattern.basic import prefixSpanEngine as pe
+from PAMI.sequentialPattern.basic import sequenceStream as ss
+from PAMI.sequentialPattern.basic import StreamingPrefixSpan as alg
+
+
+def _supports(sequences, maxLength=float("inf")):
+    store, names = pe.fromItemsets(sequences)
+    return {tuple(tuple(names[item] for item in itemSet) for itemSet in pattern): support
+            for pattern, support in pe.mine(store, 1, maxLength)}
+
+
+def _pattern(name):
+    pattern, itemSet = [], []
+    for item in ast.literal_eval(name):
+        if item == ":":
+            pattern.append(itemSet)
+            itemSet = []
+        else:
+            itemSet.append(item)
+    return pattern
+
+
+class TestSequenceStream(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(5)
+        self.sequences = [[sorted(random.sample("abcdef", random.randint(1, 2))) for _ in range(random.randint(1, 5))]
+                          for _ in range(240)]
+
+    def test_read_skips_blank_lines_and_accepts_tuples(self):
+        stream = list(ss.readEvents(["s1,3,a\n", "\n", ("s2", 4, "b")], ","))
+        self.assertEqual(stream, [("s1", 3.0, "a"), ("s2", 4.0, "b")])
+
+    def test_sessions(self):
+        events = [("x", 0, "a"), ("y", 1, "c"), ("x", 0, "b"), ("x", 2, "c"), ("x", 1, "d"), ("y", 9, "a"),
+                  ("x", 20, "e"), ("y", 21, "b")]
+        self.assertEqual(list(ss.sessions(events, 5)), [[["c"]], [["a", "b"], ["d"], ["c"]], [["a"]], [["e"]], [["b"]]])
+
+    def test_lossy_counting_bounds(self):
+        for epsilon, batchSize, windowSize in ((0.05, 40, None), (0.1, 30, None), (0.05, 40, 3)):
+            tree = ss.LossySequenceTree(epsilon, windowSize, 3)
+            done = []
+            for batch in ss.batches(self.sequences, batchSize):
+                tree.addBatch(batch)
+                done.append(batch)
+                window = [sequence for b in (done if windowSize is None else done[-windowSize:]) for sequence in b]
+                self.assertEqual(tree.length, len(window))
+                supports = _supports(window, 3)
+                minSup = 2 * epsilon * len(window)
+                counts = dict(tree.patterns(minSup))
+                for pattern, support in supports.items():
+                    if support >= minSup:
+                        self.assertIn(pattern, counts)
+                for pattern, count in counts.items():
+                    self.assertLessEqual(count, supports[pattern])
+                    self.assertGreaterEqual(count, supports[pattern] - epsilon * len(window))
+
+    def test_miner_exports_prefixSpan_patterns(self):
+        events = [(sid, 10.0 * sid + eid, item) for sid, sequence in enumerate(self.sequences)
+                  for eid, itemSet in enumerate(sequence) for item in itemSet]
+        expected = {}
+        for pattern, support in _supports(self.sequences[-80:]).items():
+            if support >= 20:
+                row = []
+                for itemSet in pattern:
+                    row.extend(itemSet)
+                    row.append(":")
+                expected[str(row)] = support
+        obj = alg.StreamingPrefixSpan(events, 20, 0.0001, 5, 40, 2)
+        windows = [window for window, _ in obj.windowPatterns()]
+        self.assertEqual(windows, [(0, 40), (0, 80), (40, 120), (80, 160), (120, 200), (160, 240)])
+        self.assertEqual(obj.getPatterns(), expected)
+        with contextlib.redirect_stdout(io.StringIO()):
+            obj.mine()
+        self.assertEqual(obj.getPatterns(), expected)
+        self.assertEqual(len(obj.getPatternsAsDataFrame()), len(expected))
+
+
+    def test_landmark_window_needs_fractional_minSup(self):
+        events = [(sid, 10.0 * sid + eid, item) for sid, sequence in enumerate(self.sequences)
+                  for eid, itemSet in enumerate(sequence) for item in itemSet]
+        windows = []
+        with self.assertRaises(Exception):
+            for window, _ in alg.StreamingPrefixSpan(events, 3, 0.02, 5, 100).windowPatterns():
+                windows.append(window)
+        self.assertEqual(windows, [(0, 100)])
+        for window, patterns in alg.StreamingPrefixSpan(events, 0.08, 0.02, 5, 100).windowPatterns():
+            supports = _supports(self.sequences[window[0]:window[1]])
+            frequent = {pattern for pattern, support in supports.items() if support >= 0.08 * (window[1] - window[0])}
+            self.assertTrue(frequent)
+            self.assertLessEqual(frequent, {tuple(tuple(itemSet) for itemSet in _pattern(name)) for name in patterns})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/test_sequenceDatabase.py
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+import numpy as np
+from PAMI.extras.syntheticDataGenerator.SequentialDatabase import SequentialDatabase
+from PAMI.sequentialPattern.basic import sequenceDatabase as _sequenceDatabase
+from PAMI.multipleMinimumSupportBasedSequentialPattern.basic import MMSBPrefixSpan
+from PAMI.sequentialPattern.basic import GSP, PrefixSpan, PrefixSpanPlus, SPADE, SPADEPlus, SPAM, bitSPADE
+
+
+def write(directory, lines, name="input.txt"):
+    path = os.path.join(directory, name)
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    return path
+
+
+class TestSequenceDatabase(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(2)
+        self.sequences = [[sorted(random.sample(["a", "b", "c", "d", "e"], random.randint(1, 3)))
+                           for _ in range(random.randint(1, 5))] for _ in range(30)]
+        self.lines = [" -1 ".join(" ".join(itemSet) for itemSet in sequence) + " -1 -2" for sequence in self.sequences]
+
+    def test_text_format(self):
+        with tempfile.TemporaryDirectory() as directory:
+            database = _sequenceDatabase.load(write(directory, self.lines + [""]), " ")
+            self.assertEqual(len(database), len(self.sequences))
+            self.assertEqual(database.itemSets(), self.sequences)
+            self.assertEqual(database.names, ["a", "b", "c", "d", "e"])
+            commas = [line.replace(" ", ",") for line in self.lines]
+            self.assertEqual(_sequenceDatabase.load(write(directory, commas), ",").itemSets(), self.sequences)
+
+    def test_binary_file_is_memory_mapped(self):
+        database = _sequenceDatabase.fromItemsets(self.sequences)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "input.seq")
+            database.save(path)
+            self.assertTrue(_sequenceDatabase.isSequenceDatabase(path))
+            opened = _sequenceDatabase.load(path)
+            self.assertIsInstance(opened.items, np.memmap)
+            self.assertEqual(opened.names, database.names)
+            self.assertEqual(opened.sequences(), database.sequences())
+            empty = os.path.join(directory, "empty.seq")
+            _sequenceDatabase.fromItemsets([]).save(empty)
+            self.assertEqual(len(_sequenceDatabase.load(empty)), 0)
+            del opened
+
+    def test_occurrences(self):
+        database = _sequenceDatabase.fromItemsets(self.sequences)
+        expected = [(sid, eid, database.names.index(item)) for sid, sequence in enumerate(self.sequences)
+                    for eid, itemSet in enumerate(sequence) for item in itemSet]
+        self.assertEqual(list(zip(*[array.tolist() for array in database.occurrences()])), expected)
+        order = database.firstAppearance()
+        self.assertEqual([database.names[i] for i in order.tolist()], list(dict.fromkeys(
+            item for sequence in self.sequences for itemSet in sequence for item in itemSet)))
+        items = database.occurrences(order)[2].tolist()
+        self.assertEqual([database.names[order[i]] for i in items], [database.names[i] for _, _, i in expected])
+
+    def test_synthetic_generator(self):
+        np.random.seed(4)
+        generator = SequentialDatabase(20, 4, 3, 9)
+        generator.create()
+        database = _sequenceDatabase.load(generator)
+        expected = []
+        for line in generator.db:
+            sequence = [[]]
+            for item in line:
+                if item == generator.seqSep:
+                    sequence.append([])
+                else:
+                    sequence[-1].append(str(item))
+            expected.append([sorted(set(itemSet)) for itemSet in sequence])
+        self.assertEqual(database.itemSets(), expected)
+
+    def test_miners_accept_the_database(self):
+        database = _sequenceDatabase.fromItemsets(self.sequences)
+        with tempfile.TemporaryDirectory() as directory:
+            text = write(directory, self.lines)
+            colons = write(directory, [line.replace("-1", ":")[:-len(" -2")] for line in self.lines], "colons.txt")
+            path = os.path.join(directory, "input.seq")
+            database.save(path)
+            results = []
+            miners = [(miner, ()) for miner in (SPADE.SPADE, SPAM.SPAM, GSP.GSP, PrefixSpan.PrefixSpan, SPADEPlus.SPADEPlus,
+                                                bitSPADE.bitSPADE, PrefixSpanPlus.PrefixSpanPlus)]
+            miners.append((MMSBPrefixSpan.MMSBprefixSpan, (2,)))
+            for miner, arguments in miners:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    expected = miner(text, 4, *arguments, " ")
+                    expected.mine()
+                    self.assertTrue(expected.getPatterns())
+                    self.assertFalse(any("-2" in pattern for pattern in map(str, expected.getPatterns())
+                                         if miner is not SPAM.SPAM))
+                    for given in (database, path):
+                        obj = miner(given, 4, *arguments, " ")
+                        obj.mine()
+                        self.assertEqual(obj.getPatterns(), expected.getPatterns())
+            with contextlib.redirect_stdout(io.StringIO()):
+                for given in (colons, database):
+                    obj = PrefixSpan.PrefixSpan(given, 4, " ", ":")
+                    obj.mine()
+                    results.append(obj.getPatterns())
+            self.assertEqual(results[0], results[1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/closed/bide/test_bide.py
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+from PAMI.sequentialPattern.basic import prefixSpanEngine as pe
+from PAMI.sequentialPattern.closed import bide, bideEngine
+
+
+def _contains(pattern, other):
+    k = 0
+    for itemSet in other:
+        if set(pattern[k]) <= set(itemSet):
+            k += 1
+            if k == len(pattern):
+                return True
+    return False
+
+
+def _closed(patterns):
+    return {pattern: support for pattern, support in patterns.items()
+            if not any(other != pattern and support == count and _contains(pattern, other)
+                       for other, count in patterns.items())}
+
+
+class TestBide(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        self.database = [[tuple(sorted(random.sample(range(5), random.randint(1, 3))))
+                          for _ in range(random.randint(0, 7))] for _ in range(40)]
+        self.store, self.names = pe.fromItemsets(self.database)
+
+    def test_engine_matches_closed_subset(self):
+        for minSup in (3, 6, 12):
+            expected = _closed(dict(pe.mine(self.store, minSup)))
+            self.assertEqual(dict(bideEngine.mine(self.store, minSup)), expected)
+
+    def test_miner(self):
+        lines = [" -1 ".join(" ".join(str(item) for item in itemSet) for itemSet in sequence) + " -1 -2"
+                 for sequence in self.database if sequence]
+        store, names = pe.fromItemsets([sequence for sequence in self.database if sequence])
+        expected = {}
+        for pattern, support in _closed(dict(pe.mine(store, 6))).items():
+            row = []
+            for itemSet in pattern:
+                row.extend(sorted(str(names[item]) for item in itemSet))
+                row.append(":")
+            expected[str(row)] = support
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "input.txt")
+            with open(path, "w") as f:
+                f.write("\n".join(lines) + "\n")
+            with contextlib.redirect_stdout(io.StringIO()):
+                obj = bide.bide(path, 6, " ")
+                obj.mine()
+            self.assertEqual(obj.getPatterns(), expected)
+            self.assertEqual(len(obj.getPatternsAsDataFrame()), len(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()